@@ -0,0 +1,127 @@
+"""In-process API benchmark over a seeded synthetic graph.
+
+Drives the full `create_app()` stack (middlewares, routing, validation,
+services, serialisation) through httpx's ASGI transport, so there is no
+server or socket in the way. Each scenario keeps `--concurrency` requests
+in flight. Log events are filtered out below WARNING.
+
+Run from the backend directory:
+
+    uv run python -m benchmarks.api --nodes 5000 --output api.json
+    uv run python -m benchmarks.compare baseline.json api.json
+"""
+
+import argparse
+import asyncio
+import logging
+import random
+import time
+from pathlib import Path
+
+import httpx
+import structlog
+
+from .synthetic import (
+    SCENARIOS,
+    ScenarioResult,
+    create_benchmark_app,
+    print_results,
+    summarise,
+    write_results,
+)
+
+
+async def _scenario(
+    client: httpx.AsyncClient,
+    name: str,
+    *,
+    nodes: int,
+    requests: int,
+    concurrency: int,
+    seed: int,
+) -> ScenarioResult:
+    path_for = SCENARIOS[name]
+    rng = random.Random(seed)
+    paths = [path_for(rng, nodes) for _ in range(requests)]
+    latencies: list[float] = []
+    errors = 0
+
+    async def worker(share: list[str]) -> None:
+        nonlocal errors
+        for path in share:
+            start = time.perf_counter()
+            response = await client.get(path)
+            if response.status_code >= 400:
+                errors += 1
+            else:
+                latencies.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    async with asyncio.TaskGroup() as group:
+        for i in range(concurrency):
+            group.create_task(worker(paths[i::concurrency]))
+    return summarise(latencies, time.perf_counter() - start, errors)
+
+
+async def _run(args: argparse.Namespace) -> dict[str, ScenarioResult]:
+    app = create_benchmark_app(
+        nodes=args.nodes, degree=args.degree, seed=args.seed, adjacency=args.adjacency
+    )
+    transport = httpx.ASGITransport(app=app)
+    results: dict[str, ScenarioResult] = {}
+    async with (
+        app.router.lifespan_context(app),
+        httpx.AsyncClient(transport=transport, base_url="http://bench") as client,
+    ):
+        for name in args.scenarios:
+            options = {
+                "nodes": args.nodes,
+                "concurrency": args.concurrency,
+                "seed": args.seed,
+            }
+            await _scenario(client, name, requests=min(args.requests, 200), **options)
+            results[name] = await _scenario(
+                client, name, requests=args.requests, **options
+            )
+    return results
+
+
+def main() -> None:
+    """Print, and optionally save, the results of each scenario."""
+    parser = argparse.ArgumentParser(description="Benchmark the API in-process.")
+    parser.add_argument("--nodes", type=int, default=2000)
+    parser.add_argument("--degree", type=int, default=5, help="edges per node")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument(
+        "--no-adjacency",
+        dest="adjacency",
+        action="store_false",
+        help="traverse the in-memory repository instead of the adjacency cache",
+    )
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument(
+        "--scenario",
+        dest="scenarios",
+        action="append",
+        choices=list(SCENARIOS),
+        help="run only this scenario (repeatable)",
+    )
+    parser.add_argument("--output", type=Path, help="write the results as JSON")
+    args = parser.parse_args()
+    args.scenarios = args.scenarios or list(SCENARIOS)
+
+    structlog.configure(
+        wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING)
+    )
+    results = asyncio.run(_run(args))
+    print_results(results)
+    if args.output:
+        parameters = {
+            key: value for key, value in vars(args).items() if key != "output"
+        }
+        write_results(args.output, "api", parameters, results)
+
+
+if __name__ == "__main__":
+    main()
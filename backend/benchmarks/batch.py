@@ -0,0 +1,165 @@
+"""Batch writes against one-at-a-time writes of the same small subgraphs.
+
+Each unit of work is a gig: a gig, venue, band and four members (7 nodes)
+joined by 12 edges. The `single` scenario writes it the way a client must
+without batches, one `POST /nodes` or `POST /edges` per item (19 requests,
+each its own transaction); `batch` writes it with one `POST /batch`. The
+throughput and latencies reported are per gig, not per request.
+
+In-process by default, over the in-memory repository, which measures the
+per-request cost of the HTTP stack. Pass `--url` to target a server backed
+by Postgres, where each request in `single` also pays for a transaction.
+
+Run from the backend directory:
+
+    uv run python -m benchmarks.batch --gigs 500 --output batch.json
+    uv run python -m benchmarks.batch --url http://localhost:8000
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+from pathlib import Path
+from typing import Any
+
+import httpx
+import structlog
+
+from .synthetic import (
+    ScenarioResult,
+    create_benchmark_app,
+    print_results,
+    summarise,
+    write_results,
+)
+
+_MEMBERS = 4
+
+
+def _gig(n: int) -> dict[str, Any]:
+    """The `/batch` body writing gig `n`."""
+    people = [f"person{i}" for i in range(_MEMBERS)]
+    nodes = [
+        {"ref": "gig", "type": "gig", "name": f"gig {n}"},
+        {"ref": "venue", "type": "venue", "name": f"venue {n}"},
+        {"ref": "band", "type": "band", "name": f"band {n}"},
+        *({"ref": p, "type": "person", "name": f"{p} of band {n}"} for p in people),
+    ]
+    edges = [
+        {"source": "gig", "target": "venue", "type": "held_at"},
+        {"source": "band", "target": "gig", "type": "played"},
+        *({"source": p, "target": "band", "type": "member_of"} for p in people),
+        *({"source": p, "target": "gig", "type": "performed_at"} for p in people),
+        {"source": "gig", "target": "band", "type": "headlined_by"},
+        {"source": "venue", "target": "band", "type": "booked"},
+    ]
+    return {"nodes": nodes, "edges": edges}
+
+
+async def _single(client: httpx.AsyncClient, body: dict[str, Any]) -> bool:
+    ids: dict[str, int] = {}
+    for node in body["nodes"]:
+        fields = {key: value for key, value in node.items() if key != "ref"}
+        response = await client.post("/api/v1/nodes", json=fields)
+        if response.status_code >= 400:
+            return False
+        ids[node["ref"]] = response.json()["id"]
+    for edge in body["edges"]:
+        fields = {
+            "source_id": ids[edge["source"]],
+            "target_id": ids[edge["target"]],
+            "type": edge["type"],
+        }
+        response = await client.post("/api/v1/edges", json=fields)
+        if response.status_code >= 400:
+            return False
+    return True
+
+
+async def _batch(client: httpx.AsyncClient, body: dict[str, Any]) -> bool:
+    response = await client.post("/api/v1/batch", json=body)
+    return response.status_code < 400
+
+
+_SCENARIOS = {"single": _single, "batch": _batch}
+
+
+async def _scenario(
+    client: httpx.AsyncClient, name: str, *, gigs: int, concurrency: int
+) -> ScenarioResult:
+    write = _SCENARIOS[name]
+    latencies: list[float] = []
+    errors = 0
+
+    async def worker(share: range) -> None:
+        nonlocal errors
+        for n in share:
+            start = time.perf_counter()
+            if await write(client, _gig(n)):
+                latencies.append((time.perf_counter() - start) * 1000)
+            else:
+                errors += 1
+
+    start = time.perf_counter()
+    async with asyncio.TaskGroup() as group:
+        for i in range(concurrency):
+            group.create_task(worker(range(i, gigs, concurrency)))
+    return summarise(latencies, time.perf_counter() - start, errors)
+
+
+async def _run(args: argparse.Namespace) -> dict[str, ScenarioResult]:
+    results: dict[str, ScenarioResult] = {}
+    if args.url:
+        client = httpx.AsyncClient(base_url=args.url, timeout=60)
+        async with client:
+            for name in args.scenarios:
+                results[name] = await _scenario(
+                    client, name, gigs=args.gigs, concurrency=args.concurrency
+                )
+        return results
+
+    app = create_benchmark_app(nodes=0, degree=0, seed=0, adjacency=False)
+    transport = httpx.ASGITransport(app=app)
+    async with (
+        app.router.lifespan_context(app),
+        httpx.AsyncClient(transport=transport, base_url="http://bench") as client,
+    ):
+        for name in args.scenarios:
+            results[name] = await _scenario(
+                client, name, gigs=args.gigs, concurrency=args.concurrency
+            )
+    return results
+
+
+def main() -> None:
+    """Print, and optionally save, the results of each scenario."""
+    parser = argparse.ArgumentParser(description="Benchmark batch writes.")
+    parser.add_argument("--url", help="test this server instead of running in-process")
+    parser.add_argument("--gigs", type=int, default=300)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument(
+        "--scenario",
+        dest="scenarios",
+        action="append",
+        choices=list(_SCENARIOS),
+        help="run only this scenario (repeatable)",
+    )
+    parser.add_argument("--output", type=Path, help="write the results as JSON")
+    args = parser.parse_args()
+    args.scenarios = args.scenarios or list(_SCENARIOS)
+
+    structlog.configure(
+        wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING)
+    )
+    results = asyncio.run(_run(args))
+    print_results(results)
+    if args.output:
+        parameters = {
+            key: value for key, value in vars(args).items() if key != "output"
+        }
+        write_results(args.output, "batch", parameters, results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Compare two benchmark result files and flag regressions.
+
+A scenario regresses when its throughput drops, or its p50, p95 or p99
+latency rises, by more than `--threshold` percent. The exit status is 1 if
+any scenario regressed, so this can gate a CI job.
+
+Run from the backend directory:
+
+    uv run python -m benchmarks.compare baseline.json current.json --threshold 10
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+# Metric name, and whether a higher value is better.
+_METRICS = (("rps", True), ("p50_ms", False), ("p95_ms", False), ("p99_ms", False))
+
+
+def _change(before: float, after: float) -> float:
+    return (after - before) / before * 100 if before else 0.0
+
+
+def compare(
+    baseline: dict[str, Any], current: dict[str, Any], threshold: float
+) -> list[str]:
+    """Print a comparison table and return the regressed `scenario metric`s."""
+    regressions: list[str] = []
+    for name, result in current["results"].items():
+        before = baseline["results"].get(name)
+        if before is None:
+            print(f"{name:>14}: not in the baseline")
+            continue
+        cells = []
+        for metric, higher_is_better in _METRICS:
+            change = _change(before[metric], result[metric])
+            worse = -change if higher_is_better else change
+            flag = "!" if worse > threshold else " "
+            if worse > threshold:
+                regressions.append(f"{name} {metric}")
+            cells.append(f"{metric} {result[metric]:9.2f} ({change:+6.1f}%){flag}")
+        print(f"{name:>14}: " + "  ".join(cells))
+    return regressions
+
+
+def main() -> None:
+    """Compare the results and exit with 1 on a regression."""
+    parser = argparse.ArgumentParser(description="Compare benchmark results.")
+    parser.add_argument("baseline", type=Path)
+    parser.add_argument("current", type=Path)
+    parser.add_argument("--threshold", type=float, default=10.0, help="percent")
+    args = parser.parse_args()
+
+    baseline = json.loads(args.baseline.read_text())
+    current = json.loads(args.current.read_text())
+    if baseline["benchmark"] != current["benchmark"]:
+        sys.exit("the files are from different benchmarks")
+    if baseline["parameters"] != current["parameters"]:
+        print("warning: the runs used different parameters", file=sys.stderr)
+
+    regressions = compare(baseline, current, args.threshold)
+    if regressions:
+        print(f"regressed beyond {args.threshold}%: " + ", ".join(regressions))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""Out-of-process load test against a real Granian server.
+
+Starts Granian serving `benchmarks.server:app` (the API over a seeded
+synthetic graph) on a local port, or targets `--url` instead, and keeps
+`--concurrency` keep-alive connections busy for `--duration` seconds per
+scenario. Reports throughput and p50/p95/p99 latency as seen by the
+client, which includes the HTTP server and the network stack. The client
+is a single asyncio process; on a small machine it competes with the
+server for CPU, so only compare runs made on the same machine.
+
+Run from the backend directory:
+
+    uv run python -m benchmarks.load --workers 2 --output load.json
+    uv run python -m benchmarks.load --url http://localhost:8000 --scenario node
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import httpx
+
+from .synthetic import (
+    SCENARIOS,
+    ScenarioResult,
+    print_results,
+    summarise,
+    write_results,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+_READY_TIMEOUT = 60.0
+
+
+@contextmanager
+def _granian(args: argparse.Namespace) -> Iterator[str]:
+    """Run Granian on `--port` until the block exits, yielding its URL."""
+    env = os.environ | {
+        "BENCH_NODES": str(args.nodes),
+        "BENCH_DEGREE": str(args.degree),
+        "BENCH_SEED": str(args.seed),
+        "BENCH_ADJACENCY": "1" if args.adjacency else "0",
+        "GRANIAN_LOG_ENABLED": "false",
+    }
+    command = [
+        *(sys.executable, "-m", "granian", "--interface", "asgi"),
+        *("--host", "127.0.0.1", "--port", str(args.port)),
+        *("--workers", str(args.workers)),
+        "benchmarks.server:app",
+    ]
+    process = subprocess.Popen(command, env=env, cwd=Path(__file__).parents[1])
+    url = f"http://127.0.0.1:{args.port}"
+    try:
+        _wait_until_ready(url, process)
+        yield url
+    finally:
+        process.terminate()
+        process.wait(timeout=30)
+
+
+def _wait_until_ready(url: str, process: subprocess.Popen[bytes]) -> None:
+    deadline = time.monotonic() + _READY_TIMEOUT
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise SystemExit(f"granian exited with status {process.returncode}")
+        try:
+            if httpx.get(f"{url}/api/health").status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        time.sleep(0.2)
+    raise SystemExit(f"granian did not answer within {_READY_TIMEOUT:.0f}s")
+
+
+async def _scenario(
+    url: str, name: str, *, nodes: int, concurrency: int, duration: float
+) -> ScenarioResult:
+    path_for = SCENARIOS[name]
+    latencies: list[float] = []
+    errors = 0
+    limits = httpx.Limits(max_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=url, limits=limits) as client:
+
+        async def connection(seed: int, until: float) -> None:
+            nonlocal errors
+            rng = random.Random(seed)
+            while time.perf_counter() < until:
+                start = time.perf_counter()
+                try:
+                    response = await client.get(path_for(rng, nodes))
+                except httpx.TransportError:
+                    errors += 1
+                    continue
+                if response.status_code >= 400:
+                    errors += 1
+                else:
+                    latencies.append((time.perf_counter() - start) * 1000)
+
+        start = time.perf_counter()
+        async with asyncio.TaskGroup() as group:
+            for seed in range(concurrency):
+                group.create_task(connection(seed, start + duration))
+        elapsed = time.perf_counter() - start
+    return summarise(latencies, elapsed, errors)
+
+
+async def _run(url: str, args: argparse.Namespace) -> dict[str, ScenarioResult]:
+    results: dict[str, ScenarioResult] = {}
+    for name in args.scenarios:
+        options = {"nodes": args.nodes, "concurrency": args.concurrency}
+        await _scenario(url, name, duration=min(args.duration, 1.0), **options)
+        results[name] = await _scenario(url, name, duration=args.duration, **options)
+    return results
+
+
+def main() -> None:
+    """Print, and optionally save, the results of each scenario."""
+    parser = argparse.ArgumentParser(description="Load test the API over HTTP.")
+    parser.add_argument("--url", help="test this server instead of starting one")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--nodes", type=int, default=2000)
+    parser.add_argument("--degree", type=int, default=5, help="edges per node")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument(
+        "--no-adjacency",
+        dest="adjacency",
+        action="store_false",
+        help="traverse the in-memory repository instead of the adjacency cache",
+    )
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument(
+        "--scenario",
+        dest="scenarios",
+        action="append",
+        choices=list(SCENARIOS),
+        help="run only this scenario (repeatable)",
+    )
+    parser.add_argument("--output", type=Path, help="write the results as JSON")
+    args = parser.parse_args()
+    args.scenarios = args.scenarios or list(SCENARIOS)
+
+    if args.url:
+        results = asyncio.run(_run(args.url, args))
+    else:
+        with _granian(args) as url:
+            results = asyncio.run(_run(url, args))
+    print_results(results)
+    if args.output:
+        parameters = {
+            key: value for key, value in vars(args).items() if key != "output"
+        }
+        write_results(args.output, "load", parameters, results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""Request latency with the direct and the queued log sink, under load.
+
+Drives a one-route app with the access log middleware in-process, keeping
+`--concurrency` requests in flight, with each sink in turn. Log output goes
+to /dev/null, so the difference is how each sink gets a line there: a
+thread-pool hop per event (direct) or a queue put (queued).
+
+Run from the backend directory:
+
+    uv run python -m benchmarks.log_sink --requests 20000 --concurrency 64
+"""
+
+import argparse
+import asyncio
+import contextlib
+import os
+import statistics
+import time
+from typing import TYPE_CHECKING, Any
+
+from fastapi import FastAPI
+
+from app.entrypoints.api.middlewares import AccessLogMiddleware, RequestIdMiddleware
+from app.shared.config.logging_ import LoggingMode, LogLevel, LogSink
+from app.shared.logging_ import close_logging, configure_logging
+
+if TYPE_CHECKING:
+    from starlette.types import ASGIApp, Message
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping() -> dict[str, str]:
+        return {"status": "ok"}
+
+    app.add_middleware(AccessLogMiddleware)
+    app.add_middleware(RequestIdMiddleware)
+    return app
+
+
+async def _request(app: ASGIApp) -> float:
+    scope: dict[str, Any] = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/ping",
+        "raw_path": b"/ping",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 50000),
+        "server": ("bench", 80),
+    }
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Message) -> None:
+        pass
+
+    start = time.perf_counter()
+    await app(scope, receive, send)
+    return (time.perf_counter() - start) * 1000
+
+
+async def _load(app: ASGIApp, requests: int, concurrency: int) -> list[float]:
+    latencies: list[float] = []
+
+    async def client(count: int) -> None:
+        for _ in range(count):
+            latencies.append(await _request(app))
+
+    share, extra = divmod(requests, concurrency)
+    async with asyncio.TaskGroup() as group:
+        for i in range(concurrency):
+            group.create_task(client(share + (i < extra)))
+    return latencies
+
+
+def _run(sink: LogSink, requests: int, concurrency: int) -> dict[str, float]:
+    configure_logging(LogLevel.INFO, LoggingMode.JSON, sink=sink)
+    app = _app()
+    try:
+        asyncio.run(_load(app, min(requests, 1000), concurrency))  # warm up
+        start = time.perf_counter()
+        latencies = asyncio.run(_load(app, requests, concurrency))
+        elapsed = time.perf_counter() - start
+    finally:
+        close_logging()
+    cuts = statistics.quantiles(latencies, n=100)
+    return {
+        "rps": requests / elapsed,
+        "p50_ms": cuts[49],
+        "p95_ms": cuts[94],
+        "p99_ms": cuts[98],
+    }
+
+
+def main() -> None:
+    """Print throughput and latency percentiles for each log sink."""
+    parser = argparse.ArgumentParser(description="Compare the log sinks.")
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    args = parser.parse_args()
+
+    results: dict[LogSink, dict[str, float]] = {}
+    with (
+        open(os.devnull, "w") as devnull,
+        contextlib.redirect_stdout(devnull),
+    ):
+        for sink in LogSink:
+            results[sink] = _run(sink, args.requests, args.concurrency)
+
+    for sink, result in results.items():
+        print(
+            f"{sink:>6}: {result['rps']:8.0f} req/s  "
+            f"p50 {result['p50_ms']:.2f} ms  p95 {result['p95_ms']:.2f} ms  "
+            f"p99 {result['p99_ms']:.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
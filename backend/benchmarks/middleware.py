@@ -0,0 +1,183 @@
+"""Per-request overhead of the API middleware stack.
+
+Compares the pure ASGI middlewares with the `@app.middleware("http")`
+(`BaseHTTPMiddleware`) functions they replaced, which are kept here as the
+baseline. Requests go straight into the ASGI app, with no server or
+sockets, so only framework and middleware time is measured. Log events are
+filtered out below WARNING, so the access log's cost is its bookkeeping
+rather than rendering and writing.
+
+Run from the backend directory:
+
+    uv run python -m benchmarks.middleware --requests 20000
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+import uuid
+from contextlib import suppress
+from typing import TYPE_CHECKING, Any
+
+import structlog
+from fastapi import FastAPI
+
+from app.entrypoints.api.middlewares import (
+    AccessLogMiddleware,
+    AppHeadersMiddleware,
+    RequestIdMiddleware,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from starlette.middleware.base import RequestResponseEndpoint
+    from starlette.requests import Request
+    from starlette.responses import Response
+    from starlette.types import ASGIApp, Message
+
+_NAME = "Menagerist"
+_VERSION = "0.0.0"
+
+
+async def _legacy_access_log(
+    request: Request, call_next: RequestResponseEndpoint
+) -> Response:
+    logger = structlog.get_logger("access")
+    client = request.client.host if request.client else None
+    request_data = {
+        "path": request.url.path,
+        "method": request.method,
+        "client": client,
+    }
+    if request.query_params:
+        request_data["query"] = str(request.query_params)
+    await logger.ainfo("http.request", **request_data)
+    start = time.perf_counter()
+    response = await call_next(request)
+    duration_ms = (time.perf_counter() - start) * 1000
+    await logger.ainfo(
+        "http.response",
+        duration_ms=round(duration_ms, 3),
+        status_code=response.status_code,
+    )
+    return response
+
+
+async def _legacy_app_headers(
+    request: Request, call_next: RequestResponseEndpoint
+) -> Response:
+    response = await call_next(request)
+    response.headers["Application-Name"] = _NAME
+    response.headers["Application-Version"] = _VERSION
+    return response
+
+
+async def _legacy_request_id(
+    request: Request, call_next: RequestResponseEndpoint
+) -> Response:
+    structlog.contextvars.clear_contextvars()
+    request_id = request.headers.get("X-Request-ID") or str(uuid.uuid4())
+    structlog.contextvars.bind_contextvars(request_id=request_id)
+    response = await call_next(request)
+    with suppress(Exception):
+        response.headers["X-Request-ID"] = request_id
+    return response
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping() -> dict[str, str]:
+        return {"status": "ok"}
+
+    return app
+
+
+def _bare() -> FastAPI:
+    return _app()
+
+
+def _http_middleware() -> FastAPI:
+    app = _app()
+    app.middleware("http")(_legacy_access_log)
+    app.middleware("http")(_legacy_app_headers)
+    app.middleware("http")(_legacy_request_id)
+    return app
+
+
+def _asgi_middleware() -> FastAPI:
+    app = _app()
+    app.add_middleware(AccessLogMiddleware)
+    app.add_middleware(AppHeadersMiddleware, name=_NAME, version=_VERSION)
+    app.add_middleware(RequestIdMiddleware)
+    return app
+
+
+STACKS: dict[str, Callable[[], ASGIApp]] = {
+    "none": _bare,
+    "http middleware": _http_middleware,
+    "asgi middleware": _asgi_middleware,
+}
+
+
+async def _per_request_us(app: ASGIApp, requests: int) -> float:
+    scope: dict[str, Any] = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/ping",
+        "raw_path": b"/ping",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 50000),
+        "server": ("bench", 80),
+    }
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Message) -> None:
+        pass
+
+    start = time.perf_counter()
+    for _ in range(requests):
+        await app(dict(scope), receive, send)
+    return (time.perf_counter() - start) / requests * 1_000_000
+
+
+async def _run(requests: int, rounds: int) -> dict[str, float]:
+    results: dict[str, float] = {}
+    for name, build in STACKS.items():
+        app = build()
+        await _per_request_us(app, min(requests, 1000))  # warm up
+        results[name] = min(
+            [await _per_request_us(app, requests) for _ in range(rounds)]
+        )
+    return results
+
+
+def main() -> None:
+    """Print the best per-request time of each middleware stack."""
+    parser = argparse.ArgumentParser(description="Time the middleware stacks.")
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    structlog.configure(
+        wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING)
+    )
+    results = asyncio.run(_run(args.requests, args.rounds))
+    baseline = results["none"]
+    for name, per_request in results.items():
+        overhead = per_request - baseline
+        print(f"{name:>16}: {per_request:8.1f} us/request  (+{overhead:.1f} us)")
+
+
+if __name__ == "__main__":
+    main()
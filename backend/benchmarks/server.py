@@ -0,0 +1,24 @@
+"""ASGI target serving the synthetic graph, for `benchmarks.load`.
+
+Configured through the environment, since Granian imports it by name in
+every worker: `BENCH_NODES`, `BENCH_DEGREE`, `BENCH_SEED` and
+`BENCH_ADJACENCY` (`0` to disable). Each worker seeds the same graph.
+"""
+
+import logging
+import os
+
+import structlog
+
+from .synthetic import create_benchmark_app
+
+structlog.configure(
+    wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING)
+)
+
+app = create_benchmark_app(
+    nodes=int(os.environ.get("BENCH_NODES", "2000")),
+    degree=int(os.environ.get("BENCH_DEGREE", "5")),
+    seed=int(os.environ.get("BENCH_SEED", "1")),
+    adjacency=os.environ.get("BENCH_ADJACENCY", "1") != "0",
+)
@@ -0,0 +1,203 @@
+"""A seeded synthetic graph, the API app serving it, and result files.
+
+Shared by the `api` and `load` benchmarks. The app is the real one from
+`create_app()`, with the graph service swapped for one over an in-memory
+repository, optionally fronted by the adjacency cache as in production.
+Nothing needs a database, so results measure the framework, middlewares,
+services and serialisation rather than Postgres. The in-memory repository
+scans every node to list and search, so those two scenarios grow with the
+graph size much faster than their SQL versions do.
+"""
+
+import json
+import math
+import platform
+import random
+import statistics
+import time
+from array import array
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any, TypedDict
+
+from app.application.graph import GraphService
+from app.domain.graph import NewEdge, NewNode
+from app.entrypoints.api.dependencies import get_graph_reader, get_graph_service
+from app.entrypoints.api.main import create_app
+from app.infrastructure.graph_cache import (
+    AdjacencyCache,
+    CachedGraphRepository,
+    CompressedAdjacency,
+)
+from app.infrastructure.memory import InMemoryGraphRepository
+from app.shared.config import get_settings
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, Callable
+    from pathlib import Path
+
+    from fastapi import FastAPI
+
+    from app.domain.graph import GraphRepository
+
+_NODE_TYPES = ("person", "band", "venue", "gig", "album")
+_EDGE_TYPES = ("member_of", "played_at", "released", "knows")
+_WORDS = (
+    "amber", "black", "crimson", "electric", "golden", "hollow", "iron",
+    "lunar", "midnight", "neon", "silver", "velvet", "wild", "young",
+)  # fmt: skip
+
+# Each scenario turns a random generator and the node count into a path.
+SCENARIOS: dict[str, Callable[[random.Random, int], str]] = {
+    "health": lambda rng, nodes: "/api/health",
+    "version": lambda rng, nodes: "/api/version",
+    "node": lambda rng, nodes: f"/api/v1/nodes/{rng.randint(1, nodes)}",
+    "list": lambda rng, nodes: "/api/v1/nodes?limit=50",
+    "neighbourhood": lambda rng, nodes: (
+        f"/api/v1/nodes/{rng.randint(1, nodes)}/neighbourhood?depth=2"
+    ),
+    "search": lambda rng, nodes: f"/api/v1/search?q={rng.choice(_WORDS)}",
+    "paths": lambda rng, nodes: (
+        f"/api/v1/paths?from={rng.randint(1, nodes)}&to={rng.randint(1, nodes)}&k=3"
+    ),
+}
+
+
+async def seed_graph(
+    repository: InMemoryGraphRepository, *, nodes: int, degree: int, seed: int
+) -> None:
+    """Add `nodes` nodes, each with `degree` edges to random other nodes."""
+    rng = random.Random(seed)
+    for i in range(nodes):
+        await repository.add_node(
+            NewNode(
+                type=rng.choice(_NODE_TYPES),
+                name=f"{rng.choice(_WORDS)} {rng.choice(_WORDS)} {i}",
+                properties={"rank": i, "tag": rng.choice(_WORDS)},
+            )
+        )
+    for source_id in range(1, nodes + 1):
+        for _ in range(degree):
+            await repository.add_edge(
+                NewEdge(
+                    source_id=source_id,
+                    target_id=rng.randint(1, nodes),
+                    type=rng.choice(_EDGE_TYPES),
+                )
+            )
+
+
+def adjacency_cache(repository: InMemoryGraphRepository) -> AdjacencyCache:
+    """Build a ready adjacency cache over the repository's edges."""
+    start = time.perf_counter()
+    sources, targets, types = array("q"), array("q"), array("H")
+    type_codes: dict[str, int] = {}
+    for edge in repository.edges.values():
+        sources.append(edge.source_id)
+        targets.append(edge.target_id)
+        types.append(type_codes.setdefault(edge.type, len(type_codes)))
+    cache = AdjacencyCache(max_pending=get_settings().graph.adjacency_cache_max_pending)
+    cache.replace(
+        CompressedAdjacency.from_arrays(sources, targets, types),
+        type_codes,
+        (len(repository.edges), max(repository.edges, default=0)),
+        seconds=time.perf_counter() - start,
+    )
+    return cache
+
+
+def create_benchmark_app(
+    *, nodes: int, degree: int, seed: int, adjacency: bool
+) -> FastAPI:
+    """Return the API app serving a synthetic graph seeded on startup."""
+    settings = get_settings()
+    app = create_app()
+    memory = InMemoryGraphRepository()
+    repository: GraphRepository = memory
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
+        nonlocal repository
+        await seed_graph(memory, nodes=nodes, degree=degree, seed=seed)
+        if adjacency:
+            repository = CachedGraphRepository(memory, adjacency_cache(memory))
+        yield
+
+    def graph_service() -> GraphService:
+        return GraphService(
+            repository,
+            max_depth=settings.graph.max_depth,
+            max_results=settings.graph.max_results,
+            search_max_results=settings.graph.search_max_results,
+            search_min_similarity=settings.graph.search_min_similarity,
+            paths_max_count=settings.graph.paths_max_count,
+            paths_max_visited=settings.graph.paths_max_visited,
+            batch_max_nodes=settings.graph.batch_max_nodes,
+            batch_max_edges=settings.graph.batch_max_edges,
+        )
+
+    # Replaces the bootstrap, which would connect to the database.
+    app.router.lifespan_context = lifespan
+    app.dependency_overrides[get_graph_service] = graph_service
+    app.dependency_overrides[get_graph_reader] = graph_service
+    return app
+
+
+class ScenarioResult(TypedDict):
+    """What `summarise` reports for one scenario."""
+
+    requests: int
+    errors: int
+    rps: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+
+
+def summarise(latencies_ms: list[float], elapsed: float, errors: int) -> ScenarioResult:
+    """Throughput and latency percentiles of one scenario.
+
+    `latencies_ms` holds successful requests only, so failures count towards
+    `requests` and `errors` but not towards throughput or latency.
+    """
+    if len(latencies_ms) > 1:
+        cuts = statistics.quantiles(latencies_ms, n=100)
+    else:
+        # quantiles() needs two samples; a lone one is every percentile.
+        cuts = latencies_ms * 99 or [math.nan] * 99
+    return {
+        "requests": len(latencies_ms) + errors,
+        "errors": errors,
+        "rps": len(latencies_ms) / elapsed,
+        "p50_ms": cuts[49],
+        "p95_ms": cuts[94],
+        "p99_ms": cuts[98],
+    }
+
+
+def write_results(
+    path: Path,
+    benchmark: str,
+    parameters: dict[str, Any],
+    results: dict[str, ScenarioResult],
+) -> None:
+    """Save results as JSON, for `benchmarks.compare`."""
+    document = {
+        "benchmark": benchmark,
+        "created_at": datetime.now(UTC).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "parameters": parameters,
+        "results": results,
+    }
+    path.write_text(json.dumps(document, indent=2) + "\n")
+
+
+def print_results(results: dict[str, ScenarioResult]) -> None:
+    """Print one line per scenario."""
+    for name, result in results.items():
+        print(
+            f"{name:>14}: {result['rps']:8.0f} req/s  "
+            f"p50 {result['p50_ms']:.2f} ms  p95 {result['p95_ms']:.2f} ms  "
+            f"p99 {result['p99_ms']:.2f} ms  errors {result['errors']}"
+        )
@@ -0,0 +1,17 @@
+from app.application.enrichment.ports import (
+    CachedResponse,
+    EnrichmentJob,
+    EnrichmentJobStore,
+    EnrichmentProvider,
+    ProviderError,
+    ResponseStore,
+)
+
+__all__ = [
+    "CachedResponse",
+    "EnrichmentJob",
+    "EnrichmentJobStore",
+    "EnrichmentProvider",
+    "ProviderError",
+    "ResponseStore",
+]
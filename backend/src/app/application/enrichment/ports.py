@@ -0,0 +1,161 @@
+"""Interfaces the enrichment workers need from providers and storage."""
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Protocol
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from app.domain.graph import Node
+
+__all__ = [
+    "CachedResponse",
+    "EnrichmentJob",
+    "EnrichmentJobStore",
+    "EnrichmentProvider",
+    "ProviderError",
+    "ResponseStore",
+]
+
+
+class ProviderError(Exception):
+    """Raised by a provider when a lookup could not be completed.
+
+    `retryable` errors (timeouts, rate limiting, server errors) are tried
+    again later; others fail the job straight away.
+    """
+
+    def __init__(self, message: str, *, retryable: bool) -> None:
+        self.retryable = retryable
+        super().__init__(message)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class EnrichmentJob:
+    """A node waiting to be enriched by one provider."""
+
+    node: Node
+    provider: str
+    attempt: int
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class CachedResponse:
+    """A provider response kept for reuse until `expires_at` (a Unix time).
+
+    `negative` marks a response that found nothing; those expire sooner, as
+    the catalogue may have gained the entry since.
+    """
+
+    body: dict[str, Any]
+    negative: bool
+    expires_at: float
+
+
+class EnrichmentProvider(Protocol):
+    """Looks nodes up in an external catalogue."""
+
+    @property
+    def name(self) -> str:
+        """Stable provider name; enrichment data is stored under it."""
+        ...
+
+    @property
+    def node_types(self) -> frozenset[str]:
+        """Node types this provider knows how to look up."""
+        ...
+
+    async def lookup(self, node: Node) -> dict[str, Any] | None:
+        """Return data about the node, or `None` when nothing matches.
+
+        Raises:
+            ProviderError: If the lookup failed.
+        """
+        ...
+
+
+class EnrichmentJobStore(Protocol):
+    """Durable queue of enrichment jobs, shared by every worker process."""
+
+    async def try_lead(self) -> bool:
+        """Try to become the one process that runs enrichment.
+
+        Provider rate limits are enforced in-process, so only the leader may
+        make requests. Leadership lasts until `close`, or until the process
+        or its hold on the database goes away; see `still_leading`.
+        """
+        ...
+
+    async def still_leading(self) -> bool:
+        """Check that this process still holds leadership.
+
+        Leadership can be lost without `close`, say when the database
+        restarts. Once lost, it is given up here, and `try_lead` must win it
+        again before any more requests are made.
+        """
+        ...
+
+    async def high_water(
+        self, provider: str, node_types: Sequence[str]
+    ) -> dict[str, int]:
+        """Return the highest node id queued for `provider`, per node type.
+
+        Discovery resumes after it, so a restart does not rescan every node.
+        Types without jobs are left out.
+        """
+        ...
+
+    async def discover(
+        self, provider: str, node_type: str, *, after_id: int, limit: int
+    ) -> int | None:
+        """Queue jobs for up to `limit` nodes of a type with ids after `after_id`.
+
+        Returns the highest node id considered, or `None` when there were
+        none. Nodes that already have a job are skipped.
+        """
+        ...
+
+    async def claim(
+        self, provider: str, *, limit: int, lease: float
+    ) -> Sequence[EnrichmentJob]:
+        """Take up to `limit` due jobs for `lease` seconds.
+
+        Jobs whose lease ran out without completing (say, after a crash) are
+        due again, which is what makes enrichment resumable.
+        """
+        ...
+
+    async def complete(self, job: EnrichmentJob, data: dict[str, Any] | None) -> None:
+        """Store the lookup result on the node and finish the job."""
+        ...
+
+    async def retry(self, job: EnrichmentJob, error: str, *, delay: float) -> None:
+        """Release the job to be tried again after `delay` seconds."""
+        ...
+
+    async def fail(self, job: EnrichmentJob, error: str) -> None:
+        """Give up on the job."""
+        ...
+
+    async def close(self) -> None:
+        """Release leadership and any resources."""
+        ...
+
+
+class ResponseStore(Protocol):
+    """Persistent tier of the provider response cache."""
+
+    async def get(self, key: str) -> CachedResponse | None:
+        """Return the unexpired response stored under `key`, if any."""
+        ...
+
+    async def put(self, key: str, response: CachedResponse) -> None:
+        """Store a response, replacing any previous one under `key`."""
+        ...
+
+    async def prune(self, *, max_entries: int) -> int:
+        """Drop expired responses, then the soonest to expire beyond `max_entries`.
+
+        Returns the number of responses dropped.
+        """
+        ...
@@ -0,0 +1,4 @@
+from app.application.exports.ports import ExportSource
+from app.application.exports.service import ExportService
+
+__all__ = ["ExportService", "ExportSource"]
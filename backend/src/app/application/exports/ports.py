@@ -0,0 +1,26 @@
+"""Interfaces the export use case needs from storage."""
+
+from typing import TYPE_CHECKING, Protocol
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from app.domain.graph import Edge, Node
+
+__all__ = ["ExportSource"]
+
+
+class ExportSource(Protocol):
+    """Streams every stored node and edge, in id order."""
+
+    def nodes(self) -> AsyncIterator[Node]:
+        """Yield every node."""
+        ...
+
+    def edges(self) -> AsyncIterator[Edge]:
+        """Yield every edge.
+
+        Must read from the same snapshot as `nodes`, so every edge refers to
+        a node that was exported.
+        """
+        ...
@@ -0,0 +1,91 @@
+"""Full graph export use case."""
+
+import json
+import zlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from app.domain.graph import Edge, Node
+
+    from .ports import ExportSource
+
+__all__ = ["ExportService"]
+
+_GZIP_LEVEL = 6
+_GZIP_WBITS = 16 + zlib.MAX_WBITS  # gzip header and trailer
+
+_encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+
+def _node_line(node: Node) -> str:
+    return _encode(
+        {
+            "kind": "node",
+            "id": node.id,
+            "key": node.key,
+            "type": node.type,
+            "name": node.name,
+            "properties": node.properties,
+        }
+    )
+
+
+def _edge_line(edge: Edge) -> str:
+    return _encode(
+        {
+            "kind": "edge",
+            "id": edge.id,
+            "source_id": edge.source_id,
+            "target_id": edge.target_id,
+            "type": edge.type,
+            "properties": edge.properties,
+        }
+    )
+
+
+class ExportService:
+    """Serialises the whole graph as NDJSON without holding it in memory.
+
+    Lines are gathered into chunks of about `chunk_bytes` so the response is
+    sent in a few large writes rather than one per row.
+    """
+
+    def __init__(self, source: ExportSource, *, chunk_bytes: int) -> None:
+        self._source = source
+        self._chunk_bytes = chunk_bytes
+
+    async def _chunks(self) -> AsyncIterator[bytes]:
+        lines: list[str] = []
+        size = 0
+        async for line in self._lines():
+            lines.append(line)
+            size += len(line)
+            if size >= self._chunk_bytes:
+                yield "".join(lines).encode()
+                lines, size = [], 0
+        if lines:
+            yield "".join(lines).encode()
+
+    async def _lines(self) -> AsyncIterator[str]:
+        async for node in self._source.nodes():
+            yield _node_line(node) + "\n"
+        async for edge in self._source.edges():
+            yield _edge_line(edge) + "\n"
+
+    async def ndjson(self, *, compress: bool = False) -> AsyncIterator[bytes]:
+        """Yield the export as NDJSON chunks: every node, then every edge.
+
+        With `compress`, the chunks form a single gzip stream instead.
+        """
+        if not compress:
+            async for chunk in self._chunks():
+                yield chunk
+            return
+
+        compressor = zlib.compressobj(_GZIP_LEVEL, zlib.DEFLATED, _GZIP_WBITS)
+        async for chunk in self._chunks():
+            if compressed := compressor.compress(chunk):
+                yield compressed
+        yield compressor.flush()
@@ -0,0 +1,16 @@
+from app.application.graph.loader import BatchLoader, GraphLoader
+from app.application.graph.service import (
+    Connections,
+    GraphService,
+    Neighbourhood,
+    PropertyChecker,
+)
+
+__all__ = [
+    "BatchLoader",
+    "Connections",
+    "GraphLoader",
+    "GraphService",
+    "Neighbourhood",
+    "PropertyChecker",
+]
@@ -0,0 +1,108 @@
+"""Request-scoped loading of nodes and edges by id, batched and cached.
+
+Building a response that embeds related entities tends to look up one id
+per item: an edge's source, then its target, then the next edge's source.
+Awaited one by one, that is a query per lookup. A `GraphLoader` instead
+collects every lookup made in the same event-loop tick — for instance by
+the coroutines passed to one `asyncio.gather` — and answers them all with
+a single `GraphRepository.get_nodes` or `get_edges` call, that is one
+`WHERE id = ANY(...)` query. Each id is fetched at most once per loader,
+so repeated ids within a request cost nothing after the first.
+
+A loader holds entities as they were when first loaded; create one per
+request and drop it afterwards.
+"""
+
+import asyncio
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Iterable, Mapping
+
+    from app.domain.graph import Edge, GraphRepository, Node
+
+__all__ = ["BatchLoader", "GraphLoader"]
+
+
+class BatchLoader[V]:
+    """Coalesces the `load` calls made in one event-loop tick into one fetch.
+
+    `fetch` receives distinct ids and maps those it found to their values.
+    Fetches run one at a time under `lock`, as a database session does not
+    allow concurrent queries.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[list[int]], Awaitable[Mapping[int, V]]],
+        *,
+        lock: asyncio.Lock,
+    ) -> None:
+        self._fetch = fetch
+        self._lock = lock
+        self._known: dict[int, asyncio.Future[V | None]] = {}
+        self._pending: dict[int, asyncio.Future[V | None]] = {}
+        self._dispatches: set[asyncio.Task[None]] = set()
+
+    async def load(self, key: int) -> V | None:
+        """Return the value for `key`, or `None` if there is none."""
+        future = self._known.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._known[key] = future
+            if not self._pending:
+                # Runs once every task already scheduled has taken its step.
+                loop.call_soon(self._dispatch)
+            self._pending[key] = future
+        # Shielded, so that a cancelled caller leaves others waiting on `key`.
+        return await asyncio.shield(future)
+
+    async def load_many(self, keys: Iterable[int]) -> list[V | None]:
+        """Return the value for each of `keys`, in order, with one fetch."""
+        return await asyncio.gather(*map(self.load, keys))
+
+    def _dispatch(self) -> None:
+        batch, self._pending = self._pending, {}
+        task = asyncio.get_running_loop().create_task(self._resolve(batch))
+        self._dispatches.add(task)
+        task.add_done_callback(self._dispatches.discard)
+
+    async def _resolve(self, batch: dict[int, asyncio.Future[V | None]]) -> None:
+        try:
+            async with self._lock:
+                found = await self._fetch(list(batch))
+        except Exception as exc:  # handed to every caller waiting on the batch
+            for key, future in batch.items():
+                # Forgotten, so that a later load tries again.
+                del self._known[key]
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        for key, future in batch.items():
+            if not future.done():
+                future.set_result(found.get(key))
+
+
+class GraphLoader:
+    """Batching, caching lookups of nodes and edges for one request."""
+
+    def __init__(self, repository: GraphRepository) -> None:
+        self._repository = repository
+        lock = asyncio.Lock()
+        self.nodes: BatchLoader[Node] = BatchLoader(self._fetch_nodes, lock=lock)
+        self.edges: BatchLoader[Edge] = BatchLoader(self._fetch_edges, lock=lock)
+
+    async def node(self, node_id: int) -> Node | None:
+        """Return a node, or `None` if it does not exist."""
+        return await self.nodes.load(node_id)
+
+    async def edge(self, edge_id: int) -> Edge | None:
+        """Return an edge, or `None` if it does not exist."""
+        return await self.edges.load(edge_id)
+
+    async def _fetch_nodes(self, node_ids: list[int]) -> dict[int, Node]:
+        return {node.id: node for node in await self._repository.get_nodes(node_ids)}
+
+    async def _fetch_edges(self, edge_ids: list[int]) -> dict[int, Edge]:
+        return {edge.id: edge for edge in await self._repository.get_edges(edge_ids)}
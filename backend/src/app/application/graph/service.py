@@ -0,0 +1,365 @@
+"""Graph use cases: storing nodes/edges and exploring neighbourhoods."""
+
+from collections import Counter
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Protocol
+
+from app.domain.graph import (
+    Direction,
+    EdgeNotFoundError,
+    InvalidBatchError,
+    NodeNotFoundError,
+    Path,
+)
+from app.domain.pagination import Page, Position, page_of
+
+from .loader import GraphLoader
+from .paths import find_routes
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+    from app.domain.graph import (
+        BatchEdge,
+        BatchResult,
+        Edge,
+        GraphRepository,
+        Neighbour,
+        NewEdge,
+        NewNode,
+        Node,
+        SearchHit,
+    )
+    from app.domain.pagination import PageRequest
+
+__all__ = ["Connections", "GraphService", "Neighbourhood", "PropertyChecker"]
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class Neighbourhood:
+    """Nodes surrounding an origin node."""
+
+    origin: Node
+    depth: int
+    neighbours: list[Neighbour]
+    truncated: bool
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class Connections:
+    """The shortest paths found between two nodes."""
+
+    origin: Node
+    destination: Node
+    max_depth: int
+    paths: list[Path]
+    truncated: bool
+
+
+class PropertyChecker(Protocol):
+    """Checks new nodes' properties before they are stored."""
+
+    async def check(self, nodes: Sequence[NewNode]) -> None:
+        """Raise if any node's properties are not acceptable for its type."""
+        ...
+
+
+def _check_batch(
+    nodes: Mapping[str, NewNode],
+    edges: Sequence[BatchEdge],
+    *,
+    max_nodes: int,
+    max_edges: int,
+) -> None:
+    if not nodes and not edges:
+        raise InvalidBatchError("The batch is empty")
+    if len(nodes) > max_nodes or len(edges) > max_edges:
+        msg = f"A batch holds at most {max_nodes} nodes and {max_edges} edges"
+        raise InvalidBatchError(msg)
+    keys = Counter(node.key for node in nodes.values() if node.key is not None)
+    if shared := [key for key, count in keys.items() if count > 1]:
+        raise InvalidBatchError(f"Node key used more than once: {shared[0]}")
+    for i, edge in enumerate(edges):
+        for end in (edge.source, edge.target):
+            if isinstance(end, str) and end not in nodes:
+                raise InvalidBatchError(f"Edge {i} refers to unknown node {end!r}")
+
+
+def _node_position(node: Node) -> Position:
+    return Position(node.type, node.id)
+
+
+def _edge_position(edge: Edge) -> Position:
+    return Position(edge.type, edge.id)
+
+
+class GraphService:
+    """Coordinates graph operations on top of a `GraphRepository`."""
+
+    def __init__(
+        self,
+        repository: GraphRepository,
+        *,
+        max_depth: int,
+        max_results: int,
+        search_max_results: int = 50,
+        search_min_similarity: float = 0.4,
+        paths_max_count: int = 10,
+        paths_max_visited: int = 50_000,
+        batch_max_nodes: int = 1000,
+        batch_max_edges: int = 5000,
+        checker: PropertyChecker | None = None,
+    ) -> None:
+        self._repository = repository
+        self._checker = checker
+        self._max_depth = max_depth
+        self._max_results = max_results
+        self._search_max_results = search_max_results
+        self._search_min_similarity = search_min_similarity
+        self._paths_max_count = paths_max_count
+        self._paths_max_visited = paths_max_visited
+        self._batch_max_nodes = batch_max_nodes
+        self._batch_max_edges = batch_max_edges
+
+    def loader(self) -> GraphLoader:
+        """Return a loader batching node and edge lookups, for one request."""
+        return GraphLoader(self._repository)
+
+    async def get_node(self, node_id: int) -> Node:
+        """Return a node.
+
+        Raises:
+            NodeNotFoundError: If the node does not exist.
+        """
+        node = await self._repository.get_node(node_id)
+        if node is None:
+            raise NodeNotFoundError(node_id)
+        return node
+
+    async def create_node(self, node: NewNode) -> Node:
+        """Store a new node.
+
+        Raises:
+            DuplicateNodeKeyError: If the node's key is already in use.
+            InvalidPropertiesError: If the properties do not follow the
+                schema of the node's type.
+        """
+        if self._checker is not None:
+            await self._checker.check([node])
+        return await self._repository.add_node(node)
+
+    async def delete_node(self, node_id: int) -> Node:
+        """Delete a node and every edge touching it.
+
+        Raises:
+            NodeNotFoundError: If the node does not exist.
+        """
+        node = await self._repository.delete_node(node_id)
+        if node is None:
+            raise NodeNotFoundError(node_id)
+        return node
+
+    async def list_nodes(
+        self, page: PageRequest, *, node_type: str | None = None
+    ) -> Page[Node]:
+        """Return a page of nodes, ordered by type then id."""
+        nodes = await self._repository.list_nodes(
+            node_type=node_type, after=page.after, limit=page.limit + 1
+        )
+        return page_of(nodes, page.limit, _node_position)
+
+    async def create_edge(self, edge: NewEdge) -> Edge:
+        """Store a new edge.
+
+        Raises:
+            NodeNotFoundError: If either endpoint does not exist.
+        """
+        return await self._repository.add_edge(edge)
+
+    async def write_batch(
+        self, nodes: Mapping[str, NewNode], edges: Sequence[BatchEdge]
+    ) -> BatchResult:
+        """Store nodes and edges in one transaction.
+
+        `nodes` are keyed by client-chosen references, which edges use as
+        endpoints alongside the ids of stored nodes. A node with a key
+        replaces the stored node with that key, keeping its id.
+
+        Raises:
+            InvalidBatchError: If the batch is empty or over the configured
+                size, two nodes share a key, or an edge uses an unknown
+                reference.
+            NodeNotFoundError: If an edge refers to a stored node that does
+                not exist.
+            InvalidPropertiesError: If a node's properties do not follow the
+                schema of its type.
+        """
+        _check_batch(
+            nodes,
+            edges,
+            max_nodes=self._batch_max_nodes,
+            max_edges=self._batch_max_edges,
+        )
+        if self._checker is not None:
+            await self._checker.check(list(nodes.values()))
+        return await self._repository.write_batch(nodes, edges)
+
+    async def get_edge(self, edge_id: int) -> Edge:
+        """Return an edge.
+
+        Raises:
+            EdgeNotFoundError: If the edge does not exist.
+        """
+        found = await self._repository.get_edges([edge_id])
+        if not found:
+            raise EdgeNotFoundError(edge_id)
+        return found[0]
+
+    async def delete_edge(self, edge_id: int) -> Edge:
+        """Delete an edge.
+
+        Raises:
+            EdgeNotFoundError: If the edge does not exist.
+        """
+        edge = await self._repository.delete_edge(edge_id)
+        if edge is None:
+            raise EdgeNotFoundError(edge_id)
+        return edge
+
+    async def list_edges(
+        self,
+        node_id: int,
+        page: PageRequest,
+        *,
+        direction: Direction = Direction.BOTH,
+        edge_types: Sequence[str] | None = None,
+    ) -> Page[Edge]:
+        """Return a page of the edges touching a node, ordered by type then id.
+
+        Raises:
+            NodeNotFoundError: If the node does not exist.
+        """
+        await self.get_node(node_id)
+        edges = await self._repository.list_edges(
+            node_id,
+            direction=direction,
+            edge_types=edge_types or None,
+            after=page.after,
+            limit=page.limit + 1,
+        )
+        return page_of(edges, page.limit, _edge_position)
+
+    async def neighbourhood(
+        self,
+        node_id: int,
+        *,
+        depth: int = 1,
+        direction: Direction = Direction.BOTH,
+        edge_types: Sequence[str] | None = None,
+    ) -> Neighbourhood:
+        """Return the nodes within `depth` hops of a node.
+
+        The depth is capped at the configured maximum and at most
+        `max_results` neighbours are returned; `truncated` reports whether
+        more were available.
+
+        Raises:
+            NodeNotFoundError: If the origin node does not exist.
+        """
+        origin = await self.get_node(node_id)
+        depth = max(1, min(depth, self._max_depth))
+
+        # Ask for one extra row so truncation can be detected without a count.
+        neighbours = await self._repository.neighbourhood(
+            node_id,
+            depth=depth,
+            direction=direction,
+            edge_types=edge_types or None,
+            limit=self._max_results + 1,
+        )
+        truncated = len(neighbours) > self._max_results
+
+        return Neighbourhood(
+            origin=origin,
+            depth=depth,
+            neighbours=neighbours[: self._max_results],
+            truncated=truncated,
+        )
+
+    async def paths(
+        self,
+        origin_id: int,
+        destination_id: int,
+        *,
+        count: int = 1,
+        max_depth: int | None = None,
+        direction: Direction = Direction.BOTH,
+        edge_types: Sequence[str] | None = None,
+    ) -> Connections:
+        """Return the `count` shortest paths between two nodes, shortest first.
+
+        Paths are at most `max_depth` links long. Both the depth and the
+        count are capped by configuration; `truncated` reports whether the
+        search gave up after `paths_max_visited` nodes, so that shorter or
+        further paths may exist.
+
+        Raises:
+            NodeNotFoundError: If either node does not exist.
+        """
+        ends = {
+            node.id: node
+            for node in await self._repository.get_nodes([origin_id, destination_id])
+        }
+        if missing := [i for i in (origin_id, destination_id) if i not in ends]:
+            raise NodeNotFoundError(*dict.fromkeys(missing))
+        depth = max(1, min(max_depth or self._max_depth, self._max_depth))
+
+        routes, truncated = await find_routes(
+            self._repository,
+            origin_id,
+            destination_id,
+            count=max(1, min(count, self._paths_max_count)),
+            max_length=depth,
+            direction=direction,
+            edge_types=edge_types or None,
+            max_visited=self._paths_max_visited,
+        )
+        nodes = {
+            node.id: node
+            for node in await self._repository.get_nodes(
+                list({i for route in routes for i in route.nodes})
+            )
+        }
+        return Connections(
+            origin=ends[origin_id],
+            destination=ends[destination_id],
+            max_depth=depth,
+            paths=[
+                Path(nodes=[nodes[i] for i in route.nodes], links=list(route.links))
+                for route in routes
+                # A node deleted since the search makes its paths stale.
+                if all(i in nodes for i in route.nodes)
+            ],
+            truncated=truncated,
+        )
+
+    async def search(
+        self,
+        text: str,
+        *,
+        node_type: str | None = None,
+        limit: int | None = None,
+    ) -> list[SearchHit]:
+        """Return the nodes best matching `text`, most relevant first.
+
+        At most `search_max_results` hits are returned.
+        """
+        if not text.strip():
+            return []
+        limit = min(limit or self._search_max_results, self._search_max_results)
+        return await self._repository.search(
+            text,
+            node_type=node_type,
+            limit=limit,
+            min_similarity=self._search_min_similarity,
+        )
@@ -0,0 +1,21 @@
+from app.application.imports.parsers import ImportFormatError
+from app.application.imports.ports import ImportSink, ImportTotals
+from app.application.imports.records import (
+    EdgeRecord,
+    ImportFormat,
+    NodeRecord,
+    RejectedRow,
+)
+from app.application.imports.service import ImportReport, ImportService
+
+__all__ = [
+    "EdgeRecord",
+    "ImportFormat",
+    "ImportFormatError",
+    "ImportReport",
+    "ImportService",
+    "ImportSink",
+    "ImportTotals",
+    "NodeRecord",
+    "RejectedRow",
+]
@@ -0,0 +1,127 @@
+"""Incremental NDJSON and CSV parsers over a stream of byte chunks.
+
+Only the current line (or quoted CSV record) is ever held in memory, so
+arbitrarily large bodies can be imported with a constant footprint.
+"""
+
+import csv
+import json
+from typing import TYPE_CHECKING, Any
+
+from .records import ImportFormat
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, AsyncIterator
+
+__all__ = ["ImportFormatError", "parse"]
+
+type ParsedRow = tuple[int, dict[str, Any] | str]
+"""`(line number, fields)`, or `(line number, error message)` for a bad row."""
+
+
+class ImportFormatError(ValueError):
+    """Raised when the body cannot be parsed at all."""
+
+
+async def _lines(
+    chunks: AsyncIterable[bytes], *, max_line_bytes: int
+) -> AsyncIterator[str]:
+    """Split a byte stream into text lines, tolerating a UTF-8 BOM and CRLF.
+
+    Lines are split before they are decoded, so that `max_line_bytes` limits
+    bytes rather than characters.
+    """
+    encoding = "utf-8-sig"
+    pending = b""
+    async for chunk in chunks:
+        *complete, pending = (pending + chunk).split(b"\n")
+        for line in complete:
+            yield line.removesuffix(b"\r").decode(encoding)
+            encoding = "utf-8"
+        if len(pending) > max_line_bytes:
+            msg = f"line longer than {max_line_bytes} bytes"
+            raise ImportFormatError(msg)
+    if last := pending.removesuffix(b"\r").decode(encoding):
+        yield last
+
+
+async def _ndjson(lines: AsyncIterator[str]) -> AsyncIterator[ParsedRow]:
+    number = 0
+    async for line in lines:
+        number += 1
+        if not line.strip():
+            continue
+        try:
+            fields = json.loads(line)
+        except json.JSONDecodeError as exc:
+            yield number, f"invalid JSON: {exc.msg}"
+            continue
+        if not isinstance(fields, dict):
+            yield number, "expected a JSON object"
+            continue
+        yield number, fields
+
+
+async def _csv_records(
+    lines: AsyncIterator[str], *, max_line_bytes: int
+) -> AsyncIterator[tuple[int, str]]:
+    """Group lines into CSV records, joining quoted fields that span lines."""
+    parts: list[str] = []
+    quotes = size = 0
+    number = start = 0
+    async for line in lines:
+        number += 1
+        if not parts:
+            start = number
+        parts.append(line)
+        # An odd number of quotes means a quoted field continues on the next
+        # line; doubled (escaped) quotes never change the parity.
+        quotes += line.count('"')
+        if quotes % 2 == 0:
+            yield start, "\n".join(parts)
+            parts, quotes, size = [], 0, 0
+            continue
+        # Every line held so far left the record open, so all are counted.
+        size += len(line.encode())
+        if size > max_line_bytes:
+            msg = f"record starting on line {start} is too long"
+            raise ImportFormatError(msg)
+
+    if parts:
+        yield start, "\n".join(parts)
+
+
+async def _csv(
+    lines: AsyncIterator[str], *, max_line_bytes: int
+) -> AsyncIterator[ParsedRow]:
+    header: list[str] | None = None
+    async for start, record in _csv_records(lines, max_line_bytes=max_line_bytes):
+        if not record.strip():
+            continue
+        try:
+            values = next(csv.reader([record], strict=True))
+        except csv.Error as exc:
+            yield start, f"invalid CSV: {exc}"
+            continue
+        if header is None:
+            header = [name.strip().lower() for name in values]
+        elif len(values) != len(header):
+            yield start, f"expected {len(header)} columns, got {len(values)}"
+        else:
+            yield start, dict(zip(header, values, strict=True))
+
+
+def parse(
+    chunks: AsyncIterable[bytes], fmt: ImportFormat, *, max_line_bytes: int
+) -> AsyncIterator[ParsedRow]:
+    """Parse a streamed body into rows of fields.
+
+    Raises:
+        ImportFormatError: While iterating, if a line exceeds `max_line_bytes`.
+    """
+    lines = _lines(chunks, max_line_bytes=max_line_bytes)
+    match fmt:
+        case ImportFormat.NDJSON:
+            return _ndjson(lines)
+        case ImportFormat.CSV:
+            return _csv(lines, max_line_bytes=max_line_bytes)
@@ -0,0 +1,42 @@
+"""Interfaces the import use case needs from storage."""
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Protocol
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from .records import EdgeRecord, NodeRecord
+
+__all__ = ["ImportSink", "ImportTotals"]
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ImportTotals:
+    """What an import sink wrote once all rows were staged."""
+
+    nodes: int
+    edges: int
+    unresolved_edge_lines: list[int]
+    unresolved_edges: int
+
+
+class ImportSink(Protocol):
+    """Stages batches of rows and writes them to the graph in one go."""
+
+    async def add_nodes(self, records: Sequence[NodeRecord]) -> None:
+        """Stage a batch of node rows."""
+        ...
+
+    async def add_edges(self, records: Sequence[EdgeRecord]) -> None:
+        """Stage a batch of edge rows."""
+        ...
+
+    async def finish(self, *, error_limit: int) -> ImportTotals:
+        """Write the staged rows, resolving edge endpoints by node key.
+
+        Nodes with a key replace any existing node with the same key; edges
+        whose endpoints cannot be resolved are skipped and counted, with up
+        to `error_limit` of their line numbers returned.
+        """
+        ...
@@ -0,0 +1,133 @@
+"""Rows accepted by a bulk import."""
+
+import json
+from dataclasses import dataclass, field
+from enum import StrEnum, auto
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+__all__ = [
+    "EdgeRecord",
+    "ImportFormat",
+    "NodeRecord",
+    "RejectedRow",
+    "to_record",
+]
+
+
+class ImportFormat(StrEnum):
+    """Supported import body formats."""
+
+    NDJSON = auto()
+    CSV = auto()
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class NodeRecord:
+    """A node row; `key` lets edges in the same or later imports refer to it."""
+
+    line: int
+    key: str | None
+    type: str
+    name: str
+    properties: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class EdgeRecord:
+    """An edge row whose endpoints are node keys."""
+
+    line: int
+    source: str
+    target: str
+    type: str
+    properties: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(frozen=True, slots=True)
+class RejectedRow:
+    """A row that could not be imported, and why."""
+
+    line: int
+    reason: str
+
+
+_NODE_FIELDS = frozenset({"kind", "key", "type", "name", "properties"})
+_EDGE_FIELDS = frozenset({"kind", "source", "target", "type", "properties"})
+
+
+def _text(fields: Mapping[str, Any], name: str) -> str | None:
+    value = fields.get(name)
+    if value is None or value == "":
+        return None
+    return str(value)
+
+
+def _required(fields: Mapping[str, Any], name: str) -> str:
+    value = _text(fields, name)
+    if value is None:
+        msg = f"missing {name!r}"
+        raise ValueError(msg)
+    return value
+
+
+def _properties(fields: Mapping[str, Any], known: frozenset[str]) -> dict[str, Any]:
+    """Merge the `properties` object with any extra columns/fields."""
+    properties = fields.get("properties") or {}
+    if isinstance(properties, str):
+        try:
+            properties = json.loads(properties)
+        except json.JSONDecodeError as exc:
+            msg = f"'properties' is not valid JSON: {exc.msg}"
+            raise ValueError(msg) from exc
+    if not isinstance(properties, dict):
+        msg = "'properties' must be an object"
+        raise ValueError(msg)
+
+    extra = {
+        name: value
+        for name, value in fields.items()
+        if name not in known and value not in (None, "")
+    }
+    return {**properties, **extra}
+
+
+def to_record(line: int, fields: Mapping[str, Any]) -> NodeRecord | EdgeRecord:
+    """Turn one parsed row into a node or edge record.
+
+    Rows are edges when `kind` says so or, without a `kind`, when they name a
+    `source` or `target`. Unknown fields become properties, so spreadsheet
+    columns can be imported as-is.
+
+    Raises:
+        ValueError: If the row is incomplete or malformed.
+    """
+    kind = _text(fields, "kind")
+    if kind is None:
+        is_edge = _text(fields, "source") is not None or (
+            _text(fields, "target") is not None
+        )
+        kind = "edge" if is_edge else "node"
+
+    match kind.lower():
+        case "node":
+            return NodeRecord(
+                line=line,
+                key=_text(fields, "key"),
+                type=_required(fields, "type"),
+                name=_required(fields, "name"),
+                properties=_properties(fields, _NODE_FIELDS),
+            )
+        case "edge":
+            return EdgeRecord(
+                line=line,
+                source=_required(fields, "source"),
+                target=_required(fields, "target"),
+                type=_required(fields, "type"),
+                properties=_properties(fields, _EDGE_FIELDS),
+            )
+        case _:
+            msg = f"unknown kind {kind!r}"
+            raise ValueError(msg)
@@ -0,0 +1,136 @@
+"""Bulk import use case."""
+
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from .parsers import parse
+from .records import EdgeRecord, NodeRecord, RejectedRow, to_record
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable
+
+    from .ports import ImportSink
+    from .records import ImportFormat
+
+__all__ = ["ImportReport", "ImportService"]
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ImportReport:
+    """Outcome of a bulk import."""
+
+    rows: int
+    nodes: int
+    edges: int
+    unresolved_edges: int
+    rejected: int
+    errors: list[RejectedRow] = field(default_factory=list)
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        """Import throughput over the whole run."""
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
+@dataclass(slots=True)
+class _Rejections:
+    limit: int
+    count: int = 0
+    rows: list[RejectedRow] = field(default_factory=list)
+
+    def add(self, line: int, reason: str) -> None:
+        self.count += 1
+        if len(self.rows) < self.limit:
+            self.rows.append(RejectedRow(line, reason))
+
+
+def _record(
+    line: int, fields: dict[str, Any] | str, rejections: _Rejections
+) -> NodeRecord | EdgeRecord | None:
+    if isinstance(fields, str):
+        rejections.add(line, fields)
+        return None
+    try:
+        return to_record(line, fields)
+    except ValueError as exc:
+        rejections.add(line, str(exc))
+        return None
+
+
+class ImportService:
+    """Streams rows from a body into an `ImportSink` in fixed-size batches."""
+
+    def __init__(
+        self,
+        sink: ImportSink,
+        *,
+        batch_size: int,
+        max_errors: int,
+        max_line_bytes: int,
+    ) -> None:
+        self._sink = sink
+        self._batch_size = batch_size
+        self._max_errors = max_errors
+        self._max_line_bytes = max_line_bytes
+
+    async def run(
+        self, chunks: AsyncIterable[bytes], fmt: ImportFormat
+    ) -> ImportReport:
+        """Import every row of a streamed body.
+
+        Invalid rows are skipped and reported. The sink writes everything in
+        a single step at the end, so an import that fails part-way through
+        writes nothing.
+
+        Raises:
+            ImportFormatError: If the body cannot be parsed at all.
+        """
+        start = time.perf_counter()
+        rejections = _Rejections(self._max_errors)
+        nodes: list[NodeRecord] = []
+        edges: list[EdgeRecord] = []
+        rows = 0
+
+        async for line, fields in parse(
+            chunks, fmt, max_line_bytes=self._max_line_bytes
+        ):
+            rows += 1
+            match _record(line, fields, rejections):
+                case NodeRecord() as node:
+                    nodes.append(node)
+                    if len(nodes) >= self._batch_size:
+                        await self._sink.add_nodes(nodes)
+                        nodes = []
+                case EdgeRecord() as edge:
+                    edges.append(edge)
+                    if len(edges) >= self._batch_size:
+                        await self._sink.add_edges(edges)
+                        edges = []
+
+        if nodes:
+            await self._sink.add_nodes(nodes)
+        if edges:
+            await self._sink.add_edges(edges)
+
+        totals = await self._sink.finish(
+            error_limit=self._max_errors - len(rejections.rows)
+        )
+        errors = [
+            *rejections.rows,
+            *(
+                RejectedRow(line, "edge endpoint not found")
+                for line in totals.unresolved_edge_lines
+            ),
+        ]
+
+        return ImportReport(
+            rows=rows,
+            nodes=totals.nodes,
+            edges=totals.edges,
+            unresolved_edges=totals.unresolved_edges,
+            rejected=rejections.count,
+            errors=errors,
+            seconds=time.perf_counter() - start,
+        )
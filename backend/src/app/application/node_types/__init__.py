@@ -0,0 +1,15 @@
+from app.application.node_types.service import NodeTypeService
+from app.application.node_types.validators import (
+    ValidatorCache,
+    compile_validator,
+    get_validators,
+    init_validators,
+)
+
+__all__ = [
+    "NodeTypeService",
+    "ValidatorCache",
+    "compile_validator",
+    "get_validators",
+    "init_validators",
+]
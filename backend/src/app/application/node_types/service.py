@@ -0,0 +1,129 @@
+"""Node type use cases: declaring typed properties and checking nodes."""
+
+import re
+from collections import Counter
+from typing import TYPE_CHECKING
+
+from app.domain.node_types import (
+    InvalidNodeTypeError,
+    InvalidPropertiesError,
+    NodeTypeNotFoundError,
+    NodeTypeSchema,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from app.domain.graph import NewNode
+    from app.domain.node_types import FieldIndex, FieldSpec, NodeTypeRepository
+
+    from .validators import ValidatorCache
+
+__all__ = ["NodeTypeService"]
+
+# Names end up in index names, so they are kept to plain identifiers.
+_NAME = re.compile(r"[a-z][a-z0-9_]{0,47}")
+
+
+class NodeTypeService:
+    """Keeps node type schemas and checks nodes against them.
+
+    Nodes of a type without a schema may have any properties.
+    """
+
+    def __init__(
+        self,
+        repository: NodeTypeRepository,
+        validators: ValidatorCache,
+        *,
+        max_fields: int,
+    ) -> None:
+        self._repository = repository
+        self._validators = validators
+        self._max_fields = max_fields
+
+    def _check_definition(self, name: str, fields: Sequence[FieldSpec]) -> None:
+        if not _NAME.fullmatch(name):
+            msg = f"Invalid node type name {name!r}: use a-z, 0-9 and _"
+            raise InvalidNodeTypeError(msg)
+        if len(fields) > self._max_fields:
+            msg = f"A node type declares at most {self._max_fields} fields"
+            raise InvalidNodeTypeError(msg)
+        for spec in fields:
+            if not _NAME.fullmatch(spec.name):
+                msg = f"Invalid field name {spec.name!r}: use a-z, 0-9 and _"
+                raise InvalidNodeTypeError(msg)
+        names = Counter(spec.name for spec in fields)
+        if repeated := [field for field, count in names.items() if count > 1]:
+            raise InvalidNodeTypeError(f"Field declared more than once: {repeated[0]}")
+
+    async def define(self, name: str, fields: Sequence[FieldSpec]) -> NodeTypeSchema:
+        """Create or redefine a node type.
+
+        Indexes for its filterable fields are built in the background.
+
+        Raises:
+            InvalidNodeTypeError: If a name is not allowed, a field is
+                repeated, or there are too many fields.
+        """
+        self._check_definition(name, fields)
+        return await self._repository.save(
+            NodeTypeSchema(name=name, fields=tuple(fields))
+        )
+
+    async def get(self, name: str) -> NodeTypeSchema:
+        """Return a node type's schema.
+
+        Raises:
+            NodeTypeNotFoundError: If the type has no schema.
+        """
+        schema = await self._repository.get(name)
+        if schema is None:
+            raise NodeTypeNotFoundError(name)
+        return schema
+
+    async def list_types(self) -> list[NodeTypeSchema]:
+        """Return every node type schema, ordered by name."""
+        return await self._repository.list_types()
+
+    async def delete(self, name: str) -> NodeTypeSchema:
+        """Delete a node type's schema; its indexes are dropped in the background.
+
+        Raises:
+            NodeTypeNotFoundError: If the type has no schema.
+        """
+        schema = await self._repository.delete(name)
+        if schema is None:
+            raise NodeTypeNotFoundError(name)
+        return schema
+
+    async def indexes(self, name: str) -> list[FieldIndex]:
+        """Return the state of a node type's field indexes.
+
+        Raises:
+            NodeTypeNotFoundError: If the type has no schema.
+        """
+        await self.get(name)
+        return await self._repository.indexes(name)
+
+    async def check(self, nodes: Sequence[NewNode]) -> None:
+        """Check each node's properties against its type's schema.
+
+        The schemas of every type involved are read in one query.
+
+        Raises:
+            InvalidPropertiesError: For the first node that does not follow
+                its type's schema.
+        """
+        types = list(dict.fromkeys(node.type for node in nodes))
+        schemas = {
+            schema.name: schema for schema in await self._repository.get_many(types)
+        }
+        if not schemas:
+            return
+        for node in nodes:
+            schema = schemas.get(node.type)
+            if schema is None:
+                continue
+            if problems := self._validators.check(schema, node.properties):
+                raise InvalidPropertiesError(node.type, problems)
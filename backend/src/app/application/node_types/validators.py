@@ -0,0 +1,126 @@
+"""Property validators compiled from node type schemas, once per version.
+
+Building a pydantic model means generating and compiling its core schema,
+which costs far more than validating with it. Each worker keeps the models
+it has built under `(type name, version)`; redefining a type bumps the
+version, so a stale validator is never used and simply ages out.
+"""
+
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    StrictBool,
+    StrictFloat,
+    StrictInt,
+    StrictStr,
+    ValidationError,
+    create_model,
+)
+
+from app.domain.node_types import FieldKind
+
+if TYPE_CHECKING:
+    from app.domain.node_types import NodeTypeSchema
+    from app.shared.config.node_types import NodeTypeSettings
+
+__all__ = [
+    "ValidatorCache",
+    "compile_validator",
+    "get_validators",
+    "init_validators",
+]
+
+_SCALAR = StrictStr | StrictInt | StrictFloat | StrictBool
+_ANNOTATIONS: dict[FieldKind, Any] = {
+    FieldKind.STRING: StrictStr,
+    FieldKind.INTEGER: StrictInt,
+    FieldKind.NUMBER: StrictInt | StrictFloat,
+    FieldKind.BOOLEAN: StrictBool,
+    FieldKind.LIST: list[_SCALAR],
+}
+
+
+def compile_validator(schema: NodeTypeSchema) -> type[BaseModel]:
+    """Build the model checking properties against `schema`.
+
+    Undeclared properties are allowed, as enrichment stores its results
+    alongside the declared ones. Values are checked strictly: `"1977"` is
+    not an integer.
+    """
+    fields: dict[str, Any] = {}
+    for i, spec in enumerate(schema.fields):
+        annotation = _ANNOTATIONS[spec.kind]
+        # Aliased, so that a field may be called `json` or `copy` without
+        # shadowing the model's own attributes.
+        if spec.required:
+            fields[f"f{i}"] = (annotation, Field(alias=spec.name))
+        else:
+            fields[f"f{i}"] = (annotation | None, Field(None, alias=spec.name))
+    return create_model(
+        f"{schema.name}_properties",
+        __config__=ConfigDict(extra="allow"),
+        **fields,
+    )
+
+
+def _problems(error: ValidationError) -> list[str]:
+    return [
+        f"{'.'.join(map(str, problem['loc']))}: {problem['msg']}"
+        for problem in error.errors(include_url=False)
+    ]
+
+
+class ValidatorCache:
+    """Least recently used property validators, keyed by `(name, version)`."""
+
+    def __init__(self, *, capacity: int) -> None:
+        self.capacity = capacity
+        self._validators: OrderedDict[tuple[str, int], type[BaseModel]] = OrderedDict()
+        self.compiled = 0
+
+    def validator(self, schema: NodeTypeSchema) -> type[BaseModel]:
+        """Return the validator for `schema`, compiling it if new."""
+        key = (schema.name, schema.version)
+        validator = self._validators.get(key)
+        if validator is not None:
+            self._validators.move_to_end(key)
+            return validator
+
+        self.compiled += 1
+        validator = compile_validator(schema)
+        if self.capacity:
+            self._validators[key] = validator
+            if len(self._validators) > self.capacity:
+                self._validators.popitem(last=False)
+        return validator
+
+    def check(self, schema: NodeTypeSchema, properties: dict[str, Any]) -> list[str]:
+        """Return what is wrong with `properties` under `schema`, if anything."""
+        try:
+            self.validator(schema).model_validate(properties)
+        except ValidationError as exc:
+            return _problems(exc)
+        return []
+
+
+_validators = ValidatorCache(capacity=0)
+
+
+def init_validators(settings: NodeTypeSettings) -> ValidatorCache:
+    """Create the worker's validator cache, replacing any previous one."""
+    global _validators
+    _validators = ValidatorCache(capacity=settings.validator_cache_size)
+    return _validators
+
+
+def get_validators() -> ValidatorCache:
+    """Return the worker's validator cache.
+
+    Until `bootstrap.startup` has run it has no capacity, so every check
+    compiles its validator afresh.
+    """
+    return _validators
@@ -0,0 +1,25 @@
+from app.application.photos.derivatives import (
+    DerivativeError,
+    DerivativeService,
+    PhotoNotFoundError,
+    UnavailableDerivativeError,
+)
+from app.application.photos.ports import ImageRenderer, PhotoStorage, StagedPhoto
+from app.application.photos.service import (
+    PhotoService,
+    PhotoTooLargeError,
+    UnsupportedPhotoError,
+)
+
+__all__ = [
+    "DerivativeError",
+    "DerivativeService",
+    "ImageRenderer",
+    "PhotoNotFoundError",
+    "PhotoService",
+    "PhotoStorage",
+    "PhotoTooLargeError",
+    "StagedPhoto",
+    "UnavailableDerivativeError",
+    "UnsupportedPhotoError",
+]
@@ -0,0 +1,94 @@
+"""Resized copies of stored photos, made once and kept."""
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+    from app.domain.photos import DerivativeFormat
+
+    from .ports import ImageRenderer, PhotoStorage
+
+__all__ = [
+    "DerivativeError",
+    "DerivativeService",
+    "PhotoNotFoundError",
+    "UnavailableDerivativeError",
+]
+
+
+class PhotoNotFoundError(LookupError):
+    """Raised when no photo is stored under a digest."""
+
+    def __init__(self, digest: str) -> None:
+        self.digest = digest
+        super().__init__(f"photo {digest} not found")
+
+
+class UnavailableDerivativeError(ValueError):
+    """Raised when a derivative size or format is not offered."""
+
+
+class DerivativeError(ValueError):
+    """Raised when a photo cannot be decoded to make a derivative."""
+
+
+class DerivativeService:
+    """Makes thumbnails and web-sized copies of photos on demand.
+
+    Only the configured `sizes` (the longest side, in pixels) and `formats`
+    are offered, so the number of files per photo is bounded. Each
+    derivative is rendered at most once and then served from disk.
+    """
+
+    def __init__(
+        self,
+        storage: PhotoStorage,
+        renderer: ImageRenderer,
+        *,
+        sizes: Iterable[int],
+        formats: Iterable[DerivativeFormat],
+        quality: int,
+    ) -> None:
+        self._storage = storage
+        self._renderer = renderer
+        self._sizes = frozenset(sizes)
+        self._formats = list(formats)
+        self._quality = quality
+
+    async def derivative(
+        self, digest: str, *, size: int, fmt: DerivativeFormat
+    ) -> Path:
+        """Return the file of a photo's derivative, rendering it if needed.
+
+        Raises:
+            UnavailableDerivativeError: If `size` or `fmt` is not offered.
+            PhotoNotFoundError: If no photo has this digest.
+            DerivativeError: If the photo could not be decoded.
+        """
+        if size not in self._sizes or fmt not in self._formats:
+            msg = f"derivatives are offered at sizes {sorted(self._sizes)} in " + (
+                ", ".join(self._formats)
+            )
+            raise UnavailableDerivativeError(msg)
+        target = self._storage.derivative_path(digest, size=size, fmt=fmt)
+        if target.exists():
+            return target
+        source = self._storage.path(digest)
+        if not source.exists():
+            raise PhotoNotFoundError(digest)
+        await self._renderer.render(
+            source, target, size=size, fmt=fmt, quality=self._quality
+        )
+        return target
+
+    def prefetch(self, digest: str) -> None:
+        """Start rendering every size in the preferred format, in the background."""
+        source = self._storage.path(digest)
+        fmt = self._formats[0]
+        for size in sorted(self._sizes):
+            target = self._storage.derivative_path(digest, size=size, fmt=fmt)
+            self._renderer.schedule(
+                source, target, size=size, fmt=fmt, quality=self._quality
+            )
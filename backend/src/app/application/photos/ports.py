@@ -0,0 +1,79 @@
+"""Interfaces the photo service needs from storage."""
+
+from typing import TYPE_CHECKING, Protocol
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from app.domain.photos import DerivativeFormat
+
+__all__ = ["ImageRenderer", "PhotoStorage", "StagedPhoto"]
+
+
+class StagedPhoto(Protocol):
+    """An upload being written, not yet visible under its digest."""
+
+    async def write(self, chunk: bytes) -> None:
+        """Append a chunk of the upload."""
+        ...
+
+    async def commit(self, digest: str) -> bool:
+        """Store the upload under `digest`.
+
+        Returns `False` if a photo with that digest was already stored, in
+        which case the existing file is kept and the upload discarded, if
+        any of it was written.
+        """
+        ...
+
+    async def discard(self) -> None:
+        """Throw the upload away."""
+        ...
+
+
+class PhotoStorage(Protocol):
+    """Content-addressed photo storage."""
+
+    def stage(self) -> StagedPhoto:
+        """Start writing a new upload."""
+        ...
+
+    def path(self, digest: str) -> Path:
+        """Where the photo with this digest is (or would be) stored."""
+        ...
+
+    def derivative_path(self, digest: str, *, size: int, fmt: DerivativeFormat) -> Path:
+        """Where a derivative of the photo is (or would be) kept."""
+        ...
+
+
+class ImageRenderer(Protocol):
+    """Resizes images away from the event loop."""
+
+    async def render(
+        self,
+        source: Path,
+        target: Path,
+        *,
+        size: int,
+        fmt: DerivativeFormat,
+        quality: int,
+    ) -> None:
+        """Write `source` scaled to fit `size` x `size` to `target` as `fmt`.
+
+        Raises:
+            DerivativeError: If `source` could not be decoded.
+        """
+        ...
+
+    def schedule(
+        self,
+        source: Path,
+        target: Path,
+        *,
+        size: int,
+        fmt: DerivativeFormat,
+        quality: int,
+    ) -> None:
+        """Render in the background; failures are logged, not raised."""
+        ...
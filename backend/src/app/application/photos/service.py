@@ -0,0 +1,112 @@
+"""Streaming photo uploads into content-addressed storage."""
+
+import asyncio
+import hashlib
+import os
+from typing import TYPE_CHECKING
+
+from app.domain.photos import SNIFF_BYTES, Photo, sniff_media_type
+
+from .derivatives import PhotoNotFoundError
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable
+    from pathlib import Path
+
+    from .derivatives import DerivativeService
+    from .ports import PhotoStorage
+
+__all__ = ["PhotoService", "PhotoTooLargeError", "UnsupportedPhotoError"]
+
+
+class PhotoTooLargeError(ValueError):
+    """Raised when an upload exceeds the configured size limit."""
+
+
+class UnsupportedPhotoError(ValueError):
+    """Raised when an upload is not an image in a supported format."""
+
+
+def _media_type(head: bytes) -> str:
+    media_type = sniff_media_type(head)
+    if media_type is None:
+        msg = "expected a JPEG, PNG, GIF, WebP, HEIF or AVIF image"
+        raise UnsupportedPhotoError(msg)
+    return media_type
+
+
+def _head(path: Path) -> tuple[bytes, int]:
+    with path.open("rb") as file:
+        return file.read(SNIFF_BYTES), os.fstat(file.fileno()).st_size
+
+
+class PhotoService:
+    """Stores uploaded photos under the SHA-256 of their content.
+
+    The body is hashed while it streams to storage chunk by chunk, so an
+    upload never has to fit in memory. Uploading the same photo twice stores
+    it once. Given `derivatives`, new photos have their derivatives rendered
+    in the background straight after upload.
+    """
+
+    def __init__(
+        self,
+        storage: PhotoStorage,
+        *,
+        max_bytes: int,
+        derivatives: DerivativeService | None = None,
+    ) -> None:
+        self._storage = storage
+        self._max_bytes = max_bytes
+        self._derivatives = derivatives
+
+    async def upload(self, chunks: AsyncIterable[bytes]) -> tuple[Photo, bool]:
+        """Store a photo, returning it and whether it was new.
+
+        Raises:
+            PhotoTooLargeError: If the body is larger than `max_bytes`.
+            UnsupportedPhotoError: If the body is not a supported image.
+        """
+        digest = hashlib.sha256()
+        head = b""
+        media_type: str | None = None
+        size = 0
+        staged = self._storage.stage()
+        try:
+            async for chunk in chunks:
+                size += len(chunk)
+                if size > self._max_bytes:
+                    msg = f"photo larger than {self._max_bytes} bytes"
+                    raise PhotoTooLargeError(msg)
+                if media_type is None:
+                    # Reject anything that is not an image before storing much.
+                    head += chunk[: SNIFF_BYTES - len(head)]
+                    if len(head) == SNIFF_BYTES:
+                        media_type = _media_type(head)
+                digest.update(chunk)
+                await staged.write(chunk)
+            if media_type is None:
+                media_type = _media_type(head)
+        except BaseException:
+            await staged.discard()
+            raise
+
+        created = await staged.commit(digest.hexdigest())
+        photo = Photo(digest=digest.hexdigest(), size=size, media_type=media_type)
+        if created and self._derivatives is not None:
+            self._derivatives.prefetch(photo.digest)
+        return photo, created
+
+    async def find(self, digest: str) -> tuple[Photo, Path]:
+        """Return a stored photo and the file holding it.
+
+        Raises:
+            PhotoNotFoundError: If no photo has this digest.
+        """
+        path = self._storage.path(digest)
+        try:
+            head, size = await asyncio.to_thread(_head, path)
+        except FileNotFoundError:
+            raise PhotoNotFoundError(digest) from None
+        media_type = sniff_media_type(head) or "application/octet-stream"
+        return Photo(digest=digest, size=size, media_type=media_type), path
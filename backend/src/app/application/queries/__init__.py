@@ -0,0 +1,4 @@
+from app.application.queries.parser import parse_filter
+from app.application.queries.service import QueryService
+
+__all__ = ["QueryService", "parse_filter"]
@@ -0,0 +1,172 @@
+"""Parse saved-query filter documents into `Filter` trees.
+
+The JSON form of each filter is an object with a single key:
+
+    {"type": "band"}
+    {"property": "formed", "op": "gte", "value": 1990}
+    {"edge": {"direction": "out", "type": "played_at", "node": {...}}}
+    {"path": [{"type": "member_of"}, {"type": "played_at"}], "node": {...}}
+    {"all": [...]}, {"any": [...]}, {"not": {...}}
+
+`op` defaults to `eq`, `direction` to `out`; an edge or step without a
+`type` follows edges of any type, and `node` may be left out.
+"""
+
+from enum import StrEnum
+from typing import TYPE_CHECKING, Any, cast
+
+from app.domain.graph import Direction
+from app.domain.queries import (
+    AllOf,
+    AnyOf,
+    InvalidFilterError,
+    Not,
+    PathExists,
+    PathStep,
+    PropertyIs,
+    PropertyOp,
+    TypeIs,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from app.domain.queries import Filter
+
+__all__ = ["parse_filter"]
+
+
+def _text(value: object, path: str) -> str:
+    if not isinstance(value, str) or not value:
+        raise InvalidFilterError(path, "expected a non-empty string")
+    return value
+
+
+def _choice[E: StrEnum](enum: type[E], value: object, path: str) -> E:
+    if isinstance(value, str):
+        try:
+            return enum(value)
+        except ValueError:
+            pass
+    choices = ", ".join(enum)
+    raise InvalidFilterError(path, f"expected one of {choices}")
+
+
+def _object(value: object, path: str, keys: set[str]) -> dict[str, Any]:
+    if not isinstance(value, dict):
+        raise InvalidFilterError(path, "expected an object")
+    if unknown := value.keys() - keys:
+        raise InvalidFilterError(path, f"unknown key {sorted(unknown)[0]!r}")
+    return value
+
+
+class _Parser:
+    """Walks a document once, counting terms against the limits."""
+
+    def __init__(self, *, max_terms: int, max_path_length: int) -> None:
+        self._max_terms = max_terms
+        self._max_path_length = max_path_length
+        self._terms = 0
+        self._forms: dict[str, Callable[[dict[str, Any], str], Filter]] = {
+            "type": self._type,
+            "property": self._property,
+            "edge": self._edge,
+            "path": self._path,
+            "all": self._all,
+            "any": self._any,
+            "not": self._not,
+        }
+
+    def filter(self, value: object, path: str) -> Filter:
+        found = value.keys() & self._forms if isinstance(value, dict) else set()
+        if len(found) != 1:
+            forms = ", ".join(self._forms)
+            raise InvalidFilterError(path, f"expected an object with one of {forms}")
+        self._terms += 1
+        if self._terms > self._max_terms:
+            raise InvalidFilterError(path, f"more than {self._max_terms} terms")
+        [form] = found
+        return self._forms[form](cast("dict[str, Any]", value), path)
+
+    def _type(self, value: dict[str, Any], path: str) -> Filter:
+        _object(value, path, {"type"})
+        return TypeIs(_text(value["type"], f"{path}.type"))
+
+    def _property(self, value: dict[str, Any], path: str) -> Filter:
+        _object(value, path, {"property", "op", "value"})
+        name = _text(value["property"], f"{path}.property")
+        op = _choice(PropertyOp, value.get("op", PropertyOp.EQ), f"{path}.op")
+        if op is PropertyOp.EXISTS:
+            return PropertyIs(name, op)
+        if "value" not in value:
+            raise InvalidFilterError(path, f"{op} needs a value")
+        if op is PropertyOp.IN and not isinstance(value["value"], list):
+            raise InvalidFilterError(f"{path}.value", "expected a list")
+        if op is PropertyOp.CONTAINS and isinstance(value["value"], list | dict):
+            raise InvalidFilterError(f"{path}.value", "expected a single value")
+        return PropertyIs(name, op, value["value"])
+
+    def _step(self, value: object, path: str, keys: set[str]) -> PathStep:
+        step = _object(value, path, keys)
+        direction = _choice(
+            Direction, step.get("direction", Direction.OUT), f"{path}.direction"
+        )
+        edge_type = step.get("type")
+        if edge_type is not None:
+            edge_type = _text(edge_type, f"{path}.type")
+        return PathStep(direction, edge_type)
+
+    def _end(self, value: dict[str, Any], path: str) -> Filter | None:
+        if value.get("node") is None:
+            return None
+        return self.filter(value["node"], f"{path}.node")
+
+    def _edge(self, value: dict[str, Any], path: str) -> Filter:
+        _object(value, path, {"edge"})
+        edge = value["edge"]
+        step = self._step(edge, f"{path}.edge", {"direction", "type", "node"})
+        return PathExists((step,), self._end(edge, f"{path}.edge"))
+
+    def _path(self, value: dict[str, Any], path: str) -> Filter:
+        _object(value, path, {"path", "node"})
+        steps = value["path"]
+        if not isinstance(steps, list) or not steps:
+            raise InvalidFilterError(f"{path}.path", "expected a non-empty list")
+        if len(steps) > self._max_path_length:
+            limit = self._max_path_length
+            raise InvalidFilterError(f"{path}.path", f"longer than {limit} steps")
+        parsed = tuple(
+            self._step(step, f"{path}.path[{i}]", {"direction", "type"})
+            for i, step in enumerate(steps)
+        )
+        return PathExists(parsed, self._end(value, path))
+
+    def _filters(self, value: object, path: str) -> tuple[Filter, ...]:
+        if not isinstance(value, list) or not value:
+            raise InvalidFilterError(path, "expected a non-empty list")
+        return tuple(self.filter(item, f"{path}[{i}]") for i, item in enumerate(value))
+
+    def _all(self, value: dict[str, Any], path: str) -> Filter:
+        _object(value, path, {"all"})
+        return AllOf(self._filters(value["all"], f"{path}.all"))
+
+    def _any(self, value: dict[str, Any], path: str) -> Filter:
+        _object(value, path, {"any"})
+        return AnyOf(self._filters(value["any"], f"{path}.any"))
+
+    def _not(self, value: dict[str, Any], path: str) -> Filter:
+        _object(value, path, {"not"})
+        return Not(self.filter(value["not"], f"{path}.not"))
+
+
+def parse_filter(
+    document: object, *, max_terms: int = 50, max_path_length: int = 4
+) -> Filter:
+    """Parse a filter document.
+
+    Raises:
+        InvalidFilterError: If the document is not a valid filter, or has more
+            than `max_terms` filters or a path longer than `max_path_length`.
+    """
+    parser = _Parser(max_terms=max_terms, max_path_length=max_path_length)
+    return parser.filter(document, "$")
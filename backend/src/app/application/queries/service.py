@@ -0,0 +1,96 @@
+"""Saved query use cases: storing filters and running them."""
+
+from typing import TYPE_CHECKING, Any
+
+from app.domain.pagination import Page, Position, page_of
+from app.domain.queries import NewSavedQuery, SavedQueryNotFoundError
+
+from .parser import parse_filter
+
+if TYPE_CHECKING:
+    from app.domain.graph import Node
+    from app.domain.pagination import PageRequest
+    from app.domain.queries import (
+        Filter,
+        FilterRunner,
+        SavedQuery,
+        SavedQueryRepository,
+    )
+
+__all__ = ["QueryService"]
+
+
+class QueryService:
+    """Stores saved queries and runs them over the graph."""
+
+    def __init__(
+        self,
+        queries: SavedQueryRepository,
+        runner: FilterRunner,
+        *,
+        max_terms: int,
+        max_path_length: int,
+    ) -> None:
+        self._queries = queries
+        self._runner = runner
+        self._max_terms = max_terms
+        self._max_path_length = max_path_length
+
+    def _parse(self, document: object) -> Filter:
+        return parse_filter(
+            document, max_terms=self._max_terms, max_path_length=self._max_path_length
+        )
+
+    async def create(self, name: str, document: dict[str, Any]) -> SavedQuery:
+        """Store a named filter.
+
+        Raises:
+            InvalidFilterError: If the filter is not valid.
+        """
+        self._parse(document)
+        return await self._queries.add(NewSavedQuery(name=name, filter=document))
+
+    async def get(self, query_id: int) -> SavedQuery:
+        """Return a saved query.
+
+        Raises:
+            SavedQueryNotFoundError: If the query does not exist.
+        """
+        query = await self._queries.get(query_id)
+        if query is None:
+            raise SavedQueryNotFoundError(query_id)
+        return query
+
+    async def list_queries(self, page: PageRequest) -> Page[SavedQuery]:
+        """Return a page of saved queries, ordered by name then id."""
+        queries = await self._queries.list_queries(
+            after=page.after, limit=page.limit + 1
+        )
+        return page_of(
+            queries, page.limit, lambda query: Position(query.name, query.id)
+        )
+
+    async def delete(self, query_id: int) -> SavedQuery:
+        """Delete a saved query.
+
+        Raises:
+            SavedQueryNotFoundError: If the query does not exist.
+        """
+        query = await self._queries.delete(query_id)
+        if query is None:
+            raise SavedQueryNotFoundError(query_id)
+        return query
+
+    async def run(self, query_id: int, page: PageRequest) -> Page[Node]:
+        """Return a page of the nodes a saved query matches, by type then id.
+
+        Raises:
+            SavedQueryNotFoundError: If the query does not exist.
+            InvalidFilterError: If the stored filter is no longer valid, for
+                instance after the limits were lowered.
+        """
+        query = await self.get(query_id)
+        nodes = await self._runner.run(
+            self._parse(query.filter), after=page.after, limit=page.limit + 1
+        )
+        return page_of(nodes, page.limit, lambda node: Position(node.type, node.id))
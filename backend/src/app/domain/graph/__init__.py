@@ -0,0 +1,41 @@
+from app.domain.graph.entities import (
+    BatchEdge,
+    BatchResult,
+    Direction,
+    Edge,
+    Link,
+    Neighbour,
+    NewEdge,
+    NewNode,
+    Node,
+    Path,
+    SearchHit,
+)
+from app.domain.graph.errors import (
+    DuplicateNodeKeyError,
+    EdgeNotFoundError,
+    GraphError,
+    InvalidBatchError,
+    NodeNotFoundError,
+)
+from app.domain.graph.repositories import GraphRepository
+
+__all__ = [
+    "BatchEdge",
+    "BatchResult",
+    "Direction",
+    "DuplicateNodeKeyError",
+    "Edge",
+    "EdgeNotFoundError",
+    "GraphError",
+    "GraphRepository",
+    "InvalidBatchError",
+    "Link",
+    "Neighbour",
+    "NewEdge",
+    "NewNode",
+    "Node",
+    "NodeNotFoundError",
+    "Path",
+    "SearchHit",
+]
@@ -0,0 +1,135 @@
+"""Graph entities: nodes, edges and traversal results."""
+
+from dataclasses import dataclass, field
+from enum import StrEnum, auto
+from typing import Any
+
+__all__ = [
+    "BatchEdge",
+    "BatchResult",
+    "Direction",
+    "Edge",
+    "Link",
+    "Neighbour",
+    "NewEdge",
+    "NewNode",
+    "Node",
+    "Path",
+    "SearchHit",
+]
+
+
+class Direction(StrEnum):
+    """Which way edges may be followed during a traversal."""
+
+    OUT = auto()
+    IN = auto()
+    BOTH = auto()
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class NewNode:
+    """A node that has not been stored yet."""
+
+    type: str
+    name: str
+    properties: dict[str, Any] = field(default_factory=dict)
+    key: str | None = None
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class Node:
+    """A stored node — a person, item, gig, band, venue, ...
+
+    `key` is an optional, unique, user-chosen identifier (for example a
+    spreadsheet row id) that imports use to refer to nodes.
+    """
+
+    id: int
+    type: str
+    name: str
+    properties: dict[str, Any] = field(default_factory=dict)
+    key: str | None = None
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class NewEdge:
+    """An edge that has not been stored yet."""
+
+    source_id: int
+    target_id: int
+    type: str
+    properties: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class Edge:
+    """A stored, directed and typed relationship between two nodes."""
+
+    id: int
+    source_id: int
+    target_id: int
+    type: str
+    properties: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class BatchEdge:
+    """An edge written by a batch.
+
+    Each endpoint is either a stored node's id or, as a string, the
+    reference of a node written by the same batch.
+    """
+
+    source: int | str
+    target: int | str
+    type: str
+    properties: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class BatchResult:
+    """What a batch wrote: node ids by reference, and the edges in order."""
+
+    node_ids: dict[str, int]
+    edges: list[Edge]
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class Link:
+    """An edge as a path search sees it: its endpoints and type.
+
+    Parallel edges of one type between the same nodes are a single link.
+    """
+
+    source_id: int
+    target_id: int
+    type: str
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class Neighbour:
+    """A node reached by a traversal and the fewest hops needed to reach it."""
+
+    node: Node
+    depth: int
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class Path:
+    """A route between two nodes without repeated nodes.
+
+    `links[i]` joins `nodes[i]` to `nodes[i + 1]`, and may have been
+    followed against its direction.
+    """
+
+    nodes: list[Node]
+    links: list[Link]
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class SearchHit:
+    """A node matching a search, with its relevance (higher is better)."""
+
+    node: Node
+    score: float
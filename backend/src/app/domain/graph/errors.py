@@ -0,0 +1,41 @@
+"""Graph domain errors."""
+
+__all__ = [
+    "DuplicateNodeKeyError",
+    "EdgeNotFoundError",
+    "GraphError",
+    "InvalidBatchError",
+    "NodeNotFoundError",
+]
+
+
+class GraphError(Exception):
+    """Base class for graph domain errors."""
+
+
+class NodeNotFoundError(GraphError):
+    """Raised when one or more referenced nodes do not exist."""
+
+    def __init__(self, *node_ids: int) -> None:
+        self.node_ids = node_ids
+        super().__init__(f"Node(s) not found: {', '.join(map(str, node_ids))}")
+
+
+class EdgeNotFoundError(GraphError):
+    """Raised when a referenced edge does not exist."""
+
+    def __init__(self, edge_id: int) -> None:
+        self.edge_id = edge_id
+        super().__init__(f"Edge not found: {edge_id}")
+
+
+class DuplicateNodeKeyError(GraphError):
+    """Raised when a node key is already used by another node."""
+
+    def __init__(self, key: str) -> None:
+        self.key = key
+        super().__init__(f"Node key already in use: {key}")
+
+
+class InvalidBatchError(GraphError):
+    """Raised when a batch write is malformed or exceeds the configured limits."""
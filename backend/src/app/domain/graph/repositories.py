@@ -0,0 +1,149 @@
+"""Graph repository interface."""
+
+from typing import TYPE_CHECKING, Protocol
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+    from app.domain.graph.entities import (
+        BatchEdge,
+        BatchResult,
+        Direction,
+        Edge,
+        Link,
+        Neighbour,
+        NewEdge,
+        NewNode,
+        Node,
+        SearchHit,
+    )
+    from app.domain.pagination import Position
+
+__all__ = ["GraphRepository"]
+
+
+class GraphRepository(Protocol):
+    """Storage for nodes and edges."""
+
+    async def get_node(self, node_id: int) -> Node | None:
+        """Return the node with the given id, if it exists."""
+        ...
+
+    async def get_nodes(self, node_ids: Sequence[int]) -> list[Node]:
+        """Return the nodes that exist among `node_ids`, in no particular order."""
+        ...
+
+    async def add_node(self, node: NewNode) -> Node:
+        """Store a new node and return it with its id.
+
+        Raises:
+            DuplicateNodeKeyError: If the node's key is already in use.
+        """
+        ...
+
+    async def delete_node(self, node_id: int) -> Node | None:
+        """Delete a node (and its edges), returning it if it existed."""
+        ...
+
+    async def list_nodes(
+        self, *, node_type: str | None, after: Position | None, limit: int
+    ) -> list[Node]:
+        """Return up to `limit` nodes ordered by `(type, id)`.
+
+        Only nodes of `node_type` are returned when it is given, and only
+        those positioned strictly after `after`.
+        """
+        ...
+
+    async def add_edge(self, edge: NewEdge) -> Edge:
+        """Store a new edge and return it with its id.
+
+        Raises:
+            NodeNotFoundError: If either endpoint does not exist.
+        """
+        ...
+
+    async def write_batch(
+        self, nodes: Mapping[str, NewNode], edges: Sequence[BatchEdge]
+    ) -> BatchResult:
+        """Store nodes and edges together, all or nothing.
+
+        `nodes` are keyed by the references that edges may use as endpoints.
+        A node with a key replaces any stored node with the same key, keeping
+        its id; every edge is new. No two nodes may share a key.
+
+        Raises:
+            NodeNotFoundError: If an edge refers to a stored node that does
+                not exist.
+        """
+        ...
+
+    async def get_edges(self, edge_ids: Sequence[int]) -> list[Edge]:
+        """Return the edges that exist among `edge_ids`, in no particular order."""
+        ...
+
+    async def delete_edge(self, edge_id: int) -> Edge | None:
+        """Delete an edge, returning it if it existed."""
+        ...
+
+    async def list_edges(
+        self,
+        node_id: int,
+        *,
+        direction: Direction,
+        edge_types: Sequence[str] | None,
+        after: Position | None,
+        limit: int,
+    ) -> list[Edge]:
+        """Return up to `limit` edges touching a node, ordered by `(type, id)`.
+
+        `direction` selects outgoing, incoming or both kinds of edge; only
+        edges positioned strictly after `after` are returned.
+        """
+        ...
+
+    async def neighbourhood(
+        self,
+        node_id: int,
+        *,
+        depth: int,
+        direction: Direction,
+        edge_types: Sequence[str] | None,
+        limit: int,
+    ) -> list[Neighbour]:
+        """Return up to `limit` nodes within `depth` hops of `node_id`.
+
+        Each node appears once, at the fewest hops needed to reach it, and
+        results are ordered by depth then id. The origin is not included.
+        """
+        ...
+
+    async def links(
+        self,
+        node_ids: Sequence[int],
+        *,
+        direction: Direction,
+        edge_types: Sequence[str] | None,
+    ) -> list[Link]:
+        """Return the distinct links touching any of `node_ids`, in no order.
+
+        `direction` is relative to those nodes: `OUT` returns the links
+        leaving them, `IN` those arriving at them, `BOTH` either kind.
+        """
+        ...
+
+    async def search(
+        self,
+        text: str,
+        *,
+        node_type: str | None,
+        limit: int,
+        min_similarity: float,
+    ) -> list[SearchHit]:
+        """Return up to `limit` nodes matching `text`, most relevant first.
+
+        Words match by prefix against names and string properties; names
+        that merely resemble `text` (at least `min_similarity`, from 0 to 1)
+        match too, so typos are tolerated.
+        """
+        ...
@@ -0,0 +1,29 @@
+from app.domain.node_types.entities import (
+    FieldIndex,
+    FieldKind,
+    FieldSpec,
+    IndexState,
+    NodeTypeSchema,
+    index_name,
+)
+from app.domain.node_types.errors import (
+    InvalidNodeTypeError,
+    InvalidPropertiesError,
+    NodeTypeError,
+    NodeTypeNotFoundError,
+)
+from app.domain.node_types.repositories import NodeTypeRepository
+
+__all__ = [
+    "FieldIndex",
+    "FieldKind",
+    "FieldSpec",
+    "IndexState",
+    "InvalidNodeTypeError",
+    "InvalidPropertiesError",
+    "NodeTypeError",
+    "NodeTypeNotFoundError",
+    "NodeTypeRepository",
+    "NodeTypeSchema",
+    "index_name",
+]
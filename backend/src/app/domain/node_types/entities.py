@@ -0,0 +1,95 @@
+"""Node type schemas: the typed properties users declare for a node type."""
+
+import hashlib
+from dataclasses import dataclass
+from enum import StrEnum, auto
+
+__all__ = [
+    "FieldIndex",
+    "FieldKind",
+    "FieldSpec",
+    "IndexState",
+    "NodeTypeSchema",
+    "index_name",
+]
+
+# Postgres truncates identifiers to 63 bytes.
+_MAX_NAME = 63
+
+
+class FieldKind(StrEnum):
+    """The JSON value a field holds.
+
+    `list` is a list of scalars, such as tags; filters test it with
+    `contains`.
+    """
+
+    STRING = auto()
+    INTEGER = auto()
+    NUMBER = auto()
+    BOOLEAN = auto()
+    LIST = auto()
+
+
+class IndexState(StrEnum):
+    """Where a filterable field's index is in its life.
+
+    Indexes are built and dropped in the background; `pending` and
+    `dropping` wait for the builder, and `failed` keeps the error.
+    """
+
+    PENDING = auto()
+    BUILDING = auto()
+    READY = auto()
+    FAILED = auto()
+    DROPPING = auto()
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class FieldSpec:
+    """One declared property of a node type.
+
+    A `filterable` field gets an index over the nodes of its type, so that
+    saved queries testing it need not scan them all.
+    """
+
+    name: str
+    kind: FieldKind
+    required: bool = False
+    filterable: bool = False
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class NodeTypeSchema:
+    """The declared fields of a node type.
+
+    `version` goes up each time the type is redefined, so anything derived
+    from a schema can be cached under `(name, version)`.
+    """
+
+    name: str
+    fields: tuple[FieldSpec, ...]
+    version: int = 1
+
+    def field(self, name: str) -> FieldSpec | None:
+        """Return the field called `name`, if declared."""
+        return next((spec for spec in self.fields if spec.name == name), None)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class FieldIndex:
+    """The index kept for one filterable field of a node type."""
+
+    node_type: str
+    field: str
+    kind: FieldKind
+    name: str
+    state: IndexState
+    error: str | None = None
+
+
+def index_name(node_type: str, field: str) -> str:
+    """Name the index of a field: readable, and unique within 63 bytes."""
+    digest = hashlib.sha1(f"{node_type}.{field}".encode(), usedforsecurity=False)
+    suffix = f"_{digest.hexdigest()[:8]}"
+    return f"ix_nodes_{node_type}_{field}"[: _MAX_NAME - len(suffix)] + suffix
@@ -0,0 +1,33 @@
+"""Node type domain errors."""
+
+__all__ = [
+    "InvalidNodeTypeError",
+    "InvalidPropertiesError",
+    "NodeTypeError",
+    "NodeTypeNotFoundError",
+]
+
+
+class NodeTypeError(Exception):
+    """Base class for node type errors."""
+
+
+class NodeTypeNotFoundError(NodeTypeError):
+    """Raised when a referenced node type has no schema."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        super().__init__(f"Node type not found: {name}")
+
+
+class InvalidNodeTypeError(NodeTypeError):
+    """Raised when a node type definition cannot be accepted."""
+
+
+class InvalidPropertiesError(NodeTypeError):
+    """Raised when a node's properties do not follow its type's schema."""
+
+    def __init__(self, node_type: str, problems: list[str]) -> None:
+        self.node_type = node_type
+        self.problems = problems
+        super().__init__(f"Invalid {node_type} properties: {'; '.join(problems)}")
@@ -0,0 +1,42 @@
+"""Node type repository interfaces."""
+
+from typing import TYPE_CHECKING, Protocol
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from app.domain.node_types.entities import FieldIndex, NodeTypeSchema
+
+__all__ = ["NodeTypeRepository"]
+
+
+class NodeTypeRepository(Protocol):
+    """Storage for node type schemas and the state of their field indexes."""
+
+    async def save(self, schema: NodeTypeSchema) -> NodeTypeSchema:
+        """Create or redefine a node type, returning it with its new version.
+
+        Filterable fields without an index get one queued for building;
+        indexes of fields no longer filterable are queued for dropping.
+        """
+        ...
+
+    async def get(self, name: str) -> NodeTypeSchema | None:
+        """Return the schema of a node type, if it has one."""
+        ...
+
+    async def get_many(self, names: Sequence[str]) -> list[NodeTypeSchema]:
+        """Return the schemas that exist among `names`, in no particular order."""
+        ...
+
+    async def list_types(self) -> list[NodeTypeSchema]:
+        """Return every node type schema, ordered by name."""
+        ...
+
+    async def delete(self, name: str) -> NodeTypeSchema | None:
+        """Delete a schema, queueing its indexes for dropping; return it if found."""
+        ...
+
+    async def indexes(self, name: str) -> list[FieldIndex]:
+        """Return the indexes kept for a node type's fields, ordered by field."""
+        ...
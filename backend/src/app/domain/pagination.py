@@ -0,0 +1,47 @@
+"""Keyset pagination primitives shared by list queries."""
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+__all__ = ["Page", "PageRequest", "Position", "page_of"]
+
+
+@dataclass(frozen=True, slots=True)
+class Position:
+    """Where a page ends: the `(sort_key, id)` of its last item.
+
+    The next page starts strictly after this pair, so it can be found with an
+    index seek however deep the page is.
+    """
+
+    sort_key: str
+    id: int
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class PageRequest:
+    """Up to `limit` items starting after `after` (or from the beginning)."""
+
+    limit: int
+    after: Position | None = None
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class Page[T]:
+    """One page of results and, if there are more, where the next starts."""
+
+    items: list[T]
+    next: Position | None
+
+
+def page_of[T](
+    items: list[T], limit: int, position: Callable[[T], Position]
+) -> Page[T]:
+    """Trim a `limit + 1` result to a page, noting where the next one starts."""
+    if len(items) <= limit:
+        return Page(items=items, next=None)
+    items = items[:limit]
+    return Page(items=items, next=position(items[-1]))
@@ -0,0 +1,76 @@
+"""Photos, identified by the SHA-256 of their content."""
+
+import re
+from dataclasses import dataclass
+from enum import StrEnum, auto
+
+__all__ = [
+    "SNIFF_BYTES",
+    "DerivativeFormat",
+    "Photo",
+    "is_digest",
+    "sniff_media_type",
+]
+
+_DIGEST = re.compile(r"[0-9a-f]{64}")
+
+# Leading bytes of each accepted image format. WebP and HEIF/AVIF need a
+# second check past the fixed prefix.
+_SIGNATURES = (
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"GIF87a", "image/gif"),
+    (b"GIF89a", "image/gif"),
+)
+_HEIF_BRANDS = {
+    b"heic": "image/heic",
+    b"heix": "image/heic",
+    b"mif1": "image/heif",
+    b"avif": "image/avif",
+}
+
+SNIFF_BYTES = 16
+"""How many leading bytes `sniff_media_type` needs."""
+
+
+def sniff_media_type(head: bytes) -> str | None:
+    """Return the image media type indicated by a file's first bytes, if any.
+
+    The content decides the type, not the client's `Content-Type`, so a
+    photo is always served back as what it really is.
+    """
+    for signature, media_type in _SIGNATURES:
+        if head.startswith(signature):
+            return media_type
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "image/webp"
+    if head[4:8] == b"ftyp":
+        return _HEIF_BRANDS.get(head[8:12])
+    return None
+
+
+def is_digest(value: str) -> bool:
+    """Whether `value` is a lowercase hex SHA-256 digest."""
+    return _DIGEST.fullmatch(value) is not None
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class Photo:
+    """A stored photo. Identical uploads share one `digest` and one file."""
+
+    digest: str
+    size: int
+    media_type: str
+
+
+class DerivativeFormat(StrEnum):
+    """Image formats derivatives (thumbnails, web sizes) can be made in."""
+
+    WEBP = auto()
+    JPEG = auto()
+    PNG = auto()
+
+    @property
+    def media_type(self) -> str:
+        """The format's media type."""
+        return f"image/{self.value}"
@@ -0,0 +1,37 @@
+from app.domain.queries.entities import NewSavedQuery, SavedQuery
+from app.domain.queries.errors import (
+    InvalidFilterError,
+    QueryError,
+    SavedQueryNotFoundError,
+)
+from app.domain.queries.filters import (
+    AllOf,
+    AnyOf,
+    Filter,
+    Not,
+    PathExists,
+    PathStep,
+    PropertyIs,
+    PropertyOp,
+    TypeIs,
+)
+from app.domain.queries.repositories import FilterRunner, SavedQueryRepository
+
+__all__ = [
+    "AllOf",
+    "AnyOf",
+    "Filter",
+    "FilterRunner",
+    "InvalidFilterError",
+    "NewSavedQuery",
+    "Not",
+    "PathExists",
+    "PathStep",
+    "PropertyIs",
+    "PropertyOp",
+    "QueryError",
+    "SavedQuery",
+    "SavedQueryNotFoundError",
+    "SavedQueryRepository",
+    "TypeIs",
+]
@@ -0,0 +1,26 @@
+"""Saved query entities."""
+
+from dataclasses import dataclass
+from typing import Any
+
+__all__ = ["NewSavedQuery", "SavedQuery"]
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class NewSavedQuery:
+    """A saved query that has not been stored yet.
+
+    `filter` is the JSON document, kept as written so it reads back the same.
+    """
+
+    name: str
+    filter: dict[str, Any]
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class SavedQuery:
+    """A stored, named filter over the graph's nodes."""
+
+    id: int
+    name: str
+    filter: dict[str, Any]
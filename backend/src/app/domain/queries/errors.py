@@ -0,0 +1,23 @@
+"""Saved query domain errors."""
+
+__all__ = ["InvalidFilterError", "QueryError", "SavedQueryNotFoundError"]
+
+
+class QueryError(Exception):
+    """Base class for saved query errors."""
+
+
+class SavedQueryNotFoundError(QueryError):
+    """Raised when a referenced saved query does not exist."""
+
+    def __init__(self, query_id: int) -> None:
+        self.query_id = query_id
+        super().__init__(f"Saved query not found: {query_id}")
+
+
+class InvalidFilterError(QueryError):
+    """Raised when a filter document does not follow the filter language."""
+
+    def __init__(self, path: str, message: str) -> None:
+        self.path = path
+        super().__init__(f"{path}: {message}")
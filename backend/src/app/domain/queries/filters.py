@@ -0,0 +1,103 @@
+"""The saved-query filter language.
+
+A filter is a tree of predicates over one node. Leaves test the node's
+type or a property; `PathExists` asks for a chain of edges leading to a
+node matching a nested filter; `AllOf`, `AnyOf` and `Not` combine filters.
+"""
+
+from dataclasses import dataclass
+from enum import StrEnum, auto
+from typing import Any
+
+from app.domain.graph import Direction
+
+__all__ = [
+    "AllOf",
+    "AnyOf",
+    "Filter",
+    "Not",
+    "PathExists",
+    "PathStep",
+    "PropertyIs",
+    "PropertyOp",
+    "TypeIs",
+]
+
+
+class PropertyOp(StrEnum):
+    """How a property value is compared.
+
+    Values compare as JSON: numbers with numbers, strings with strings.
+    `in` takes a list of values; `contains` tests that a list property
+    holds a value; `exists` takes none.
+    """
+
+    EQ = auto()
+    NE = auto()
+    LT = auto()
+    LTE = auto()
+    GT = auto()
+    GTE = auto()
+    IN = auto()
+    CONTAINS = auto()
+    EXISTS = auto()
+
+
+@dataclass(frozen=True, slots=True)
+class TypeIs:
+    """The node has this type."""
+
+    type: str
+
+
+@dataclass(frozen=True, slots=True)
+class PropertyIs:
+    """The node's property `name` compares to `value` with `op`."""
+
+    name: str
+    op: PropertyOp
+    value: Any = None
+
+
+@dataclass(frozen=True, slots=True)
+class PathStep:
+    """One hop along an edge, of `edge_type` if given."""
+
+    direction: Direction = Direction.OUT
+    edge_type: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class PathExists:
+    """Following `steps` from the node reaches a node matching `node`.
+
+    With a single step this is edge existence; `node` may be omitted to
+    accept wherever the path ends.
+    """
+
+    steps: tuple[PathStep, ...]
+    node: Filter | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class AllOf:
+    """Every filter matches."""
+
+    filters: tuple[Filter, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class AnyOf:
+    """At least one filter matches."""
+
+    filters: tuple[Filter, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class Not:
+    """The filter does not match."""
+
+    filter: Filter
+
+
+type Filter = TypeIs | PropertyIs | PathExists | AllOf | AnyOf | Not
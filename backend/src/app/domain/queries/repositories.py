@@ -0,0 +1,43 @@
+"""Saved query repository interfaces."""
+
+from typing import TYPE_CHECKING, Protocol
+
+if TYPE_CHECKING:
+    from app.domain.graph import Node
+    from app.domain.pagination import Position
+    from app.domain.queries.entities import NewSavedQuery, SavedQuery
+    from app.domain.queries.filters import Filter
+
+__all__ = ["FilterRunner", "SavedQueryRepository"]
+
+
+class SavedQueryRepository(Protocol):
+    """Storage for saved queries."""
+
+    async def add(self, query: NewSavedQuery) -> SavedQuery:
+        """Store a new saved query and return it with its id."""
+        ...
+
+    async def get(self, query_id: int) -> SavedQuery | None:
+        """Return the saved query with the given id, if it exists."""
+        ...
+
+    async def list_queries(
+        self, *, after: Position | None, limit: int
+    ) -> list[SavedQuery]:
+        """Return up to `limit` saved queries ordered by `(name, id)`."""
+        ...
+
+    async def delete(self, query_id: int) -> SavedQuery | None:
+        """Delete a saved query, returning it if it existed."""
+        ...
+
+
+class FilterRunner(Protocol):
+    """Finds the nodes matching a filter."""
+
+    async def run(
+        self, filter: Filter, *, after: Position | None, limit: int
+    ) -> list[Node]:
+        """Return up to `limit` matching nodes ordered by `(type, id)`."""
+        ...
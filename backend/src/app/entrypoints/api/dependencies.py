@@ -0,0 +1,227 @@
+"""FastAPI dependencies shared by the API routers."""
+
+from typing import TYPE_CHECKING
+
+from fastapi import Depends, Request
+from sqlalchemy.ext.asyncio import AsyncSession  # noqa: TC002
+
+from app.application.exports import ExportService
+from app.application.graph import GraphLoader, GraphService
+from app.application.imports import ImportService
+from app.application.node_types import NodeTypeService, get_validators
+from app.application.photos import DerivativeService, PhotoService
+from app.application.queries import QueryService
+from app.entrypoints.api.middlewares import recently_wrote
+from app.infrastructure.database import (
+    CopyImportSink,
+    CursorExportSource,
+    get_database,
+    get_query_plans,
+)
+from app.infrastructure.database.repositories import (
+    SqlAlchemyFilterRunner,
+    SqlAlchemyGraphRepository,
+    SqlAlchemyNodeTypeRepository,
+    SqlAlchemySavedQueryRepository,
+)
+from app.infrastructure.graph_cache import CachedGraphRepository, get_adjacency_cache
+from app.infrastructure.imaging import get_image_renderer
+from app.infrastructure.storage import create_photo_storage
+from app.shared.config import Settings, get_settings
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+
+    from app.domain.graph import GraphRepository
+
+__all__ = [
+    "get_derivative_service",
+    "get_export_service",
+    "get_graph_loader",
+    "get_graph_reader",
+    "get_graph_service",
+    "get_import_service",
+    "get_node_type_service",
+    "get_photo_service",
+    "get_query_service",
+    "get_read_session",
+    "get_replica_session",
+    "get_session",
+]
+
+
+async def get_session() -> AsyncGenerator[AsyncSession]:
+    """Yield a session bound to the worker's pooled engine.
+
+    The session is closed (returning its connection to the pool) once the
+    response has been produced.
+    """
+    async with get_database().sessionmaker() as session:
+        yield session
+
+
+async def get_read_session(request: Request) -> AsyncGenerator[AsyncSession]:
+    """Yield a session for reads that may lag slightly behind writes.
+
+    It is bound to the read replica when one is configured, unless the
+    client has just written and must see its own writes.
+    """
+    database = get_database()
+    if recently_wrote(request):
+        sessionmaker = database.sessionmaker
+    else:
+        sessionmaker = database.read_sessionmaker
+    async with sessionmaker() as session:
+        yield session
+
+
+async def get_replica_session() -> AsyncGenerator[AsyncSession]:
+    """Yield a session bound to the read replica, when one is configured.
+
+    For long reads that must never hold primary connections.
+    """
+    async with get_database().read_sessionmaker() as session:
+        yield session
+
+
+def get_node_type_service(
+    session: AsyncSession = Depends(get_session),
+    settings: Settings = Depends(get_settings),
+) -> NodeTypeService:
+    """Build the node type service for the current request."""
+    return NodeTypeService(
+        SqlAlchemyNodeTypeRepository(session),
+        get_validators(),
+        max_fields=settings.node_types.max_fields,
+    )
+
+
+def _graph_service(
+    session: AsyncSession,
+    settings: Settings,
+    checker: NodeTypeService | None = None,
+) -> GraphService:
+    repository: GraphRepository = SqlAlchemyGraphRepository(session)
+    cache = get_adjacency_cache()
+    if cache is not None:
+        repository = CachedGraphRepository(repository, cache)
+
+    return GraphService(
+        repository,
+        max_depth=settings.graph.max_depth,
+        max_results=settings.graph.max_results,
+        search_max_results=settings.graph.search_max_results,
+        search_min_similarity=settings.graph.search_min_similarity,
+        paths_max_count=settings.graph.paths_max_count,
+        paths_max_visited=settings.graph.paths_max_visited,
+        batch_max_nodes=settings.graph.batch_max_nodes,
+        batch_max_edges=settings.graph.batch_max_edges,
+        checker=checker,
+    )
+
+
+def get_graph_service(
+    session: AsyncSession = Depends(get_session),
+    settings: Settings = Depends(get_settings),
+    node_types: NodeTypeService = Depends(get_node_type_service),
+) -> GraphService:
+    """Build the graph service for the current request.
+
+    Traversals are answered from the worker's adjacency cache when enabled,
+    and new nodes are checked against their type's schema.
+    """
+    return _graph_service(session, settings, node_types)
+
+
+def get_graph_reader(
+    session: AsyncSession = Depends(get_read_session),
+    settings: Settings = Depends(get_settings),
+) -> GraphService:
+    """Build a graph service for traversal and search, which only read.
+
+    It reads from the replica when one is configured; see `get_read_session`.
+    """
+    return _graph_service(session, settings)
+
+
+def get_graph_loader(
+    service: GraphService = Depends(get_graph_service),
+) -> GraphLoader:
+    """Build the current request's loader of nodes and edges by id.
+
+    Lookups made together share one query, and each id is loaded at most
+    once per request.
+    """
+    return service.loader()
+
+
+def get_import_service(
+    session: AsyncSession = Depends(get_session),
+    settings: Settings = Depends(get_settings),
+) -> ImportService:
+    """Build the bulk import service for the current request."""
+    return ImportService(
+        CopyImportSink(session),
+        batch_size=settings.imports.batch_size,
+        max_errors=settings.imports.max_errors,
+        max_line_bytes=settings.imports.max_line_bytes,
+    )
+
+
+def get_export_service(
+    session: AsyncSession = Depends(get_replica_session),
+    settings: Settings = Depends(get_settings),
+) -> ExportService:
+    """Build the export service for the current request.
+
+    The session stays open until the streamed response has been sent, so
+    it reads from the replica when one is configured.
+    """
+    return ExportService(
+        CursorExportSource(session, batch_size=settings.exports.batch_size),
+        chunk_bytes=settings.exports.chunk_bytes,
+    )
+
+
+def get_derivative_service(
+    settings: Settings = Depends(get_settings),
+) -> DerivativeService:
+    """Build the photo derivative service for the current request."""
+    return DerivativeService(
+        create_photo_storage(settings.photos),
+        get_image_renderer(),
+        sizes=settings.photos.derivative_sizes,
+        formats=settings.photos.derivative_formats,
+        quality=settings.photos.derivative_quality,
+    )
+
+
+def get_photo_service(settings: Settings = Depends(get_settings)) -> PhotoService:
+    """Build the photo service for the current request.
+
+    With eager derivatives, new photos are resized as soon as they are stored.
+    """
+    derivatives = None
+    if settings.photos.eager_derivatives:
+        derivatives = get_derivative_service(settings)
+    return PhotoService(
+        create_photo_storage(settings.photos),
+        max_bytes=settings.photos.max_bytes,
+        derivatives=derivatives,
+    )
+
+
+def get_query_service(
+    session: AsyncSession = Depends(get_session),
+    settings: Settings = Depends(get_settings),
+) -> QueryService:
+    """Build the saved query service for the current request.
+
+    Filters run with the worker's cache of compiled statements.
+    """
+    return QueryService(
+        SqlAlchemySavedQueryRepository(session),
+        SqlAlchemyFilterRunner(session, get_query_plans()),
+        max_terms=settings.queries.max_terms,
+        max_path_length=settings.queries.max_path_length,
+    )
@@ -4,14 +4,23 @@ from contextlib import asynccontextmanager
 from typing import TYPE_CHECKING
 
 from fastapi import FastAPI
+from starlette.routing import Route
 
+from app.infrastructure.metrics import (
+    collect_worker_metrics,
+    start_metrics,
+    stop_metrics,
+)
 from app.infrastructure.wiring import bootstrap
 from app.shared.config import Settings, get_settings
 
 from .middlewares import (
-    access_log_middleware,
-    app_response_headers_middleware,
-    request_id_middleware,
+    AccessLogMiddleware,
+    AppHeadersMiddleware,
+    MetricsMiddleware,
+    ProfilingMiddleware,
+    RecentWriteMiddleware,
+    RequestIdMiddleware,
 )
 from .system.router import router as system_router
 from .v1.router import v1_router
@@ -33,9 +42,13 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
     settings: Settings = get_settings()
 
     await bootstrap.startup(settings)
+    if settings.metrics.enabled:
+        routes = [(r.path, r.methods or ()) for r in app.routes if isinstance(r, Route)]
+        start_metrics(settings.metrics, routes=routes, collect=collect_worker_metrics)
     try:
         yield
     finally:
+        await stop_metrics()
         await bootstrap.shutdown(settings)
 
 
@@ -57,16 +70,48 @@ def create_app() -> FastAPI:
     fastapi_app.include_router(system_router, prefix=API_PREFIX)
     fastapi_app.include_router(v1_router, prefix=API_PREFIX)
 
+    # Not added at all when disabled, so other requests pay nothing for it.
+    if settings.profiling.enabled:
+        fastapi_app.add_middleware(
+            ProfilingMiddleware,
+            directory=settings.profiling.directory,
+            token=settings.profiling.token.get_secret_value(),
+        )
+
     if settings.api.access_log_enabled:
-        fastapi_app.middleware("http")(access_log_middleware)
+        fastapi_app.add_middleware(
+            AccessLogMiddleware, rules=settings.api.access_log_rules
+        )
+
+    # Only needed to steer reads between the primary and a replica.
+    if settings.database.read_dsn is not None:
+        fastapi_app.add_middleware(
+            RecentWriteMiddleware, max_age=settings.database.recent_write_seconds
+        )
+
+    fastapi_app.add_middleware(
+        AppHeadersMiddleware,
+        name=settings.app.display_name,
+        version=settings.app.version,
+    )
 
-    fastapi_app.middleware("http")(app_response_headers_middleware)
+    # Bind the request id outside every middleware that logs
+    fastapi_app.add_middleware(RequestIdMiddleware)
 
-    # Ensure that the request id middleware is bound last
-    fastapi_app.middleware("http")(request_id_middleware)
+    # Outermost, so that request latency includes the other middlewares.
+    fastapi_app.add_middleware(MetricsMiddleware)
 
     fastapi_app.openapi_tags = [
         {"name": "System", "description": "System related endpoints"},
+        {"name": "Nodes", "description": "Nodes and graph traversal"},
+        {"name": "Edges", "description": "Relationships between nodes"},
+        {"name": "Search", "description": "Full-text and fuzzy node search"},
+        {"name": "Import", "description": "Bulk loading of nodes and edges"},
+        {"name": "Export", "description": "Full dumps of the graph"},
+        {"name": "Queries", "description": "Saved, reusable node filters"},
+        {"name": "Paths", "description": "How two nodes are connected"},
+        {"name": "Batch", "description": "Atomic writes of many nodes and edges"},
+        {"name": "Node types", "description": "Typed, indexed node properties"},
     ]
 
     return fastapi_app
@@ -1,9 +1,19 @@
-from app.entrypoints.api.middlewares.access_logger import access_log_middleware
-from app.entrypoints.api.middlewares.app_headers import app_response_headers_middleware
-from app.entrypoints.api.middlewares.request_id import request_id_middleware
+from app.entrypoints.api.middlewares.access_logger import AccessLogMiddleware
+from app.entrypoints.api.middlewares.app_headers import AppHeadersMiddleware
+from app.entrypoints.api.middlewares.metrics import MetricsMiddleware
+from app.entrypoints.api.middlewares.profiling import ProfilingMiddleware
+from app.entrypoints.api.middlewares.recent_write import (
+    RecentWriteMiddleware,
+    recently_wrote,
+)
+from app.entrypoints.api.middlewares.request_id import RequestIdMiddleware
 
 __all__ = [
-    "access_log_middleware",
-    "app_response_headers_middleware",
-    "request_id_middleware",
+    "AccessLogMiddleware",
+    "AppHeadersMiddleware",
+    "MetricsMiddleware",
+    "ProfilingMiddleware",
+    "RecentWriteMiddleware",
+    "RequestIdMiddleware",
+    "recently_wrote",
 ]
@@ -1,59 +1,135 @@
+import random
+import re
 import time
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, cast
 
 import structlog
+from starlette.datastructures import QueryParams
+
+from app.shared.config.api import AccessLogPolicy, AccessLogRule
 
 if TYPE_CHECKING:
-    from starlette.middleware.base import RequestResponseEndpoint
-    from starlette.requests import Request
-    from starlette.responses import Response
+    from collections.abc import Callable, Sequence
 
+    from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-async def access_log_middleware(
-    request: Request,
-    call_next: RequestResponseEndpoint,
-) -> Response:
-    """Middleware to log basic HTTP request/response details via structlog.
+_ALWAYS = AccessLogRule(prefix="/", policy=AccessLogPolicy.ALWAYS)
 
-    Logs only method/path/client/query/status/duration; no bodies or headers.
+
+def _matcher(rules: Sequence[AccessLogRule]) -> Callable[[str], AccessLogRule]:
+    """Compile `rules` into one function finding a path's rule.
+
+    The prefixes become a single regex, longest first, so that a path is
+    matched against all of them in one pass.
     """
-    logger = structlog.get_logger("access")
+    if not rules:
+        return lambda _: _ALWAYS
+    ordered = sorted(rules, key=lambda rule: len(rule.prefix), reverse=True)
+    pattern = re.compile("|".join(f"({re.escape(rule.prefix)})" for rule in ordered))
+
+    def match(path: str) -> AccessLogRule:
+        found = pattern.match(path)
+        return _ALWAYS if found is None else ordered[cast("int", found.lastindex) - 1]
 
-    # noinspection PyUnresolvedReferences
-    client = request.client.host if request.client else None
+    return match
 
+
+def _request_data(scope: Scope) -> dict[str, str | None]:
+    client = scope.get("client")
     request_data = {
-        "path": request.url.path,
-        "method": request.method,
-        "client": client,
+        "path": scope["path"],
+        "method": scope["method"],
+        "client": client[0] if client else None,
     }
-    if request.query_params:
-        request_data["query"] = str(request.query_params)
-
-    await logger.ainfo("http.request", **request_data)
-
-    start = time.perf_counter()
-    response: Response
-    try:
-        response = await call_next(request)
-    except Exception as exc:
-        duration_ms = (time.perf_counter() - start) * 1000
-        await logger.aexception(
-            "http.response.exception",
-            exc_info=exc,
-            stack_info=True,
-            path=request.url.path,
-            method=request.method,
-            client=client,
-            duration_ms=round(duration_ms, 3),
-        )
-        raise
-    else:
-        duration_ms = (time.perf_counter() - start) * 1000
-        response_data = {
-            "duration_ms": round(duration_ms, 3),
-            "status_code": response.status_code,
-        }
-
-        await logger.ainfo("http.response", **response_data)
-        return response
+    if query_string := scope["query_string"]:
+        request_data["query"] = str(QueryParams(query_string))
+    return request_data
+
+
+def _wanted(rule: AccessLogRule, status_code: int | None, duration_ms: float) -> bool:
+    """Whether a request held back by a `slow` or `errors` rule gets logged."""
+    if rule.policy is AccessLogPolicy.SLOW:
+        return duration_ms >= rule.slow_ms
+    return status_code is None or status_code >= 400
+
+
+class AccessLogMiddleware:
+    """Middleware to log basic HTTP request/response details via structlog.
+
+    Logs only method/path/client/query/status/duration; no bodies or headers.
+    The duration runs until the response body has been sent in full.
+
+    `rules` pick which requests are logged by path prefix. Requests that are
+    never logged, or not sampled, skip the middleware entirely. Under `slow`
+    and `errors` rules, a request is only known to be wanted once it has
+    finished, so it gets one `http.response` line with the request's details.
+    """
+
+    def __init__(self, app: ASGIApp, *, rules: Sequence[AccessLogRule] = ()) -> None:
+        self.app = app
+        self.logger = structlog.get_logger("access")
+        self._match = _matcher(rules)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Log the request, then the response or the exception it raised."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        rule = self._match(scope["path"])
+        match rule.policy:
+            case AccessLogPolicy.ALWAYS:
+                await self._logged(scope, receive, send, None)
+            case AccessLogPolicy.SAMPLE if random.random() * 100 < rule.sample_percent:
+                await self._logged(scope, receive, send, None)
+            case AccessLogPolicy.SLOW | AccessLogPolicy.ERRORS:
+                await self._logged(scope, receive, send, rule)
+            case _:
+                await self.app(scope, receive, send)
+
+    async def _logged(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+        deferred: AccessLogRule | None,
+    ) -> None:
+        request_data = _request_data(scope)
+        if deferred is None:
+            await self.logger.ainfo("http.request", **request_data)
+
+        status_code: int | None = None
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as exc:
+            duration_ms = (time.perf_counter() - start) * 1000
+            await self.logger.aexception(
+                "http.response.exception",
+                exc_info=exc,
+                stack_info=True,
+                path=request_data["path"],
+                method=request_data["method"],
+                client=request_data["client"],
+                duration_ms=round(duration_ms, 3),
+            )
+            raise
+        else:
+            duration_ms = (time.perf_counter() - start) * 1000
+            response_data: dict[str, object] = {
+                "duration_ms": round(duration_ms, 3),
+                "status_code": status_code,
+            }
+            if deferred is not None:
+                if not _wanted(deferred, status_code, duration_ms):
+                    return
+                response_data = {**request_data, **response_data}
+
+            await self.logger.ainfo("http.response", **response_data)
@@ -1,22 +1,31 @@
 from typing import TYPE_CHECKING
 
-from app.shared.config import Settings, get_settings
-
 if TYPE_CHECKING:
-    from starlette.middleware.base import RequestResponseEndpoint
-    from starlette.requests import Request
-    from starlette.responses import Response
+    from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class AppHeadersMiddleware:
+    """Middleware to apply application headers to the response.
+
+    The header bytes are encoded once, when the app is built.
+    """
 
+    def __init__(self, app: ASGIApp, *, name: str, version: str) -> None:
+        self.app = app
+        self.headers = [
+            (b"application-name", name.encode("latin-1")),
+            (b"application-version", version.encode("latin-1")),
+        ]
 
-async def app_response_headers_middleware(
-    request: Request,
-    call_next: RequestResponseEndpoint,
-) -> Response:
-    """Middleware to apply application headers to the response."""
-    settings: Settings = get_settings()
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Add the application headers when the response starts."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-    response: Response = await call_next(request)
-    response.headers["Application-Name"] = settings.app.display_name
-    response.headers["Application-Version"] = settings.app.version
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), *self.headers]
+            await send(message)
 
-    return response
+        await self.app(scope, receive, send_wrapper)
@@ -0,0 +1,47 @@
+import time
+from typing import TYPE_CHECKING
+
+from app.infrastructure.metrics import get_metrics
+
+if TYPE_CHECKING:
+    from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class MetricsMiddleware:
+    """Middleware that counts requests and their latency by route template.
+
+    Does nothing until the worker's metrics have been started.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Record the request once its response has been sent."""
+        metrics = get_metrics()
+        if metrics is None or scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Unhandled exceptions become a 500 further out.
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        metrics.request_started()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            # The router stores the matched route in the scope.
+            route = scope.get("route")
+            metrics.request_finished(
+                getattr(route, "path", None),
+                scope["method"],
+                status_code,
+                time.perf_counter() - start,
+            )
@@ -0,0 +1,80 @@
+import asyncio
+import cProfile
+import hmac
+import re
+import time
+from typing import TYPE_CHECKING, cast
+
+import structlog
+import structlog.contextvars
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from starlette.types import ASGIApp, Receive, Scope, Send
+
+_HEADER = b"x-profile"
+_UNSAFE = re.compile(r"[^A-Za-z0-9_.-]")
+
+
+def _profile_header(scope: Scope) -> bytes | None:
+    for key, value in scope["headers"]:
+        if key == _HEADER:
+            return cast("bytes", value)
+    return None
+
+
+class ProfilingMiddleware:
+    """Middleware that profiles requests asking for it with `X-Profile`.
+
+    Only added to the app when profiling is enabled. The profiler sees the
+    whole event loop thread, so requests running concurrently show up in
+    the stats too, and only one request is profiled at a time.
+    """
+
+    def __init__(self, app: ASGIApp, *, directory: Path, token: str) -> None:
+        self.app = app
+        self.directory = directory
+        self.token = token.encode("latin-1")
+        self.logger = structlog.get_logger("profiling")
+        self._active = False
+
+    def _wanted(self, scope: Scope) -> bool:
+        if scope["type"] != "http":
+            return False
+        value = _profile_header(scope)
+        if value is None:
+            return False
+        return not self.token or hmac.compare_digest(value, self.token)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Run the request under `cProfile` if it asked for it."""
+        if not self._wanted(scope):
+            await self.app(scope, receive, send)
+            return
+        if self._active:
+            await self.logger.awarning("profiling.busy", path=scope["path"])
+            await self.app(scope, receive, send)
+            return
+
+        self._active = True
+        profile = cProfile.Profile()
+        profile.enable()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            profile.disable()
+            self._active = False
+            path = await asyncio.to_thread(self._write, profile)
+            await self.logger.ainfo(
+                "profiling.written", path=str(path), request_path=scope["path"]
+            )
+
+    def _write(self, profile: cProfile.Profile) -> Path:
+        """Dump the stats as `<time>-<request id>.pstats` and return the path."""
+        request_id = structlog.contextvars.get_contextvars().get("request_id", "")
+        name = f"{time.strftime('%Y%m%dT%H%M%S')}-{_UNSAFE.sub('_', request_id)[:64]}"
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / f"{name}.pstats"
+        profile.dump_stats(path)
+        return path
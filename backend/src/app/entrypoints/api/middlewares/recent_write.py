@@ -0,0 +1,53 @@
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from starlette.requests import HTTPConnection
+    from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+RECENT_WRITE_COOKIE = "recent_write"
+RECENT_WRITE_HEADER = "x-recent-write"
+
+_SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+def recently_wrote(connection: HTTPConnection) -> bool:
+    """Whether the client asks to read its own recent writes.
+
+    Browsers send the cookie set after their writes; other clients can send
+    the `X-Recent-Write` header instead.
+    """
+    return (
+        RECENT_WRITE_COOKIE in connection.cookies
+        or RECENT_WRITE_HEADER in connection.headers
+    )
+
+
+class RecentWriteMiddleware:
+    """Middleware marking clients that have just written.
+
+    A successful write sets a short-lived cookie, so that the client's next
+    reads go to the primary database rather than a lagging replica.
+    """
+
+    def __init__(self, app: ASGIApp, *, max_age: int) -> None:
+        self.app = app
+        self.header = (
+            b"set-cookie",
+            (
+                f"{RECENT_WRITE_COOKIE}=1; Max-Age={max_age}; Path=/; "
+                "HttpOnly; SameSite=Lax"
+            ).encode("latin-1"),
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Set the cookie when a write succeeds."""
+        if scope["type"] != "http" or scope["method"] in _SAFE_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                message["headers"] = [*message.get("headers", ()), self.header]
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
@@ -1,33 +1,46 @@
 import uuid
-from contextlib import suppress
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, cast
 
 import structlog
 import structlog.contextvars
 
 if TYPE_CHECKING:
-    from starlette.middleware.base import RequestResponseEndpoint
-    from starlette.requests import Request
-    from starlette.responses import Response
+    from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+_HEADER = b"x-request-id"
 
-async def request_id_middleware(
-    request: Request,
-    call_next: RequestResponseEndpoint,
-) -> Response:
+
+def _client_request_id(scope: Scope) -> str:
+    for key, value in scope["headers"]:
+        if key == _HEADER:
+            return cast("bytes", value).decode("latin-1")
+    return ""
+
+
+class RequestIdMiddleware:
     """Middleware that binds a request id into structlog.contextvars."""
-    structlog.contextvars.clear_contextvars()
-    request_id = request.headers.get("X-Request-ID") or str(uuid.uuid4())
-    structlog.contextvars.bind_contextvars(request_id=request_id)
-
-    response: Response | None = None
-    try:
-        response = await call_next(request)
-    finally:
-        # Attach the request id to the response so clients can correlate logs.
-        if response is not None:
-            with suppress(Exception):
-                response.headers["X-Request-ID"] = request_id
-
-    assert response is not None
-    return response
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Bind the client's `X-Request-ID` (or a new one) for this request."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        structlog.contextvars.clear_contextvars()
+        request_id = _client_request_id(scope) or str(uuid.uuid4())
+        structlog.contextvars.bind_contextvars(request_id=request_id)
+        header = (_HEADER, request_id.encode("latin-1"))
+
+        async def send_wrapper(message: Message) -> None:
+            # Attach the request id to the response so clients can correlate logs.
+            if message["type"] == "http.response.start":
+                message["headers"] = [
+                    *(h for h in message.get("headers", ()) if h[0] != _HEADER),
+                    header,
+                ]
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
@@ -1,10 +1,19 @@
 from http import HTTPStatus
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import PlainTextResponse
 
+from app.infrastructure.database import get_query_plans
+from app.infrastructure.graph_cache import get_adjacency_cache
+from app.infrastructure.metrics import get_metrics
 from app.shared.config import Settings, get_settings
 
-from .schemas import HealthCheckResponse, VersionResponse
+from .schemas import (
+    AdjacencyCacheResponse,
+    HealthCheckResponse,
+    QueryPlanCacheResponse,
+    VersionResponse,
+)
 
 router: APIRouter = APIRouter(tags=["System"])
 
@@ -33,3 +42,76 @@ async def health_check() -> HealthCheckResponse:
 async def version(settings: Settings = Depends(get_settings)) -> VersionResponse:
     """Get the packaged application version."""
     return VersionResponse(version=settings.app.version)
+
+
+@router.get(
+    "/adjacency-cache",
+    response_model=AdjacencyCacheResponse,
+    summary="Adjacency cache statistics",
+    description="Memory footprint and hit rate of this worker's traversal cache.",
+    status_code=HTTPStatus.OK,
+    response_description="Adjacency cache statistics",
+)
+async def adjacency_cache() -> AdjacencyCacheResponse:
+    """Report on this worker's in-memory adjacency cache."""
+    cache = get_adjacency_cache()
+    if cache is None:
+        return AdjacencyCacheResponse(enabled=False)
+
+    stats = cache.stats()
+    return AdjacencyCacheResponse(
+        enabled=True,
+        ready=stats.ready,
+        nodes=stats.nodes,
+        edges=stats.edges,
+        pending_changes=stats.pending_changes,
+        memory_bytes=stats.memory_bytes,
+        hits=stats.hits,
+        misses=stats.misses,
+        hit_rate=stats.hit_rate,
+        rebuilds=stats.rebuilds,
+        last_rebuild_seconds=stats.last_rebuild_seconds,
+    )
+
+
+@router.get(
+    "/query-plan-cache",
+    response_model=QueryPlanCacheResponse,
+    summary="Query plan cache statistics",
+    description="Size and hit rate of this worker's compiled saved-query plans.",
+    status_code=HTTPStatus.OK,
+    response_description="Query plan cache statistics",
+)
+async def query_plan_cache() -> QueryPlanCacheResponse:
+    """Report on this worker's cache of compiled saved-query statements."""
+    stats = get_query_plans().stats()
+    return QueryPlanCacheResponse(
+        size=stats.size,
+        capacity=stats.capacity,
+        hits=stats.hits,
+        misses=stats.misses,
+        hit_rate=stats.hit_rate,
+    )
+
+
+@router.get(
+    "/metrics",
+    summary="Prometheus metrics",
+    description=(
+        "Request counts and latency per route, pool usage, cache hit ratios "
+        "and queue depths, summed over every worker, in the Prometheus text "
+        "format."
+    ),
+    status_code=HTTPStatus.OK,
+    response_class=PlainTextResponse,
+    responses={HTTPStatus.NOT_FOUND: {"description": "Metrics are disabled"}},
+    response_description="Metrics in the Prometheus text format",
+)
+async def metrics() -> PlainTextResponse:
+    """Report metrics for every worker of this server."""
+    registry = get_metrics()
+    if registry is None:
+        raise HTTPException(HTTPStatus.NOT_FOUND, "Metrics are disabled")
+    return PlainTextResponse(
+        registry.render(), media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
@@ -13,3 +13,29 @@ class VersionResponse(BaseModel):
     """Response schema for the application/package version endpoint."""
 
     version: str
+
+
+class AdjacencyCacheResponse(BaseModel):
+    """Response schema for the adjacency cache statistics endpoint."""
+
+    enabled: bool
+    ready: bool = False
+    nodes: int = 0
+    edges: int = 0
+    pending_changes: int = 0
+    memory_bytes: int = 0
+    hits: int = 0
+    misses: int = 0
+    hit_rate: float = 0.0
+    rebuilds: int = 0
+    last_rebuild_seconds: float | None = None
+
+
+class QueryPlanCacheResponse(BaseModel):
+    """Response schema for the saved query plan cache statistics endpoint."""
+
+    size: int
+    capacity: int
+    hits: int
+    misses: int
+    hit_rate: float
@@ -0,0 +1,41 @@
+from http import HTTPStatus
+
+from fastapi import APIRouter, Depends, HTTPException
+
+from app.application.graph import GraphService  # noqa: TC001
+from app.domain.graph import InvalidBatchError, NodeNotFoundError
+from app.domain.node_types import InvalidPropertiesError
+from app.entrypoints.api.dependencies import get_graph_service
+
+from .schemas import BatchRequest, BatchResponse
+
+router: APIRouter = APIRouter(prefix="/batch", tags=["Batch"])
+
+
+@router.post(
+    "",
+    response_model=BatchResponse,
+    summary="Write nodes and edges together",
+    description=(
+        "Create or update many nodes and create the edges between them in "
+        "one transaction: either everything is written or nothing is. Edges "
+        "refer to new nodes by their `ref` and to stored nodes by id. A node "
+        "with a `key` updates the stored node with that key. Nodes must follow "
+        "their type's schema, if it has one. Batch sizes are capped by server "
+        "configuration."
+    ),
+    status_code=HTTPStatus.CREATED,
+    response_description="The id of each node and the stored edges",
+)
+async def write_batch(
+    body: BatchRequest,
+    service: GraphService = Depends(get_graph_service),
+) -> BatchResponse:
+    """Write a batch of nodes and edges atomically."""
+    try:
+        result = await service.write_batch(
+            body.nodes_by_ref(), [edge.to_domain() for edge in body.edges]
+        )
+    except (InvalidBatchError, InvalidPropertiesError, NodeNotFoundError) as exc:
+        raise HTTPException(HTTPStatus.UNPROCESSABLE_CONTENT, str(exc)) from exc
+    return BatchResponse.from_domain(result)
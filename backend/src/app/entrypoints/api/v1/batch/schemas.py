@@ -0,0 +1,80 @@
+from typing import TYPE_CHECKING, Annotated, Any
+
+from pydantic import BaseModel, Field, model_validator
+
+from app.domain.graph import BatchEdge, NewNode
+from app.entrypoints.api.v1.edges.schemas import EdgeResponse, EdgeType
+from app.entrypoints.api.v1.nodes.schemas import NodeCreate
+
+if TYPE_CHECKING:
+    from app.domain.graph import BatchResult
+
+type NodeRef = Annotated[str, Field(min_length=1, max_length=64)]
+
+
+class BatchNodeCreate(NodeCreate):
+    """A node written by a batch, under a reference chosen by the client."""
+
+    ref: NodeRef = Field(description="Lets edges in the same batch use the node.")
+
+
+class BatchEdgeCreate(BaseModel):
+    """An edge written by a batch."""
+
+    source: int | NodeRef = Field(
+        description="A stored node's id, or the `ref` of a node in the batch."
+    )
+    target: int | NodeRef = Field(
+        description="A stored node's id, or the `ref` of a node in the batch."
+    )
+    type: EdgeType
+    properties: dict[str, Any] = Field(default_factory=dict)
+
+    def to_domain(self) -> BatchEdge:
+        """Convert to the domain representation."""
+        return BatchEdge(
+            source=self.source,
+            target=self.target,
+            type=self.type,
+            properties=self.properties,
+        )
+
+
+class BatchRequest(BaseModel):
+    """Request schema for writing nodes and edges together."""
+
+    nodes: list[BatchNodeCreate] = Field(default_factory=list)
+    edges: list[BatchEdgeCreate] = Field(default_factory=list)
+
+    @model_validator(mode="after")
+    def check_unique_refs(self) -> BatchRequest:
+        """Reject batches that use a node reference twice."""
+        refs = [node.ref for node in self.nodes]
+        if len(set(refs)) != len(refs):
+            msg = "node refs must be unique within a batch"
+            raise ValueError(msg)
+        return self
+
+    def nodes_by_ref(self) -> dict[str, NewNode]:
+        """Return the domain nodes, keyed by reference."""
+        return {
+            node.ref: NewNode(
+                key=node.key, type=node.type, name=node.name, properties=node.properties
+            )
+            for node in self.nodes
+        }
+
+
+class BatchResponse(BaseModel):
+    """Response schema for a batch write."""
+
+    nodes: dict[str, int] = Field(description="The id of each node, by `ref`.")
+    edges: list[EdgeResponse] = Field(description="The edges, in request order.")
+
+    @classmethod
+    def from_domain(cls, result: BatchResult) -> BatchResponse:
+        """Build the response from the domain batch result."""
+        return cls(
+            nodes=result.node_ids,
+            edges=[EdgeResponse.from_domain(edge) for edge in result.edges],
+        )
@@ -0,0 +1,75 @@
+from http import HTTPStatus
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+
+from app.application.graph import GraphLoader, GraphService  # noqa: TC001
+from app.domain.graph import EdgeNotFoundError, NodeNotFoundError
+from app.entrypoints.api.dependencies import get_graph_loader, get_graph_service
+
+from .schemas import EdgeCreate, EdgeResponse
+
+router: APIRouter = APIRouter(prefix="/edges", tags=["Edges"])
+
+
+@router.post(
+    "",
+    response_model=EdgeResponse,
+    summary="Create an edge",
+    status_code=HTTPStatus.CREATED,
+    response_description="The stored edge",
+)
+async def create_edge(
+    body: EdgeCreate,
+    service: GraphService = Depends(get_graph_service),
+) -> EdgeResponse:
+    """Connect two existing nodes."""
+    try:
+        edge = await service.create_edge(body.to_domain())
+    except NodeNotFoundError as exc:
+        raise HTTPException(HTTPStatus.UNPROCESSABLE_CONTENT, str(exc)) from exc
+    return EdgeResponse.from_domain(edge)
+
+
+@router.get(
+    "/{edge_id}",
+    response_model=EdgeResponse,
+    response_model_exclude_unset=True,
+    summary="Get an edge",
+    description="Get an edge by id; with `expand`, embed its source and target.",
+    status_code=HTTPStatus.OK,
+    response_description="The requested edge",
+)
+async def get_edge(
+    edge_id: int,
+    expand: Annotated[
+        bool, Query(description="Embed the edge's source and target nodes.")
+    ] = False,
+    service: GraphService = Depends(get_graph_service),
+    loader: GraphLoader = Depends(get_graph_loader),
+) -> EdgeResponse:
+    """Get an edge by id."""
+    try:
+        edge = await service.get_edge(edge_id)
+    except EdgeNotFoundError as exc:
+        raise HTTPException(HTTPStatus.NOT_FOUND, str(exc)) from exc
+    response = EdgeResponse.from_domain(edge)
+    if expand:
+        await response.expand(loader)
+    return response
+
+
+@router.delete(
+    "/{edge_id}",
+    summary="Delete an edge",
+    status_code=HTTPStatus.NO_CONTENT,
+)
+async def delete_edge(
+    edge_id: int,
+    service: GraphService = Depends(get_graph_service),
+) -> None:
+    """Delete an edge."""
+    try:
+        await service.delete_edge(edge_id)
+    except EdgeNotFoundError as exc:
+        raise HTTPException(HTTPStatus.NOT_FOUND, str(exc)) from exc
@@ -0,0 +1,71 @@
+import asyncio
+from typing import TYPE_CHECKING, Annotated, Any
+
+from pydantic import BaseModel, Field
+
+from app.domain.graph import NewEdge
+from app.entrypoints.api.v1.nodes.schemas import NodeResponse
+
+if TYPE_CHECKING:
+    from app.application.graph import GraphLoader
+    from app.domain.graph import Edge
+
+type EdgeType = Annotated[str, Field(min_length=1, max_length=64)]
+
+
+class EdgeCreate(BaseModel):
+    """Request schema for creating an edge."""
+
+    source_id: int
+    target_id: int
+    type: EdgeType
+    properties: dict[str, Any] = Field(default_factory=dict)
+
+    def to_domain(self) -> NewEdge:
+        """Convert to the domain representation."""
+        return NewEdge(
+            source_id=self.source_id,
+            target_id=self.target_id,
+            type=self.type,
+            properties=self.properties,
+        )
+
+
+class EdgeResponse(BaseModel):
+    """Response schema for a stored edge."""
+
+    id: int
+    source_id: int
+    target_id: int
+    type: str
+    properties: dict[str, Any]
+    source: NodeResponse | None = Field(
+        default=None,
+        description="The source node; only present when expanded.",
+    )
+    target: NodeResponse | None = Field(
+        default=None,
+        description="The target node; only present when expanded.",
+    )
+
+    @classmethod
+    def from_domain(cls, edge: Edge) -> EdgeResponse:
+        """Build the response from a domain edge."""
+        return cls(
+            id=edge.id,
+            source_id=edge.source_id,
+            target_id=edge.target_id,
+            type=edge.type,
+            properties=edge.properties,
+        )
+
+    async def expand(self, loader: GraphLoader) -> None:
+        """Embed the source and target nodes, loaded through `loader`.
+
+        Expanding several edges concurrently loads all their nodes at once.
+        """
+        source, target = await asyncio.gather(
+            loader.node(self.source_id), loader.node(self.target_id)
+        )
+        self.source = NodeResponse.from_domain(source) if source else None
+        self.target = NodeResponse.from_domain(target) if target else None
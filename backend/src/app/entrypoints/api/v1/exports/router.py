@@ -0,0 +1,44 @@
+from http import HTTPStatus
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+
+from app.application.exports import ExportService  # noqa: TC001
+from app.entrypoints.api.dependencies import get_export_service
+
+router: APIRouter = APIRouter(prefix="/export", tags=["Export"])
+
+_FILENAME = "menagerist-export.ndjson"
+
+
+@router.get(
+    "",
+    summary="Export the whole graph",
+    description=(
+        "Stream every node and then every edge as NDJSON, one JSON object per "
+        "line with a `kind` of `node` or `edge`. The dump is read from a "
+        "single consistent snapshot."
+    ),
+    status_code=HTTPStatus.OK,
+    response_class=StreamingResponse,
+    responses={
+        HTTPStatus.OK: {
+            "content": {"application/x-ndjson": {}, "application/gzip": {}},
+            "description": "The graph as NDJSON, optionally gzip-compressed",
+        }
+    },
+)
+async def export_graph(
+    gzip: Annotated[
+        bool, Query(description="Compress the dump as a .ndjson.gz file.")
+    ] = False,
+    service: ExportService = Depends(get_export_service),
+) -> StreamingResponse:
+    """Export the whole graph as NDJSON."""
+    filename = f"{_FILENAME}.gz" if gzip else _FILENAME
+    return StreamingResponse(
+        service.ndjson(compress=gzip),
+        media_type="application/gzip" if gzip else "application/x-ndjson",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
@@ -0,0 +1,72 @@
+from http import HTTPStatus
+
+import structlog
+from fastapi import APIRouter, Depends, HTTPException, Request
+
+from app.application.imports import (
+    ImportFormat,
+    ImportFormatError,
+    ImportService,
+)
+from app.entrypoints.api.dependencies import get_import_service
+
+from .schemas import ImportReportResponse
+
+router: APIRouter = APIRouter(prefix="/import", tags=["Import"])
+
+_MEDIA_TYPES = {
+    "text/csv": ImportFormat.CSV,
+    "application/x-ndjson": ImportFormat.NDJSON,
+    "application/ndjson": ImportFormat.NDJSON,
+    "application/jsonl": ImportFormat.NDJSON,
+    "application/x-jsonlines": ImportFormat.NDJSON,
+}
+
+
+def _body_format(request: Request, requested: ImportFormat | None) -> ImportFormat:
+    if requested is not None:
+        return requested
+    media_type = request.headers.get("content-type", "").partition(";")[0]
+    fmt = _MEDIA_TYPES.get(media_type.strip().lower())
+    if fmt is None:
+        msg = "Send text/csv or application/x-ndjson, or pass ?format=csv|ndjson"
+        raise HTTPException(HTTPStatus.UNSUPPORTED_MEDIA_TYPE, msg)
+    return fmt
+
+
+@router.post(
+    "",
+    response_model=ImportReportResponse,
+    summary="Bulk import nodes and edges",
+    description=(
+        "Stream NDJSON or CSV rows describing nodes and edges. Rows with "
+        "`source` and `target` columns are edges, whose endpoints are node "
+        "`key`s; every other row is a node. The body is parsed incrementally "
+        "and written in batches, and the whole import is applied atomically."
+    ),
+    status_code=HTTPStatus.OK,
+    response_description="Counts, rejected rows and throughput",
+)
+async def import_graph(
+    request: Request,
+    format: ImportFormat | None = None,
+    service: ImportService = Depends(get_import_service),
+) -> ImportReportResponse:
+    """Bulk import nodes and edges from a streamed body."""
+    fmt = _body_format(request, format)
+    try:
+        report = await service.run(request.stream(), fmt)
+    except ImportFormatError as exc:
+        raise HTTPException(HTTPStatus.UNPROCESSABLE_CONTENT, str(exc)) from exc
+
+    structlog.get_logger("import").info(
+        "import.completed",
+        format=fmt,
+        rows=report.rows,
+        nodes=report.nodes,
+        edges=report.edges,
+        rejected=report.rejected,
+        unresolved_edges=report.unresolved_edges,
+        rows_per_second=round(report.rows_per_second),
+    )
+    return ImportReportResponse.from_domain(report)
@@ -0,0 +1,47 @@
+from typing import TYPE_CHECKING
+
+from pydantic import BaseModel, Field
+
+if TYPE_CHECKING:
+    from app.application.imports import ImportReport
+
+
+class RejectedRowResponse(BaseModel):
+    """A row that was not imported."""
+
+    line: int
+    reason: str
+
+
+class ImportReportResponse(BaseModel):
+    """Response schema for a completed bulk import."""
+
+    rows: int = Field(description="Rows read from the body.")
+    nodes: int = Field(description="Nodes created or updated.")
+    edges: int = Field(description="Edges created.")
+    unresolved_edges: int = Field(
+        description="Edges skipped because an endpoint key matched no node."
+    )
+    rejected: int = Field(description="Rows skipped because they were invalid.")
+    errors: list[RejectedRowResponse] = Field(
+        description="Details for the first skipped rows, up to a server limit."
+    )
+    seconds: float
+    rows_per_second: float
+
+    @classmethod
+    def from_domain(cls, report: ImportReport) -> ImportReportResponse:
+        """Build the response from an import report."""
+        return cls(
+            rows=report.rows,
+            nodes=report.nodes,
+            edges=report.edges,
+            unresolved_edges=report.unresolved_edges,
+            rejected=report.rejected,
+            errors=[
+                RejectedRowResponse(line=row.line, reason=row.reason)
+                for row in report.errors
+            ],
+            seconds=report.seconds,
+            rows_per_second=report.rows_per_second,
+        )
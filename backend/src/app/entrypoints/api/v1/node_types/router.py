@@ -0,0 +1,109 @@
+from http import HTTPStatus
+
+from fastapi import APIRouter, Depends, HTTPException
+
+from app.application.node_types import NodeTypeService  # noqa: TC001
+from app.domain.node_types import InvalidNodeTypeError, NodeTypeNotFoundError
+from app.entrypoints.api.dependencies import get_node_type_service
+
+from .schemas import FieldIndexResponse, NodeTypeDefinition, NodeTypeResponse
+
+router: APIRouter = APIRouter(prefix="/node-types", tags=["Node types"])
+
+
+@router.get(
+    "",
+    response_model=list[NodeTypeResponse],
+    summary="List node types",
+    description="List the node types that have a schema, ordered by name.",
+    status_code=HTTPStatus.OK,
+    response_description="Every node type schema",
+)
+async def list_node_types(
+    service: NodeTypeService = Depends(get_node_type_service),
+) -> list[NodeTypeResponse]:
+    """List node type schemas."""
+    return [NodeTypeResponse.from_domain(s) for s in await service.list_types()]
+
+
+@router.put(
+    "/{name}",
+    response_model=NodeTypeResponse,
+    summary="Define a node type",
+    description=(
+        "Create or replace the schema of a node type. New nodes of the type "
+        "must then have properties of the declared kinds. Filterable fields "
+        "are indexed in the background; see `/node-types/{name}/indexes`."
+    ),
+    status_code=HTTPStatus.OK,
+    response_description="The stored schema",
+)
+async def define_node_type(
+    name: str,
+    body: NodeTypeDefinition,
+    service: NodeTypeService = Depends(get_node_type_service),
+) -> NodeTypeResponse:
+    """Define a node type."""
+    try:
+        schema = await service.define(
+            name, [field.to_domain() for field in body.fields]
+        )
+    except InvalidNodeTypeError as exc:
+        raise HTTPException(HTTPStatus.UNPROCESSABLE_CONTENT, str(exc)) from exc
+    return NodeTypeResponse.from_domain(schema)
+
+
+@router.get(
+    "/{name}",
+    response_model=NodeTypeResponse,
+    summary="Get a node type",
+    status_code=HTTPStatus.OK,
+    response_description="The requested schema",
+)
+async def get_node_type(
+    name: str,
+    service: NodeTypeService = Depends(get_node_type_service),
+) -> NodeTypeResponse:
+    """Get a node type's schema."""
+    try:
+        schema = await service.get(name)
+    except NodeTypeNotFoundError as exc:
+        raise HTTPException(HTTPStatus.NOT_FOUND, str(exc)) from exc
+    return NodeTypeResponse.from_domain(schema)
+
+
+@router.delete(
+    "/{name}",
+    summary="Delete a node type",
+    description="Delete a node type's schema; its indexes are dropped.",
+    status_code=HTTPStatus.NO_CONTENT,
+)
+async def delete_node_type(
+    name: str,
+    service: NodeTypeService = Depends(get_node_type_service),
+) -> None:
+    """Delete a node type's schema."""
+    try:
+        await service.delete(name)
+    except NodeTypeNotFoundError as exc:
+        raise HTTPException(HTTPStatus.NOT_FOUND, str(exc)) from exc
+
+
+@router.get(
+    "/{name}/indexes",
+    response_model=list[FieldIndexResponse],
+    summary="List a node type's indexes",
+    description="Show how far each filterable field's index has been built.",
+    status_code=HTTPStatus.OK,
+    response_description="The indexes of the type's fields, by field",
+)
+async def list_field_indexes(
+    name: str,
+    service: NodeTypeService = Depends(get_node_type_service),
+) -> list[FieldIndexResponse]:
+    """List the indexes of a node type's fields."""
+    try:
+        indexes = await service.indexes(name)
+    except NodeTypeNotFoundError as exc:
+        raise HTTPException(HTTPStatus.NOT_FOUND, str(exc)) from exc
+    return [FieldIndexResponse.from_domain(index) for index in indexes]
@@ -0,0 +1,85 @@
+from typing import TYPE_CHECKING, Annotated
+
+from pydantic import BaseModel, Field
+
+from app.domain.node_types import FieldKind, FieldSpec, IndexState
+
+if TYPE_CHECKING:
+    from app.domain.node_types import FieldIndex, NodeTypeSchema
+
+type FieldName = Annotated[str, Field(min_length=1, max_length=48)]
+
+
+class FieldDefinition(BaseModel):
+    """A declared property of a node type."""
+
+    name: FieldName
+    kind: FieldKind
+    required: bool = False
+    filterable: bool = Field(
+        default=False,
+        description="Index the field, so that saved queries can filter on it.",
+    )
+
+    def to_domain(self) -> FieldSpec:
+        """Convert to the domain representation."""
+        return FieldSpec(
+            name=self.name,
+            kind=self.kind,
+            required=self.required,
+            filterable=self.filterable,
+        )
+
+    @classmethod
+    def from_domain(cls, spec: FieldSpec) -> FieldDefinition:
+        """Build the schema from a domain field."""
+        return cls(
+            name=spec.name,
+            kind=spec.kind,
+            required=spec.required,
+            filterable=spec.filterable,
+        )
+
+
+class NodeTypeDefinition(BaseModel):
+    """Request schema for defining a node type."""
+
+    fields: list[FieldDefinition]
+
+
+class NodeTypeResponse(BaseModel):
+    """Response schema for a node type."""
+
+    name: str
+    version: int
+    fields: list[FieldDefinition]
+
+    @classmethod
+    def from_domain(cls, schema: NodeTypeSchema) -> NodeTypeResponse:
+        """Build the response from a domain node type schema."""
+        return cls(
+            name=schema.name,
+            version=schema.version,
+            fields=[FieldDefinition.from_domain(spec) for spec in schema.fields],
+        )
+
+
+class FieldIndexResponse(BaseModel):
+    """Response schema for the index of a filterable field."""
+
+    field: str
+    kind: FieldKind
+    name: str
+    state: IndexState
+    error: str | None
+
+    @classmethod
+    def from_domain(cls, index: FieldIndex) -> FieldIndexResponse:
+        """Build the response from a domain field index."""
+        return cls(
+            field=index.field,
+            kind=index.kind,
+            name=index.name,
+            state=index.state,
+            error=index.error,
+        )
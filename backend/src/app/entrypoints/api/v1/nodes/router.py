@@ -0,0 +1,167 @@
+import asyncio
+from http import HTTPStatus
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+
+from app.application.graph import GraphLoader, GraphService  # noqa: TC001
+from app.domain.graph import Direction, DuplicateNodeKeyError, NodeNotFoundError
+from app.domain.node_types import InvalidPropertiesError
+from app.domain.pagination import PageRequest  # noqa: TC001
+from app.entrypoints.api.dependencies import (
+    get_graph_loader,
+    get_graph_reader,
+    get_graph_service,
+)
+from app.entrypoints.api.v1.edges.schemas import EdgeResponse
+from app.entrypoints.api.v1.pagination import PageResponse, page_request
+
+from .schemas import NeighbourhoodResponse, NodeCreate, NodeResponse, NodeType
+
+router: APIRouter = APIRouter(prefix="/nodes", tags=["Nodes"])
+
+
+@router.get(
+    "",
+    response_model=PageResponse[NodeResponse],
+    summary="List nodes",
+    description="List nodes ordered by type then id, optionally of one type.",
+    status_code=HTTPStatus.OK,
+    response_description="One page of nodes",
+)
+async def list_nodes(
+    type: NodeType | None = None,
+    page: PageRequest = Depends(page_request),
+    service: GraphService = Depends(get_graph_service),
+) -> PageResponse[NodeResponse]:
+    """List nodes, a page at a time."""
+    result = await service.list_nodes(page, node_type=type)
+    return PageResponse[NodeResponse].from_domain(result, NodeResponse.from_domain)
+
+
+@router.post(
+    "",
+    response_model=NodeResponse,
+    summary="Create a node",
+    status_code=HTTPStatus.CREATED,
+    response_description="The stored node",
+)
+async def create_node(
+    body: NodeCreate,
+    service: GraphService = Depends(get_graph_service),
+) -> NodeResponse:
+    """Create a node."""
+    try:
+        node = await service.create_node(body.to_domain())
+    except DuplicateNodeKeyError as exc:
+        raise HTTPException(HTTPStatus.CONFLICT, str(exc)) from exc
+    except InvalidPropertiesError as exc:
+        raise HTTPException(HTTPStatus.UNPROCESSABLE_CONTENT, str(exc)) from exc
+    return NodeResponse.from_domain(node)
+
+
+@router.get(
+    "/{node_id}",
+    response_model=NodeResponse,
+    summary="Get a node",
+    status_code=HTTPStatus.OK,
+    response_description="The requested node",
+)
+async def get_node(
+    node_id: int,
+    service: GraphService = Depends(get_graph_service),
+) -> NodeResponse:
+    """Get a node by id."""
+    try:
+        node = await service.get_node(node_id)
+    except NodeNotFoundError as exc:
+        raise HTTPException(HTTPStatus.NOT_FOUND, str(exc)) from exc
+    return NodeResponse.from_domain(node)
+
+
+@router.delete(
+    "/{node_id}",
+    summary="Delete a node",
+    description="Delete a node together with every edge touching it.",
+    status_code=HTTPStatus.NO_CONTENT,
+)
+async def delete_node(
+    node_id: int,
+    service: GraphService = Depends(get_graph_service),
+) -> None:
+    """Delete a node and its edges."""
+    try:
+        await service.delete_node(node_id)
+    except NodeNotFoundError as exc:
+        raise HTTPException(HTTPStatus.NOT_FOUND, str(exc)) from exc
+
+
+@router.get(
+    "/{node_id}/edges",
+    response_model=PageResponse[EdgeResponse],
+    response_model_exclude_unset=True,
+    summary="List a node's edges",
+    description=(
+        "List the edges touching a node, ordered by type then id. "
+        "`direction` chooses outgoing, incoming or both. With `expand`, each "
+        "edge embeds its source and target nodes, all loaded in one query."
+    ),
+    status_code=HTTPStatus.OK,
+    response_description="One page of edges",
+)
+async def list_edges(
+    node_id: int,
+    direction: Direction = Direction.BOTH,
+    edge_types: Annotated[
+        list[str] | None,
+        Query(description="Only list edges of these types (repeatable)."),
+    ] = None,
+    expand: Annotated[
+        bool, Query(description="Embed each edge's source and target nodes.")
+    ] = False,
+    page: PageRequest = Depends(page_request),
+    service: GraphService = Depends(get_graph_service),
+    loader: GraphLoader = Depends(get_graph_loader),
+) -> PageResponse[EdgeResponse]:
+    """List the edges of a node, a page at a time."""
+    try:
+        result = await service.list_edges(
+            node_id, page, direction=direction, edge_types=edge_types
+        )
+    except NodeNotFoundError as exc:
+        raise HTTPException(HTTPStatus.NOT_FOUND, str(exc)) from exc
+    response = PageResponse[EdgeResponse].from_domain(result, EdgeResponse.from_domain)
+    if expand:
+        await asyncio.gather(*(item.expand(loader) for item in response.items))
+    return response
+
+
+@router.get(
+    "/{node_id}/neighbourhood",
+    response_model=NeighbourhoodResponse,
+    summary="Explore a node's neighbourhood",
+    description=(
+        "Find every node within `depth` hops of a node in a single query. "
+        "Depth and result count are capped by server configuration."
+    ),
+    status_code=HTTPStatus.OK,
+    response_description="Nodes reachable from the origin, nearest first",
+)
+async def neighbourhood(
+    node_id: int,
+    depth: Annotated[int, Query(ge=1)] = 1,
+    direction: Direction = Direction.BOTH,
+    edge_types: Annotated[
+        list[str] | None,
+        Query(description="Only follow edges of these types (repeatable)."),
+    ] = None,
+    service: GraphService = Depends(get_graph_reader),
+) -> NeighbourhoodResponse:
+    """Explore the nodes surrounding a node."""
+    try:
+        result = await service.neighbourhood(
+            node_id, depth=depth, direction=direction, edge_types=edge_types
+        )
+    except NodeNotFoundError as exc:
+        raise HTTPException(HTTPStatus.NOT_FOUND, str(exc)) from exc
+    return NeighbourhoodResponse.from_domain(result)
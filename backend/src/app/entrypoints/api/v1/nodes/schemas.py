@@ -0,0 +1,90 @@
+from typing import TYPE_CHECKING, Annotated, Any
+
+from pydantic import BaseModel, Field
+
+from app.domain.graph import NewNode
+
+if TYPE_CHECKING:
+    from app.application.graph import Neighbourhood
+    from app.domain.graph import Neighbour, Node
+
+type NodeType = Annotated[str, Field(min_length=1, max_length=64)]
+type NodeKey = Annotated[str, Field(min_length=1, max_length=255)]
+
+
+class NodeCreate(BaseModel):
+    """Request schema for creating a node."""
+
+    type: NodeType
+    name: str = Field(min_length=1)
+    properties: dict[str, Any] = Field(default_factory=dict)
+    key: NodeKey | None = None
+
+    def to_domain(self) -> NewNode:
+        """Convert to the domain representation."""
+        return NewNode(
+            key=self.key, type=self.type, name=self.name, properties=self.properties
+        )
+
+
+class NodeResponse(BaseModel):
+    """Response schema for a stored node."""
+
+    id: int
+    key: str | None
+    type: str
+    name: str
+    properties: dict[str, Any]
+
+    @classmethod
+    def from_domain(cls, node: Node) -> NodeResponse:
+        """Build the response from a domain node."""
+        return cls(
+            id=node.id,
+            key=node.key,
+            type=node.type,
+            name=node.name,
+            properties=node.properties,
+        )
+
+
+class NeighbourResponse(NodeResponse):
+    """A node reached by a traversal."""
+
+    depth: int
+
+    @classmethod
+    def from_neighbour(cls, neighbour: Neighbour) -> NeighbourResponse:
+        """Build the response from a traversal result."""
+        node = neighbour.node
+        return cls(
+            id=node.id,
+            key=node.key,
+            type=node.type,
+            name=node.name,
+            properties=node.properties,
+            depth=neighbour.depth,
+        )
+
+
+class NeighbourhoodResponse(BaseModel):
+    """Response schema for a neighbourhood traversal."""
+
+    origin: NodeResponse
+    depth: int = Field(description="Depth actually used, after applying the cap.")
+    neighbours: list[NeighbourResponse]
+    truncated: bool = Field(
+        description="Whether more neighbours exist than the result cap allows."
+    )
+
+    @classmethod
+    def from_domain(cls, neighbourhood: Neighbourhood) -> NeighbourhoodResponse:
+        """Build the response from a domain neighbourhood."""
+        return cls(
+            origin=NodeResponse.from_domain(neighbourhood.origin),
+            depth=neighbourhood.depth,
+            neighbours=[
+                NeighbourResponse.from_neighbour(n) for n in neighbourhood.neighbours
+            ],
+            truncated=neighbourhood.truncated,
+        )
@@ -0,0 +1,86 @@
+"""Cursor pagination shared by the v1 list endpoints.
+
+List endpoints take `Depends(page_request)` and return a `PageResponse`.
+Cursors are opaque to clients; they encode the `(sort key, id)` position of
+the last item returned, which repositories turn into an index seek.
+"""
+
+import base64
+import binascii
+import json
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Annotated
+
+from fastapi import Depends, HTTPException, Query
+from pydantic import BaseModel, Field
+
+from app.domain.pagination import PageRequest, Position
+from app.shared.config import Settings, get_settings
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from app.domain.pagination import Page
+
+__all__ = ["PageResponse", "decode_cursor", "encode_cursor", "page_request"]
+
+
+def encode_cursor(position: Position) -> str:
+    """Encode a position as an opaque, URL-safe cursor."""
+    raw = json.dumps([position.sort_key, position.id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> Position:
+    """Decode a cursor produced by `encode_cursor`.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        sort_key, id_ = json.loads(raw)
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as exc:
+        msg = "malformed cursor"
+        raise ValueError(msg) from exc
+    if not isinstance(sort_key, str) or not isinstance(id_, int):
+        msg = "malformed cursor"
+        raise ValueError(msg)
+    return Position(sort_key, id_)
+
+
+def page_request(
+    cursor: Annotated[
+        str | None,
+        Query(description="`next_cursor` from the previous page."),
+    ] = None,
+    limit: Annotated[
+        int | None,
+        Query(ge=1, description="Page size; capped by server configuration."),
+    ] = None,
+    settings: Settings = Depends(get_settings),
+) -> PageRequest:
+    """Read the `cursor` and `limit` query parameters of a list endpoint."""
+    try:
+        after = decode_cursor(cursor) if cursor else None
+    except ValueError as exc:
+        raise HTTPException(HTTPStatus.BAD_REQUEST, "Invalid cursor") from exc
+    size = min(limit or settings.api.default_page_size, settings.api.max_page_size)
+    return PageRequest(limit=size, after=after)
+
+
+class PageResponse[T](BaseModel):
+    """Response envelope for one page of a list endpoint."""
+
+    items: list[T]
+    next_cursor: str | None = Field(
+        description="Pass as `cursor` to fetch the next page; null on the last."
+    )
+
+    @classmethod
+    def from_domain[D](cls, page: Page[D], item: Callable[[D], T]) -> PageResponse[T]:
+        """Build the response from a domain page, converting each item."""
+        return cls(
+            items=[item(entry) for entry in page.items],
+            next_cursor=encode_cursor(page.next) if page.next else None,
+        )
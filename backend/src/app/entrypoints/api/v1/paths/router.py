@@ -0,0 +1,52 @@
+from http import HTTPStatus
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+
+from app.application.graph import GraphService  # noqa: TC001
+from app.domain.graph import Direction, NodeNotFoundError
+from app.entrypoints.api.dependencies import get_graph_reader
+
+from .schemas import PathsResponse
+
+router: APIRouter = APIRouter(prefix="/paths", tags=["Paths"])
+
+
+@router.get(
+    "",
+    response_model=PathsResponse,
+    summary="Find how two nodes are connected",
+    description=(
+        "Find the `k` shortest paths between two nodes, shortest first, "
+        "searching from both ends at once. Paths never visit a node twice. "
+        "Depth, path count and search effort are capped by server "
+        "configuration."
+    ),
+    status_code=HTTPStatus.OK,
+    response_description="Paths from the origin to the destination",
+)
+async def paths(
+    origin: Annotated[int, Query(alias="from", description="Origin node id.")],
+    destination: Annotated[int, Query(alias="to", description="Destination node id.")],
+    k: Annotated[int, Query(ge=1, description="Number of paths wanted.")] = 1,
+    max_depth: Annotated[int | None, Query(ge=1)] = None,
+    direction: Direction = Direction.BOTH,
+    edge_types: Annotated[
+        list[str] | None,
+        Query(description="Only follow edges of these types (repeatable)."),
+    ] = None,
+    service: GraphService = Depends(get_graph_reader),
+) -> PathsResponse:
+    """Find the shortest paths between two nodes."""
+    try:
+        result = await service.paths(
+            origin,
+            destination,
+            count=k,
+            max_depth=max_depth,
+            direction=direction,
+            edge_types=edge_types,
+        )
+    except NodeNotFoundError as exc:
+        raise HTTPException(HTTPStatus.NOT_FOUND, str(exc)) from exc
+    return PathsResponse.from_domain(result)
@@ -0,0 +1,67 @@
+from typing import TYPE_CHECKING
+
+from pydantic import BaseModel, Field
+
+from app.entrypoints.api.v1.nodes.schemas import NodeResponse
+
+if TYPE_CHECKING:
+    from app.application.graph import Connections
+    from app.domain.graph import Link, Path
+
+
+class LinkResponse(BaseModel):
+    """An edge followed by a path, in its stored direction."""
+
+    source_id: int
+    target_id: int
+    type: str
+
+    @classmethod
+    def from_domain(cls, link: Link) -> LinkResponse:
+        """Build the response from a domain link."""
+        return cls(source_id=link.source_id, target_id=link.target_id, type=link.type)
+
+
+class PathResponse(BaseModel):
+    """One path: `links[i]` joins `nodes[i]` to `nodes[i + 1]`."""
+
+    length: int = Field(description="Number of links in the path.")
+    nodes: list[NodeResponse]
+    links: list[LinkResponse]
+
+    @classmethod
+    def from_domain(cls, path: Path) -> PathResponse:
+        """Build the response from a domain path."""
+        return cls(
+            length=len(path.links),
+            nodes=[NodeResponse.from_domain(node) for node in path.nodes],
+            links=[LinkResponse.from_domain(link) for link in path.links],
+        )
+
+
+class PathsResponse(BaseModel):
+    """Response schema for a path search."""
+
+    origin: NodeResponse
+    destination: NodeResponse
+    max_depth: int = Field(
+        description="Longest path searched for, after applying the cap."
+    )
+    paths: list[PathResponse]
+    truncated: bool = Field(
+        description=(
+            "Whether the search stopped at the server's visit limit, so that "
+            "other paths may exist."
+        )
+    )
+
+    @classmethod
+    def from_domain(cls, connections: Connections) -> PathsResponse:
+        """Build the response from the domain search result."""
+        return cls(
+            origin=NodeResponse.from_domain(connections.origin),
+            destination=NodeResponse.from_domain(connections.destination),
+            max_depth=connections.max_depth,
+            paths=[PathResponse.from_domain(path) for path in connections.paths],
+            truncated=connections.truncated,
+        )
@@ -0,0 +1,45 @@
+"""Responses for photo files, which never change once stored."""
+
+from http import HTTPStatus
+from typing import TYPE_CHECKING
+
+from fastapi import Request, Response
+from fastapi.responses import FileResponse
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+__all__ = ["immutable_file", "not_modified"]
+
+# A file's content is fixed by the digest in its URL, so caches may keep it
+# for good and need not revalidate it.
+_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+def _headers(etag: str) -> dict[str, str]:
+    return {"ETag": etag, "Cache-Control": _CACHE_CONTROL}
+
+
+def not_modified(request: Request, etag: str) -> Response | None:
+    """Return `304 Not Modified` if the client's `If-None-Match` has `etag`.
+
+    Only call this once the file is known to exist: `*` matches any current
+    representation, so a missing file must still get `404 Not Found`.
+    """
+    header = request.headers.get("if-none-match")
+    if header is None:
+        return None
+    tags = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    if "*" in tags or etag in tags:
+        return Response(status_code=HTTPStatus.NOT_MODIFIED, headers=_headers(etag))
+    return None
+
+
+def immutable_file(path: Path, *, etag: str, media_type: str) -> FileResponse:
+    """Serve a stored file with a strong `etag` and immutable caching.
+
+    `Range` requests get `206 Partial Content`. Whole files are handed to
+    the server by path (the ASGI pathsend extension, which Granian sends
+    with sendfile), so their bytes never pass through Python.
+    """
+    return FileResponse(path, media_type=media_type, headers=_headers(etag))
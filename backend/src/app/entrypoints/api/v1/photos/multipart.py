@@ -0,0 +1,115 @@
+"""Incremental reader for one file in a `multipart/form-data` body.
+
+The file's bytes are yielded as they arrive; at most one network chunk plus
+a boundary's worth of bytes is held at a time, however large the file.
+"""
+
+from email.message import Message
+from email.parser import BytesHeaderParser
+from email.utils import collapse_rfc2231_value
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, AsyncIterator
+
+__all__ = ["MultipartError", "boundary", "file_part"]
+
+_MAX_HEADER_BYTES = 16 * 1024
+
+
+class MultipartError(ValueError):
+    """Raised when a multipart body is malformed or lacks the expected file."""
+
+
+def _param(header: str, name: str, value: str) -> str | None:
+    message = Message()
+    message[header] = value
+    param = message.get_param(name, header=header)
+    return collapse_rfc2231_value(param) if param is not None else None
+
+
+def boundary(content_type: str) -> bytes | None:
+    """Return the boundary of a `multipart/form-data` content type, if it is one."""
+    media_type = content_type.partition(";")[0].strip().lower()
+    if media_type != "multipart/form-data":
+        return None
+    value = _param("content-type", "boundary", content_type)
+    return value.encode("latin-1") if value else None
+
+
+class _Reader:
+    def __init__(self, chunks: AsyncIterable[bytes]) -> None:
+        self._chunks = aiter(chunks)
+        self.buffer = b""
+
+    async def fill(self) -> None:
+        try:
+            chunk = await anext(self._chunks)
+        except StopAsyncIteration:
+            msg = "multipart body ended unexpectedly"
+            raise MultipartError(msg) from None
+        self.buffer += chunk
+
+    async def skip_past(self, marker: bytes) -> bytes:
+        """Consume up to and including `marker`, returning what preceded it."""
+        start = 0
+        while (index := self.buffer.find(marker, start)) < 0:
+            if len(self.buffer) > _MAX_HEADER_BYTES:
+                msg = "multipart headers too long"
+                raise MultipartError(msg)
+            start = max(0, len(self.buffer) - len(marker) + 1)
+            await self.fill()
+        before = self.buffer[:index]
+        self.buffer = self.buffer[index + len(marker) :]
+        return before
+
+    async def stream_until(self, marker: bytes) -> AsyncIterator[bytes]:
+        """Yield everything before `marker`, then consume the marker."""
+        # A marker may straddle two chunks, so the last few bytes are held
+        # back until the next chunk shows they are not the start of one.
+        keep = len(marker) - 1
+        while (index := self.buffer.find(marker)) < 0:
+            if len(self.buffer) > keep:
+                yield self.buffer[:-keep]
+                self.buffer = self.buffer[-keep:]
+            await self.fill()
+        if index:
+            yield self.buffer[:index]
+        self.buffer = self.buffer[index + len(marker) :]
+
+
+def _field_name(headers: bytes) -> str | None:
+    message = BytesHeaderParser().parsebytes(headers.lstrip(b"\r\n") + b"\r\n\r\n")
+    disposition = message.get("content-disposition")
+    if disposition is None:
+        return None
+    return _param("content-disposition", "name", str(disposition))
+
+
+async def file_part(
+    chunks: AsyncIterable[bytes], boundary: bytes, *, field: str
+) -> AsyncIterator[bytes]:
+    """Yield the content of the part named `field`, skipping any other parts.
+
+    Raises:
+        MultipartError: If the body is malformed or has no such part.
+    """
+    reader = _Reader(chunks)
+    # Every delimiter but the first is preceded by CRLF; start with one so
+    # the first needs no special case.
+    reader.buffer = b"\r\n"
+    delimiter = b"\r\n--" + boundary
+    await reader.skip_past(delimiter)
+    while True:
+        while len(reader.buffer) < 2:
+            await reader.fill()
+        if reader.buffer.startswith(b"--"):
+            msg = f"multipart body has no {field!r} part"
+            raise MultipartError(msg)
+        name = _field_name(await reader.skip_past(b"\r\n\r\n"))
+        if name == field:
+            async for data in reader.stream_until(delimiter):
+                yield data
+            return
+        async for _ in reader.stream_until(delimiter):
+            pass
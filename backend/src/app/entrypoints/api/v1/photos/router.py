@@ -0,0 +1,160 @@
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any
+
+import structlog
+from fastapi import APIRouter, Depends, HTTPException, Path, Request, Response
+from fastapi.responses import FileResponse
+
+from app.application.photos import (
+    DerivativeError,
+    DerivativeService,
+    PhotoNotFoundError,
+    PhotoService,
+    PhotoTooLargeError,
+    UnavailableDerivativeError,
+    UnsupportedPhotoError,
+)
+from app.domain.photos import DerivativeFormat, is_digest
+from app.entrypoints.api.dependencies import get_derivative_service, get_photo_service
+from app.shared.config import Settings, get_settings
+
+from .files import immutable_file, not_modified
+from .multipart import MultipartError, boundary, file_part
+from .schemas import PhotoResponse
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+router: APIRouter = APIRouter(prefix="/photos", tags=["Photos"])
+
+_FIELD = "file"
+
+
+def _photo_body(request: Request) -> AsyncIterator[bytes]:
+    content_type = request.headers.get("content-type", "")
+    if (delimiter := boundary(content_type)) is not None:
+        return file_part(request.stream(), delimiter, field=_FIELD)
+    media_type = content_type.partition(";")[0].strip().lower()
+    if media_type.startswith("image/") or media_type == "application/octet-stream":
+        return request.stream()
+    msg = f"Send multipart/form-data with a {_FIELD!r} part, or the image itself"
+    raise HTTPException(HTTPStatus.UNSUPPORTED_MEDIA_TYPE, msg)
+
+
+@router.post(
+    "",
+    response_model=PhotoResponse,
+    summary="Upload a photo",
+    description=(
+        f"Send the photo as the `{_FIELD}` part of a `multipart/form-data` "
+        "body, or as the raw request body. Photos are stored by the SHA-256 "
+        "of their content: uploading one that is already stored returns it "
+        "with `200 OK` instead of `201 Created`, and takes no extra space."
+    ),
+    status_code=HTTPStatus.CREATED,
+    responses={HTTPStatus.OK: {"model": PhotoResponse, "description": "Duplicate"}},
+    response_description="The stored photo",
+)
+async def upload_photo(
+    request: Request,
+    response: Response,
+    service: PhotoService = Depends(get_photo_service),
+    settings: Settings = Depends(get_settings),
+) -> PhotoResponse:
+    """Store a streamed photo under its content hash."""
+    length = request.headers.get("content-length", "")
+    if length.isdigit() and int(length) > settings.photos.max_bytes:
+        msg = f"Photos are limited to {settings.photos.max_bytes} bytes"
+        raise HTTPException(HTTPStatus.CONTENT_TOO_LARGE, msg)
+    try:
+        photo, created = await service.upload(_photo_body(request))
+    except PhotoTooLargeError as exc:
+        raise HTTPException(HTTPStatus.CONTENT_TOO_LARGE, str(exc)) from exc
+    except UnsupportedPhotoError as exc:
+        raise HTTPException(HTTPStatus.UNSUPPORTED_MEDIA_TYPE, str(exc)) from exc
+    except MultipartError as exc:
+        raise HTTPException(HTTPStatus.BAD_REQUEST, str(exc)) from exc
+
+    if not created:
+        response.status_code = HTTPStatus.OK
+    structlog.get_logger("photos").info(
+        "photo.uploaded",
+        digest=photo.digest,
+        size=photo.size,
+        media_type=photo.media_type,
+        created=created,
+    )
+    return PhotoResponse.from_domain(photo)
+
+
+_FILE_RESPONSES: dict[int | str, dict[str, Any]] = {
+    HTTPStatus.OK: {"content": {"image/*": {}}},
+    HTTPStatus.PARTIAL_CONTENT: {"description": "The requested `Range`"},
+    HTTPStatus.NOT_MODIFIED: {"description": "Unchanged since `If-None-Match`"},
+    HTTPStatus.NOT_FOUND: {"description": "Not found"},
+}
+
+
+def _check_digest(digest: str) -> None:
+    if not is_digest(digest):
+        raise HTTPException(HTTPStatus.NOT_FOUND, f"photo {digest} not found")
+
+
+@router.get(
+    "/{digest}",
+    summary="Get a photo",
+    description=(
+        "Return the photo as uploaded. Its `ETag` is its digest and it may be "
+        "cached indefinitely. `Range` and `If-None-Match` are supported."
+    ),
+    response_class=FileResponse,
+    responses=_FILE_RESPONSES,
+)
+async def get_photo(
+    digest: str,
+    request: Request,
+    service: PhotoService = Depends(get_photo_service),
+) -> Response:
+    """Serve a stored photo."""
+    _check_digest(digest)
+    try:
+        photo, path = await service.find(digest)
+    except PhotoNotFoundError as exc:
+        raise HTTPException(HTTPStatus.NOT_FOUND, str(exc)) from exc
+    etag = f'"{digest}"'
+    if (response := not_modified(request, etag)) is not None:
+        return response
+    return immutable_file(path, etag=etag, media_type=photo.media_type)
+
+
+@router.get(
+    "/{digest}/derivatives/{size}.{fmt}",
+    summary="Get a resized photo",
+    description=(
+        "Return the photo scaled down to fit within `size` x `size` pixels, "
+        "in the given format. Only the configured sizes and formats are "
+        "offered. Each is rendered on first request and kept, and is cached "
+        "like the photo itself."
+    ),
+    response_class=FileResponse,
+    responses=_FILE_RESPONSES,
+)
+async def get_derivative(
+    digest: str,
+    fmt: DerivativeFormat,
+    request: Request,
+    size: int = Path(ge=1),
+    service: DerivativeService = Depends(get_derivative_service),
+) -> Response:
+    """Serve a derivative of a stored photo."""
+    _check_digest(digest)
+    try:
+        path = await service.derivative(digest, size=size, fmt=fmt)
+    except (PhotoNotFoundError, UnavailableDerivativeError) as exc:
+        raise HTTPException(HTTPStatus.NOT_FOUND, str(exc)) from exc
+    except DerivativeError as exc:
+        raise HTTPException(HTTPStatus.UNPROCESSABLE_CONTENT, str(exc)) from exc
+    etag = f'"{digest}-{size}.{fmt}"'
+    if (response := not_modified(request, etag)) is not None:
+        return response
+    return immutable_file(path, etag=etag, media_type=fmt.media_type)
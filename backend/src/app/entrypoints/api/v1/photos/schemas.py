@@ -0,0 +1,19 @@
+from typing import TYPE_CHECKING
+
+from pydantic import BaseModel, Field
+
+if TYPE_CHECKING:
+    from app.domain.photos import Photo
+
+
+class PhotoResponse(BaseModel):
+    """Response schema for a stored photo."""
+
+    digest: str = Field(description="SHA-256 of the photo; it identifies the photo.")
+    size: int = Field(description="Size in bytes.")
+    media_type: str = Field(description="Image type, detected from the content.")
+
+    @classmethod
+    def from_domain(cls, photo: Photo) -> PhotoResponse:
+        """Build the response from a domain photo."""
+        return cls(digest=photo.digest, size=photo.size, media_type=photo.media_type)
@@ -0,0 +1,114 @@
+from http import HTTPStatus
+
+from fastapi import APIRouter, Depends, HTTPException
+
+from app.application.queries import QueryService  # noqa: TC001
+from app.domain.pagination import PageRequest  # noqa: TC001
+from app.domain.queries import InvalidFilterError, SavedQueryNotFoundError
+from app.entrypoints.api.dependencies import get_query_service
+from app.entrypoints.api.v1.nodes.schemas import NodeResponse
+from app.entrypoints.api.v1.pagination import PageResponse, page_request
+
+from .schemas import SavedQueryCreate, SavedQueryResponse
+
+router: APIRouter = APIRouter(prefix="/queries", tags=["Queries"])
+
+
+@router.post(
+    "",
+    response_model=SavedQueryResponse,
+    summary="Save a query",
+    description="Store a named filter. The filter is validated when saved.",
+    status_code=HTTPStatus.CREATED,
+    response_description="The stored query",
+)
+async def create_query(
+    body: SavedQueryCreate,
+    service: QueryService = Depends(get_query_service),
+) -> SavedQueryResponse:
+    """Save a named filter."""
+    try:
+        query = await service.create(body.name, body.filter)
+    except InvalidFilterError as exc:
+        raise HTTPException(HTTPStatus.UNPROCESSABLE_CONTENT, str(exc)) from exc
+    return SavedQueryResponse.from_domain(query)
+
+
+@router.get(
+    "",
+    response_model=PageResponse[SavedQueryResponse],
+    summary="List saved queries",
+    description="List saved queries ordered by name then id.",
+    status_code=HTTPStatus.OK,
+    response_description="One page of saved queries",
+)
+async def list_queries(
+    page: PageRequest = Depends(page_request),
+    service: QueryService = Depends(get_query_service),
+) -> PageResponse[SavedQueryResponse]:
+    """List saved queries, a page at a time."""
+    result = await service.list_queries(page)
+    return PageResponse[SavedQueryResponse].from_domain(
+        result, SavedQueryResponse.from_domain
+    )
+
+
+@router.get(
+    "/{query_id}",
+    response_model=SavedQueryResponse,
+    summary="Get a saved query",
+    status_code=HTTPStatus.OK,
+    response_description="The requested query",
+)
+async def get_query(
+    query_id: int,
+    service: QueryService = Depends(get_query_service),
+) -> SavedQueryResponse:
+    """Get a saved query by id."""
+    try:
+        query = await service.get(query_id)
+    except SavedQueryNotFoundError as exc:
+        raise HTTPException(HTTPStatus.NOT_FOUND, str(exc)) from exc
+    return SavedQueryResponse.from_domain(query)
+
+
+@router.delete(
+    "/{query_id}",
+    summary="Delete a saved query",
+    status_code=HTTPStatus.NO_CONTENT,
+)
+async def delete_query(
+    query_id: int,
+    service: QueryService = Depends(get_query_service),
+) -> None:
+    """Delete a saved query."""
+    try:
+        await service.delete(query_id)
+    except SavedQueryNotFoundError as exc:
+        raise HTTPException(HTTPStatus.NOT_FOUND, str(exc)) from exc
+
+
+@router.get(
+    "/{query_id}/run",
+    response_model=PageResponse[NodeResponse],
+    summary="Run a saved query",
+    description=(
+        "List the nodes matching a saved query, ordered by type then id. "
+        "Queries of the same shape share one compiled statement."
+    ),
+    status_code=HTTPStatus.OK,
+    response_description="One page of matching nodes",
+)
+async def run_query(
+    query_id: int,
+    page: PageRequest = Depends(page_request),
+    service: QueryService = Depends(get_query_service),
+) -> PageResponse[NodeResponse]:
+    """Run a saved query, a page at a time."""
+    try:
+        result = await service.run(query_id, page)
+    except SavedQueryNotFoundError as exc:
+        raise HTTPException(HTTPStatus.NOT_FOUND, str(exc)) from exc
+    except InvalidFilterError as exc:
+        raise HTTPException(HTTPStatus.UNPROCESSABLE_CONTENT, str(exc)) from exc
+    return PageResponse[NodeResponse].from_domain(result, NodeResponse.from_domain)
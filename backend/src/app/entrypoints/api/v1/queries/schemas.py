@@ -0,0 +1,34 @@
+from typing import TYPE_CHECKING, Any
+
+from pydantic import BaseModel, Field
+
+if TYPE_CHECKING:
+    from app.domain.queries import SavedQuery
+
+
+class SavedQueryCreate(BaseModel):
+    """Request schema for saving a query."""
+
+    name: str = Field(min_length=1, max_length=200)
+    filter: dict[str, Any] = Field(
+        description=(
+            'A filter object such as `{"type": "band"}`, '
+            '`{"property": "formed", "op": "gte", "value": 1990}`, '
+            '`{"edge": {"direction": "out", "type": "played_at", "node": {...}}}`, '
+            '`{"path": [{"type": "member_of"}, {"type": "played_at"}], '
+            '"node": {...}}`, or `{"all" | "any": [...]}` and `{"not": {...}}`.'
+        )
+    )
+
+
+class SavedQueryResponse(BaseModel):
+    """Response schema for a saved query."""
+
+    id: int
+    name: str
+    filter: dict[str, Any]
+
+    @classmethod
+    def from_domain(cls, query: SavedQuery) -> SavedQueryResponse:
+        """Build the response from a domain saved query."""
+        return cls(id=query.id, name=query.name, filter=query.filter)
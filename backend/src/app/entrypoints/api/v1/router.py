@@ -1,3 +1,24 @@
 from fastapi import APIRouter
 
+from .batch.router import router as batch_router
+from .edges.router import router as edges_router
+from .exports.router import router as exports_router
+from .imports.router import router as imports_router
+from .node_types.router import router as node_types_router
+from .nodes.router import router as nodes_router
+from .paths.router import router as paths_router
+from .photos.router import router as photos_router
+from .queries.router import router as queries_router
+from .search.router import router as search_router
+
 v1_router: APIRouter = APIRouter(prefix="/v1")
+v1_router.include_router(nodes_router)
+v1_router.include_router(edges_router)
+v1_router.include_router(imports_router)
+v1_router.include_router(exports_router)
+v1_router.include_router(search_router)
+v1_router.include_router(photos_router)
+v1_router.include_router(queries_router)
+v1_router.include_router(paths_router)
+v1_router.include_router(batch_router)
+v1_router.include_router(node_types_router)
@@ -0,0 +1,36 @@
+from http import HTTPStatus
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query
+
+from app.application.graph import GraphService  # noqa: TC001
+from app.entrypoints.api.dependencies import get_graph_reader
+from app.entrypoints.api.v1.nodes.schemas import NodeType  # noqa: TC001
+
+from .schemas import SearchResponse
+
+router: APIRouter = APIRouter(prefix="/search", tags=["Search"])
+
+
+@router.get(
+    "",
+    response_model=SearchResponse,
+    summary="Search nodes",
+    description=(
+        "Find nodes by name and property values. Words match by prefix, "
+        "names that resemble the query match despite typos, and results are "
+        "ranked by relevance. The number of hits is capped by server "
+        "configuration."
+    ),
+    status_code=HTTPStatus.OK,
+    response_description="Matching nodes, most relevant first",
+)
+async def search(
+    q: Annotated[str, Query(min_length=1, max_length=200)],
+    type: NodeType | None = None,
+    limit: Annotated[int | None, Query(ge=1)] = None,
+    service: GraphService = Depends(get_graph_reader),
+) -> SearchResponse:
+    """Search nodes by name and properties."""
+    hits = await service.search(q, node_type=type, limit=limit)
+    return SearchResponse.from_domain(q, hits)
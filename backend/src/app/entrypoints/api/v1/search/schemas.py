@@ -0,0 +1,39 @@
+from typing import TYPE_CHECKING
+
+from pydantic import BaseModel, Field
+
+from app.entrypoints.api.v1.nodes.schemas import NodeResponse
+
+if TYPE_CHECKING:
+    from app.domain.graph import SearchHit
+
+
+class SearchHitResponse(NodeResponse):
+    """A node matching a search."""
+
+    score: float = Field(description="Relevance; higher is better.")
+
+    @classmethod
+    def from_hit(cls, hit: SearchHit) -> SearchHitResponse:
+        """Build the response from a search hit."""
+        node = hit.node
+        return cls(
+            id=node.id,
+            key=node.key,
+            type=node.type,
+            name=node.name,
+            properties=node.properties,
+            score=hit.score,
+        )
+
+
+class SearchResponse(BaseModel):
+    """Response schema for a node search."""
+
+    query: str
+    hits: list[SearchHitResponse]
+
+    @classmethod
+    def from_domain(cls, query: str, hits: list[SearchHit]) -> SearchResponse:
+        """Build the response from the search results."""
+        return cls(query=query, hits=[SearchHitResponse.from_hit(h) for h in hits])
@@ -0,0 +1,107 @@
+"""Command-line entry point.
+
+Run `menagerist import PATH` (or `python -m app.entrypoints.cli import PATH`)
+to bulk load a CSV or NDJSON file using the same settings as the API, and
+`menagerist app-info --write` when building an image to snapshot the package
+metadata the API reports.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from dataclasses import asdict
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from app.application.imports import ImportFormat, ImportFormatError, ImportService
+from app.infrastructure.database import CopyImportSink, close_database, init_database
+from app.shared.config import get_settings
+from app.shared.config.app_info import ApplicationInfo
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Sequence
+
+__all__ = ["main"]
+
+_CHUNK_SIZE = 256 * 1024
+_SUFFIXES = {
+    ".csv": ImportFormat.CSV,
+    ".ndjson": ImportFormat.NDJSON,
+    ".jsonl": ImportFormat.NDJSON,
+}
+
+
+async def _read_chunks(path: Path) -> AsyncIterator[bytes]:
+    with path.open("rb") as file:
+        while chunk := await asyncio.to_thread(file.read, _CHUNK_SIZE):
+            yield chunk
+
+
+async def _import(path: Path, fmt: ImportFormat) -> int:
+    settings = get_settings()
+    database = init_database(settings.database)
+    try:
+        async with database.sessionmaker() as session:
+            service = ImportService(
+                CopyImportSink(session),
+                batch_size=settings.imports.batch_size,
+                max_errors=settings.imports.max_errors,
+                max_line_bytes=settings.imports.max_line_bytes,
+            )
+            report = await service.run(_read_chunks(path), fmt)
+    except ImportFormatError as exc:
+        print(f"{path}: {exc}", file=sys.stderr)
+        return 1
+    finally:
+        await close_database()
+
+    print(
+        json.dumps(
+            asdict(report) | {"rows_per_second": report.rows_per_second}, indent=2
+        )
+    )
+    return 0
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="menagerist")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    import_ = commands.add_parser("import", help="bulk import nodes and edges")
+    import_.add_argument("path", type=Path, help="CSV or NDJSON file")
+    import_.add_argument(
+        "--format",
+        type=ImportFormat,
+        choices=list(ImportFormat),
+        help="body format (default: inferred from the file extension)",
+    )
+
+    app_info = commands.add_parser("app-info", help="show the package metadata")
+    app_info.add_argument(
+        "--write",
+        action="store_true",
+        help="also save it as the snapshot the API loads at startup",
+    )
+    return parser
+
+
+def _app_info(*, write: bool) -> int:
+    info = ApplicationInfo.read_package()
+    print(info.model_dump_json(indent=2))
+    if write:
+        print(f"wrote {info.write_snapshot()}", file=sys.stderr)
+    return 0
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the command line interface and return the exit status."""
+    parser = _parser()
+    args = parser.parse_args(argv)
+    if args.command == "app-info":
+        return _app_info(write=args.write)
+
+    fmt: ImportFormat | None = args.format or _SUFFIXES.get(args.path.suffix.lower())
+    if fmt is None:
+        parser.error("cannot infer the format from the extension; pass --format")
+    return asyncio.run(_import(args.path, fmt))
@@ -0,0 +1,39 @@
+from app.infrastructure.database.engine import (
+    Database,
+    close_database,
+    get_database,
+    init_database,
+)
+from app.infrastructure.database.enrichment import SqlEnrichmentJobStore
+from app.infrastructure.database.exporter import CursorExportSource
+from app.infrastructure.database.field_indexes import (
+    FieldIndexBuilder,
+    start_field_indexes,
+    stop_field_indexes,
+)
+from app.infrastructure.database.filters import (
+    QueryPlanCache,
+    QueryPlanCacheStats,
+    get_query_plans,
+    init_query_plans,
+)
+from app.infrastructure.database.importer import CopyImportSink
+from app.infrastructure.database.response_cache import SqlResponseStore
+
+__all__ = [
+    "CopyImportSink",
+    "CursorExportSource",
+    "Database",
+    "FieldIndexBuilder",
+    "QueryPlanCache",
+    "QueryPlanCacheStats",
+    "SqlEnrichmentJobStore",
+    "SqlResponseStore",
+    "close_database",
+    "get_database",
+    "get_query_plans",
+    "init_database",
+    "init_query_plans",
+    "start_field_indexes",
+    "stop_field_indexes",
+]
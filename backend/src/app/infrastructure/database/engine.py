@@ -0,0 +1,161 @@
+"""Async SQLAlchemy engine and session factory.
+
+A single `Database` is created per worker process by `bootstrap.startup` and
+disposed by `bootstrap.shutdown`, so every request borrows a pooled
+connection instead of paying for connection setup. When a read replica is
+configured, the `Database` also owns a separate pool on it.
+"""
+
+from typing import TYPE_CHECKING
+
+from sqlalchemy import URL, make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+if TYPE_CHECKING:
+    from app.shared.config.database import DatabaseSettings
+
+__all__ = [
+    "Database",
+    "close_database",
+    "create_engine",
+    "database_url",
+    "get_database",
+    "init_database",
+    "read_database_url",
+]
+
+_DRIVER = "postgresql+asyncpg"
+
+
+def database_url(settings: DatabaseSettings) -> URL:
+    """Build the SQLAlchemy URL for the configured database."""
+    return URL.create(
+        _DRIVER,
+        username=settings.user,
+        password=settings.password.get_secret_value() or None,
+        host=settings.host,
+        port=settings.port,
+        database=settings.name,
+        # SQLAlchemy keeps its own prepared statement cache on top of the
+        # asyncpg one; both must agree (e.g. both 0 behind pgbouncer).
+        query={"prepared_statement_cache_size": str(settings.statement_cache_size)},
+    )
+
+
+def read_database_url(settings: DatabaseSettings) -> URL | None:
+    """Build the SQLAlchemy URL for the read replica, if one is configured.
+
+    The DSN's scheme is replaced, so a plain `postgresql://` one works.
+    """
+    if settings.read_dsn is None:
+        return None
+    url = make_url(settings.read_dsn.get_secret_value())
+    return url.set(
+        drivername=_DRIVER,
+        query={
+            **url.query,
+            "prepared_statement_cache_size": str(settings.statement_cache_size),
+        },
+    )
+
+
+def create_engine(
+    settings: DatabaseSettings, *, read_only: bool = False
+) -> AsyncEngine:
+    """Create a pooled async engine from the database settings.
+
+    With `read_only`, the engine connects to the read replica with its own
+    pool size.
+
+    Raises:
+        ValueError: If `read_only` is set but no replica is configured.
+    """
+    if not read_only:
+        url = database_url(settings)
+        pool_size, max_overflow = settings.pool_size, settings.max_overflow
+    elif (replica := read_database_url(settings)) is not None:
+        url = replica
+        pool_size, max_overflow = settings.read_pool_size, settings.read_max_overflow
+    else:
+        msg = "No read replica is configured"
+        raise ValueError(msg)
+    return create_async_engine(
+        url,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=settings.pool_timeout,
+        pool_recycle=settings.pool_recycle,
+        pool_pre_ping=settings.pool_pre_ping,
+        echo=settings.echo,
+        connect_args={"statement_cache_size": settings.statement_cache_size},
+    )
+
+
+class Database:
+    """Owns the engines and session factories for one worker process.
+
+    Without a replica, the read engine is the primary one.
+    """
+
+    def __init__(
+        self, engine: AsyncEngine, read_engine: AsyncEngine | None = None
+    ) -> None:
+        self.engine = engine
+        self.sessionmaker: async_sessionmaker[AsyncSession] = async_sessionmaker(
+            engine, expire_on_commit=False
+        )
+        self.read_engine = read_engine or engine
+        self.read_sessionmaker: async_sessionmaker[AsyncSession] = (
+            async_sessionmaker(self.read_engine, expire_on_commit=False)
+            if read_engine is not None
+            else self.sessionmaker
+        )
+
+    @property
+    def has_replica(self) -> bool:
+        """Whether reads can be sent to a separate replica."""
+        return self.read_engine is not self.engine
+
+    async def dispose(self) -> None:
+        """Close all pooled connections."""
+        await self.engine.dispose()
+        if self.has_replica:
+            await self.read_engine.dispose()
+
+
+_database: Database | None = None
+
+
+def init_database(settings: DatabaseSettings) -> Database:
+    """Create the worker's database, replacing any previous instance."""
+    global _database
+    read_engine = None
+    if settings.read_dsn is not None:
+        read_engine = create_engine(settings, read_only=True)
+    _database = Database(create_engine(settings), read_engine)
+    return _database
+
+
+def get_database() -> Database:
+    """Return the worker's database.
+
+    Raises:
+        RuntimeError: If `init_database` has not been called.
+    """
+    if _database is None:
+        msg = "Database has not been initialised; was bootstrap.startup run?"
+        raise RuntimeError(msg)
+    return _database
+
+
+async def close_database() -> None:
+    """Dispose the worker's database if one was initialised."""
+    global _database
+    if _database is not None:
+        await _database.dispose()
+        _database = None
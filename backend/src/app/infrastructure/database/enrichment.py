@@ -0,0 +1,259 @@
+"""Postgres-backed enrichment job queue."""
+
+import json
+from contextlib import suppress
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import ARRAY, Text, bindparam, text
+
+from app.application.enrichment import EnrichmentJob
+from app.domain.graph import Node
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+__all__ = ["SqlEnrichmentJobStore"]
+
+# Arbitrary application-wide advisory lock id ("mgenrich").
+_LEADER_LOCK = 0x6D67_656E_7269_6368
+
+_TRY_LEAD = text("SELECT pg_try_advisory_lock(:lock)")
+_RESIGN = text("SELECT pg_advisory_unlock(:lock)")
+# A bigint advisory lock shows in pg_locks split into two 32-bit halves.
+_STILL_LEADING = text(
+    """
+    SELECT EXISTS (
+        SELECT FROM pg_locks
+        WHERE locktype = 'advisory' AND granted AND pid = pg_backend_pid()
+          AND classid = :high AND objid = :low AND objsubid = 1
+    )
+    """
+)
+_DISCOVER = text(
+    """
+    WITH batch AS (
+        SELECT id FROM nodes
+        WHERE type = :node_type AND id > :after_id
+        ORDER BY id
+        LIMIT :limit
+    ), queued AS (
+        INSERT INTO enrichment_jobs (node_id, provider)
+        SELECT id, CAST(:provider AS text) FROM batch
+        ON CONFLICT DO NOTHING
+    )
+    SELECT max(id) FROM batch
+    """
+)
+# Discovery queues nodes of a type in id order, so every node below the
+# highest queued one has been seen.
+_HIGH_WATER = text(
+    """
+    SELECT n.type, max(j.node_id) AS top
+    FROM enrichment_jobs AS j JOIN nodes AS n ON n.id = j.node_id
+    WHERE j.provider = :provider AND n.type = ANY(:node_types)
+    GROUP BY n.type
+    """
+).bindparams(bindparam("node_types", type_=ARRAY(Text)))
+# SKIP LOCKED lets several claimers run at once without blocking each other.
+_CLAIM = text(
+    """
+    WITH due AS (
+        SELECT node_id FROM enrichment_jobs
+        WHERE provider = :provider
+          AND status IN ('pending', 'running')
+          AND next_attempt_at <= now()
+          AND (locked_until IS NULL OR locked_until < now())
+        ORDER BY next_attempt_at
+        LIMIT :limit
+        FOR UPDATE SKIP LOCKED
+    )
+    UPDATE enrichment_jobs AS j
+    SET status = 'running',
+        attempts = j.attempts + 1,
+        locked_until = now() + make_interval(secs => :lease),
+        updated_at = now()
+    FROM due, nodes AS n
+    WHERE j.provider = :provider AND j.node_id = due.node_id AND n.id = j.node_id
+    RETURNING j.attempts, n.id, n.key, n.type, n.name, n.properties
+    """
+)
+_STORE_RESULT = text(
+    """
+    UPDATE nodes
+    SET properties = jsonb_set(
+            properties, ARRAY[CAST(:provider AS text)], CAST(:data AS jsonb)
+        ),
+        updated_at = now()
+    WHERE id = :node_id
+    """
+)
+_FINISH = text(
+    """
+    UPDATE enrichment_jobs
+    SET status = :status, locked_until = NULL, last_error = :error,
+        next_attempt_at = now() + make_interval(secs => :delay),
+        updated_at = now()
+    WHERE node_id = :node_id AND provider = :provider
+    """
+)
+
+
+class SqlEnrichmentJobStore:
+    """Keeps enrichment jobs in the `enrichment_jobs` table.
+
+    Each call uses its own short transaction on the pooled engine; only the
+    leadership lock holds a connection for longer.
+    """
+
+    def __init__(self, engine: AsyncEngine) -> None:
+        self._engine = engine
+        self._leader: AsyncConnection | None = None
+
+    async def try_lead(self) -> bool:
+        """Try to take the session-level advisory lock that marks the leader."""
+        if self._leader is not None:
+            return True
+        connection = await self._engine.connect()
+        try:
+            result = await connection.execute(_TRY_LEAD, {"lock": _LEADER_LOCK})
+            leading = bool(result.scalar_one())
+            # Leave no transaction open while holding the connection.
+            await connection.commit()
+        except BaseException:
+            await connection.close()
+            raise
+        if not leading:
+            await connection.close()
+            return False
+        self._leader = connection
+        return True
+
+    async def still_leading(self) -> bool:
+        """Check that the lock's connection is alive and still holds the lock.
+
+        The server releases the lock if that connection drops, so on any
+        failure the connection is discarded and leadership given up.
+        """
+        if self._leader is None:
+            return False
+        try:
+            result = await self._leader.execute(
+                _STILL_LEADING,
+                {"high": _LEADER_LOCK >> 32, "low": _LEADER_LOCK & 0xFFFF_FFFF},
+            )
+            leading = bool(result.scalar_one())
+            await self._leader.commit()
+        except Exception:
+            leading = False
+        if not leading:
+            connection, self._leader = self._leader, None
+            with suppress(Exception):
+                await connection.invalidate()
+                await connection.close()
+        return leading
+
+    async def high_water(
+        self, provider: str, node_types: Sequence[str]
+    ) -> dict[str, int]:
+        """Return the highest node id queued for `provider`, per node type."""
+        async with self._engine.connect() as connection:
+            result = await connection.execute(
+                _HIGH_WATER, {"provider": provider, "node_types": list(node_types)}
+            )
+            return {row.type: row.top for row in result}
+
+    async def discover(
+        self, provider: str, node_type: str, *, after_id: int, limit: int
+    ) -> int | None:
+        """Queue jobs for the next batch of nodes of a type."""
+        async with self._engine.begin() as connection:
+            result = await connection.execute(
+                _DISCOVER,
+                {
+                    "provider": provider,
+                    "node_type": node_type,
+                    "after_id": after_id,
+                    "limit": limit,
+                },
+            )
+            top: int | None = result.scalar_one()
+        return top
+
+    async def claim(
+        self, provider: str, *, limit: int, lease: float
+    ) -> list[EnrichmentJob]:
+        """Take up to `limit` due jobs for `lease` seconds."""
+        async with self._engine.begin() as connection:
+            result = await connection.execute(
+                _CLAIM, {"provider": provider, "limit": limit, "lease": float(lease)}
+            )
+            rows = result.all()
+        return [
+            EnrichmentJob(
+                node=Node(
+                    id=row.id,
+                    key=row.key,
+                    type=row.type,
+                    name=row.name,
+                    properties=row.properties,
+                ),
+                provider=provider,
+                attempt=row.attempts,
+            )
+            for row in rows
+        ]
+
+    async def _finish(
+        self,
+        connection: AsyncConnection,
+        job: EnrichmentJob,
+        status: str,
+        *,
+        error: str | None = None,
+        delay: float = 0.0,
+    ) -> None:
+        await connection.execute(
+            _FINISH,
+            {
+                "status": status,
+                "error": error,
+                "delay": float(delay),
+                "node_id": job.node.id,
+                "provider": job.provider,
+            },
+        )
+
+    async def complete(self, job: EnrichmentJob, data: dict[str, Any] | None) -> None:
+        """Store the lookup result under the provider's name and finish the job."""
+        async with self._engine.begin() as connection:
+            if data is not None:
+                await connection.execute(
+                    _STORE_RESULT,
+                    {
+                        "provider": job.provider,
+                        "data": json.dumps(data),
+                        "node_id": job.node.id,
+                    },
+                )
+            await self._finish(connection, job, "done")
+
+    async def retry(self, job: EnrichmentJob, error: str, *, delay: float) -> None:
+        """Release the job to be tried again after `delay` seconds."""
+        async with self._engine.begin() as connection:
+            await self._finish(connection, job, "pending", error=error, delay=delay)
+
+    async def fail(self, job: EnrichmentJob, error: str) -> None:
+        """Give up on the job."""
+        async with self._engine.begin() as connection:
+            await self._finish(connection, job, "failed", error=error)
+
+    async def close(self) -> None:
+        """Release leadership and return the lock's connection to the pool."""
+        if self._leader is not None:
+            # Session locks outlive a return to the pool, so unlock first.
+            await self._leader.execute(_RESIGN, {"lock": _LEADER_LOCK})
+            await self._leader.commit()
+            await self._leader.close()
+            self._leader = None
@@ -0,0 +1,73 @@
+"""Export source that reads the graph through server-side cursors."""
+
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import select
+
+from app.domain.graph import Edge, Node
+from app.infrastructure.database.tables import edges, nodes
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from sqlalchemy import Row, Select
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+__all__ = ["CursorExportSource"]
+
+_NODES = select(
+    nodes.c.id, nodes.c.key, nodes.c.type, nodes.c.name, nodes.c.properties
+).order_by(nodes.c.id)
+_EDGES = select(
+    edges.c.id, edges.c.source_id, edges.c.target_id, edges.c.type, edges.c.properties
+).order_by(edges.c.id)
+
+
+class CursorExportSource:
+    """Streams nodes and edges from one consistent snapshot.
+
+    Rows are fetched `batch_size` at a time from a server-side cursor, so
+    memory use does not grow with the size of the graph. Both queries run in
+    a single REPEATABLE READ transaction; edges written after the export
+    started therefore never point at nodes missing from it.
+    """
+
+    def __init__(self, session: AsyncSession, *, batch_size: int) -> None:
+        self._session = session
+        self._batch_size = batch_size
+        self._started = False
+
+    async def _rows(self, statement: Select[Any]) -> AsyncIterator[Row[Any]]:
+        if not self._started:
+            await self._session.connection(
+                execution_options={"isolation_level": "REPEATABLE READ"}
+            )
+            self._started = True
+        result = await self._session.stream(
+            statement.execution_options(yield_per=self._batch_size)
+        )
+        async for rows in result.partitions():
+            for row in rows:
+                yield row
+
+    async def nodes(self) -> AsyncIterator[Node]:
+        """Yield every node in id order."""
+        async for row in self._rows(_NODES):
+            yield Node(
+                id=row.id,
+                key=row.key,
+                type=row.type,
+                name=row.name,
+                properties=row.properties,
+            )
+
+    async def edges(self) -> AsyncIterator[Edge]:
+        """Yield every edge in id order."""
+        async for row in self._rows(_EDGES):
+            yield Edge(
+                id=row.id,
+                source_id=row.source_id,
+                target_id=row.target_id,
+                type=row.type,
+                properties=row.properties,
+            )
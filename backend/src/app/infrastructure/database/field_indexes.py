@@ -0,0 +1,240 @@
+"""Builds and drops the indexes of filterable node type fields.
+
+Defining a node type only queues work in `node_type_indexes`; a background
+builder then runs the DDL with `CREATE INDEX CONCURRENTLY`, so that nodes
+can still be written while an index is built. Concurrent builds cannot run
+inside a transaction and leave an invalid index behind when they fail, so
+each build first drops any index of the same name, and a failed one is
+dropped again before being reported.
+
+Each index is partial, over the nodes of its type, and covers the field's
+value: a btree over `properties['field']` for scalars, serving equality
+and range filters, and a GIN `jsonb_path_ops` index for lists, serving
+`contains`. The planner uses them for filters that also test the type. The
+expression is written as SQLAlchemy compiles JSONB access for Postgres 14
+and later, since an index only serves queries using the same expression.
+"""
+
+import asyncio
+from contextlib import suppress
+from typing import TYPE_CHECKING
+
+import structlog
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+
+from app.domain.node_types import FieldIndex, FieldKind, IndexState
+
+if TYPE_CHECKING:
+    from sqlalchemy import TextClause
+    from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+    from app.shared.config.node_types import NodeTypeSettings
+
+__all__ = [
+    "FieldIndexBuilder",
+    "create_index_sql",
+    "drop_index_sql",
+    "start_field_indexes",
+    "stop_field_indexes",
+]
+
+# Arbitrary application-wide advisory lock id ("mgindex").
+_BUILDER_LOCK = 0x6D67_696E_6465_78
+
+_TRY_LOCK = text("SELECT pg_try_advisory_lock(:lock)")
+_UNLOCK = text("SELECT pg_advisory_unlock(:lock)")
+# Work left `building` was interrupted; only the lock holder builds, so it
+# is safe to take up again.
+_NEXT = text(
+    """
+    SELECT node_type, field, kind, name, state FROM node_type_indexes
+    WHERE state IN ('pending', 'building', 'dropping')
+    ORDER BY updated_at
+    LIMIT 1
+    """
+)
+_START = text(
+    """
+    UPDATE node_type_indexes SET state = 'building', updated_at = now()
+    WHERE node_type = :node_type AND field = :field AND kind = :kind
+      AND state IN ('pending', 'building')
+    """
+)
+# A redefinition while building changes the kind or state; the row is then
+# left for the next round.
+_FINISH = text(
+    """
+    UPDATE node_type_indexes
+    SET state = :state, error = :error, updated_at = now()
+    WHERE node_type = :node_type AND field = :field AND kind = :kind
+      AND state = 'building'
+    """
+)
+_FORGET = text(
+    """
+    DELETE FROM node_type_indexes
+    WHERE node_type = :node_type AND field = :field AND state = 'dropping'
+    """
+)
+
+_PREPARER = postgresql.dialect().identifier_preparer  # type: ignore[no-untyped-call]
+
+
+def _literal(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
+
+
+def create_index_sql(index: FieldIndex) -> str:
+    """Return the DDL building `index` without blocking writes to `nodes`."""
+    value = f"(properties[{_literal(index.field)}])"
+    if index.kind is FieldKind.LIST:
+        columns = f"USING gin ({value} jsonb_path_ops)"
+    else:
+        columns = f"({value})"
+    return (
+        f"CREATE INDEX CONCURRENTLY {_PREPARER.quote(index.name)} ON nodes "
+        f"{columns} WHERE type = {_literal(index.node_type)}"
+    )
+
+
+def drop_index_sql(index: FieldIndex) -> str:
+    """Return the DDL dropping `index`, if it exists, without blocking writes."""
+    return f"DROP INDEX CONCURRENTLY IF EXISTS {_PREPARER.quote(index.name)}"
+
+
+class FieldIndexBuilder:
+    """Works through queued index builds and drops, one at a time.
+
+    Every `interval` seconds it takes a session advisory lock, so that one
+    worker in the deployment runs DDL at a time, and handles queued work
+    until none is left.
+    """
+
+    def __init__(self, engine: AsyncEngine, *, interval: float) -> None:
+        self._engine = engine
+        self._interval = interval
+        self._task: asyncio.Task[None] | None = None
+        self._logger = structlog.get_logger("field_indexes")
+
+    async def _next(self) -> FieldIndex | None:
+        async with self._engine.connect() as connection:
+            row = (await connection.execute(_NEXT)).one_or_none()
+        if row is None:
+            return None
+        return FieldIndex(
+            node_type=row.node_type,
+            field=row.field,
+            kind=FieldKind(row.kind),
+            name=row.name,
+            state=IndexState(row.state),
+        )
+
+    async def _ddl(self, sql: str) -> None:
+        async with self._engine.connect() as connection:
+            connection = await connection.execution_options(
+                isolation_level="AUTOCOMMIT"
+            )
+            await connection.execute(text(sql))
+
+    async def _update(self, statement: TextClause, **params: object) -> int:
+        async with self._engine.begin() as connection:
+            result = await connection.execute(statement, params)
+        return result.rowcount
+
+    async def _drop(self, index: FieldIndex) -> None:
+        await self._ddl(drop_index_sql(index))
+        await self._update(_FORGET, node_type=index.node_type, field=index.field)
+        await self._logger.ainfo("field_index.dropped", index=index.name)
+
+    async def _build(self, index: FieldIndex) -> None:
+        keys = {
+            "node_type": index.node_type,
+            "field": index.field,
+            "kind": index.kind.value,
+        }
+        if not await self._update(_START, **keys):
+            return  # redefined or deleted since it was read
+        try:
+            await self._ddl(drop_index_sql(index))
+            await self._ddl(create_index_sql(index))
+        except Exception as exc:  # reported on the index, then the next one
+            with suppress(Exception):
+                await self._ddl(drop_index_sql(index))
+            await self._update(
+                _FINISH, state=IndexState.FAILED.value, error=str(exc), **keys
+            )
+            await self._logger.awarning(
+                "field_index.failed", index=index.name, error=str(exc)
+            )
+            return
+        await self._update(_FINISH, state=IndexState.READY.value, error=None, **keys)
+        await self._logger.ainfo("field_index.built", index=index.name)
+
+    async def _work(self) -> None:
+        while (index := await self._next()) is not None:
+            if index.state is IndexState.DROPPING:
+                await self._drop(index)
+            else:
+                await self._build(index)
+
+    async def run_once(self) -> bool:
+        """Handle all queued work if no other worker is; return whether it did."""
+        async with self._engine.connect() as holder:
+            locked = await holder.scalar(_TRY_LOCK, {"lock": _BUILDER_LOCK})
+            # Leave no transaction open while holding the connection.
+            await holder.commit()
+            if not locked:
+                return False
+            try:
+                await self._work()
+            finally:
+                await _unlock(holder)
+        return True
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.run_once()
+            except Exception as exc:  # keep building after transient failures
+                await self._logger.aexception("field_index.run_failed", exc_info=exc)
+            await asyncio.sleep(self._interval)
+
+    def start(self) -> None:
+        """Start building in the background."""
+        self._task = asyncio.create_task(self._run(), name="field-indexes")
+
+    async def stop(self) -> None:
+        """Stop building; an interrupted build is taken up again later."""
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+
+async def _unlock(connection: AsyncConnection) -> None:
+    # Session locks outlive a return to the pool, so unlock first.
+    await connection.execute(_UNLOCK, {"lock": _BUILDER_LOCK})
+    await connection.commit()
+
+
+_builder: FieldIndexBuilder | None = None
+
+
+def start_field_indexes(
+    engine: AsyncEngine, settings: NodeTypeSettings
+) -> FieldIndexBuilder:
+    """Start the worker's field index builder."""
+    global _builder
+    _builder = FieldIndexBuilder(engine, interval=settings.index_poll_interval)
+    _builder.start()
+    return _builder
+
+
+async def stop_field_indexes() -> None:
+    """Stop the worker's field index builder."""
+    global _builder
+    if _builder is not None:
+        await _builder.stop()
+        _builder = None
@@ -0,0 +1,291 @@
+"""Compile saved-query filters to SQL, caching statements by shape.
+
+Two filters have the same shape when they differ only in values: node and
+edge types, property names and compared values. Every value becomes a bind
+parameter named after its position in the tree, so a shape compiles to one
+statement whose SQL text never changes. Reusing that statement skips
+building and compiling it again, and the identical text lets asyncpg reuse
+its server-side prepared statement on each pooled connection.
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import (
+    BigInteger,
+    Integer,
+    Text,
+    and_,
+    bindparam,
+    case,
+    exists,
+    func,
+    not_,
+    or_,
+    select,
+    tuple_,
+)
+from sqlalchemy.dialects.postgresql import JSONB
+
+from app.domain.graph import Direction
+from app.domain.queries import (
+    AllOf,
+    AnyOf,
+    Not,
+    PathExists,
+    PropertyIs,
+    PropertyOp,
+    TypeIs,
+)
+from app.infrastructure.database.tables import edges, nodes
+
+if TYPE_CHECKING:
+    from sqlalchemy import ColumnElement, FromClause, Select
+
+    from app.domain.queries import Filter
+    from app.shared.config.queries import QuerySettings
+
+__all__ = [
+    "QueryPlanCache",
+    "QueryPlanCacheStats",
+    "filter_parameters",
+    "filter_shape",
+    "filter_statement",
+    "get_query_plans",
+    "init_query_plans",
+]
+
+type Shape = tuple[object, ...]
+
+_ROOT = "f"
+_COMPARISONS = {
+    PropertyOp.LT: "<",
+    PropertyOp.LTE: "<=",
+    PropertyOp.GT: ">",
+    PropertyOp.GTE: ">=",
+}
+
+
+def filter_shape(filter: Filter) -> Shape:
+    """Return a hashable description of `filter` without its values."""
+    match filter:
+        case TypeIs():
+            return ("type",)
+        case PropertyIs(op=op):
+            return ("property", op)
+        case PathExists(steps=steps, node=node):
+            hops = tuple((step.direction, step.edge_type is not None) for step in steps)
+            return ("path", hops, None if node is None else filter_shape(node))
+        case AllOf(filters=filters):
+            return ("all", *map(filter_shape, filters))
+        case AnyOf(filters=filters):
+            return ("any", *map(filter_shape, filters))
+        case Not(filter=inner):
+            return ("not", filter_shape(inner))
+
+
+def _collect(filter: Filter, name: str, params: dict[str, object]) -> None:
+    match filter:
+        case TypeIs(type=node_type):
+            params[f"{name}_type"] = node_type
+        case PropertyIs(name=key, op=op, value=value):
+            params[f"{name}_key"] = key
+            if op is not PropertyOp.EXISTS:
+                params[f"{name}_value"] = value
+        case PathExists():
+            _collect_path(filter, name, params)
+        case AllOf(filters=filters) | AnyOf(filters=filters):
+            for i, inner in enumerate(filters):
+                _collect(inner, f"{name}_{i}", params)
+        case Not(filter=inner):
+            _collect(inner, f"{name}_n", params)
+
+
+def _collect_path(filter: PathExists, name: str, params: dict[str, object]) -> None:
+    for i, step in enumerate(filter.steps):
+        if step.edge_type is not None:
+            params[f"{name}_e{i}_type"] = step.edge_type
+    if filter.node is not None:
+        _collect(filter.node, f"{name}_n", params)
+
+
+def filter_parameters(filter: Filter) -> dict[str, object]:
+    """Return the bind parameter values of `filter`'s statement."""
+    params: dict[str, object] = {}
+    _collect(filter, _ROOT, params)
+    return params
+
+
+def _property(filter: PropertyIs, name: str, node: FromClause) -> ColumnElement[bool]:
+    key = bindparam(f"{name}_key", type_=Text)
+    if filter.op is PropertyOp.EXISTS:
+        has_key: ColumnElement[bool] = node.c.properties.has_key(key)
+        return has_key
+    value = bindparam(f"{name}_value", type_=JSONB)
+    field = node.c.properties[key]
+    match filter.op:
+        case PropertyOp.EQ:
+            return field == value
+        case PropertyOp.NE:
+            return field != value
+        case PropertyOp.IN:
+            # A JSON array contains each of its scalar elements.
+            return value.contains(field)
+        case PropertyOp.CONTAINS:
+            # Wrapped, so that a list field's GIN index can serve the test.
+            return field.contains(func.jsonb_build_array(value))
+    # JSON orders values of different types too; only compare like with like.
+    return and_(
+        func.jsonb_typeof(field) == func.jsonb_typeof(value),
+        field.op(_COMPARISONS[filter.op], is_comparison=True)(value),
+    )
+
+
+def _path(filter: PathExists, name: str, node: FromClause) -> ColumnElement[bool]:
+    """One `EXISTS` joining an edge alias per step, and the end node if tested."""
+    current: ColumnElement[int] = node.c.id
+    conditions: list[ColumnElement[bool]] = []
+    for i, step in enumerate(filter.steps):
+        edge = edges.alias(f"{name}_e{i}")
+        following: ColumnElement[int]
+        match step.direction:
+            case Direction.OUT:
+                conditions.append(edge.c.source_id == current)
+                following = edge.c.target_id
+            case Direction.IN:
+                conditions.append(edge.c.target_id == current)
+                following = edge.c.source_id
+            case Direction.BOTH:
+                conditions.append(
+                    or_(edge.c.source_id == current, edge.c.target_id == current)
+                )
+                following = case(
+                    (edge.c.source_id == current, edge.c.target_id),
+                    else_=edge.c.source_id,
+                )
+        if step.edge_type is not None:
+            conditions.append(edge.c.type == bindparam(f"{name}_e{i}_type", type_=Text))
+        current = following
+    if filter.node is not None:
+        end = nodes.alias(f"{name}_n")
+        conditions.append(end.c.id == current)
+        conditions.append(_condition(filter.node, f"{name}_n", end))
+    return exists().where(*conditions)
+
+
+def _conditions(
+    filters: tuple[Filter, ...], name: str, node: FromClause
+) -> list[ColumnElement[bool]]:
+    return [_condition(inner, f"{name}_{i}", node) for i, inner in enumerate(filters)]
+
+
+def _condition(filter: Filter, name: str, node: FromClause) -> ColumnElement[bool]:
+    match filter:
+        case TypeIs():
+            return node.c.type == bindparam(f"{name}_type", type_=Text)
+        case PropertyIs():
+            return _property(filter, name, node)
+        case PathExists():
+            return _path(filter, name, node)
+        case AllOf(filters=filters):
+            return and_(
+                *(_condition(f, f"{name}_{i}", node) for i, f in enumerate(filters))
+            )
+        case AnyOf(filters=filters):
+            return or_(
+                *(_condition(f, f"{name}_{i}", node) for i, f in enumerate(filters))
+            )
+        case Not(filter=inner):
+            # Missing properties compare as NULL; `not` must still match them.
+            return not_(_condition(inner, f"{name}_n", node).is_(True))
+
+
+def filter_statement(filter: Filter, *, paginated: bool) -> Select[Any]:
+    """Select the nodes matching `filter`, ordered by `(type, id)`.
+
+    Bind parameters: those from `filter_parameters`, `limit`, and when
+    `paginated` is set, `after_type` and `after_id`.
+    """
+    stmt = select(
+        nodes.c.id, nodes.c.key, nodes.c.type, nodes.c.name, nodes.c.properties
+    ).where(_condition(filter, _ROOT, nodes))
+    if paginated:
+        after = tuple_(
+            bindparam("after_type", type_=Text), bindparam("after_id", type_=BigInteger)
+        )
+        stmt = stmt.where(tuple_(nodes.c.type, nodes.c.id) > after)
+    return stmt.order_by(nodes.c.type, nodes.c.id).limit(
+        bindparam("limit", type_=Integer)
+    )
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class QueryPlanCacheStats:
+    """A point-in-time view of the query plan cache."""
+
+    size: int
+    capacity: int
+    hits: int
+    misses: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of lookups answered from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class QueryPlanCache:
+    """Least recently used filter statements, keyed by shape."""
+
+    def __init__(self, *, capacity: int) -> None:
+        self.capacity = capacity
+        self._plans: OrderedDict[tuple[Shape, bool], Select[Any]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def plan(self, filter: Filter, *, paginated: bool) -> Select[Any]:
+        """Return the statement for `filter`'s shape, compiling it if new."""
+        key = (filter_shape(filter), paginated)
+        statement = self._plans.get(key)
+        if statement is not None:
+            self.hits += 1
+            self._plans.move_to_end(key)
+            return statement
+
+        self.misses += 1
+        statement = filter_statement(filter, paginated=paginated)
+        if self.capacity:
+            self._plans[key] = statement
+            if len(self._plans) > self.capacity:
+                self._plans.popitem(last=False)
+        return statement
+
+    def stats(self) -> QueryPlanCacheStats:
+        """Return the cache's size and hit counts."""
+        return QueryPlanCacheStats(
+            size=len(self._plans),
+            capacity=self.capacity,
+            hits=self.hits,
+            misses=self.misses,
+        )
+
+
+_plans = QueryPlanCache(capacity=0)
+
+
+def init_query_plans(settings: QuerySettings) -> QueryPlanCache:
+    """Create the worker's query plan cache, replacing any previous one."""
+    global _plans
+    _plans = QueryPlanCache(capacity=settings.plan_cache_size)
+    return _plans
+
+
+def get_query_plans() -> QueryPlanCache:
+    """Return the worker's query plan cache.
+
+    Until `bootstrap.startup` has run it has no capacity, so every filter is
+    compiled afresh.
+    """
+    return _plans
@@ -0,0 +1,155 @@
+"""Bulk import sink that stages rows with COPY and merges them set-wise."""
+
+import json
+from typing import TYPE_CHECKING, Any, cast
+
+from sqlalchemy import text
+
+from app.application.imports import ImportTotals
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from asyncpg import Connection
+    from sqlalchemy import CursorResult, Result
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from app.application.imports import EdgeRecord, NodeRecord
+
+__all__ = ["CopyImportSink"]
+
+# Temporary tables live in the session's own schema and vanish on commit or
+# rollback, so concurrent imports never see each other's rows.
+_CREATE_STAGING = (
+    text(
+        "CREATE TEMPORARY TABLE import_nodes "
+        "(line bigint, key text, type text, name text, properties jsonb) "
+        "ON COMMIT DROP"
+    ),
+    text(
+        "CREATE TEMPORARY TABLE import_edges "
+        "(line bigint, source text, target text, type text, properties jsonb) "
+        "ON COMMIT DROP"
+    ),
+)
+_NODE_COLUMNS = ("line", "key", "type", "name", "properties")
+_EDGE_COLUMNS = ("line", "source", "target", "type", "properties")
+
+# The last row wins when a key appears more than once in one import.
+_UPSERT_KEYED_NODES = text(
+    """
+    INSERT INTO nodes (key, type, name, properties)
+    SELECT DISTINCT ON (key) key, type, name, properties
+    FROM import_nodes
+    WHERE key IS NOT NULL
+    ORDER BY key, line DESC
+    ON CONFLICT (key) DO UPDATE
+    SET type = EXCLUDED.type,
+        name = EXCLUDED.name,
+        properties = EXCLUDED.properties,
+        updated_at = now()
+    """
+)
+_INSERT_UNKEYED_NODES = text(
+    """
+    INSERT INTO nodes (type, name, properties)
+    SELECT type, name, properties FROM import_nodes WHERE key IS NULL
+    """
+)
+_INSERT_EDGES = text(
+    """
+    INSERT INTO edges (source_id, target_id, type, properties)
+    SELECT s.id, t.id, e.type, e.properties
+    FROM import_edges AS e
+    JOIN nodes AS s ON s.key = e.source
+    JOIN nodes AS t ON t.key = e.target
+    """
+)
+_COUNT_EDGES = text("SELECT count(*) FROM import_edges")
+_UNRESOLVED_EDGES = text(
+    """
+    SELECT e.line
+    FROM import_edges AS e
+    WHERE NOT EXISTS (SELECT 1 FROM nodes AS s WHERE s.key = e.source)
+       OR NOT EXISTS (SELECT 1 FROM nodes AS t WHERE t.key = e.target)
+    ORDER BY e.line
+    LIMIT :limit
+    """
+)
+
+
+def _rowcount(result: Result[Any]) -> int:
+    return cast("CursorResult[Any]", result).rowcount
+
+
+class CopyImportSink:
+    """Stages import rows in temporary tables via asyncpg `COPY`.
+
+    Each batch is streamed with the binary COPY protocol instead of one
+    INSERT per row. `finish` then upserts nodes and resolves edge endpoints
+    with a join on the node key, and commits everything in one transaction.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+        self._driver: Connection | None = None
+
+    async def _connection(self) -> Connection:
+        if self._driver is None:
+            for statement in _CREATE_STAGING:
+                await self._session.execute(statement)
+            connection = await self._session.connection()
+            raw = await connection.get_raw_connection()
+            self._driver = raw.driver_connection
+        assert self._driver is not None
+        return self._driver
+
+    async def _copy(
+        self, table: str, columns: Sequence[str], records: list[tuple[Any, ...]]
+    ) -> None:
+        driver = await self._connection()
+        await driver.copy_records_to_table(table, records=records, columns=columns)
+
+    async def add_nodes(self, records: Sequence[NodeRecord]) -> None:
+        """Stage a batch of node rows."""
+        await self._copy(
+            "import_nodes",
+            _NODE_COLUMNS,
+            [
+                (r.line, r.key, r.type, r.name, json.dumps(r.properties))
+                for r in records
+            ],
+        )
+
+    async def add_edges(self, records: Sequence[EdgeRecord]) -> None:
+        """Stage a batch of edge rows."""
+        await self._copy(
+            "import_edges",
+            _EDGE_COLUMNS,
+            [
+                (r.line, r.source, r.target, r.type, json.dumps(r.properties))
+                for r in records
+            ],
+        )
+
+    async def finish(self, *, error_limit: int) -> ImportTotals:
+        """Write the staged rows, resolving edge endpoints by node key."""
+        await self._connection()
+        session = self._session
+
+        keyed = _rowcount(await session.execute(_UPSERT_KEYED_NODES))
+        unkeyed = _rowcount(await session.execute(_INSERT_UNKEYED_NODES))
+        edges = _rowcount(await session.execute(_INSERT_EDGES))
+        staged_edges: int = (await session.execute(_COUNT_EDGES)).scalar_one()
+        unresolved_lines: list[int] = []
+        if error_limit > 0 and staged_edges > edges:
+            result = await session.execute(_UNRESOLVED_EDGES, {"limit": error_limit})
+            unresolved_lines = list(result.scalars())
+        await session.commit()
+
+        return ImportTotals(
+            nodes=keyed + unkeyed,
+            edges=edges,
+            unresolved_edge_lines=unresolved_lines,
+            unresolved_edges=staged_edges - edges,
+        )
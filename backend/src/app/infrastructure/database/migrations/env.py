@@ -0,0 +1,58 @@
+"""Alembic environment.
+
+The connection details come from `Settings.database`, so migrations use the
+same `MG_DATABASE__*` configuration as the API.
+"""
+
+import asyncio
+from typing import TYPE_CHECKING
+
+from alembic import context
+from sqlalchemy import pool
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.infrastructure.database.engine import database_url
+from app.infrastructure.database.tables import metadata
+from app.shared.config import get_settings
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Connection
+
+
+def run_migrations_offline() -> None:
+    """Emit the migration SQL without connecting to a database."""
+    context.configure(
+        url=database_url(get_settings().database),
+        target_metadata=metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def do_run_migrations(connection: Connection) -> None:
+    """Run the migrations on an open connection."""
+    context.configure(connection=connection, target_metadata=metadata)
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+async def run_migrations_online() -> None:
+    """Connect to the configured database and run the migrations."""
+    engine = create_async_engine(
+        database_url(get_settings().database), poolclass=pool.NullPool
+    )
+
+    async with engine.connect() as connection:
+        await connection.run_sync(do_run_migrations)
+
+    await engine.dispose()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    asyncio.run(run_migrations_online())
@@ -0,0 +1,31 @@
+"""Add a unique user-chosen key to nodes.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 10:00:00.000000
+"""
+
+from typing import TYPE_CHECKING
+
+import sqlalchemy as sa
+from alembic import op
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+revision: str = "0002"
+down_revision: str | Sequence[str] | None = "0001"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("nodes", sa.Column("key", sa.Text(), nullable=True))
+    op.create_unique_constraint(op.f("uq_nodes_key"), "nodes", ["key"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint(op.f("uq_nodes_key"), "nodes", type_="unique")
+    op.drop_column("nodes", "key")
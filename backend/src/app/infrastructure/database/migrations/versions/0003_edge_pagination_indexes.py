@@ -0,0 +1,54 @@
+"""Extend the edge endpoint indexes with the id for keyset pagination.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 12:00:00.000000
+"""
+
+from typing import TYPE_CHECKING
+
+from alembic import op
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+revision: str = "0003"
+down_revision: str | Sequence[str] | None = "0002"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        op.f("ix_edges_source_id_type_id"),
+        "edges",
+        ["source_id", "type", "id"],
+        postgresql_include=["target_id"],
+    )
+    op.create_index(
+        op.f("ix_edges_target_id_type_id"),
+        "edges",
+        ["target_id", "type", "id"],
+        postgresql_include=["source_id"],
+    )
+    op.drop_index(op.f("ix_edges_target_id_type"), table_name="edges")
+    op.drop_index(op.f("ix_edges_source_id_type"), table_name="edges")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(
+        op.f("ix_edges_source_id_type"),
+        "edges",
+        ["source_id", "type"],
+        postgresql_include=["target_id"],
+    )
+    op.create_index(
+        op.f("ix_edges_target_id_type"),
+        "edges",
+        ["target_id", "type"],
+        postgresql_include=["source_id"],
+    )
+    op.drop_index(op.f("ix_edges_target_id_type_id"), table_name="edges")
+    op.drop_index(op.f("ix_edges_source_id_type_id"), table_name="edges")
@@ -0,0 +1,62 @@
+"""Add full-text and trigram search over node names and properties.
+
+Adding a stored generated column rewrites the nodes table, so this migration
+takes an exclusive lock for the duration of the rewrite.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18 14:00:00.000000
+"""
+
+from typing import TYPE_CHECKING
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+revision: str = "0004"
+down_revision: str | Sequence[str] | None = "0003"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.add_column(
+        "nodes",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                "setweight(to_tsvector('simple', name), 'A') || "
+                "setweight(jsonb_to_tsvector('simple', properties, "
+                """'["string", "numeric"]'), 'B')""",
+                persisted=True,
+            ),
+            nullable=False,
+        ),
+    )
+    op.create_index(
+        op.f("ix_nodes_search_vector"),
+        "nodes",
+        ["search_vector"],
+        postgresql_using="gin",
+    )
+    op.create_index(
+        op.f("ix_nodes_name"),
+        "nodes",
+        ["name"],
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_nodes_name"), table_name="nodes")
+    op.drop_index(op.f("ix_nodes_search_vector"), table_name="nodes")
+    op.drop_column("nodes", "search_vector")
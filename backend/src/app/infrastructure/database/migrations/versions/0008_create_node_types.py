@@ -0,0 +1,83 @@
+"""Create node type schemas and their field indexes.
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-18 22:00:00.000000
+"""
+
+from typing import TYPE_CHECKING
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+revision: str = "0008"
+down_revision: str | Sequence[str] | None = "0007"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "node_types",
+        sa.Column("name", sa.Text(), nullable=False),
+        sa.Column("fields", postgresql.JSONB(), nullable=False),
+        sa.Column("version", sa.Integer(), server_default=sa.text("1"), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("name", name=op.f("pk_node_types")),
+    )
+    op.create_table(
+        "node_type_indexes",
+        sa.Column("node_type", sa.Text(), nullable=False),
+        sa.Column("field", sa.Text(), nullable=False),
+        sa.Column("kind", sa.Text(), nullable=False),
+        sa.Column("name", sa.Text(), nullable=False),
+        sa.Column(
+            "state", sa.Text(), server_default=sa.text("'pending'"), nullable=False
+        ),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint(
+            "node_type", "field", name=op.f("pk_node_type_indexes")
+        ),
+    )
+    op.create_index(
+        op.f("ix_node_type_indexes_updated_at"),
+        "node_type_indexes",
+        ["updated_at"],
+        postgresql_where=sa.text("state IN ('pending', 'building', 'dropping')"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema, dropping the field indexes built on `nodes`."""
+    op.execute(
+        """
+        DO $$
+        DECLARE index_name text;
+        BEGIN
+            FOR index_name IN SELECT name FROM node_type_indexes LOOP
+                EXECUTE format('DROP INDEX IF EXISTS %I', index_name);
+            END LOOP;
+        END $$
+        """
+    )
+    op.drop_index(
+        op.f("ix_node_type_indexes_updated_at"), table_name="node_type_indexes"
+    )
+    op.drop_table("node_type_indexes")
+    op.drop_table("node_types")
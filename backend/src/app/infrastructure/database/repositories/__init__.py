@@ -0,0 +1,15 @@
+from app.infrastructure.database.repositories.graph import SqlAlchemyGraphRepository
+from app.infrastructure.database.repositories.node_types import (
+    SqlAlchemyNodeTypeRepository,
+)
+from app.infrastructure.database.repositories.queries import (
+    SqlAlchemyFilterRunner,
+    SqlAlchemySavedQueryRepository,
+)
+
+__all__ = [
+    "SqlAlchemyFilterRunner",
+    "SqlAlchemyGraphRepository",
+    "SqlAlchemyNodeTypeRepository",
+    "SqlAlchemySavedQueryRepository",
+]
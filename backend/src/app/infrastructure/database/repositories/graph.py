@@ -0,0 +1,626 @@
+"""SQLAlchemy implementation of the graph repository."""
+
+import re
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import (
+    ARRAY,
+    BigInteger,
+    Integer,
+    Select,
+    Text,
+    and_,
+    any_,
+    bindparam,
+    delete,
+    func,
+    insert,
+    literal,
+    literal_column,
+    or_,
+    select,
+    tuple_,
+    union_all,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError
+
+from app.domain.graph import (
+    BatchResult,
+    Direction,
+    DuplicateNodeKeyError,
+    Edge,
+    Link,
+    Neighbour,
+    Node,
+    NodeNotFoundError,
+    SearchHit,
+)
+from app.infrastructure.database.tables import SEARCH_CONFIG, edges, nodes
+
+if TYPE_CHECKING:
+    from collections.abc import Collection, Mapping, Sequence
+
+    from sqlalchemy import ColumnElement, CompoundSelect, Insert, Row, Subquery
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from app.domain.graph import BatchEdge, NewEdge, NewNode
+    from app.domain.pagination import Position
+
+__all__ = [
+    "SqlAlchemyGraphRepository",
+    "batch_edges_statement",
+    "batch_nodes_statement",
+    "links_statement",
+    "list_edges_statement",
+    "list_nodes_statement",
+    "neighbourhood_statement",
+    "search_statement",
+    "tsquery_terms",
+]
+
+_NODE_COLUMNS = (
+    nodes.c.id,
+    nodes.c.key,
+    nodes.c.type,
+    nodes.c.name,
+    nodes.c.properties,
+)
+_EDGE_COLUMNS = (
+    edges.c.id,
+    edges.c.source_id,
+    edges.c.target_id,
+    edges.c.type,
+    edges.c.properties,
+)
+
+
+def _node(row: Row[Any]) -> Node:
+    return Node(
+        id=row.id,
+        key=row.key,
+        type=row.type,
+        name=row.name,
+        properties=row.properties,
+    )
+
+
+def _edge(row: Row[Any]) -> Edge:
+    return Edge(
+        id=row.id,
+        source_id=row.source_id,
+        target_id=row.target_id,
+        type=row.type,
+        properties=row.properties,
+    )
+
+
+def _batch_end(end: int | str, node_ids: dict[str, int]) -> int:
+    """Resolve an edge endpoint of a batch to a node id."""
+    return end if isinstance(end, int) else node_ids[end]
+
+
+def _hops(direction: Direction, *, filter_types: bool) -> Subquery:
+    """Select (from_id, to_id) pairs for the edges a traversal may follow."""
+
+    def hop(from_col: ColumnElement[int], to_col: ColumnElement[int]) -> Select[Any]:
+        stmt = select(from_col.label("from_id"), to_col.label("to_id"))
+        if filter_types:
+            # A single array parameter keeps the SQL text identical for any
+            # number of types, so the prepared statement is reused.
+            types = bindparam("edge_types", type_=ARRAY(Text))
+            stmt = stmt.where(edges.c.type == any_(types))
+        return stmt
+
+    stmt: Select[Any] | CompoundSelect[Any]
+    match direction:
+        case Direction.OUT:
+            stmt = hop(edges.c.source_id, edges.c.target_id)
+        case Direction.IN:
+            stmt = hop(edges.c.target_id, edges.c.source_id)
+        case Direction.BOTH:
+            stmt = union_all(
+                hop(edges.c.source_id, edges.c.target_id),
+                hop(edges.c.target_id, edges.c.source_id),
+            )
+    return stmt.subquery("hops")
+
+
+def neighbourhood_statement(direction: Direction, *, filter_types: bool) -> Select[Any]:
+    """Build the single recursive query behind a neighbourhood traversal.
+
+    Bind parameters: `origin`, `depth`, `limit` and, when `filter_types` is
+    set, `edge_types`.
+
+    The walk carries only `(node_id, depth)` and is combined with `UNION`
+    rather than `UNION ALL`. Postgres discards rows already produced, so each
+    level holds at most one row per distinct node — cycles and diamonds
+    cannot multiply rows the way path enumeration does, and the work per hop
+    is bounded by the edges of the frontier instead of the number of paths.
+    """
+    hops = _hops(direction, filter_types=filter_types)
+
+    origin = bindparam("origin", type_=BigInteger)
+    max_depth = bindparam("depth", type_=Integer)
+
+    walk = select(
+        origin.label("node_id"), literal_column("0", Integer).label("depth")
+    ).cte("walk", recursive=True)
+    walk = walk.union(
+        select(hops.c.to_id, walk.c.depth + literal_column("1", Integer))
+        .join_from(walk, hops, hops.c.from_id == walk.c.node_id)
+        .where(and_(walk.c.depth < max_depth, hops.c.to_id != origin))
+    )
+
+    reached = (
+        select(walk.c.node_id, func.min(walk.c.depth).label("depth"))
+        .where(walk.c.node_id != origin)
+        .group_by(walk.c.node_id)
+        .subquery("reached")
+    )
+
+    return (
+        select(*_NODE_COLUMNS, reached.c.depth)
+        .join_from(reached, nodes, nodes.c.id == reached.c.node_id)
+        .order_by(reached.c.depth, nodes.c.id)
+        .limit(bindparam("limit", type_=Integer))
+    )
+
+
+def _after(
+    stmt: Select[Any],
+    sort_key: ColumnElement[str],
+    id_: ColumnElement[int],
+    after: Position | None,
+) -> Select[Any]:
+    """Restrict a keyset-paginated query to rows after `after`."""
+    if after is None:
+        return stmt
+    # A row comparison lets Postgres seek straight to the position in the
+    # `(sort key, id)` index, so deep pages cost the same as the first.
+    position = tuple_(literal(after.sort_key), literal(after.id))
+    return stmt.where(tuple_(sort_key, id_) > position)
+
+
+def list_nodes_statement(
+    *, node_type: str | None, after: Position | None, limit: int
+) -> Select[Any]:
+    """Select a page of nodes ordered by `(type, id)`."""
+    stmt = select(*_NODE_COLUMNS)
+    if node_type is not None:
+        stmt = stmt.where(nodes.c.type == node_type)
+    stmt = _after(stmt, nodes.c.type, nodes.c.id, after)
+    return stmt.order_by(nodes.c.type, nodes.c.id).limit(limit)
+
+
+def list_edges_statement(
+    node_id: int,
+    *,
+    direction: Direction,
+    edge_types: Sequence[str] | None,
+    after: Position | None,
+    limit: int,
+) -> Select[Any]:
+    """Select a page of the edges touching a node, ordered by `(type, id)`.
+
+    Each direction is a separate branch served by its own
+    `(endpoint, type, id)` index; for `BOTH` the two ordered branches are
+    merged, with self-loops taken from the outgoing side only.
+    """
+
+    def branch(endpoint: ColumnElement[int]) -> Select[Any]:
+        stmt = select(*_EDGE_COLUMNS).where(endpoint == node_id)
+        if edge_types:
+            types = bindparam("edge_types", list(edge_types), type_=ARRAY(Text))
+            stmt = stmt.where(edges.c.type == any_(types))
+        stmt = _after(stmt, edges.c.type, edges.c.id, after)
+        return stmt.order_by(edges.c.type, edges.c.id).limit(limit)
+
+    match direction:
+        case Direction.OUT:
+            return branch(edges.c.source_id)
+        case Direction.IN:
+            return branch(edges.c.target_id)
+        case Direction.BOTH:
+            incoming = branch(edges.c.target_id).where(edges.c.source_id != node_id)
+            outgoing = branch(edges.c.source_id)
+            touching = union_all(outgoing, incoming).subquery("touching")
+            return (
+                select(touching).order_by(touching.c.type, touching.c.id).limit(limit)
+            )
+
+
+# Rows per batch statement, which keeps the bind parameters of a multi-row
+# VALUES list well under the protocol's limit of 32767.
+_BATCH_ROWS = 1000
+
+
+def batch_nodes_statement(rows: list[dict[str, Any]]) -> Insert:
+    """Insert nodes with one multi-row `VALUES` list, returning `(id, key)`.
+
+    A row whose key is taken updates that node instead. Keyless rows never
+    conflict, and take identity values in `VALUES` order, so sorting their
+    returned ids gives them back in the order they were listed.
+    """
+    stmt = pg_insert(nodes).values(rows)
+    return stmt.on_conflict_do_update(
+        index_elements=[nodes.c.key],
+        set_={
+            "type": stmt.excluded.type,
+            "name": stmt.excluded.name,
+            "properties": stmt.excluded.properties,
+            "updated_at": func.now(),
+        },
+    ).returning(nodes.c.id, nodes.c.key)
+
+
+def batch_edges_statement(rows: list[dict[str, Any]]) -> Insert:
+    """Insert edges with one multi-row `VALUES` list, returning them.
+
+    Their ids follow the `VALUES` order, as for keyless nodes.
+    """
+    return insert(edges).values(rows).returning(*_EDGE_COLUMNS)
+
+
+def links_statement(direction: Direction, *, filter_types: bool) -> Select[Any]:
+    """Select the distinct links touching any of a set of nodes.
+
+    Bind parameters: `ids` and, when `filter_types` is set, `edge_types`.
+    One statement fetches a whole frontier of a path search; as both are
+    arrays, its text stays the same however many nodes or types there are.
+    """
+    ids = bindparam("ids", type_=ARRAY(BigInteger))
+    match direction:
+        case Direction.OUT:
+            touching = edges.c.source_id == any_(ids)
+        case Direction.IN:
+            touching = edges.c.target_id == any_(ids)
+        case Direction.BOTH:
+            touching = or_(
+                edges.c.source_id == any_(ids), edges.c.target_id == any_(ids)
+            )
+    stmt = (
+        select(edges.c.source_id, edges.c.target_id, edges.c.type)
+        .distinct()
+        .where(touching)
+    )
+    if filter_types:
+        types = bindparam("edge_types", type_=ARRAY(Text))
+        stmt = stmt.where(edges.c.type == any_(types))
+    return stmt
+
+
+_WORD = re.compile(r"[^\W_]+")
+
+
+def tsquery_terms(text: str, *, match_all: bool) -> str:
+    """Turn free text into `to_tsquery` input that matches words by prefix.
+
+    Only word characters survive, so user input can never inject tsquery
+    operators. Single characters must match exactly, as a one-letter prefix
+    would match most of the collection.
+    """
+    words = dict.fromkeys(word.lower() for word in _WORD.findall(text))
+    terms = [f"'{word}':*" if len(word) > 1 else f"'{word}'" for word in words]
+    return (" & " if match_all else " | ").join(terms)
+
+
+def search_statement(*, use_terms: bool, filter_type: bool) -> Select[Any]:
+    """Build the ranked search query.
+
+    Bind parameters: `text`, `limit`, `terms` when `use_terms` is set (see
+    `tsquery_terms`) and `node_type` when `filter_type` is set.
+
+    A node matches when its search vector matches the terms (GIN index on
+    `search_vector`) or its name resembles the text (`<%`, trigram GIN index
+    on `name`). Postgres combines the two index scans with a bitmap OR.
+    """
+    text_ = bindparam("text", type_=Text)
+    fuzzy = text_.bool_op("<%")(nodes.c.name)
+    score: ColumnElement[float] = func.word_similarity(text_, nodes.c.name)
+    matches: ColumnElement[bool] = fuzzy
+    if use_terms:
+        config: ColumnElement[Any] = literal_column(f"'{SEARCH_CONFIG}'::regconfig")
+        query = func.to_tsquery(config, bindparam("terms", type_=Text))
+        matches = or_(nodes.c.search_vector.bool_op("@@")(query), fuzzy)
+        # Normalisation 1 stops long property lists from outranking names.
+        normalisation = literal_column("1", Integer)
+        score = score + func.ts_rank_cd(nodes.c.search_vector, query, normalisation)
+
+    labelled = score.label("score")
+    stmt = select(*_NODE_COLUMNS, labelled).where(matches)
+    if filter_type:
+        stmt = stmt.where(nodes.c.type == bindparam("node_type", type_=Text))
+    return stmt.order_by(labelled.desc(), nodes.c.id).limit(
+        bindparam("limit", type_=Integer)
+    )
+
+
+class SqlAlchemyGraphRepository:
+    """Graph repository backed by the `nodes` and `edges` tables."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def get_node(self, node_id: int) -> Node | None:
+        """Return the node with the given id, if it exists."""
+        result = await self._session.execute(
+            select(*_NODE_COLUMNS).where(nodes.c.id == node_id)
+        )
+        row = result.one_or_none()
+        return _node(row) if row is not None else None
+
+    async def get_nodes(self, node_ids: Sequence[int]) -> list[Node]:
+        """Return the nodes that exist among `node_ids`, in no particular order."""
+        if not node_ids:
+            return []
+        ids = bindparam("ids", list(node_ids), type_=ARRAY(BigInteger))
+        result = await self._session.execute(
+            select(*_NODE_COLUMNS).where(nodes.c.id == any_(ids))
+        )
+        return [_node(row) for row in result]
+
+    async def add_node(self, node: NewNode) -> Node:
+        """Store a new node and return it with its id.
+
+        Raises:
+            DuplicateNodeKeyError: If the node's key is already in use.
+        """
+        try:
+            result = await self._session.execute(
+                insert(nodes)
+                .values(
+                    key=node.key,
+                    type=node.type,
+                    name=node.name,
+                    properties=node.properties,
+                )
+                .returning(*_NODE_COLUMNS)
+            )
+            row = result.one()
+            await self._session.commit()
+        except IntegrityError as exc:
+            await self._session.rollback()
+            raise DuplicateNodeKeyError(str(node.key)) from exc
+        return _node(row)
+
+    async def delete_node(self, node_id: int) -> Node | None:
+        """Delete a node (and its edges), returning it if it existed."""
+        result = await self._session.execute(
+            delete(nodes).where(nodes.c.id == node_id).returning(*_NODE_COLUMNS)
+        )
+        row = result.one_or_none()
+        await self._session.commit()
+        return _node(row) if row is not None else None
+
+    async def list_nodes(
+        self, *, node_type: str | None, after: Position | None, limit: int
+    ) -> list[Node]:
+        """Return up to `limit` nodes ordered by `(type, id)`."""
+        result = await self._session.execute(
+            list_nodes_statement(node_type=node_type, after=after, limit=limit)
+        )
+        return [_node(row) for row in result]
+
+    async def add_edge(self, edge: NewEdge) -> Edge:
+        """Store a new edge and return it with its id.
+
+        Raises:
+            NodeNotFoundError: If either endpoint does not exist.
+        """
+        try:
+            result = await self._session.execute(
+                insert(edges)
+                .values(
+                    source_id=edge.source_id,
+                    target_id=edge.target_id,
+                    type=edge.type,
+                    properties=edge.properties,
+                )
+                .returning(*_EDGE_COLUMNS)
+            )
+            row = result.one()
+            await self._session.commit()
+        except IntegrityError as exc:
+            await self._session.rollback()
+            raise NodeNotFoundError(edge.source_id, edge.target_id) from exc
+        return _edge(row)
+
+    async def write_batch(
+        self, nodes: Mapping[str, NewNode], edges: Sequence[BatchEdge]
+    ) -> BatchResult:
+        """Store nodes and edges together, all or nothing.
+
+        Nodes then edges are written by multi-row statements of up to
+        `_BATCH_ROWS` rows each, in a single transaction.
+
+        Raises:
+            NodeNotFoundError: If an edge refers to a stored node that does
+                not exist.
+        """
+        try:
+            node_ids = await self._write_batch_nodes(nodes)
+            stored: list[Edge] = []
+            for start in range(0, len(edges), _BATCH_ROWS):
+                rows = [
+                    {
+                        "source_id": _batch_end(edge.source, node_ids),
+                        "target_id": _batch_end(edge.target, node_ids),
+                        "type": edge.type,
+                        "properties": edge.properties,
+                    }
+                    for edge in edges[start : start + _BATCH_ROWS]
+                ]
+                result = await self._session.execute(batch_edges_statement(rows))
+                stored.extend(sorted(map(_edge, result), key=lambda e: e.id))
+            await self._session.commit()
+        except IntegrityError as exc:
+            await self._session.rollback()
+            stored_ids = {
+                end
+                for edge in edges
+                for end in (edge.source, edge.target)
+                if isinstance(end, int)
+            }
+            if missing := await self._missing_nodes(stored_ids):
+                raise NodeNotFoundError(*missing) from exc
+            raise
+        return BatchResult(node_ids=node_ids, edges=stored)
+
+    async def _missing_nodes(self, node_ids: Collection[int]) -> list[int]:
+        """Return which of `node_ids` are not stored, in order."""
+        if not node_ids:
+            return []
+        ids = bindparam("ids", list(node_ids), type_=ARRAY(BigInteger))
+        result = await self._session.execute(
+            select(nodes.c.id).where(nodes.c.id == any_(ids))
+        )
+        return sorted(set(node_ids) - set(result.scalars()))
+
+    async def _write_batch_nodes(self, nodes: Mapping[str, NewNode]) -> dict[str, int]:
+        items = list(nodes.items())
+        node_ids: dict[str, int] = {}
+        for start in range(0, len(items), _BATCH_ROWS):
+            chunk = items[start : start + _BATCH_ROWS]
+            result = await self._session.execute(
+                batch_nodes_statement(
+                    [
+                        {
+                            "key": node.key,
+                            "type": node.type,
+                            "name": node.name,
+                            "properties": node.properties,
+                        }
+                        for _, node in chunk
+                    ]
+                )
+            )
+            rows = result.all()
+            by_key = {row.key: row.id for row in rows if row.key is not None}
+            keyless = iter(sorted(row.id for row in rows if row.key is None))
+            for ref, node in chunk:
+                node_ids[ref] = next(keyless) if node.key is None else by_key[node.key]
+        return node_ids
+
+    async def get_edges(self, edge_ids: Sequence[int]) -> list[Edge]:
+        """Return the edges that exist among `edge_ids`, in no particular order."""
+        if not edge_ids:
+            return []
+        ids = bindparam("ids", list(edge_ids), type_=ARRAY(BigInteger))
+        result = await self._session.execute(
+            select(*_EDGE_COLUMNS).where(edges.c.id == any_(ids))
+        )
+        return [_edge(row) for row in result]
+
+    async def delete_edge(self, edge_id: int) -> Edge | None:
+        """Delete an edge, returning it if it existed."""
+        result = await self._session.execute(
+            delete(edges).where(edges.c.id == edge_id).returning(*_EDGE_COLUMNS)
+        )
+        row = result.one_or_none()
+        await self._session.commit()
+        return _edge(row) if row is not None else None
+
+    async def list_edges(
+        self,
+        node_id: int,
+        *,
+        direction: Direction,
+        edge_types: Sequence[str] | None,
+        after: Position | None,
+        limit: int,
+    ) -> list[Edge]:
+        """Return up to `limit` edges touching a node, ordered by `(type, id)`."""
+        result = await self._session.execute(
+            list_edges_statement(
+                node_id,
+                direction=direction,
+                edge_types=edge_types,
+                after=after,
+                limit=limit,
+            )
+        )
+        return [_edge(row) for row in result]
+
+    async def neighbourhood(
+        self,
+        node_id: int,
+        *,
+        depth: int,
+        direction: Direction,
+        edge_types: Sequence[str] | None,
+        limit: int,
+    ) -> list[Neighbour]:
+        """Return up to `limit` nodes within `depth` hops of `node_id`."""
+        params: dict[str, object] = {"origin": node_id, "depth": depth, "limit": limit}
+        if edge_types:
+            params["edge_types"] = list(edge_types)
+
+        result = await self._session.execute(
+            neighbourhood_statement(direction, filter_types=bool(edge_types)),
+            params,
+        )
+        return [Neighbour(node=_node(row), depth=row.depth) for row in result]
+
+    async def links(
+        self,
+        node_ids: Sequence[int],
+        *,
+        direction: Direction,
+        edge_types: Sequence[str] | None,
+    ) -> list[Link]:
+        """Return the distinct links touching any of `node_ids`."""
+        if not node_ids:
+            return []
+        params: dict[str, object] = {"ids": list(node_ids)}
+        if edge_types:
+            params["edge_types"] = list(edge_types)
+
+        result = await self._session.execute(
+            links_statement(direction, filter_types=bool(edge_types)), params
+        )
+        return [
+            Link(source_id=row.source_id, target_id=row.target_id, type=row.type)
+            for row in result
+        ]
+
+    async def search(
+        self,
+        text: str,
+        *,
+        node_type: str | None,
+        limit: int,
+        min_similarity: float,
+    ) -> list[SearchHit]:
+        """Return up to `limit` nodes matching `text`, most relevant first.
+
+        Every word must match at first. Only if nothing does are nodes
+        matching any word returned, so chatty queries still find something
+        without ranking half the collection every time.
+        """
+        # The trigram threshold is per transaction, so concurrent requests
+        # with other settings are unaffected.
+        await self._session.execute(
+            select(
+                func.set_config(
+                    "pg_trgm.word_similarity_threshold", str(min_similarity), True
+                )
+            )
+        )
+        params: dict[str, object] = {"text": text, "limit": limit}
+        if node_type is not None:
+            params["node_type"] = node_type
+
+        hits = await self._search(tsquery_terms(text, match_all=True), params)
+        if not hits:
+            any_word = tsquery_terms(text, match_all=False)
+            if " | " in any_word:
+                hits = await self._search(any_word, params)
+        return hits
+
+    async def _search(self, terms: str, params: dict[str, object]) -> list[SearchHit]:
+        statement = search_statement(
+            use_terms=bool(terms), filter_type="node_type" in params
+        )
+        result = await self._session.execute(statement, {**params, "terms": terms})
+        return [SearchHit(node=_node(row), score=row.score) for row in result]
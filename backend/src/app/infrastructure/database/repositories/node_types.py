@@ -0,0 +1,218 @@
+"""SQLAlchemy node type repository."""
+
+from dataclasses import replace
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import (
+    ARRAY,
+    Text,
+    and_,
+    any_,
+    bindparam,
+    case,
+    delete,
+    func,
+    literal,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.domain.node_types import (
+    FieldIndex,
+    FieldKind,
+    FieldSpec,
+    IndexState,
+    NodeTypeSchema,
+    index_name,
+)
+from app.infrastructure.database.tables import node_type_indexes, node_types
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from sqlalchemy import Insert, Row, Update
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+__all__ = [
+    "SqlAlchemyNodeTypeRepository",
+    "queue_drops_statement",
+    "queue_indexes_statement",
+]
+
+_TYPE_COLUMNS = (node_types.c.name, node_types.c.fields, node_types.c.version)
+_INDEX_COLUMNS = (
+    node_type_indexes.c.node_type,
+    node_type_indexes.c.field,
+    node_type_indexes.c.kind,
+    node_type_indexes.c.name,
+    node_type_indexes.c.state,
+    node_type_indexes.c.error,
+)
+
+
+def _fields(fields: Sequence[FieldSpec]) -> list[dict[str, Any]]:
+    return [
+        {
+            "name": spec.name,
+            "kind": spec.kind.value,
+            "required": spec.required,
+            "filterable": spec.filterable,
+        }
+        for spec in fields
+    ]
+
+
+def _schema(row: Row[Any]) -> NodeTypeSchema:
+    return NodeTypeSchema(
+        name=row.name,
+        fields=tuple(
+            FieldSpec(
+                name=field["name"],
+                kind=FieldKind(field["kind"]),
+                required=field["required"],
+                filterable=field["filterable"],
+            )
+            for field in row.fields
+        ),
+        version=row.version,
+    )
+
+
+def _index(row: Row[Any]) -> FieldIndex:
+    return FieldIndex(
+        node_type=row.node_type,
+        field=row.field,
+        kind=FieldKind(row.kind),
+        name=row.name,
+        state=IndexState(row.state),
+        error=row.error,
+    )
+
+
+def queue_indexes_statement(schema: NodeTypeSchema) -> Insert:
+    """Queue an index for each filterable field that lacks a fitting one.
+
+    An index of the same kind that is built, or on its way, is kept; any
+    other is queued to be (re)built.
+    """
+    rows = [
+        {
+            "node_type": schema.name,
+            "field": spec.name,
+            "kind": spec.kind.value,
+            "name": index_name(schema.name, spec.name),
+            "state": IndexState.PENDING.value,
+        }
+        for spec in schema.fields
+        if spec.filterable
+    ]
+    stmt = pg_insert(node_type_indexes).values(rows)
+    current = node_type_indexes.c
+    keep = and_(
+        current.kind == stmt.excluded.kind,
+        current.state.in_([IndexState.PENDING, IndexState.BUILDING, IndexState.READY]),
+    )
+    return stmt.on_conflict_do_update(
+        index_elements=[current.node_type, current.field],
+        set_={
+            "kind": stmt.excluded.kind,
+            "state": case(
+                (keep, current.state), else_=literal(IndexState.PENDING.value)
+            ),
+            "error": None,
+            "updated_at": case((keep, current.updated_at), else_=func.now()),
+        },
+    )
+
+
+def queue_drops_statement(name: str, keep: Sequence[str]) -> Update:
+    """Queue the indexes of a type's fields other than `keep` for dropping."""
+    stmt = update(node_type_indexes).where(
+        node_type_indexes.c.node_type == name,
+        node_type_indexes.c.state != IndexState.DROPPING,
+    )
+    if keep:
+        stmt = stmt.where(node_type_indexes.c.field.not_in(keep))
+    return stmt.values(state=IndexState.DROPPING, error=None, updated_at=func.now())
+
+
+class SqlAlchemyNodeTypeRepository:
+    """Node type repository backed by the `node_types` tables."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def save(self, schema: NodeTypeSchema) -> NodeTypeSchema:
+        """Create or redefine a node type, returning it with its new version.
+
+        Filterable fields without an index get one queued for building;
+        indexes of fields no longer filterable are queued for dropping.
+        """
+        stmt = pg_insert(node_types).values(
+            name=schema.name, fields=_fields(schema.fields)
+        )
+        result = await self._session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[node_types.c.name],
+                set_={
+                    "fields": stmt.excluded.fields,
+                    "version": node_types.c.version + 1,
+                    "updated_at": func.now(),
+                },
+            ).returning(node_types.c.version)
+        )
+        version = result.scalar_one()
+        filterable = [spec.name for spec in schema.fields if spec.filterable]
+        if filterable:
+            await self._session.execute(queue_indexes_statement(schema))
+        await self._session.execute(queue_drops_statement(schema.name, filterable))
+        await self._session.commit()
+        return replace(schema, version=version)
+
+    async def get(self, name: str) -> NodeTypeSchema | None:
+        """Return the schema of a node type, if it has one."""
+        result = await self._session.execute(
+            select(*_TYPE_COLUMNS).where(node_types.c.name == name)
+        )
+        row = result.one_or_none()
+        return _schema(row) if row is not None else None
+
+    async def get_many(self, names: Sequence[str]) -> list[NodeTypeSchema]:
+        """Return the schemas that exist among `names`, in no particular order."""
+        if not names:
+            return []
+        wanted = bindparam("names", list(names), type_=ARRAY(Text))
+        result = await self._session.execute(
+            select(*_TYPE_COLUMNS).where(node_types.c.name == any_(wanted))
+        )
+        return [_schema(row) for row in result]
+
+    async def list_types(self) -> list[NodeTypeSchema]:
+        """Return every node type schema, ordered by name."""
+        result = await self._session.execute(
+            select(*_TYPE_COLUMNS).order_by(node_types.c.name)
+        )
+        return [_schema(row) for row in result]
+
+    async def delete(self, name: str) -> NodeTypeSchema | None:
+        """Delete a schema, queueing its indexes for dropping; return it if found."""
+        result = await self._session.execute(
+            delete(node_types)
+            .where(node_types.c.name == name)
+            .returning(*_TYPE_COLUMNS)
+        )
+        row = result.one_or_none()
+        if row is not None:
+            await self._session.execute(queue_drops_statement(name, ()))
+        await self._session.commit()
+        return _schema(row) if row is not None else None
+
+    async def indexes(self, name: str) -> list[FieldIndex]:
+        """Return the indexes kept for a node type's fields, ordered by field."""
+        result = await self._session.execute(
+            select(*_INDEX_COLUMNS)
+            .where(node_type_indexes.c.node_type == name)
+            .order_by(node_type_indexes.c.field)
+        )
+        return [_index(row) for row in result]
@@ -0,0 +1,108 @@
+"""SQLAlchemy saved query repository and filter runner."""
+
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import delete, insert, literal, select, tuple_
+
+from app.domain.graph import Node
+from app.domain.queries import SavedQuery
+from app.infrastructure.database.filters import filter_parameters
+from app.infrastructure.database.tables import saved_queries
+
+if TYPE_CHECKING:
+    from sqlalchemy import Row
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from app.domain.pagination import Position
+    from app.domain.queries import Filter, NewSavedQuery
+    from app.infrastructure.database.filters import QueryPlanCache
+
+__all__ = ["SqlAlchemyFilterRunner", "SqlAlchemySavedQueryRepository"]
+
+_QUERY_COLUMNS = (saved_queries.c.id, saved_queries.c.name, saved_queries.c.filter)
+
+
+def _saved_query(row: Row[Any]) -> SavedQuery:
+    return SavedQuery(id=row.id, name=row.name, filter=row.filter)
+
+
+class SqlAlchemySavedQueryRepository:
+    """Saved query repository backed by the `saved_queries` table."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def add(self, query: NewSavedQuery) -> SavedQuery:
+        """Store a new saved query and return it with its id."""
+        result = await self._session.execute(
+            insert(saved_queries)
+            .values(name=query.name, filter=query.filter)
+            .returning(*_QUERY_COLUMNS)
+        )
+        row = result.one()
+        await self._session.commit()
+        return _saved_query(row)
+
+    async def get(self, query_id: int) -> SavedQuery | None:
+        """Return the saved query with the given id, if it exists."""
+        result = await self._session.execute(
+            select(*_QUERY_COLUMNS).where(saved_queries.c.id == query_id)
+        )
+        row = result.one_or_none()
+        return _saved_query(row) if row is not None else None
+
+    async def list_queries(
+        self, *, after: Position | None, limit: int
+    ) -> list[SavedQuery]:
+        """Return up to `limit` saved queries ordered by `(name, id)`."""
+        stmt = select(*_QUERY_COLUMNS)
+        if after is not None:
+            position = tuple_(saved_queries.c.name, saved_queries.c.id)
+            stmt = stmt.where(
+                position > tuple_(literal(after.sort_key), literal(after.id))
+            )
+        result = await self._session.execute(
+            stmt.order_by(saved_queries.c.name, saved_queries.c.id).limit(limit)
+        )
+        return [_saved_query(row) for row in result]
+
+    async def delete(self, query_id: int) -> SavedQuery | None:
+        """Delete a saved query, returning it if it existed."""
+        result = await self._session.execute(
+            delete(saved_queries)
+            .where(saved_queries.c.id == query_id)
+            .returning(*_QUERY_COLUMNS)
+        )
+        row = result.one_or_none()
+        await self._session.commit()
+        return _saved_query(row) if row is not None else None
+
+
+class SqlAlchemyFilterRunner:
+    """Runs filters with the worker's cached statements, one per shape."""
+
+    def __init__(self, session: AsyncSession, plans: QueryPlanCache) -> None:
+        self._session = session
+        self._plans = plans
+
+    async def run(
+        self, filter: Filter, *, after: Position | None, limit: int
+    ) -> list[Node]:
+        """Return up to `limit` matching nodes ordered by `(type, id)`."""
+        params = filter_parameters(filter)
+        params["limit"] = limit
+        if after is not None:
+            params["after_type"] = after.sort_key
+            params["after_id"] = after.id
+        statement = self._plans.plan(filter, paginated=after is not None)
+        result = await self._session.execute(statement, params)
+        return [
+            Node(
+                id=row.id,
+                key=row.key,
+                type=row.type,
+                name=row.name,
+                properties=row.properties,
+            )
+            for row in result
+        ]
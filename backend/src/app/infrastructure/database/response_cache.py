@@ -0,0 +1,78 @@
+"""Postgres tier of the provider response cache."""
+
+from typing import TYPE_CHECKING
+
+from sqlalchemy import delete, extract, func, select
+from sqlalchemy.dialects.postgresql import insert
+
+from app.application.enrichment import CachedResponse
+from app.infrastructure.database.tables import provider_responses
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+__all__ = ["SqlResponseStore"]
+
+_table = provider_responses
+
+
+class SqlResponseStore:
+    """Keeps cached provider responses in the `provider_responses` table.
+
+    The table is shared by every worker process and survives restarts, so
+    a response fetched once is reused by re-enrichment and re-imports.
+    """
+
+    def __init__(self, engine: AsyncEngine) -> None:
+        self._engine = engine
+
+    async def get(self, key: str) -> CachedResponse | None:
+        """Return the unexpired response stored under `key`, if any."""
+        statement = select(
+            _table.c.body,
+            _table.c.negative,
+            extract("epoch", _table.c.expires_at).label("expires_at"),
+        ).where(_table.c.key == key, _table.c.expires_at > func.now())
+        async with self._engine.connect() as connection:
+            row = (await connection.execute(statement)).one_or_none()
+        if row is None:
+            return None
+        return CachedResponse(
+            body=row.body, negative=row.negative, expires_at=float(row.expires_at)
+        )
+
+    async def put(self, key: str, response: CachedResponse) -> None:
+        """Store a response, replacing any previous one under `key`."""
+        statement = insert(_table).values(
+            key=key,
+            body=response.body,
+            negative=response.negative,
+            expires_at=func.to_timestamp(response.expires_at),
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=[_table.c.key],
+            set_={
+                "body": statement.excluded.body,
+                "negative": statement.excluded.negative,
+                "expires_at": statement.excluded.expires_at,
+            },
+        )
+        async with self._engine.begin() as connection:
+            await connection.execute(statement)
+
+    async def prune(self, *, max_entries: int) -> int:
+        """Drop expired responses, then the soonest to expire beyond `max_entries`."""
+        overflow = (
+            select(_table.c.key)
+            .order_by(_table.c.expires_at.desc())
+            .offset(max_entries)
+            .scalar_subquery()
+        )
+        async with self._engine.begin() as connection:
+            expired = await connection.execute(
+                delete(_table).where(_table.c.expires_at <= func.now())
+            )
+            evicted = await connection.execute(
+                delete(_table).where(_table.c.key.in_(overflow))
+            )
+        return expired.rowcount + evicted.rowcount
@@ -0,0 +1,213 @@
+"""SQLAlchemy Core table definitions.
+
+The tables are the source of truth for Alembic autogeneration; repositories
+map rows to domain entities themselves.
+"""
+
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    Column,
+    Computed,
+    DateTime,
+    ForeignKey,
+    Identity,
+    Index,
+    Integer,
+    MetaData,
+    PrimaryKeyConstraint,
+    Table,
+    Text,
+    func,
+    text,
+)
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
+
+__all__ = [
+    "SEARCH_CONFIG",
+    "edges",
+    "enrichment_jobs",
+    "metadata",
+    "node_type_indexes",
+    "node_types",
+    "nodes",
+    "provider_responses",
+    "saved_queries",
+]
+
+SEARCH_CONFIG = "simple"
+"""Text search configuration: no stemming or stop words, as names are proper nouns."""
+
+# Names weigh most; string property values (titles, venues, years...) are
+# searchable too. Being generated, the vector is kept current on every write.
+_SEARCH_VECTOR = (
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', name), 'A') || "
+    f"setweight(jsonb_to_tsvector('{SEARCH_CONFIG}', properties, "
+    """'["string", "numeric"]'), 'B')"""
+)
+
+metadata = MetaData(
+    naming_convention={
+        "ix": "ix_%(table_name)s_%(column_0_N_name)s",
+        "uq": "uq_%(table_name)s_%(column_0_N_name)s",
+        "ck": "ck_%(table_name)s_%(constraint_name)s",
+        "fk": "fk_%(table_name)s_%(column_0_name)s_%(referred_table_name)s",
+        "pk": "pk_%(table_name)s",
+    }
+)
+
+nodes = Table(
+    "nodes",
+    metadata,
+    Column("id", BigInteger, Identity(always=True), primary_key=True),
+    Column("key", Text, unique=True),
+    Column("type", Text, nullable=False),
+    Column("name", Text, nullable=False),
+    Column("properties", JSONB, nullable=False, server_default=text("'{}'::jsonb")),
+    Column(
+        "created_at", DateTime(timezone=True), nullable=False, server_default=func.now()
+    ),
+    Column(
+        "updated_at", DateTime(timezone=True), nullable=False, server_default=func.now()
+    ),
+    Column(
+        "search_vector",
+        TSVECTOR,
+        Computed(_SEARCH_VECTOR, persisted=True),
+        nullable=False,
+    ),
+    Index(None, "type", "id"),
+    Index(None, "search_vector", postgresql_using="gin"),
+    # Trigram index for typo-tolerant (`<%`) and substring matching on names.
+    Index(
+        None,
+        "name",
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    ),
+)
+
+edges = Table(
+    "edges",
+    metadata,
+    Column("id", BigInteger, Identity(always=True), primary_key=True),
+    Column(
+        "source_id",
+        BigInteger,
+        ForeignKey("nodes.id", ondelete="CASCADE"),
+        nullable=False,
+    ),
+    Column(
+        "target_id",
+        BigInteger,
+        ForeignKey("nodes.id", ondelete="CASCADE"),
+        nullable=False,
+    ),
+    Column("type", Text, nullable=False),
+    Column("properties", JSONB, nullable=False, server_default=text("'{}'::jsonb")),
+    Column(
+        "created_at", DateTime(timezone=True), nullable=False, server_default=func.now()
+    ),
+    # Traversals look edges up by (endpoint, type) and only need the opposite
+    # endpoint, so covering it allows index-only scans on each hop. The
+    # trailing id gives edge listings a `(type, id)` order to paginate on.
+    Index(None, "source_id", "type", "id", postgresql_include=["target_id"]),
+    Index(None, "target_id", "type", "id", postgresql_include=["source_id"]),
+)
+
+# One row per (node, provider). Rows are never deleted once done, so a node
+# is looked up once per provider however often the workers restart.
+enrichment_jobs = Table(
+    "enrichment_jobs",
+    metadata,
+    Column(
+        "node_id",
+        BigInteger,
+        ForeignKey("nodes.id", ondelete="CASCADE"),
+        nullable=False,
+    ),
+    Column("provider", Text, nullable=False),
+    Column("status", Text, nullable=False, server_default=text("'pending'")),
+    Column("attempts", Integer, nullable=False, server_default=text("0")),
+    Column(
+        "next_attempt_at",
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    ),
+    Column("locked_until", DateTime(timezone=True)),
+    Column("last_error", Text),
+    Column(
+        "updated_at", DateTime(timezone=True), nullable=False, server_default=func.now()
+    ),
+    PrimaryKeyConstraint("node_id", "provider"),
+    # Claiming scans only unfinished jobs, in due order.
+    Index(
+        None,
+        "provider",
+        "next_attempt_at",
+        postgresql_where=text("status IN ('pending', 'running')"),
+    ),
+)
+
+# Cached provider responses, keyed by a hash of the normalised request.
+provider_responses = Table(
+    "provider_responses",
+    metadata,
+    Column("key", Text, primary_key=True),
+    Column("body", JSONB, nullable=False),
+    Column("negative", Boolean, nullable=False, server_default=text("false")),
+    Column("expires_at", DateTime(timezone=True), nullable=False),
+    # Pruning drops expired rows, then the soonest to expire.
+    Index(None, "expires_at"),
+)
+
+# Named filters over the nodes; the filter is stored as the JSON submitted.
+saved_queries = Table(
+    "saved_queries",
+    metadata,
+    Column("id", BigInteger, Identity(always=True), primary_key=True),
+    Column("name", Text, nullable=False),
+    Column("filter", JSONB, nullable=False),
+    Column(
+        "created_at", DateTime(timezone=True), nullable=False, server_default=func.now()
+    ),
+    Index(None, "name", "id"),
+)
+
+# Declared properties per node type, as a JSON list of field objects. The
+# version goes up on each redefinition, keying cached validators.
+node_types = Table(
+    "node_types",
+    metadata,
+    Column("name", Text, primary_key=True),
+    Column("fields", JSONB, nullable=False),
+    Column("version", Integer, nullable=False, server_default=text("1")),
+    Column(
+        "updated_at", DateTime(timezone=True), nullable=False, server_default=func.now()
+    ),
+)
+
+# One row per index over a filterable field, worked through by the index
+# builder. Not tied to `node_types`: a deleted type's rows stay until their
+# indexes are dropped.
+node_type_indexes = Table(
+    "node_type_indexes",
+    metadata,
+    Column("node_type", Text, nullable=False),
+    Column("field", Text, nullable=False),
+    Column("kind", Text, nullable=False),
+    Column("name", Text, nullable=False),
+    Column("state", Text, nullable=False, server_default=text("'pending'")),
+    Column("error", Text),
+    Column(
+        "updated_at", DateTime(timezone=True), nullable=False, server_default=func.now()
+    ),
+    PrimaryKeyConstraint("node_type", "field"),
+    # The builder scans only unfinished work, oldest first.
+    Index(
+        None,
+        "updated_at",
+        postgresql_where=text("state IN ('pending', 'building', 'dropping')"),
+    ),
+)
@@ -0,0 +1,33 @@
+from app.infrastructure.enrichment.cache import (
+    ResponseCache,
+    ResponseCacheStats,
+    request_key,
+)
+from app.infrastructure.enrichment.client import ProviderClient
+from app.infrastructure.enrichment.musicbrainz import MusicBrainzProvider
+from app.infrastructure.enrichment.ratelimit import TokenBucket
+from app.infrastructure.enrichment.tmdb import TmdbProvider
+from app.infrastructure.enrichment.workers import (
+    EnrichmentStats,
+    EnrichmentWorkers,
+    get_enrichment,
+    get_response_cache,
+    start_enrichment,
+    stop_enrichment,
+)
+
+__all__ = [
+    "EnrichmentStats",
+    "EnrichmentWorkers",
+    "MusicBrainzProvider",
+    "ProviderClient",
+    "ResponseCache",
+    "ResponseCacheStats",
+    "TmdbProvider",
+    "TokenBucket",
+    "get_enrichment",
+    "get_response_cache",
+    "request_key",
+    "start_enrichment",
+    "stop_enrichment",
+]
@@ -0,0 +1,160 @@
+"""Two-tier cache of provider responses: an in-process LRU over a shared store."""
+
+import hashlib
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import structlog
+
+from app.application.enrichment import CachedResponse
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from app.application.enrichment import ResponseStore
+
+__all__ = ["ResponseCache", "ResponseCacheStats", "request_key"]
+
+
+def _normalise(value: str) -> str:
+    return " ".join(value.split()).casefold()
+
+
+def request_key(base_url: str, path: str, params: Mapping[str, str]) -> str:
+    """Hash a request so that trivially different spellings share an entry.
+
+    Parameter order, case and runs of whitespace are ignored; the providers'
+    searches are case-insensitive, so these never change the answer.
+    """
+    query = "&".join(
+        f"{name}={_normalise(value)}" for name, value in sorted(params.items())
+    )
+    request = f"{base_url.rstrip('/')}{path}?{query}"
+    return hashlib.sha256(request.encode()).hexdigest()
+
+
+@dataclass(slots=True)
+class ResponseCacheStats:
+    """Running totals for one cache in this process."""
+
+    memory_hits: int = 0
+    persistent_hits: int = 0
+    negative_hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+    pruned: int = 0
+    errors: int = 0
+
+    @property
+    def hits(self) -> int:
+        """Lookups answered by either tier."""
+        return self.memory_hits + self.persistent_hits
+
+    @property
+    def hit_ratio(self) -> float:
+        """Share of lookups answered from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class ResponseCache:
+    """Caches provider responses in memory and, optionally, in a shared store.
+
+    The memory tier is a per-process LRU of at most `max_memory_entries`.
+    Misses fall through to the persistent `store`, whose hits are promoted
+    into memory. Responses expire after `ttl` seconds, or `negative_ttl` for
+    ones that found nothing. The store is pruned to `max_persistent_entries`
+    every `prune_every` writes. A failing store only costs cache hits:
+    errors are logged and counted, never raised.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float,
+        negative_ttl: float,
+        max_memory_entries: int,
+        store: ResponseStore | None = None,
+        max_persistent_entries: int = 0,
+        prune_every: int = 1000,
+    ) -> None:
+        self._ttl = ttl
+        self._negative_ttl = negative_ttl
+        self._max_memory_entries = max_memory_entries
+        self._store = store
+        self._max_persistent_entries = max_persistent_entries
+        self._prune_every = prune_every
+        self._memory: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._writes = 0
+        self.stats = ResponseCacheStats()
+        self._logger = structlog.get_logger("provider_cache")
+
+    def _remember(self, key: str, response: CachedResponse) -> None:
+        if self._max_memory_entries <= 0:
+            return
+        self._memory[key] = response
+        self._memory.move_to_end(key)
+        while len(self._memory) > self._max_memory_entries:
+            self._memory.popitem(last=False)
+            self.stats.evictions += 1
+
+    def _from_memory(self, key: str, now: float) -> CachedResponse | None:
+        response = self._memory.get(key)
+        if response is None:
+            return None
+        if response.expires_at <= now:
+            del self._memory[key]
+            return None
+        self._memory.move_to_end(key)
+        return response
+
+    async def _from_store(self, key: str) -> CachedResponse | None:
+        if self._store is None:
+            return None
+        try:
+            return await self._store.get(key)
+        except Exception as exc:  # fall back to the provider
+            self.stats.errors += 1
+            await self._logger.aexception("provider_cache.read_failed", exc_info=exc)
+            return None
+
+    async def get(self, key: str) -> CachedResponse | None:
+        """Return the cached response for `key`, if there is an unexpired one."""
+        response = self._from_memory(key, time.time())
+        if response is not None:
+            self.stats.memory_hits += 1
+        elif (response := await self._from_store(key)) is not None:
+            self.stats.persistent_hits += 1
+            self._remember(key, response)
+        else:
+            self.stats.misses += 1
+            return None
+        if response.negative:
+            self.stats.negative_hits += 1
+        return response
+
+    async def put(self, key: str, body: dict[str, Any], *, negative: bool) -> None:
+        """Cache a response; `negative` ones found nothing and expire sooner."""
+        ttl = self._negative_ttl if negative else self._ttl
+        if ttl <= 0:
+            return
+        response = CachedResponse(
+            body=body, negative=negative, expires_at=time.time() + ttl
+        )
+        self._remember(key, response)
+        self.stats.stores += 1
+        if self._store is None:
+            return
+        try:
+            await self._store.put(key, response)
+            self._writes += 1
+            if self._writes % self._prune_every == 0:
+                self.stats.pruned += await self._store.prune(
+                    max_entries=self._max_persistent_entries
+                )
+        except Exception as exc:  # the memory tier still has it
+            self.stats.errors += 1
+            await self._logger.aexception("provider_cache.write_failed", exc_info=exc)
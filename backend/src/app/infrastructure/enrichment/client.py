@@ -0,0 +1,202 @@
+"""Shared, rate-limited HTTP client for one enrichment provider."""
+
+import asyncio
+import random
+import time
+from email.utils import parsedate_to_datetime
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any
+
+import httpx
+
+from app.application.enrichment import ProviderError
+
+from .cache import request_key
+from .ratelimit import TokenBucket
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+    from .cache import ResponseCache
+
+__all__ = ["ProviderClient"]
+
+type _Params = tuple[tuple[str, str], ...]
+
+_RETRY_STATUSES = frozenset(
+    {
+        HTTPStatus.TOO_MANY_REQUESTS,
+        HTTPStatus.BAD_GATEWAY,
+        HTTPStatus.SERVICE_UNAVAILABLE,
+        HTTPStatus.GATEWAY_TIMEOUT,
+        HTTPStatus.INTERNAL_SERVER_ERROR,
+    }
+)
+
+
+def _retry_after(response: httpx.Response) -> float | None:
+    """Seconds requested by a `Retry-After` header, if any."""
+    value = response.headers.get("retry-after")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        moment = parsedate_to_datetime(value)
+    except TypeError, ValueError:
+        return None
+    return max(0.0, moment.timestamp() - time.time())
+
+
+def _json_object(path: str, response: httpx.Response) -> dict[str, Any]:
+    try:
+        body = response.json()
+    except ValueError as exc:
+        msg = f"{path}: response is not JSON"
+        raise ProviderError(msg, retryable=False) from exc
+    if not isinstance(body, dict):
+        msg = f"{path}: expected a JSON object"
+        raise ProviderError(msg, retryable=False)
+    return body
+
+
+class ProviderClient:
+    """One keep-alive connection pool, rate limiter and retry policy.
+
+    Each provider gets exactly one client for the life of the worker, so
+    connections (and TLS sessions) are reused across lookups. Identical
+    requests that are already in flight share a single response. With a
+    `cache`, responses seen before are answered without spending the rate
+    limit at all.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        *,
+        rate: float,
+        burst: int = 1,
+        timeout: float = 10.0,
+        max_retries: int = 3,
+        backoff: float = 0.5,
+        max_backoff: float = 30.0,
+        connections: int = 4,
+        headers: Mapping[str, str] | None = None,
+        params: Mapping[str, str] | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+        cache: ResponseCache | None = None,
+    ) -> None:
+        self._base_url = base_url
+        self._cache = cache
+        self._http = httpx.AsyncClient(
+            base_url=base_url,
+            transport=transport,
+            headers=headers,
+            params=params,
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=connections, max_keepalive_connections=connections
+            ),
+        )
+        self._bucket = TokenBucket(rate, capacity=burst)
+        self._max_retries = max_retries
+        self._backoff = backoff
+        self._max_backoff = max_backoff
+        self._in_flight: dict[tuple[str, _Params], asyncio.Future[dict[str, Any]]] = {}
+        self.requests = 0
+        self.shared = 0
+
+    async def get_json(
+        self,
+        path: str,
+        params: Mapping[str, str],
+        *,
+        not_found: Callable[[dict[str, Any]], bool] | None = None,
+    ) -> dict[str, Any]:
+        """GET `path` and decode the JSON body, sharing identical calls.
+
+        `not_found` tells whether a body means nothing matched, so that the
+        cache keeps it for the shorter negative TTL.
+
+        Raises:
+            ProviderError: If the request failed, after any retries.
+        """
+        key = (path, tuple(sorted(params.items())))
+        if (pending := self._in_flight.get(key)) is not None:
+            self.shared += 1
+            return await asyncio.shield(pending)
+
+        future: asyncio.Future[dict[str, Any]] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._in_flight[key] = future
+        try:
+            result = await self._get_cached(path, params, not_found)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as exc:
+            future.set_exception(exc)
+            # Mark retrieved so an unshared failure is not reported as unhandled.
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._in_flight[key]
+
+    async def _get_cached(
+        self,
+        path: str,
+        params: Mapping[str, str],
+        not_found: Callable[[dict[str, Any]], bool] | None,
+    ) -> dict[str, Any]:
+        if self._cache is None:
+            return await self._get_with_retries(path, params)
+        key = request_key(self._base_url, path, params)
+        if (cached := await self._cache.get(key)) is not None:
+            return cached.body
+        body = await self._get_with_retries(path, params)
+        negative = not_found is not None and not_found(body)
+        await self._cache.put(key, body, negative=negative)
+        return body
+
+    def _delay(self, attempt: int) -> float:
+        """Exponential backoff with full jitter."""
+        ceiling = min(self._max_backoff, self._backoff * 2**attempt)
+        return random.uniform(0, ceiling)
+
+    async def _get_with_retries(
+        self, path: str, params: Mapping[str, str]
+    ) -> dict[str, Any]:
+        attempt = 0
+        while True:
+            await self._bucket.acquire()
+            self.requests += 1
+            try:
+                response = await self._http.get(path, params=params)
+            except httpx.TransportError as exc:
+                error = ProviderError(f"{path}: {exc!r}", retryable=True)
+            else:
+                if response.is_success:
+                    return _json_object(path, response)
+                retryable = response.status_code in _RETRY_STATUSES
+                error = ProviderError(
+                    f"{path}: HTTP {response.status_code}", retryable=retryable
+                )
+                if (wait := _retry_after(response)) is not None:
+                    self._bucket.pause(wait)
+                if not retryable:
+                    raise error
+
+            if attempt >= self._max_retries:
+                raise error
+            await asyncio.sleep(self._delay(attempt))
+            attempt += 1
+
+    async def aclose(self) -> None:
+        """Close pooled connections."""
+        await self._http.aclose()
@@ -0,0 +1,122 @@
+"""MusicBrainz lookups for artists, releases and recordings."""
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from app.domain.graph import Node
+
+    from .client import ProviderClient
+
+__all__ = ["MusicBrainzProvider"]
+
+_LUCENE_SPECIAL = '\\+-&|!(){}[]^"~*?:/'
+
+
+def _phrase(text: str) -> str:
+    """Quote text as a Lucene phrase so punctuation in names is literal."""
+    escaped = "".join(f"\\{c}" if c in _LUCENE_SPECIAL else c for c in text)
+    return f'"{escaped}"'
+
+
+def _artist(hit: dict[str, Any]) -> dict[str, Any]:
+    life_span = hit.get("life-span") or {}
+    return {
+        "id": hit["id"],
+        "name": hit.get("name"),
+        "type": hit.get("type"),
+        "country": hit.get("country"),
+        "disambiguation": hit.get("disambiguation"),
+        "begin": life_span.get("begin"),
+        "end": life_span.get("end"),
+    }
+
+
+def _credit(hit: dict[str, Any]) -> str | None:
+    credits = hit.get("artist-credit") or []
+    return "".join(c.get("name", "") + c.get("joinphrase", "") for c in credits) or None
+
+
+def _release(hit: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "id": hit["id"],
+        "title": hit.get("title"),
+        "artist": _credit(hit),
+        "date": hit.get("date"),
+        "country": hit.get("country"),
+        "status": hit.get("status"),
+    }
+
+
+def _recording(hit: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "id": hit["id"],
+        "title": hit.get("title"),
+        "artist": _credit(hit),
+        "length_ms": hit.get("length"),
+        "first_release_date": hit.get("first-release-date"),
+    }
+
+
+_ENTITIES = {
+    "artist": ("artists", "artist", _artist),
+    "release": ("releases", "release", _release),
+    "recording": ("recordings", "recording", _recording),
+}
+
+
+class MusicBrainzProvider:
+    """Searches MusicBrainz by node name and keeps the best confident hit.
+
+    MusicBrainz allows about one request per second per client; the pacing
+    is done by the shared `ProviderClient`.
+    """
+
+    name = "musicbrainz"
+
+    def __init__(
+        self,
+        client: ProviderClient,
+        *,
+        artist_types: Iterable[str],
+        release_types: Iterable[str],
+        recording_types: Iterable[str],
+        min_score: int = 90,
+    ) -> None:
+        self._client = client
+        self._min_score = min_score
+        self._entities = {
+            **dict.fromkeys(artist_types, "artist"),
+            **dict.fromkeys(release_types, "release"),
+            **dict.fromkeys(recording_types, "recording"),
+        }
+
+    @property
+    def node_types(self) -> frozenset[str]:
+        """Node types this provider knows how to look up."""
+        return frozenset(self._entities)
+
+    async def lookup(self, node: Node) -> dict[str, Any] | None:
+        """Return the best matching MusicBrainz entity, if it is a confident match.
+
+        Raises:
+            ProviderError: If the request failed.
+        """
+        entity = self._entities.get(node.type)
+        if entity is None:
+            return None
+        collection, field, convert = _ENTITIES[entity]
+        query = f"{field}:{_phrase(node.name)}"
+        if entity != "artist" and (artist := node.properties.get("artist")):
+            query += f" AND artist:{_phrase(str(artist))}"
+
+        body = await self._client.get_json(
+            f"/{entity}",
+            {"query": query, "fmt": "json", "limit": "1"},
+            not_found=lambda body: not body.get(collection),
+        )
+        hits = body.get(collection) or []
+        if not hits or int(hits[0].get("score", 0)) < self._min_score:
+            return None
+        return {"entity": entity, **convert(hits[0])}
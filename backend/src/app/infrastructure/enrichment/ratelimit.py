@@ -0,0 +1,41 @@
+"""Token-bucket rate limiting for outbound provider requests."""
+
+import asyncio
+import time
+
+__all__ = ["TokenBucket"]
+
+
+class TokenBucket:
+    """Allows `rate` acquisitions per second on average, in bursts of `capacity`.
+
+    Waiters are served in arrival order: a lock is held while sleeping for
+    the next token, so a burst of callers cannot overtake each other.
+    """
+
+    def __init__(self, rate: float, *, capacity: int = 1) -> None:
+        self._rate = rate
+        self._capacity = float(capacity)
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._tokens = min(self._capacity, self._tokens + elapsed * self._rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+                self._refill()
+            self._tokens -= 1
+
+    def pause(self, seconds: float) -> None:
+        """Hold back the next token for at least `seconds` (e.g. `Retry-After`)."""
+        self._refill()
+        self._tokens = min(self._tokens, 1 - seconds * self._rate)
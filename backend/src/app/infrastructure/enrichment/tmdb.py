@@ -0,0 +1,95 @@
+"""TMDB lookups for films and TV shows."""
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from app.domain.graph import Node
+
+    from .client import ProviderClient
+
+__all__ = ["TmdbProvider"]
+
+
+def _year(node: Node) -> str | None:
+    year = node.properties.get("year")
+    return str(year) if year is not None and str(year).isdigit() else None
+
+
+def _movie(hit: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "id": hit["id"],
+        "title": hit.get("title"),
+        "original_title": hit.get("original_title"),
+        "release_date": hit.get("release_date"),
+        "overview": hit.get("overview"),
+        "poster_path": hit.get("poster_path"),
+    }
+
+
+def _tv(hit: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "id": hit["id"],
+        "name": hit.get("name"),
+        "original_name": hit.get("original_name"),
+        "first_air_date": hit.get("first_air_date"),
+        "overview": hit.get("overview"),
+        "poster_path": hit.get("poster_path"),
+    }
+
+
+def _no_results(body: dict[str, Any]) -> bool:
+    return not body.get("results")
+
+
+_SEARCHES = {
+    "movie": ("primary_release_year", _movie),
+    "tv": ("first_air_date_year", _tv),
+}
+
+
+class TmdbProvider:
+    """Searches TMDB by node name (and `year` property) and keeps the top hit."""
+
+    name = "tmdb"
+
+    def __init__(
+        self,
+        client: ProviderClient,
+        *,
+        movie_types: Iterable[str],
+        tv_types: Iterable[str],
+    ) -> None:
+        self._client = client
+        self._searches = {
+            **dict.fromkeys(movie_types, "movie"),
+            **dict.fromkeys(tv_types, "tv"),
+        }
+
+    @property
+    def node_types(self) -> frozenset[str]:
+        """Node types this provider knows how to look up."""
+        return frozenset(self._searches)
+
+    async def lookup(self, node: Node) -> dict[str, Any] | None:
+        """Return the top TMDB search result for the node, if any.
+
+        Raises:
+            ProviderError: If the request failed.
+        """
+        search = self._searches.get(node.type)
+        if search is None:
+            return None
+        year_param, convert = _SEARCHES[search]
+        params = {"query": node.name, "include_adult": "false"}
+        if (year := _year(node)) is not None:
+            params[year_param] = year
+
+        body = await self._client.get_json(
+            f"/search/{search}", params, not_found=_no_results
+        )
+        results = body.get("results") or []
+        if not results:
+            return None
+        return {"media_type": search, **convert(results[0])}
@@ -0,0 +1,374 @@
+"""Paced background enrichment: one feeder and a worker pool per provider."""
+
+import asyncio
+import random
+from contextlib import suppress
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import structlog
+
+from app.application.enrichment import ProviderError
+from app.infrastructure.database import SqlEnrichmentJobStore, SqlResponseStore
+
+from .cache import ResponseCache
+from .client import ProviderClient
+from .musicbrainz import MusicBrainzProvider
+from .tmdb import TmdbProvider
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+    from app.application.enrichment import (
+        EnrichmentJob,
+        EnrichmentJobStore,
+        EnrichmentProvider,
+    )
+    from app.shared.config.enrichment import EnrichmentSettings
+    from app.shared.config.provider_cache import ProviderCacheSettings
+
+__all__ = [
+    "EnrichmentStats",
+    "EnrichmentWorkers",
+    "get_enrichment",
+    "get_response_cache",
+    "start_enrichment",
+    "stop_enrichment",
+]
+
+
+@dataclass(slots=True)
+class EnrichmentStats:
+    """Running totals for one provider in this process."""
+
+    queued: int = 0
+    enriched: int = 0
+    unmatched: int = 0
+    retried: int = 0
+    failed: int = 0
+
+
+class _LostLeadershipError(Exception):
+    """Raised by a feeder once another process may have become the leader."""
+
+
+class EnrichmentWorkers:
+    """Feeds due jobs from the store to a bounded pool of workers.
+
+    Only one process (the store's leader) runs lookups, so each provider's
+    rate limit holds across the whole deployment. Per provider, a feeder
+    queues newly created nodes as jobs, claims due jobs into a bounded
+    in-memory queue, and `workers` tasks drain it. Claimed jobs carry a
+    lease; if the process stops before finishing them they become due again,
+    so an interrupted run picks up where it left off.
+    """
+
+    def __init__(
+        self,
+        store: EnrichmentJobStore,
+        providers: Sequence[EnrichmentProvider],
+        *,
+        workers: int,
+        queue_size: int,
+        batch_size: int,
+        poll_interval: float,
+        lease: float,
+        max_attempts: int,
+        retry_delay: float,
+        max_retry_delay: float,
+    ) -> None:
+        self._store = store
+        self._providers = providers
+        self._workers = workers
+        self._queue_size = queue_size
+        self._batch_size = batch_size
+        self._poll_interval = poll_interval
+        self._lease = lease
+        self._max_attempts = max_attempts
+        self._retry_delay = retry_delay
+        self._max_retry_delay = max_retry_delay
+        self._queues: dict[str, asyncio.Queue[EnrichmentJob]] = {}
+        self._stats = {p.name: EnrichmentStats() for p in providers}
+        self._task: asyncio.Task[None] | None = None
+        self._logger = structlog.get_logger("enrichment")
+
+    @property
+    def leading(self) -> bool:
+        """Whether this process is the one running lookups."""
+        return bool(self._queues)
+
+    def queue_depths(self) -> dict[str, int]:
+        """Jobs claimed and waiting for a worker, per provider."""
+        return {name: queue.qsize() for name, queue in self._queues.items()}
+
+    def stats(self) -> dict[str, EnrichmentStats]:
+        """Running totals per provider."""
+        return self._stats
+
+    async def _lead(self) -> None:
+        while True:
+            try:
+                if await self._store.try_lead():
+                    return
+            except Exception as exc:  # the database may not be up yet
+                await self._logger.aexception("enrichment.lead_failed", exc_info=exc)
+            await asyncio.sleep(self._poll_interval)
+
+    async def run(self) -> None:
+        """Wait for leadership, then enrich until cancelled.
+
+        If leadership is lost, every lookup stops and the process waits to
+        lead again, so that two processes never share a provider's limit.
+        """
+        while True:
+            await self._lead()
+            await self._logger.ainfo(
+                "enrichment.started", providers=[p.name for p in self._providers]
+            )
+            try:
+                await self._enrich()
+            except* _LostLeadershipError:
+                await self._logger.awarning("enrichment.leadership_lost")
+            finally:
+                self._queues.clear()
+
+    async def _enrich(self) -> None:
+        async with asyncio.TaskGroup() as group:
+            for provider in self._providers:
+                queue: asyncio.Queue[EnrichmentJob] = asyncio.Queue(self._queue_size)
+                self._queues[provider.name] = queue
+                group.create_task(self._feed(provider, queue))
+                for _ in range(self._workers):
+                    group.create_task(self._work(provider, queue))
+
+    async def _resume(self, provider: EnrichmentProvider) -> dict[str, int]:
+        """Start discovery after the nodes already queued for `provider`."""
+        node_types = sorted(provider.node_types)
+        queued = await self._store.high_water(provider.name, node_types)
+        return {node_type: queued.get(node_type, 0) for node_type in node_types}
+
+    async def _discover(
+        self, provider: EnrichmentProvider, high_water: dict[str, int]
+    ) -> bool:
+        """Queue jobs for one batch of new nodes per type; report if any."""
+        found = False
+        for node_type, after_id in high_water.items():
+            top = await self._store.discover(
+                provider.name, node_type, after_id=after_id, limit=self._batch_size
+            )
+            if top is not None:
+                high_water[node_type] = top
+                found = True
+        return found
+
+    async def _claim(
+        self, provider: EnrichmentProvider, queue: asyncio.Queue[EnrichmentJob]
+    ) -> Sequence[EnrichmentJob]:
+        """Claim as many due jobs as the queue has room for."""
+        room = min(self._queue_size - queue.qsize(), self._batch_size)
+        if room <= 0:
+            return []
+        return await self._store.claim(provider.name, limit=room, lease=self._lease)
+
+    async def _feed(
+        self, provider: EnrichmentProvider, queue: asyncio.Queue[EnrichmentJob]
+    ) -> None:
+        # Node ids only grow, so remembering the highest one seen per type
+        # keeps discovery incremental, across restarts too.
+        high_water: dict[str, int] | None = None
+        while True:
+            if not await self._store.still_leading():
+                raise _LostLeadershipError
+            try:
+                if high_water is None:
+                    high_water = await self._resume(provider)
+                discovered = await self._discover(provider, high_water)
+                jobs = await self._claim(provider, queue)
+            except Exception as exc:  # keep feeding after transient failures
+                await self._logger.aexception(
+                    "enrichment.feed_failed", provider=provider.name, exc_info=exc
+                )
+                discovered, jobs = False, []
+
+            for job in jobs:
+                queue.put_nowait(job)
+            self._stats[provider.name].queued += len(jobs)
+            if not jobs and not discovered:
+                await asyncio.sleep(self._poll_interval)
+            elif queue.full():
+                # Let the workers catch up before claiming more.
+                await queue.join()
+
+    async def _work(
+        self, provider: EnrichmentProvider, queue: asyncio.Queue[EnrichmentJob]
+    ) -> None:
+        while True:
+            job = await queue.get()
+            try:
+                await self._process(provider, job)
+            except Exception as exc:  # a broken job must not stop the worker
+                await self._logger.aexception(
+                    "enrichment.job_failed",
+                    provider=provider.name,
+                    node_id=job.node.id,
+                    exc_info=exc,
+                )
+            finally:
+                queue.task_done()
+
+    def _backoff(self, attempt: int) -> float:
+        """Exponential delay before the next attempt, with jitter."""
+        delay = min(self._max_retry_delay, self._retry_delay * 2 ** (attempt - 1))
+        return random.uniform(delay / 2, delay)
+
+    async def _process(self, provider: EnrichmentProvider, job: EnrichmentJob) -> None:
+        stats = self._stats[provider.name]
+        try:
+            data = await provider.lookup(job.node)
+        except ProviderError as exc:
+            if exc.retryable and job.attempt < self._max_attempts:
+                stats.retried += 1
+                delay = self._backoff(job.attempt)
+                await self._store.retry(job, str(exc), delay=delay)
+            else:
+                stats.failed += 1
+                await self._store.fail(job, str(exc))
+            return
+
+        if data is None:
+            stats.unmatched += 1
+        else:
+            stats.enriched += 1
+        await self._store.complete(job, data)
+
+    def start(self) -> None:
+        """Start enriching in the background."""
+        self._task = asyncio.create_task(self.run(), name="enrichment")
+
+    async def stop(self) -> None:
+        """Stop all workers and give up leadership.
+
+        Jobs claimed but not finished are picked up again once their lease
+        expires.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        self._queues.clear()
+        await self._store.close()
+
+
+def _response_cache(
+    engine: AsyncEngine, settings: ProviderCacheSettings
+) -> ResponseCache | None:
+    if not settings.enabled:
+        return None
+    return ResponseCache(
+        ttl=settings.ttl_seconds,
+        negative_ttl=settings.negative_ttl_seconds,
+        max_memory_entries=settings.memory_entries,
+        store=SqlResponseStore(engine) if settings.persistent else None,
+        max_persistent_entries=settings.max_persistent_entries,
+        prune_every=settings.prune_every,
+    )
+
+
+def _providers(
+    settings: EnrichmentSettings, cache: ResponseCache | None
+) -> tuple[list[EnrichmentProvider], list[ProviderClient]]:
+    """Build the configured providers, each with its own HTTP client."""
+    providers: list[EnrichmentProvider] = []
+    clients: list[ProviderClient] = []
+    tmdb, musicbrainz = settings.tmdb, settings.musicbrainz
+    token = tmdb.access_token.get_secret_value()
+    if tmdb.enabled and token:
+        client = ProviderClient(
+            tmdb.base_url,
+            rate=tmdb.rate,
+            burst=tmdb.burst,
+            timeout=settings.request_timeout,
+            max_retries=settings.request_retries,
+            headers={"Authorization": f"Bearer {token}"},
+            cache=cache,
+        )
+        clients.append(client)
+        providers.append(
+            TmdbProvider(client, movie_types=tmdb.movie_types, tv_types=tmdb.tv_types)
+        )
+    if musicbrainz.enabled:
+        client = ProviderClient(
+            musicbrainz.base_url,
+            rate=musicbrainz.rate,
+            timeout=settings.request_timeout,
+            max_retries=settings.request_retries,
+            connections=1,
+            headers={"User-Agent": musicbrainz.user_agent},
+            cache=cache,
+        )
+        clients.append(client)
+        providers.append(
+            MusicBrainzProvider(
+                client,
+                artist_types=musicbrainz.artist_types,
+                release_types=musicbrainz.release_types,
+                recording_types=musicbrainz.recording_types,
+                min_score=musicbrainz.min_score,
+            )
+        )
+    return providers, clients
+
+
+_workers: EnrichmentWorkers | None = None
+_clients: list[ProviderClient] = []
+_cache: ResponseCache | None = None
+
+
+def start_enrichment(
+    engine: AsyncEngine,
+    settings: EnrichmentSettings,
+    cache_settings: ProviderCacheSettings,
+) -> EnrichmentWorkers:
+    """Start enriching nodes in the background from the configured providers."""
+    global _workers, _clients, _cache
+    _cache = _response_cache(engine, cache_settings)
+    providers, _clients = _providers(settings, _cache)
+    _workers = EnrichmentWorkers(
+        SqlEnrichmentJobStore(engine),
+        providers,
+        workers=settings.workers_per_provider,
+        queue_size=settings.queue_size,
+        batch_size=settings.batch_size,
+        poll_interval=settings.poll_interval,
+        lease=settings.lease_seconds,
+        max_attempts=settings.max_attempts,
+        retry_delay=settings.retry_base_delay,
+        max_retry_delay=settings.retry_max_delay,
+    )
+    _workers.start()
+    return _workers
+
+
+def get_enrichment() -> EnrichmentWorkers | None:
+    """Return the worker's enrichment pool, or `None` when it is disabled."""
+    return _workers
+
+
+def get_response_cache() -> ResponseCache | None:
+    """Return the worker's provider response cache, if enrichment runs here."""
+    return _cache
+
+
+async def stop_enrichment() -> None:
+    """Stop enriching and close the provider clients."""
+    global _workers, _cache
+    if _workers is not None:
+        await _workers.stop()
+        _workers = None
+    for client in _clients:
+        await client.aclose()
+    _clients.clear()
+    _cache = None
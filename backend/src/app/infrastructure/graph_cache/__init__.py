@@ -0,0 +1,20 @@
+from app.infrastructure.graph_cache.cache import AdjacencyCache, AdjacencyCacheStats
+from app.infrastructure.graph_cache.csr import CompressedAdjacency
+from app.infrastructure.graph_cache.refresher import (
+    AdjacencyCacheRefresher,
+    get_adjacency_cache,
+    start_adjacency_cache,
+    stop_adjacency_cache,
+)
+from app.infrastructure.graph_cache.repository import CachedGraphRepository
+
+__all__ = [
+    "AdjacencyCache",
+    "AdjacencyCacheRefresher",
+    "AdjacencyCacheStats",
+    "CachedGraphRepository",
+    "CompressedAdjacency",
+    "get_adjacency_cache",
+    "start_adjacency_cache",
+    "stop_adjacency_cache",
+]
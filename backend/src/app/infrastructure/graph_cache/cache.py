@@ -0,0 +1,277 @@
+"""Per-worker adjacency cache: a CSR snapshot plus a small write overlay."""
+
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from itertools import chain
+from typing import TYPE_CHECKING
+
+from app.domain.graph import Direction, Link
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+
+    from app.domain.graph import Edge
+
+    from .csr import CompressedAdjacency
+
+__all__ = ["AdjacencyCache", "AdjacencyCacheStats", "Fingerprint"]
+
+type Fingerprint = tuple[int, int]
+"""`(edge count, highest edge id)` — changes whenever edges are added or removed."""
+
+type _EdgeKey = tuple[int, int, int]
+
+
+def _link(node_id: int, neighbour: int, sense: Direction, edge_type: str) -> Link:
+    if sense is Direction.OUT:
+        return Link(source_id=node_id, target_id=neighbour, type=edge_type)
+    return Link(source_id=neighbour, target_id=node_id, type=edge_type)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class AdjacencyCacheStats:
+    """Point-in-time figures for reporting."""
+
+    ready: bool
+    nodes: int
+    edges: int
+    pending_changes: int
+    memory_bytes: int
+    hits: int
+    misses: int
+    rebuilds: int
+    last_rebuild_seconds: float | None
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of traversals answered from memory."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class AdjacencyCache:
+    """In-memory edge set answering k-hop traversals without the database.
+
+    The bulk of the graph lives in an immutable `CompressedAdjacency`
+    snapshot. Edges added or removed by this worker since the snapshot was
+    built are kept in an overlay and consulted during traversals; once the
+    overlay grows past `max_pending` (or another worker changes the graph)
+    the owner rebuilds the snapshot and calls `replace`.
+    """
+
+    def __init__(self, *, max_pending: int) -> None:
+        self._max_pending = max_pending
+        self._snapshot: CompressedAdjacency | None = None
+        self._type_codes: dict[str, int] = {}
+        self._fingerprint: Fingerprint = (0, 0)
+        self._added_out: defaultdict[int, list[tuple[int, int]]] = defaultdict(list)
+        self._added_in: defaultdict[int, list[tuple[int, int]]] = defaultdict(list)
+        self._removed: Counter[_EdgeKey] = Counter()
+        self._removed_nodes: set[int] = set()
+        self._pending = 0
+        self.hits = 0
+        self.misses = 0
+        self.rebuilds = 0
+        self.last_rebuild_seconds: float | None = None
+
+    @property
+    def ready(self) -> bool:
+        """Whether a snapshot has been loaded."""
+        return self._snapshot is not None
+
+    @property
+    def fingerprint(self) -> Fingerprint:
+        """Expected database fingerprint, including this worker's writes."""
+        return self._fingerprint
+
+    @property
+    def needs_compaction(self) -> bool:
+        """Whether the overlay has grown enough to warrant a rebuild."""
+        return self._pending > self._max_pending
+
+    def type_code(self, edge_type: str) -> int:
+        """Return the small integer code for an edge type, assigning one."""
+        return self._type_codes.setdefault(edge_type, len(self._type_codes))
+
+    def replace(
+        self,
+        snapshot: CompressedAdjacency,
+        type_codes: dict[str, int],
+        fingerprint: Fingerprint,
+        *,
+        seconds: float,
+    ) -> None:
+        """Swap in a freshly built snapshot and drop the overlay."""
+        self._snapshot = snapshot
+        self._type_codes = type_codes
+        self._fingerprint = fingerprint
+        self._added_out.clear()
+        self._added_in.clear()
+        self._removed.clear()
+        self._removed_nodes.clear()
+        self._pending = 0
+        self.rebuilds += 1
+        self.last_rebuild_seconds = seconds
+
+    def edge_added(self, edge: Edge) -> None:
+        """Record an edge written by this worker."""
+        code = self.type_code(edge.type)
+        self._added_out[edge.source_id].append((edge.target_id, code))
+        self._added_in[edge.target_id].append((edge.source_id, code))
+        count, max_id = self._fingerprint
+        self._fingerprint = (count + 1, max(max_id, edge.id))
+        self._pending += 1
+
+    def edge_removed(self, edge: Edge) -> None:
+        """Record an edge deleted by this worker."""
+        code = self.type_code(edge.type)
+        outgoing = self._added_out.get(edge.source_id, [])
+        if (edge.target_id, code) in outgoing:
+            outgoing.remove((edge.target_id, code))
+            self._added_in[edge.target_id].remove((edge.source_id, code))
+        else:
+            self._removed[edge.source_id, edge.target_id, code] += 1
+        count, max_id = self._fingerprint
+        self._fingerprint = (count - 1, max_id)
+        self._pending += 1
+
+    def node_removed(self, node_id: int) -> None:
+        """Record a node deleted by this worker along with its edges."""
+        edge_count = self.degree(node_id)
+        self._removed_nodes.add(node_id)
+        count, max_id = self._fingerprint
+        self._fingerprint = (count - edge_count, max_id)
+        self._pending += 1
+
+    def degree(self, node_id: int) -> int:
+        """Number of live edges touching a node, overlay included."""
+        outgoing = sum(1 for _ in self._adjacent(node_id, Direction.OUT, None))
+        # Self-loops appear in both directions but are a single edge.
+        incoming = sum(
+            1
+            for neighbour, _ in self._adjacent(node_id, Direction.IN, None)
+            if neighbour != node_id
+        )
+        return outgoing + incoming
+
+    def neighbourhood(
+        self,
+        node_id: int,
+        *,
+        depth: int,
+        direction: Direction,
+        edge_types: Sequence[str] | None,
+        limit: int,
+    ) -> list[tuple[int, int]]:
+        """Breadth-first search returning `(node_id, depth)` pairs.
+
+        Results are ordered by depth then id, matching the SQL traversal.
+        The search stops after the first level that reaches `limit`.
+        """
+        codes = self._codes(edge_types)
+        seen = {node_id}
+        frontier = [node_id]
+        reached: list[tuple[int, int]] = []
+        for level in range(1, depth + 1):
+            next_frontier: list[int] = []
+            for current in frontier:
+                for neighbour, _ in self._neighbours(current, direction, codes):
+                    if neighbour not in seen and neighbour not in self._removed_nodes:
+                        seen.add(neighbour)
+                        next_frontier.append(neighbour)
+            next_frontier.sort()
+            reached.extend((found, level) for found in next_frontier)
+            if not next_frontier or len(reached) >= limit:
+                break
+            frontier = next_frontier
+        return reached[:limit]
+
+    def links(
+        self,
+        node_ids: Sequence[int],
+        *,
+        direction: Direction,
+        edge_types: Sequence[str] | None,
+    ) -> list[Link]:
+        """Return the distinct links touching any of `node_ids`.
+
+        `direction` is relative to those nodes, as for the repository.
+        """
+        codes = self._codes(edge_types)
+        names = {code: name for name, code in self._type_codes.items()}
+        senses = [Direction.OUT, Direction.IN]
+        if direction is not Direction.BOTH:
+            senses = [direction]
+        found: dict[Link, None] = {}
+        for node_id in node_ids:
+            if node_id in self._removed_nodes:
+                continue
+            for sense in senses:
+                for neighbour, code in self._adjacent(node_id, sense, codes):
+                    if neighbour not in self._removed_nodes:
+                        found[_link(node_id, neighbour, sense, names[code])] = None
+        return list(found)
+
+    def _codes(self, edge_types: Sequence[str] | None) -> set[int] | None:
+        if not edge_types:
+            return None
+        return {self._type_codes[t] for t in edge_types if t in self._type_codes}
+
+    def _neighbours(
+        self, node_id: int, direction: Direction, codes: set[int] | None
+    ) -> Iterator[tuple[int, int]]:
+        if direction is not Direction.IN:
+            yield from self._adjacent(node_id, Direction.OUT, codes)
+        if direction is not Direction.OUT:
+            yield from self._adjacent(node_id, Direction.IN, codes)
+
+    def _adjacent(
+        self, node_id: int, direction: Direction, codes: set[int] | None
+    ) -> Iterator[tuple[int, int]]:
+        """Yield live `(neighbour, type_code)` pairs in one direction."""
+        snapshot = self._snapshot
+        if snapshot is None:
+            return
+        if direction is Direction.OUT:
+            edges: Iterable[tuple[int, int]] = snapshot.outgoing(node_id)
+            added = self._added_out.get(node_id, ())
+        else:
+            edges = snapshot.incoming(node_id)
+            added = self._added_in.get(node_id, ())
+
+        if self._removed:
+            edges = self._without_removed(node_id, direction, edges)
+        for neighbour, code in chain(edges, added):
+            if codes is None or code in codes:
+                yield neighbour, code
+
+    def _without_removed(
+        self, node_id: int, direction: Direction, edges: Iterable[tuple[int, int]]
+    ) -> Iterator[tuple[int, int]]:
+        """Skip exactly as many copies of a deleted edge as were deleted."""
+        skipped: Counter[_EdgeKey] = Counter()
+        for neighbour, code in edges:
+            key = (
+                (node_id, neighbour, code)
+                if direction is Direction.OUT
+                else (neighbour, node_id, code)
+            )
+            if skipped[key] < self._removed[key]:
+                skipped[key] += 1
+                continue
+            yield neighbour, code
+
+    def stats(self) -> AdjacencyCacheStats:
+        """Return figures for reporting."""
+        snapshot = self._snapshot
+        return AdjacencyCacheStats(
+            ready=snapshot is not None,
+            nodes=len(snapshot.node_ids) if snapshot else 0,
+            edges=self._fingerprint[0],
+            pending_changes=self._pending,
+            memory_bytes=snapshot.nbytes if snapshot else 0,
+            hits=self.hits,
+            misses=self.misses,
+            rebuilds=self.rebuilds,
+            last_rebuild_seconds=self.last_rebuild_seconds,
+        )
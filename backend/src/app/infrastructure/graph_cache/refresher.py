@@ -0,0 +1,153 @@
+"""Keeps a worker's adjacency cache in step with the database."""
+
+import asyncio
+import time
+from array import array
+from contextlib import suppress
+from typing import TYPE_CHECKING
+
+import structlog
+from sqlalchemy import func, select
+
+from app.infrastructure.database.tables import edges
+
+from .cache import AdjacencyCache
+from .csr import CompressedAdjacency
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+    from app.shared.config.graph import GraphSettings
+
+    from .cache import Fingerprint
+
+__all__ = [
+    "AdjacencyCacheRefresher",
+    "get_adjacency_cache",
+    "start_adjacency_cache",
+    "stop_adjacency_cache",
+]
+
+_FINGERPRINT = select(func.count(), func.coalesce(func.max(edges.c.id), 0))
+_EDGES = select(edges.c.source_id, edges.c.target_id, edges.c.type)
+_BATCH_SIZE = 10_000
+
+
+async def _fingerprint(connection: AsyncConnection) -> Fingerprint:
+    count, max_id = (await connection.execute(_FINGERPRINT)).one()
+    return int(count), int(max_id)
+
+
+class AdjacencyCacheRefresher:
+    """Rebuilds the cache on start-up and whenever it falls out of step.
+
+    Writes made through this worker update the cache incrementally. Every
+    `interval` seconds the refresher compares the `(count, max id)`
+    fingerprint of the edges table with the one the cache expects; a
+    mismatch means another worker (or an import) changed the graph, and the
+    snapshot is rebuilt in full. A rebuild is also triggered when the write
+    overlay grows too large.
+    """
+
+    def __init__(
+        self, cache: AdjacencyCache, engine: AsyncEngine, *, interval: float
+    ) -> None:
+        self.cache = cache
+        self._engine = engine
+        self._interval = interval
+        self._task: asyncio.Task[None] | None = None
+        self._logger = structlog.get_logger("adjacency_cache")
+
+    async def rebuild(self) -> None:
+        """Load every edge and swap in a new snapshot."""
+        start = time.perf_counter()
+        sources, targets, types = array("q"), array("q"), array("H")
+        type_codes: dict[str, int] = {}
+
+        async with self._engine.connect() as connection:
+            # Read the fingerprint and the edges from the same snapshot.
+            connection = await connection.execution_options(
+                isolation_level="REPEATABLE READ"
+            )
+            async with connection.begin():
+                fingerprint = await _fingerprint(connection)
+                result = await connection.stream(
+                    _EDGES.execution_options(yield_per=_BATCH_SIZE)
+                )
+                async for rows in result.partitions():
+                    for source_id, target_id, edge_type in rows:
+                        sources.append(source_id)
+                        targets.append(target_id)
+                        types.append(type_codes.setdefault(edge_type, len(type_codes)))
+
+        # Building is CPU-bound; a thread keeps the event loop responsive.
+        snapshot = await asyncio.to_thread(
+            CompressedAdjacency.from_arrays, sources, targets, types
+        )
+        seconds = time.perf_counter() - start
+        self.cache.replace(snapshot, type_codes, fingerprint, seconds=seconds)
+        await self._logger.ainfo(
+            "adjacency_cache.rebuilt",
+            edges=snapshot.edge_count,
+            memory_bytes=snapshot.nbytes,
+            duration_ms=round(seconds * 1000, 3),
+        )
+
+    async def refresh(self) -> None:
+        """Rebuild the snapshot if it is missing or stale."""
+        if self.cache.ready and not self.cache.needs_compaction:
+            async with self._engine.connect() as connection:
+                if await _fingerprint(connection) == self.cache.fingerprint:
+                    return
+        await self.rebuild()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except Exception as exc:  # keep refreshing after transient failures
+                await self._logger.aexception(
+                    "adjacency_cache.refresh_failed", exc_info=exc
+                )
+            await asyncio.sleep(self._interval)
+
+    def start(self) -> None:
+        """Start refreshing in the background."""
+        self._task = asyncio.create_task(self._run(), name="adjacency-cache")
+
+    async def stop(self) -> None:
+        """Stop the background refresh."""
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+
+_refresher: AdjacencyCacheRefresher | None = None
+
+
+def start_adjacency_cache(
+    engine: AsyncEngine, settings: GraphSettings
+) -> AdjacencyCache:
+    """Create the worker's adjacency cache and start keeping it fresh."""
+    global _refresher
+    cache = AdjacencyCache(max_pending=settings.adjacency_cache_max_pending)
+    _refresher = AdjacencyCacheRefresher(
+        cache, engine, interval=settings.adjacency_cache_refresh_interval
+    )
+    _refresher.start()
+    return cache
+
+
+def get_adjacency_cache() -> AdjacencyCache | None:
+    """Return the worker's adjacency cache, or `None` when it is disabled."""
+    return _refresher.cache if _refresher is not None else None
+
+
+async def stop_adjacency_cache() -> None:
+    """Stop refreshing and drop the worker's adjacency cache."""
+    global _refresher
+    if _refresher is not None:
+        await _refresher.stop()
+        _refresher = None
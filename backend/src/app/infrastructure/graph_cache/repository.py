@@ -0,0 +1,178 @@
+"""Graph repository decorator that answers traversals from memory."""
+
+from typing import TYPE_CHECKING
+
+from app.domain.graph import Neighbour
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+    from app.domain.graph import (
+        BatchEdge,
+        BatchResult,
+        Direction,
+        Edge,
+        GraphRepository,
+        Link,
+        NewEdge,
+        NewNode,
+        Node,
+        SearchHit,
+    )
+    from app.domain.pagination import Position
+
+    from .cache import AdjacencyCache
+
+__all__ = ["CachedGraphRepository"]
+
+
+class CachedGraphRepository:
+    """Wraps a `GraphRepository`, serving traversals from an adjacency cache.
+
+    Writes go to the wrapped repository first and are then applied to the
+    cache. Traversals fall back to the wrapped repository until the cache
+    has loaded its first snapshot.
+    """
+
+    def __init__(self, repository: GraphRepository, cache: AdjacencyCache) -> None:
+        self._repository = repository
+        self._cache = cache
+
+    async def get_node(self, node_id: int) -> Node | None:
+        """Return the node with the given id, if it exists."""
+        return await self._repository.get_node(node_id)
+
+    async def get_nodes(self, node_ids: Sequence[int]) -> list[Node]:
+        """Return the nodes that exist among `node_ids`."""
+        return await self._repository.get_nodes(node_ids)
+
+    async def add_node(self, node: NewNode) -> Node:
+        """Store a new node and return it with its id."""
+        return await self._repository.add_node(node)
+
+    async def delete_node(self, node_id: int) -> Node | None:
+        """Delete a node (and its edges), returning it if it existed."""
+        node = await self._repository.delete_node(node_id)
+        if node is not None:
+            self._cache.node_removed(node_id)
+        return node
+
+    async def list_nodes(
+        self, *, node_type: str | None, after: Position | None, limit: int
+    ) -> list[Node]:
+        """Return up to `limit` nodes ordered by `(type, id)`."""
+        return await self._repository.list_nodes(
+            node_type=node_type, after=after, limit=limit
+        )
+
+    async def add_edge(self, edge: NewEdge) -> Edge:
+        """Store a new edge and return it with its id."""
+        stored = await self._repository.add_edge(edge)
+        self._cache.edge_added(stored)
+        return stored
+
+    async def write_batch(
+        self, nodes: Mapping[str, NewNode], edges: Sequence[BatchEdge]
+    ) -> BatchResult:
+        """Store nodes and edges together, all or nothing."""
+        result = await self._repository.write_batch(nodes, edges)
+        for edge in result.edges:
+            self._cache.edge_added(edge)
+        return result
+
+    async def get_edges(self, edge_ids: Sequence[int]) -> list[Edge]:
+        """Return the edges that exist among `edge_ids`."""
+        return await self._repository.get_edges(edge_ids)
+
+    async def delete_edge(self, edge_id: int) -> Edge | None:
+        """Delete an edge, returning it if it existed."""
+        edge = await self._repository.delete_edge(edge_id)
+        if edge is not None:
+            self._cache.edge_removed(edge)
+        return edge
+
+    async def list_edges(
+        self,
+        node_id: int,
+        *,
+        direction: Direction,
+        edge_types: Sequence[str] | None,
+        after: Position | None,
+        limit: int,
+    ) -> list[Edge]:
+        """Return up to `limit` edges touching a node, ordered by `(type, id)`."""
+        return await self._repository.list_edges(
+            node_id,
+            direction=direction,
+            edge_types=edge_types,
+            after=after,
+            limit=limit,
+        )
+
+    async def neighbourhood(
+        self,
+        node_id: int,
+        *,
+        depth: int,
+        direction: Direction,
+        edge_types: Sequence[str] | None,
+        limit: int,
+    ) -> list[Neighbour]:
+        """Return up to `limit` nodes within `depth` hops of `node_id`."""
+        if not self._cache.ready:
+            self._cache.misses += 1
+            return await self._repository.neighbourhood(
+                node_id,
+                depth=depth,
+                direction=direction,
+                edge_types=edge_types,
+                limit=limit,
+            )
+
+        self._cache.hits += 1
+        reached = self._cache.neighbourhood(
+            node_id,
+            depth=depth,
+            direction=direction,
+            edge_types=edge_types,
+            limit=limit,
+        )
+        nodes = {
+            node.id: node
+            for node in await self._repository.get_nodes([n for n, _ in reached])
+        }
+        return [
+            Neighbour(node=nodes[found], depth=hops)
+            for found, hops in reached
+            if found in nodes
+        ]
+
+    async def links(
+        self,
+        node_ids: Sequence[int],
+        *,
+        direction: Direction,
+        edge_types: Sequence[str] | None,
+    ) -> list[Link]:
+        """Return the distinct links touching any of `node_ids`."""
+        if not self._cache.ready:
+            self._cache.misses += 1
+            return await self._repository.links(
+                node_ids, direction=direction, edge_types=edge_types
+            )
+
+        self._cache.hits += 1
+        return self._cache.links(node_ids, direction=direction, edge_types=edge_types)
+
+    async def search(
+        self,
+        text: str,
+        *,
+        node_type: str | None,
+        limit: int,
+        min_similarity: float,
+    ) -> list[SearchHit]:
+        """Return up to `limit` nodes matching `text`, most relevant first."""
+        return await self._repository.search(
+            text, node_type=node_type, limit=limit, min_similarity=min_similarity
+        )
@@ -0,0 +1,15 @@
+from app.infrastructure.imaging.renderer import (
+    ProcessPoolRenderer,
+    get_image_renderer,
+    start_image_renderer,
+    stop_image_renderer,
+)
+from app.infrastructure.imaging.resize import render_derivative
+
+__all__ = [
+    "ProcessPoolRenderer",
+    "get_image_renderer",
+    "render_derivative",
+    "start_image_renderer",
+    "stop_image_renderer",
+]
@@ -0,0 +1,148 @@
+"""A process pool that renders photo derivatives off the event loop."""
+
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING
+
+import structlog
+
+from .resize import render_derivative
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from app.domain.photos import DerivativeFormat
+    from app.shared.config.photos import PhotoSettings
+
+__all__ = [
+    "ProcessPoolRenderer",
+    "get_image_renderer",
+    "start_image_renderer",
+    "stop_image_renderer",
+]
+
+
+class ProcessPoolRenderer:
+    """Resizes images in `workers` separate processes.
+
+    Decoding and resampling are CPU-bound and hold the GIL, so they run in a
+    process pool where they cannot stall the server's event loop. Requests
+    for a derivative that is already being rendered wait for that render
+    rather than starting another. A render outlives a cancelled request, so
+    its result is still kept for the next one.
+    """
+
+    def __init__(self, *, workers: int) -> None:
+        self._executor = ProcessPoolExecutor(max_workers=workers)
+        self._in_flight: dict[Path, asyncio.Future[None]] = {}
+        self._background: set[asyncio.Task[None]] = set()
+        self._logger = structlog.get_logger("derivatives")
+        self.rendered = 0
+        self.failed = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Renders queued or running."""
+        return len(self._in_flight)
+
+    def _finished(self, target: Path, future: asyncio.Future[None]) -> None:
+        del self._in_flight[target]
+        if future.cancelled():
+            return
+        # Retrieving the exception also stops asyncio reporting it as lost
+        # when every waiter has gone away.
+        if future.exception() is None:
+            self.rendered += 1
+        else:
+            self.failed += 1
+
+    async def render(
+        self,
+        source: Path,
+        target: Path,
+        *,
+        size: int,
+        fmt: DerivativeFormat,
+        quality: int,
+    ) -> None:
+        """Write `source` scaled to fit `size` x `size` to `target` as `fmt`."""
+        future = self._in_flight.get(target)
+        if future is None:
+            future = asyncio.get_running_loop().run_in_executor(
+                self._executor, render_derivative, source, target, size, fmt, quality
+            )
+            self._in_flight[target] = future
+            future.add_done_callback(lambda done: self._finished(target, done))
+        await asyncio.shield(future)
+
+    async def _render_logged(
+        self,
+        source: Path,
+        target: Path,
+        *,
+        size: int,
+        fmt: DerivativeFormat,
+        quality: int,
+    ) -> None:
+        try:
+            await self.render(source, target, size=size, fmt=fmt, quality=quality)
+        except Exception as exc:  # nobody is waiting for this render
+            await self._logger.aexception(
+                "derivatives.render_failed", target=target.name, exc_info=exc
+            )
+
+    def schedule(
+        self,
+        source: Path,
+        target: Path,
+        *,
+        size: int,
+        fmt: DerivativeFormat,
+        quality: int,
+    ) -> None:
+        """Render in the background; failures are logged, not raised."""
+        task = asyncio.create_task(
+            self._render_logged(source, target, size=size, fmt=fmt, quality=quality)
+        )
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    async def stop(self) -> None:
+        """Abandon background renders and shut the worker processes down."""
+        for task in self._background:
+            task.cancel()
+        await asyncio.gather(*self._background, return_exceptions=True)
+        await asyncio.to_thread(self._executor.shutdown, cancel_futures=True)
+
+
+_renderer: ProcessPoolRenderer | None = None
+
+
+def start_image_renderer(settings: PhotoSettings) -> ProcessPoolRenderer:
+    """Create the worker's image renderer.
+
+    Worker processes are only started once there is something to render.
+    """
+    global _renderer
+    _renderer = ProcessPoolRenderer(workers=settings.derivative_workers)
+    return _renderer
+
+
+def get_image_renderer() -> ProcessPoolRenderer:
+    """Return the worker's image renderer.
+
+    Raises:
+        RuntimeError: If `start_image_renderer` has not been called.
+    """
+    if _renderer is None:
+        msg = "Image renderer has not been started; was bootstrap.startup run?"
+        raise RuntimeError(msg)
+    return _renderer
+
+
+async def stop_image_renderer() -> None:
+    """Shut the worker's image renderer down, if one was started."""
+    global _renderer
+    if _renderer is not None:
+        await _renderer.stop()
+        _renderer = None
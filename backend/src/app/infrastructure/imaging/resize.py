@@ -0,0 +1,57 @@
+"""Image resizing, run inside the renderer's worker processes."""
+
+import os
+import tempfile
+from typing import TYPE_CHECKING, Any
+
+from app.application.photos import DerivativeError
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+__all__ = ["render_derivative"]
+
+_SAVE_OPTIONS: dict[str, dict[str, Any]] = {
+    "webp": {"method": 4},
+    "jpeg": {"optimize": True, "progressive": True},
+    "png": {"optimize": True},
+}
+
+
+def render_derivative(
+    source: Path, target: Path, size: int, fmt: str, quality: int
+) -> None:
+    """Write `source` scaled to fit `size` x `size` to `target` in `fmt`.
+
+    The file appears at `target` atomically, so a half-written derivative
+    is never served.
+
+    Raises:
+        DerivativeError: If `source` is not an image Pillow can decode.
+    """
+    # Only worker processes resize, so only they pay for importing Pillow.
+    from PIL import Image, ImageOps
+
+    try:
+        with Image.open(source) as original:
+            # JPEGs can be decoded straight at a fraction of full scale,
+            # which is much faster than decoding everything and shrinking.
+            original.draft("RGB", (size, size))
+            image = ImageOps.exif_transpose(original)
+            image.thumbnail((size, size), Image.Resampling.LANCZOS)
+            if fmt == "jpeg" and image.mode not in {"RGB", "L"}:
+                image = image.convert("RGB")
+    except (OSError, ValueError, Image.DecompressionBombError) as exc:
+        msg = f"cannot decode {source.name}: {exc}"
+        raise DerivativeError(msg) from None
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, staging = tempfile.mkstemp(dir=target.parent, suffix=".part")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            image.save(file, format=fmt, quality=quality, **_SAVE_OPTIONS[fmt])
+        os.chmod(staging, 0o644)
+        os.replace(staging, target)
+    except BaseException:
+        os.unlink(staging)
+        raise
@@ -0,0 +1,13 @@
+from app.infrastructure.memory.graph import InMemoryGraphRepository
+from app.infrastructure.memory.node_types import InMemoryNodeTypeRepository
+from app.infrastructure.memory.queries import (
+    InMemoryFilterRunner,
+    InMemorySavedQueryRepository,
+)
+
+__all__ = [
+    "InMemoryFilterRunner",
+    "InMemoryGraphRepository",
+    "InMemoryNodeTypeRepository",
+    "InMemorySavedQueryRepository",
+]
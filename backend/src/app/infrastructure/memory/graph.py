@@ -0,0 +1,288 @@
+"""In-memory graph repository for tests and experiments."""
+
+import itertools
+import re
+from collections import deque
+from difflib import SequenceMatcher
+from typing import TYPE_CHECKING
+
+from app.domain.graph import (
+    BatchResult,
+    Direction,
+    DuplicateNodeKeyError,
+    Edge,
+    Link,
+    Neighbour,
+    Node,
+    NodeNotFoundError,
+    SearchHit,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping, Sequence
+
+    from app.domain.graph import BatchEdge, NewEdge, NewNode
+    from app.domain.pagination import Position
+
+__all__ = ["InMemoryGraphRepository"]
+
+_WORD = re.compile(r"[^\W_]+")
+
+
+def _words(node: Node) -> list[str]:
+    values = [node.name, *map(str, node.properties.values())]
+    return [word.lower() for value in values for word in _WORD.findall(value)]
+
+
+def _after(sort_key: str, id_: int, after: Position | None) -> bool:
+    return after is None or (sort_key, id_) > (after.sort_key, after.id)
+
+
+class InMemoryGraphRepository:
+    """Graph repository that keeps nodes and edges in dictionaries."""
+
+    def __init__(self) -> None:
+        self.nodes: dict[int, Node] = {}
+        self.edges: dict[int, Edge] = {}
+        self._node_ids = itertools.count(1)
+        self._edge_ids = itertools.count(1)
+
+    async def get_node(self, node_id: int) -> Node | None:
+        """Return the node with the given id, if it exists."""
+        return self.nodes.get(node_id)
+
+    async def get_nodes(self, node_ids: Sequence[int]) -> list[Node]:
+        """Return the nodes that exist among `node_ids`, in no particular order."""
+        return [self.nodes[i] for i in dict.fromkeys(node_ids) if i in self.nodes]
+
+    async def add_node(self, node: NewNode) -> Node:
+        """Store a new node and return it with its id.
+
+        Raises:
+            DuplicateNodeKeyError: If the node's key is already in use.
+        """
+        if node.key is not None and any(n.key == node.key for n in self.nodes.values()):
+            raise DuplicateNodeKeyError(node.key)
+        stored = Node(
+            id=next(self._node_ids),
+            key=node.key,
+            type=node.type,
+            name=node.name,
+            properties=dict(node.properties),
+        )
+        self.nodes[stored.id] = stored
+        return stored
+
+    async def delete_node(self, node_id: int) -> Node | None:
+        """Delete a node (and its edges), returning it if it existed."""
+        node = self.nodes.pop(node_id, None)
+        if node is not None:
+            self.edges = {
+                edge_id: edge
+                for edge_id, edge in self.edges.items()
+                if node_id not in (edge.source_id, edge.target_id)
+            }
+        return node
+
+    async def list_nodes(
+        self, *, node_type: str | None, after: Position | None, limit: int
+    ) -> list[Node]:
+        """Return up to `limit` nodes ordered by `(type, id)`."""
+        matching = sorted(
+            (
+                node
+                for node in self.nodes.values()
+                if node_type in (None, node.type) and _after(node.type, node.id, after)
+            ),
+            key=lambda node: (node.type, node.id),
+        )
+        return matching[:limit]
+
+    async def add_edge(self, edge: NewEdge) -> Edge:
+        """Store a new edge and return it with its id.
+
+        Raises:
+            NodeNotFoundError: If either endpoint does not exist.
+        """
+        if edge.source_id not in self.nodes or edge.target_id not in self.nodes:
+            raise NodeNotFoundError(edge.source_id, edge.target_id)
+        stored = Edge(
+            id=next(self._edge_ids),
+            source_id=edge.source_id,
+            target_id=edge.target_id,
+            type=edge.type,
+            properties=dict(edge.properties),
+        )
+        self.edges[stored.id] = stored
+        return stored
+
+    async def write_batch(
+        self, nodes: Mapping[str, NewNode], edges: Sequence[BatchEdge]
+    ) -> BatchResult:
+        """Store nodes and edges together, all or nothing.
+
+        Raises:
+            NodeNotFoundError: If an edge refers to a stored node that does
+                not exist.
+        """
+        stored_ids = {
+            end
+            for edge in edges
+            for end in (edge.source, edge.target)
+            if isinstance(end, int)
+        }
+        if missing := sorted(stored_ids - self.nodes.keys()):
+            raise NodeNotFoundError(*missing)
+
+        by_key = {node.key: node.id for node in self.nodes.values() if node.key}
+        node_ids: dict[str, int] = {}
+        for ref, node in nodes.items():
+            node_id = by_key.get(node.key) if node.key else None
+            if node_id is None:
+                node_id = next(self._node_ids)
+            self.nodes[node_id] = Node(
+                id=node_id,
+                key=node.key,
+                type=node.type,
+                name=node.name,
+                properties=dict(node.properties),
+            )
+            node_ids[ref] = node_id
+
+        stored: list[Edge] = []
+        for edge in edges:
+            source, target = (
+                end if isinstance(end, int) else node_ids[end]
+                for end in (edge.source, edge.target)
+            )
+            stored.append(
+                Edge(
+                    id=next(self._edge_ids),
+                    source_id=source,
+                    target_id=target,
+                    type=edge.type,
+                    properties=dict(edge.properties),
+                )
+            )
+        self.edges.update((edge.id, edge) for edge in stored)
+        return BatchResult(node_ids=node_ids, edges=stored)
+
+    async def get_edges(self, edge_ids: Sequence[int]) -> list[Edge]:
+        """Return the edges that exist among `edge_ids`, in no particular order."""
+        return [self.edges[i] for i in dict.fromkeys(edge_ids) if i in self.edges]
+
+    async def delete_edge(self, edge_id: int) -> Edge | None:
+        """Delete an edge, returning it if it existed."""
+        return self.edges.pop(edge_id, None)
+
+    async def list_edges(
+        self,
+        node_id: int,
+        *,
+        direction: Direction,
+        edge_types: Sequence[str] | None,
+        after: Position | None,
+        limit: int,
+    ) -> list[Edge]:
+        """Return up to `limit` edges touching a node, ordered by `(type, id)`."""
+        matching = sorted(
+            (
+                edge
+                for edge in self.edges.values()
+                if (
+                    (direction is not Direction.IN and edge.source_id == node_id)
+                    or (direction is not Direction.OUT and edge.target_id == node_id)
+                )
+                and (not edge_types or edge.type in edge_types)
+                and _after(edge.type, edge.id, after)
+            ),
+            key=lambda edge: (edge.type, edge.id),
+        )
+        return matching[:limit]
+
+    def _hops(
+        self, node_id: int, direction: Direction, edge_types: Sequence[str] | None
+    ) -> Iterator[int]:
+        for edge in self.edges.values():
+            if edge_types and edge.type not in edge_types:
+                continue
+            if direction is not Direction.IN and edge.source_id == node_id:
+                yield edge.target_id
+            if direction is not Direction.OUT and edge.target_id == node_id:
+                yield edge.source_id
+
+    async def neighbourhood(
+        self,
+        node_id: int,
+        *,
+        depth: int,
+        direction: Direction,
+        edge_types: Sequence[str] | None,
+        limit: int,
+    ) -> list[Neighbour]:
+        """Return up to `limit` nodes within `depth` hops of `node_id`."""
+        seen = {node_id: 0}
+        queue = deque([node_id])
+        while queue:
+            current = queue.popleft()
+            if seen[current] == depth:
+                continue
+            for neighbour in self._hops(current, direction, edge_types):
+                if neighbour not in seen:
+                    seen[neighbour] = seen[current] + 1
+                    queue.append(neighbour)
+
+        reached = sorted(
+            (hops, found) for found, hops in seen.items() if found != node_id
+        )
+        return [
+            Neighbour(node=self.nodes[found], depth=hops)
+            for hops, found in reached[:limit]
+        ]
+
+    async def links(
+        self,
+        node_ids: Sequence[int],
+        *,
+        direction: Direction,
+        edge_types: Sequence[str] | None,
+    ) -> list[Link]:
+        """Return the distinct links touching any of `node_ids`."""
+        wanted = set(node_ids)
+        found = dict.fromkeys(
+            Link(source_id=edge.source_id, target_id=edge.target_id, type=edge.type)
+            for edge in self.edges.values()
+            if (not edge_types or edge.type in edge_types)
+            and (
+                (direction is not Direction.IN and edge.source_id in wanted)
+                or (direction is not Direction.OUT and edge.target_id in wanted)
+            )
+        )
+        return list(found)
+
+    async def search(
+        self,
+        text: str,
+        *,
+        node_type: str | None,
+        limit: int,
+        min_similarity: float,
+    ) -> list[SearchHit]:
+        """Return up to `limit` nodes matching `text`, most relevant first.
+
+        A rough stand-in for the database search: the score is the share of
+        words matched by prefix, plus how closely the name resembles `text`.
+        """
+        wanted = [word.lower() for word in _WORD.findall(text)]
+        hits: list[SearchHit] = []
+        for node in self.nodes.values():
+            if node_type not in (None, node.type):
+                continue
+            words = _words(node)
+            matched = sum(any(w.startswith(want) for w in words) for want in wanted)
+            similarity = SequenceMatcher(None, text.lower(), node.name.lower()).ratio()
+            if matched or similarity >= min_similarity:
+                score = matched / len(wanted) if wanted else 0.0
+                hits.append(SearchHit(node=node, score=score + similarity))
+        hits.sort(key=lambda hit: (-hit.score, hit.node.id))
+        return hits[:limit]
@@ -0,0 +1,87 @@
+"""In-memory node type repository for tests."""
+
+from dataclasses import replace
+from typing import TYPE_CHECKING
+
+from app.domain.node_types import FieldIndex, IndexState, index_name
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from app.domain.node_types import NodeTypeSchema
+
+__all__ = ["InMemoryNodeTypeRepository"]
+
+_KEPT = (IndexState.PENDING, IndexState.BUILDING, IndexState.READY)
+
+
+class InMemoryNodeTypeRepository:
+    """Node type repository that keeps schemas and index states in dictionaries.
+
+    Nothing builds the indexes; tests move them between states directly.
+    """
+
+    def __init__(self) -> None:
+        self.types: dict[str, NodeTypeSchema] = {}
+        self.field_indexes: dict[tuple[str, str], FieldIndex] = {}
+
+    def _queue(self, schema: NodeTypeSchema) -> None:
+        filterable = {spec.name: spec for spec in schema.fields if spec.filterable}
+        for key, index in list(self.field_indexes.items()):
+            if index.node_type == schema.name and index.field not in filterable:
+                self.field_indexes[key] = replace(
+                    index, state=IndexState.DROPPING, error=None
+                )
+        for name, spec in filterable.items():
+            current = self.field_indexes.get((schema.name, name))
+            if (
+                current is not None
+                and current.kind is spec.kind
+                and current.state in _KEPT
+            ):
+                continue
+            self.field_indexes[schema.name, name] = FieldIndex(
+                node_type=schema.name,
+                field=name,
+                kind=spec.kind,
+                name=index_name(schema.name, name),
+                state=IndexState.PENDING,
+            )
+
+    async def save(self, schema: NodeTypeSchema) -> NodeTypeSchema:
+        """Create or redefine a node type, returning it with its new version.
+
+        Filterable fields without an index get one queued for building;
+        indexes of fields no longer filterable are queued for dropping.
+        """
+        current = self.types.get(schema.name)
+        stored = replace(schema, version=current.version + 1 if current else 1)
+        self.types[schema.name] = stored
+        self._queue(stored)
+        return stored
+
+    async def get(self, name: str) -> NodeTypeSchema | None:
+        """Return the schema of a node type, if it has one."""
+        return self.types.get(name)
+
+    async def get_many(self, names: Sequence[str]) -> list[NodeTypeSchema]:
+        """Return the schemas that exist among `names`, in no particular order."""
+        return [self.types[name] for name in dict.fromkeys(names) if name in self.types]
+
+    async def list_types(self) -> list[NodeTypeSchema]:
+        """Return every node type schema, ordered by name."""
+        return [self.types[name] for name in sorted(self.types)]
+
+    async def delete(self, name: str) -> NodeTypeSchema | None:
+        """Delete a schema, queueing its indexes for dropping; return it if found."""
+        schema = self.types.pop(name, None)
+        if schema is not None:
+            self._queue(replace(schema, fields=()))
+        return schema
+
+    async def indexes(self, name: str) -> list[FieldIndex]:
+        """Return the indexes kept for a node type's fields, ordered by field."""
+        return sorted(
+            (index for index in self.field_indexes.values() if index.node_type == name),
+            key=lambda index: index.field,
+        )
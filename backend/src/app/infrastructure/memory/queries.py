@@ -0,0 +1,151 @@
+"""In-memory saved query repository and filter runner for tests."""
+
+import itertools
+import operator
+from typing import TYPE_CHECKING, Any
+
+from app.domain.graph import Direction
+from app.domain.queries import (
+    AllOf,
+    AnyOf,
+    Not,
+    PathExists,
+    PropertyIs,
+    PropertyOp,
+    SavedQuery,
+    TypeIs,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from app.domain.graph import Node
+    from app.domain.pagination import Position
+    from app.domain.queries import Filter, NewSavedQuery
+
+    from .graph import InMemoryGraphRepository
+
+__all__ = ["InMemoryFilterRunner", "InMemorySavedQueryRepository"]
+
+_COMPARISONS: dict[PropertyOp, Callable[[Any, Any], bool]] = {
+    PropertyOp.EQ: operator.eq,
+    PropertyOp.NE: operator.ne,
+    PropertyOp.LT: operator.lt,
+    PropertyOp.LTE: operator.le,
+    PropertyOp.GT: operator.gt,
+    PropertyOp.GTE: operator.ge,
+}
+
+
+def _json_type(value: object) -> str:
+    if isinstance(value, bool):
+        return "boolean"
+    if isinstance(value, int | float):
+        return "number"
+    return type(value).__name__
+
+
+class InMemorySavedQueryRepository:
+    """Saved query repository that keeps queries in a dictionary."""
+
+    def __init__(self) -> None:
+        self.queries: dict[int, SavedQuery] = {}
+        self._ids = itertools.count(1)
+
+    async def add(self, query: NewSavedQuery) -> SavedQuery:
+        """Store a new saved query and return it with its id."""
+        stored = SavedQuery(id=next(self._ids), name=query.name, filter=query.filter)
+        self.queries[stored.id] = stored
+        return stored
+
+    async def get(self, query_id: int) -> SavedQuery | None:
+        """Return the saved query with the given id, if it exists."""
+        return self.queries.get(query_id)
+
+    async def list_queries(
+        self, *, after: Position | None, limit: int
+    ) -> list[SavedQuery]:
+        """Return up to `limit` saved queries ordered by `(name, id)`."""
+        ordered = sorted(self.queries.values(), key=lambda q: (q.name, q.id))
+        if after is not None:
+            position = (after.sort_key, after.id)
+            ordered = [q for q in ordered if (q.name, q.id) > position]
+        return ordered[:limit]
+
+    async def delete(self, query_id: int) -> SavedQuery | None:
+        """Delete a saved query, returning it if it existed."""
+        return self.queries.pop(query_id, None)
+
+
+class InMemoryFilterRunner:
+    """Evaluates filters node by node over an in-memory graph."""
+
+    def __init__(self, graph: InMemoryGraphRepository) -> None:
+        self._graph = graph
+
+    def _property(self, filter: PropertyIs, node: Node) -> bool:
+        if filter.name not in node.properties:
+            return False
+        value = node.properties[filter.name]
+        if filter.op is PropertyOp.EXISTS:
+            return True
+        if filter.op is PropertyOp.IN:
+            return value in filter.value
+        if filter.op is PropertyOp.CONTAINS:
+            return isinstance(value, list) and filter.value in value
+        if filter.op in (PropertyOp.EQ, PropertyOp.NE):
+            return _COMPARISONS[filter.op](value, filter.value)
+        return _json_type(value) == _json_type(filter.value) and _COMPARISONS[
+            filter.op
+        ](value, filter.value)
+
+    def _reached(self, filter: PathExists, node: Node) -> set[int]:
+        current = {node.id}
+        for step in filter.steps:
+            following: set[int] = set()
+            for edge in self._graph.edges.values():
+                if step.edge_type not in (None, edge.type):
+                    continue
+                if step.direction is not Direction.IN and edge.source_id in current:
+                    following.add(edge.target_id)
+                if step.direction is not Direction.OUT and edge.target_id in current:
+                    following.add(edge.source_id)
+            current = following
+        return current
+
+    def matches(self, filter: Filter, node: Node) -> bool:
+        """Whether `node` matches `filter`."""
+        match filter:
+            case TypeIs(type=node_type):
+                return node.type == node_type
+            case PropertyIs():
+                return self._property(filter, node)
+            case PathExists(node=end):
+                reached = self._reached(filter, node)
+                if end is None:
+                    return bool(reached)
+                return any(
+                    self.matches(end, self._graph.nodes[found]) for found in reached
+                )
+            case AllOf(filters=filters):
+                return all(self.matches(inner, node) for inner in filters)
+            case AnyOf(filters=filters):
+                return any(self.matches(inner, node) for inner in filters)
+            case Not(filter=inner):
+                return not self.matches(inner, node)
+
+    async def run(
+        self, filter: Filter, *, after: Position | None, limit: int
+    ) -> list[Node]:
+        """Return up to `limit` matching nodes ordered by `(type, id)`."""
+        position = (after.sort_key, after.id) if after is not None else None
+        matching = sorted(
+            (
+                node
+                for node in self._graph.nodes.values()
+                if (position is None or (node.type, node.id) > position)
+                and self.matches(filter, node)
+            ),
+            key=lambda node: (node.type, node.id),
+        )
+        return matching[:limit]
@@ -0,0 +1,20 @@
+from app.infrastructure.metrics.registry import (
+    Metrics,
+    Scalar,
+    get_metrics,
+    start_metrics,
+    stop_metrics,
+)
+from app.infrastructure.metrics.sources import collect_worker_metrics
+from app.infrastructure.metrics.store import MetricsFile, read_metrics_files
+
+__all__ = [
+    "Metrics",
+    "MetricsFile",
+    "Scalar",
+    "collect_worker_metrics",
+    "get_metrics",
+    "read_metrics_files",
+    "start_metrics",
+    "stop_metrics",
+]
@@ -0,0 +1,279 @@
+"""Prometheus metrics, counted per worker and reported for all of them."""
+
+import asyncio
+import hashlib
+import os
+from bisect import bisect_left
+from contextlib import suppress
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Literal
+
+import structlog
+
+from .store import MetricsFile, read_metrics_files
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Sequence
+    from pathlib import Path
+
+    from app.shared.config.metrics import MetricsSettings
+
+__all__ = ["Metrics", "Scalar", "get_metrics", "start_metrics", "stop_metrics"]
+
+_STATUS_CLASSES = ("1xx", "2xx", "3xx", "4xx", "5xx")
+_FIRST_BUCKET = len(_STATUS_CLASSES)
+_UNMATCHED = "<unmatched>"
+_HITS, _MISSES = "_hits_total", "_misses_total"
+_REQUESTS = "http_requests_total"
+_DURATION = "http_request_duration_seconds"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(*labels: tuple[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels) + "}"
+
+
+def _number(value: float) -> str:
+    return str(int(value)) if value.is_integer() else repr(value)
+
+
+@dataclass(frozen=True, slots=True)
+class Scalar:
+    """A counter or gauge that a worker publishes the current value of."""
+
+    name: str
+    kind: Literal["counter", "gauge"]
+    help: str
+    labels: tuple[tuple[str, str], ...] = field(default=())
+
+    @property
+    def key(self) -> str:
+        """The series as written in the exposition format."""
+        return self.name + _labels(*self.labels)
+
+
+_IN_FLIGHT = Scalar("http_requests_in_flight", "gauge", "HTTP requests being handled.")
+
+
+class Metrics:
+    """Request metrics and published gauges for one worker.
+
+    Every value has a fixed slot in this worker's `MetricsFile`, laid out
+    when the worker starts from its `routes`, latency `buckets` and
+    `scalars`, so recording a request only adds to preallocated floats.
+    Workers with the same layout write files in one group, which
+    `render` sums. Gauges of workers that are no longer running are left
+    out; their counters still count.
+
+    `collect` returns the current value of each scalar, and is called every
+    `interval` seconds (and before rendering) once `start` has been called.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        *,
+        routes: Iterable[tuple[str, Iterable[str]]],
+        buckets: Sequence[float],
+        collect: Callable[[], Iterable[tuple[Scalar, float]]],
+        interval: float,
+        pid: int | None = None,
+    ) -> None:
+        self._collect = collect
+        self._interval = interval
+        self._buckets = sorted(buckets)
+        declared = dict.fromkeys(scalar for scalar, _ in collect())
+        self._scalars = [_IN_FLIGHT, *sorted(declared, key=lambda s: s.name)]
+        self._slots = {scalar.key: i for i, scalar in enumerate(self._scalars)}
+
+        # Per route and method: a count per status class, a count per latency
+        # bucket (not cumulative) plus one for +Inf, and the sum of seconds.
+        self._stride = len(_STATUS_CLASSES) + len(self._buckets) + 2
+        self._series: list[tuple[str, str]] = []
+        self._routes: dict[str, dict[str, int]] = {}
+        for path, methods in [*routes, (_UNMATCHED, [""])]:
+            for method in sorted(methods):
+                base = len(self._scalars) + len(self._series) * self._stride
+                self._routes.setdefault(path, {})[method] = base
+                self._series.append((path, method))
+        self._unmatched = self._routes[_UNMATCHED][""]
+        self._size = len(self._scalars) + len(self._series) * self._stride
+        self._counters = [
+            *(i for i, s in enumerate(self._scalars) if s.kind == "counter"),
+            *range(len(self._scalars), self._size),
+        ]
+
+        layout = repr((self._scalars, self._series, self._buckets)).encode()
+        self._directory = directory
+        self._group = f"{os.getppid()}-{hashlib.sha256(layout).hexdigest()[:12]}"
+        self._file = MetricsFile(
+            directory, group=self._group, pid=pid or os.getpid(), size=self._size
+        )
+        self._values = self._file.values
+        self._task: asyncio.Task[None] | None = None
+        self._logger = structlog.get_logger("metrics")
+
+    def request_started(self) -> None:
+        """Count a request as in flight."""
+        self._values[0] += 1
+
+    def request_finished(
+        self, route: str | None, method: str, status: int, seconds: float
+    ) -> None:
+        """Record a finished request against its route template."""
+        values = self._values
+        values[0] -= 1
+        methods = self._routes.get(route) if route is not None else None
+        base = methods.get(method, self._unmatched) if methods else self._unmatched
+        values[base + max(1, min(status // 100, 5)) - 1] += 1
+        values[base + _FIRST_BUCKET + bisect_left(self._buckets, seconds)] += 1
+        values[base + self._stride - 1] += seconds
+
+    def publish(self) -> None:
+        """Store the current value of every scalar for other workers to read."""
+        for scalar, value in self._collect():
+            if (slot := self._slots.get(scalar.key)) is not None:
+                self._values[slot] = value
+
+    def _totals(self) -> list[float]:
+        totals = [0.0] * self._size
+        for values, alive in read_metrics_files(
+            self._directory, group=self._group, size=self._size
+        ):
+            for slot in range(self._size) if alive else self._counters:
+                totals[slot] += values[slot]
+        return totals
+
+    def _render_scalars(self, totals: list[float]) -> list[str]:
+        lines: list[str] = []
+        for slot, scalar in enumerate(self._scalars):
+            if slot == 0 or scalar.name != self._scalars[slot - 1].name:
+                lines.append(f"# HELP {scalar.name} {scalar.help}")
+                lines.append(f"# TYPE {scalar.name} {scalar.kind}")
+            lines.append(f"{scalar.key} {_number(totals[slot])}")
+
+        # Each pair of hit and miss counters also gets its ratio.
+        for key, slot in self._slots.items():
+            prefix = key.removesuffix(_HITS)
+            misses_slot = self._slots.get(prefix + _MISSES)
+            if prefix == key or misses_slot is None:
+                continue
+            hits, misses = totals[slot], totals[misses_slot]
+            ratio = hits / (hits + misses) if hits + misses else 0.0
+            lines.append(f"# HELP {prefix}_hit_ratio Share of lookups that hit.")
+            lines.append(f"# TYPE {prefix}_hit_ratio gauge")
+            lines.append(f"{prefix}_hit_ratio {_number(ratio)}")
+        return lines
+
+    def _render_route(
+        self, totals: list[float], index: int
+    ) -> tuple[list[str], list[str]]:
+        path, method = self._series[index]
+        base = len(self._scalars) + index * self._stride
+        route = ("route", path), ("method", method)
+        counts = [
+            f"{_REQUESTS}{_labels(*route, ('status', status))} {_number(count)}"
+            for offset, status in enumerate(_STATUS_CLASSES)
+            if (count := totals[base + offset])
+        ]
+        if not counts:
+            return [], []
+
+        buckets: list[str] = []
+        cumulative = 0.0
+        bounds = [*map(_number, self._buckets), "+Inf"]
+        for offset, bound in enumerate(bounds, start=_FIRST_BUCKET):
+            cumulative += totals[base + offset]
+            series = _labels(*route, ("le", bound))
+            buckets.append(f"{_DURATION}_bucket{series} {_number(cumulative)}")
+        series = _labels(*route)
+        seconds = totals[base + self._stride - 1]
+        buckets.append(f"{_DURATION}_sum{series} {_number(seconds)}")
+        buckets.append(f"{_DURATION}_count{series} {_number(cumulative)}")
+        return counts, buckets
+
+    def _render_requests(self, totals: list[float]) -> list[str]:
+        counts = [
+            f"# HELP {_REQUESTS} HTTP requests by route, method and status.",
+            f"# TYPE {_REQUESTS} counter",
+        ]
+        buckets = [
+            f"# HELP {_DURATION} Time to send each response in full.",
+            f"# TYPE {_DURATION} histogram",
+        ]
+        for index in range(len(self._series)):
+            route_counts, route_buckets = self._render_route(totals, index)
+            counts += route_counts
+            buckets += route_buckets
+        return counts + buckets
+
+    def render(self) -> str:
+        """Return every worker's metrics in the Prometheus text format."""
+        self.publish()
+        totals = self._totals()
+        lines = self._render_scalars(totals) + self._render_requests(totals)
+        return "\n".join(lines) + "\n"
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                self.publish()
+            except Exception as exc:  # keep publishing after a failed collection
+                await self._logger.aexception("metrics.publish_failed", exc_info=exc)
+            await asyncio.sleep(self._interval)
+
+    def start(self) -> None:
+        """Start publishing scalars in the background."""
+        self._task = asyncio.create_task(self._run(), name="metrics")
+
+    async def stop(self) -> None:
+        """Stop publishing, and zero this worker's gauges."""
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        for slot, scalar in enumerate(self._scalars):
+            if scalar.kind == "gauge":
+                self._values[slot] = 0.0
+        self._file.close()
+
+
+_metrics: Metrics | None = None
+
+
+def start_metrics(
+    settings: MetricsSettings,
+    *,
+    routes: Iterable[tuple[str, Iterable[str]]],
+    collect: Callable[[], Iterable[tuple[Scalar, float]]],
+) -> Metrics:
+    """Create the worker's metrics and start publishing its gauges."""
+    global _metrics
+    _metrics = Metrics(
+        settings.directory,
+        routes=routes,
+        buckets=settings.latency_buckets,
+        collect=collect,
+        interval=settings.publish_interval,
+    )
+    _metrics.start()
+    return _metrics
+
+
+def get_metrics() -> Metrics | None:
+    """Return the worker's metrics, or `None` when they are disabled."""
+    return _metrics
+
+
+async def stop_metrics() -> None:
+    """Stop publishing and release the worker's metrics file."""
+    global _metrics
+    if _metrics is not None:
+        await _metrics.stop()
+        _metrics = None
@@ -0,0 +1,137 @@
+"""Current figures from this worker's pools, caches and queues."""
+
+from contextlib import suppress
+from typing import TYPE_CHECKING
+
+from sqlalchemy.pool import QueuePool
+
+from app.infrastructure.database import get_database, get_query_plans
+from app.infrastructure.enrichment import get_enrichment, get_response_cache
+from app.infrastructure.graph_cache import get_adjacency_cache
+from app.infrastructure.imaging import get_image_renderer
+
+from .registry import Scalar
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+__all__ = ["collect_worker_metrics"]
+
+type Sample = tuple[Scalar, float]
+
+_POOL_SIZE = Scalar("db_pool_size", "gauge", "Connections the pool keeps open.")
+_POOL_CHECKED_OUT = Scalar(
+    "db_pool_checked_out", "gauge", "Connections in use by requests or jobs."
+)
+_POOL_OVERFLOW = Scalar(
+    "db_pool_overflow", "gauge", "Connections open beyond the pool size."
+)
+_READ_POOL_SIZE = Scalar(
+    "db_read_pool_size", "gauge", "Connections the replica pool keeps open."
+)
+_READ_POOL_CHECKED_OUT = Scalar(
+    "db_read_pool_checked_out", "gauge", "Replica connections in use by requests."
+)
+_READ_POOL_OVERFLOW = Scalar(
+    "db_read_pool_overflow", "gauge", "Replica connections open beyond the pool size."
+)
+_ADJACENCY_HITS = Scalar(
+    "adjacency_cache_hits_total", "counter", "Traversals answered from memory."
+)
+_ADJACENCY_MISSES = Scalar(
+    "adjacency_cache_misses_total", "counter", "Traversals sent to the database."
+)
+_QUERY_PLAN_HITS = Scalar(
+    "query_plan_cache_hits_total", "counter", "Saved queries run from a cached plan."
+)
+_QUERY_PLAN_MISSES = Scalar(
+    "query_plan_cache_misses_total", "counter", "Saved queries compiled afresh."
+)
+_PROVIDER_HITS = Scalar(
+    "provider_cache_hits_total", "counter", "Provider lookups answered by the cache."
+)
+_PROVIDER_MISSES = Scalar(
+    "provider_cache_misses_total", "counter", "Provider lookups sent upstream."
+)
+_RENDERS_IN_FLIGHT = Scalar(
+    "image_renders_in_flight", "gauge", "Photo derivatives being rendered."
+)
+
+
+def _queue_depth(provider: str) -> Scalar:
+    return Scalar(
+        "enrichment_queue_depth",
+        "gauge",
+        "Enrichment jobs claimed and waiting for a worker.",
+        (("provider", provider),),
+    )
+
+
+def _jobs(provider: str, result: str) -> Scalar:
+    return Scalar(
+        "enrichment_jobs_total",
+        "counter",
+        "Enrichment jobs processed, by outcome.",
+        (("provider", provider), ("result", result)),
+    )
+
+
+def _renders(result: str) -> Scalar:
+    return Scalar(
+        "image_renders_total",
+        "counter",
+        "Photo derivatives rendered, by outcome.",
+        (("result", result),),
+    )
+
+
+def _database() -> Iterator[Sample]:
+    with suppress(RuntimeError):
+        database = get_database()
+        pool = database.engine.pool
+        if isinstance(pool, QueuePool):
+            yield _POOL_SIZE, pool.size()
+            yield _POOL_CHECKED_OUT, pool.checkedout()
+            yield _POOL_OVERFLOW, max(pool.overflow(), 0)
+        pool = database.read_engine.pool
+        if database.has_replica and isinstance(pool, QueuePool):
+            yield _READ_POOL_SIZE, pool.size()
+            yield _READ_POOL_CHECKED_OUT, pool.checkedout()
+            yield _READ_POOL_OVERFLOW, max(pool.overflow(), 0)
+
+
+def _caches() -> Iterator[Sample]:
+    if (adjacency := get_adjacency_cache()) is not None:
+        yield _ADJACENCY_HITS, adjacency.hits
+        yield _ADJACENCY_MISSES, adjacency.misses
+    plans = get_query_plans()
+    yield _QUERY_PLAN_HITS, plans.hits
+    yield _QUERY_PLAN_MISSES, plans.misses
+    if (responses := get_response_cache()) is not None:
+        yield _PROVIDER_HITS, responses.stats.hits
+        yield _PROVIDER_MISSES, responses.stats.misses
+
+
+def _enrichment() -> Iterator[Sample]:
+    if (workers := get_enrichment()) is None:
+        return
+    depths = workers.queue_depths()
+    for provider, stats in workers.stats().items():
+        yield _queue_depth(provider), depths.get(provider, 0)
+        yield _jobs(provider, "enriched"), stats.enriched
+        yield _jobs(provider, "unmatched"), stats.unmatched
+        yield _jobs(provider, "retried"), stats.retried
+        yield _jobs(provider, "failed"), stats.failed
+
+
+def _renderer() -> Iterator[Sample]:
+    with suppress(RuntimeError):
+        renderer = get_image_renderer()
+        yield _RENDERS_IN_FLIGHT, renderer.in_flight
+        yield _renders("rendered"), renderer.rendered
+        yield _renders("failed"), renderer.failed
+
+
+def collect_worker_metrics() -> list[Sample]:
+    """Return this worker's current figures, for those parts that are running."""
+    return [*_database(), *_caches(), *_enrichment(), *_renderer()]
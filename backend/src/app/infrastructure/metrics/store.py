@@ -0,0 +1,64 @@
+"""Per-worker metric values in files that every worker can read."""
+
+import mmap
+import os
+from array import array
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+__all__ = ["MetricsFile", "read_metrics_files"]
+
+_SUFFIX = ".metrics"
+
+
+class MetricsFile:
+    """A fixed number of float values, memory-mapped from this worker's file.
+
+    Updating a value is a store into shared memory: nothing is written or
+    flushed per update, yet other workers reading the file see it.
+    """
+
+    def __init__(self, directory: Path, *, group: str, pid: int, size: int) -> None:
+        directory.mkdir(parents=True, exist_ok=True)
+        self.path = directory / f"{group}-{pid}{_SUFFIX}"
+        with self.path.open("w+b") as file:
+            file.truncate(size * 8)
+            self._map = mmap.mmap(file.fileno(), size * 8)
+        self.values = memoryview(self._map).cast("d")
+
+    def close(self) -> None:
+        """Unmap the file, leaving it for other workers to read."""
+        self.values.release()
+        self._map.close()
+
+
+def _alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def read_metrics_files(
+    directory: Path, *, group: str, size: int
+) -> Iterator[tuple[array[float], bool]]:
+    """Yield the values of every worker in `group`, and whether it is running.
+
+    Files of a different size (from a different layout) are skipped.
+    """
+    for path in directory.glob(f"{group}-*{_SUFFIX}"):
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            continue
+        if len(data) != size * 8:
+            continue
+        values = array("d")
+        values.frombytes(data)
+        yield values, _alive(int(path.stem.rpartition("-")[2]))
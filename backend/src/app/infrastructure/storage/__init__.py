@@ -0,0 +1,4 @@
+from app.infrastructure.storage.factory import create_photo_storage
+from app.infrastructure.storage.local import LocalPhotoStorage
+
+__all__ = ["LocalPhotoStorage", "create_photo_storage"]
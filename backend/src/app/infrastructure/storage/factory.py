@@ -0,0 +1,20 @@
+"""Select the configured photo storage backend."""
+
+from typing import TYPE_CHECKING
+
+from app.shared.config.photos import PhotoBackend
+
+from .local import LocalPhotoStorage
+
+if TYPE_CHECKING:
+    from app.application.photos import PhotoStorage
+    from app.shared.config.photos import PhotoSettings
+
+__all__ = ["create_photo_storage"]
+
+
+def create_photo_storage(settings: PhotoSettings) -> PhotoStorage:
+    """Build the photo storage backend chosen in `settings`."""
+    match settings.backend:
+        case PhotoBackend.LOCAL:
+            return LocalPhotoStorage(settings.root, buffer_bytes=settings.buffer_bytes)
@@ -0,0 +1,121 @@
+"""Photo storage on the local filesystem."""
+
+import asyncio
+import os
+import tempfile
+from typing import TYPE_CHECKING, BinaryIO
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from app.domain.photos import DerivativeFormat
+
+__all__ = ["LocalPhotoStorage"]
+
+
+class _StagedFile:
+    """An upload written to a temporary file beside the final location.
+
+    Chunks are buffered up to `buffer_bytes` and written from a thread, so
+    the event loop never blocks on the disk.
+    """
+
+    def __init__(self, storage: LocalPhotoStorage, *, buffer_bytes: int) -> None:
+        self._storage = storage
+        self._buffer_bytes = buffer_bytes
+        self._buffer: list[bytes] = []
+        self._buffered = 0
+        self._file: BinaryIO | None = None
+        self._path: str | None = None
+
+    def _open(self) -> BinaryIO:
+        if self._file is None:
+            staging = self._storage.root / "staging"
+            staging.mkdir(parents=True, exist_ok=True)
+            fd, self._path = tempfile.mkstemp(dir=staging)
+            self._file = os.fdopen(fd, "wb")
+        return self._file
+
+    def _write(self, chunks: list[bytes]) -> None:
+        self._open().writelines(chunks)
+
+    async def _flush(self) -> None:
+        if self._buffer:
+            chunks, self._buffer, self._buffered = self._buffer, [], 0
+            await asyncio.to_thread(self._write, chunks)
+
+    async def write(self, chunk: bytes) -> None:
+        """Append a chunk of the upload."""
+        self._buffer.append(chunk)
+        self._buffered += len(chunk)
+        if self._buffered >= self._buffer_bytes:
+            await self._flush()
+
+    def _commit(self, target: Path, chunks: list[bytes]) -> bool:
+        if self._file is None and target.exists():
+            # Still wholly in memory, so a duplicate is never written at all.
+            return False
+        self._write(chunks)
+        file = self._open()
+        file.flush()
+        os.fsync(file.fileno())
+        file.close()
+        assert self._path is not None
+        # mkstemp creates owner-only files; photos are ordinary content.
+        os.chmod(self._path, 0o644)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            # Linking fails rather than overwrites, so concurrent uploads of
+            # one photo cannot clobber each other.
+            os.link(self._path, target)
+        except FileExistsError:
+            return False
+        finally:
+            os.unlink(self._path)
+        return True
+
+    async def commit(self, digest: str) -> bool:
+        """Store the upload under `digest`, unless it is already stored."""
+        chunks, self._buffer, self._buffered = self._buffer, [], 0
+        return await asyncio.to_thread(self._commit, self._storage.path(digest), chunks)
+
+    def _discard(self) -> None:
+        if self._file is not None:
+            self._file.close()
+        if self._path is not None:
+            os.unlink(self._path)
+
+    async def discard(self) -> None:
+        """Throw the upload away."""
+        self._buffer.clear()
+        await asyncio.to_thread(self._discard)
+
+
+class LocalPhotoStorage:
+    """Stores each photo once, at `<root>/<ab>/<cd>/<digest>`.
+
+    Uploads are staged in `<root>/staging` (the same filesystem, so they can
+    be moved into place atomically) and hard-linked to their final path.
+    One that fits in `buffer_bytes` is only written if its digest is new;
+    a larger duplicate is staged, as its digest is only known at the end,
+    and then unlinked.
+    Derivatives are kept under `<root>/derivatives`, named by digest, size
+    and format.
+    """
+
+    def __init__(self, root: Path, *, buffer_bytes: int) -> None:
+        self.root = root
+        self._buffer_bytes = buffer_bytes
+
+    def path(self, digest: str) -> Path:
+        """Where the photo with this digest is (or would be) stored."""
+        return self.root / digest[:2] / digest[2:4] / digest
+
+    def derivative_path(self, digest: str, *, size: int, fmt: DerivativeFormat) -> Path:
+        """Where a derivative of the photo is (or would be) kept."""
+        name = f"{digest}-{size}.{fmt}"
+        return self.root / "derivatives" / digest[:2] / digest[2:4] / name
+
+    def stage(self) -> _StagedFile:
+        """Start writing a new upload."""
+        return _StagedFile(self, buffer_bytes=self._buffer_bytes)
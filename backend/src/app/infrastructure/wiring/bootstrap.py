@@ -9,7 +9,18 @@ from typing import TYPE_CHECKING
 
 import structlog
 
-from app.shared.logging_ import configure_logging
+from app.application.node_types import init_validators
+from app.infrastructure.database import (
+    close_database,
+    init_database,
+    init_query_plans,
+    start_field_indexes,
+    stop_field_indexes,
+)
+from app.infrastructure.enrichment import start_enrichment, stop_enrichment
+from app.infrastructure.graph_cache import start_adjacency_cache, stop_adjacency_cache
+from app.infrastructure.imaging import start_image_renderer, stop_image_renderer
+from app.shared.logging_ import close_logging, configure_logging
 
 if TYPE_CHECKING:
     from app.shared.config import Settings
@@ -23,12 +34,29 @@ async def startup(settings: Settings) -> None:
     Import logging_ helpers lazily to avoid import cycles and keep bootstrap
     lightweight for tests that don't require logging_ configuration.
     """
-    configure_logging(settings.logging.level, settings.logging.mode)
+    configure_logging(
+        settings.logging.level,
+        settings.logging.mode,
+        sink=settings.logging.sink,
+        queue_size=settings.logging.queue_size,
+        batch_size=settings.logging.batch_size,
+        overflow=settings.logging.overflow,
+    )
     logger = structlog.get_logger("bootstrap")
     logger.info("application.startup")
     logger.debug(
         "application.startup.settings", settings=settings.model_dump(mode="json")
     )
+    database = init_database(settings.database)
+    init_query_plans(settings.queries)
+    init_validators(settings.node_types)
+    if settings.node_types.index_builds_enabled:
+        start_field_indexes(database.engine, settings.node_types)
+    if settings.graph.adjacency_cache_enabled:
+        start_adjacency_cache(database.engine, settings.graph)
+    if settings.enrichment.enabled:
+        start_enrichment(database.engine, settings.enrichment, settings.provider_cache)
+    start_image_renderer(settings.photos)
 
 
 async def shutdown(settings: Settings) -> None:
@@ -36,5 +64,11 @@ async def shutdown(settings: Settings) -> None:
 
     Perform tidy-up tasks and emit a shutdown message.
     """
+    await stop_image_renderer()
+    await stop_enrichment()
+    await stop_adjacency_cache()
+    await stop_field_indexes()
+    await close_database()
     logger = structlog.get_logger("bootstrap")
     logger.info("application.shutdown")
+    close_logging()
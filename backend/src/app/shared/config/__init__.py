@@ -5,7 +5,18 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from app.shared.config.api import APISettings
 from app.shared.config.app_info import ApplicationInfo
+from app.shared.config.database import DatabaseSettings
+from app.shared.config.enrichment import EnrichmentSettings
+from app.shared.config.exports import ExportSettings
+from app.shared.config.graph import GraphSettings
+from app.shared.config.imports import ImportSettings
 from app.shared.config.logging_ import LoggingSettings
+from app.shared.config.metrics import MetricsSettings
+from app.shared.config.node_types import NodeTypeSettings
+from app.shared.config.photos import PhotoSettings
+from app.shared.config.profiling import ProfilingSettings
+from app.shared.config.provider_cache import ProviderCacheSettings
+from app.shared.config.queries import QuerySettings
 
 __all__ = ["Settings", "get_settings"]
 
@@ -26,6 +37,17 @@ class Settings(BaseSettings):
     app: ApplicationInfo = Field(default_factory=ApplicationInfo.from_package)
     logging: LoggingSettings = Field(default_factory=LoggingSettings)
     api: APISettings = Field(default_factory=APISettings)
+    database: DatabaseSettings = Field(default_factory=DatabaseSettings)
+    graph: GraphSettings = Field(default_factory=GraphSettings)
+    imports: ImportSettings = Field(default_factory=ImportSettings)
+    exports: ExportSettings = Field(default_factory=ExportSettings)
+    enrichment: EnrichmentSettings = Field(default_factory=EnrichmentSettings)
+    provider_cache: ProviderCacheSettings = Field(default_factory=ProviderCacheSettings)
+    photos: PhotoSettings = Field(default_factory=PhotoSettings)
+    metrics: MetricsSettings = Field(default_factory=MetricsSettings)
+    profiling: ProfilingSettings = Field(default_factory=ProfilingSettings)
+    queries: QuerySettings = Field(default_factory=QuerySettings)
+    node_types: NodeTypeSettings = Field(default_factory=NodeTypeSettings)
 
 
 @lru_cache
@@ -1,15 +1,61 @@
 """API-specific configuration settings."""
 
+from enum import StrEnum, auto
 from typing import Literal
 
-from pydantic import Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from app.shared.types import CSV, ValidatedNetworkHostStr  # noqa: TC001
 
 
+class AccessLogPolicy(StrEnum):
+    """Which requests under a path prefix get access log lines."""
+
+    ALWAYS = auto()
+    NEVER = auto()
+    SAMPLE = auto()
+    SLOW = auto()
+    ERRORS = auto()
+
+
+class AccessLogRule(BaseModel):
+    """An access log policy for paths starting with `prefix`.
+
+    Written `prefix=policy`, with the percentage to keep for `sample` and
+    the threshold in milliseconds for `slow`: `/api/health=never`,
+    `/api/v1/photos=slow:250`, `/api=sample:10`.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    prefix: str = Field(pattern="^/")
+    policy: AccessLogPolicy
+    sample_percent: float = Field(100, gt=0, le=100)
+    slow_ms: float = Field(0, ge=0)
+
+    @model_validator(mode="before")
+    @classmethod
+    def _parse(cls, value: object) -> object:
+        if not isinstance(value, str):
+            return value
+        prefix, _, rule = value.partition("=")
+        policy, _, argument = rule.partition(":")
+        data = {"prefix": prefix.strip(), "policy": policy.strip().lower()}
+        match data["policy"]:
+            case AccessLogPolicy.SAMPLE:
+                data["sample_percent"] = argument
+            case AccessLogPolicy.SLOW:
+                data["slow_ms"] = argument
+        return data
+
+
 class APISettings(BaseSettings):
-    """Settings for the API entrypoint."""
+    """Settings for the API entrypoint.
+
+    Requests are access logged according to the `access_log_rules` entry
+    with the longest matching prefix, or always if none matches.
+    """
 
     model_config = SettingsConfigDict(
         frozen=True,
@@ -17,3 +63,9 @@ class APISettings(BaseSettings):
 
     trusted_hosts: Literal["*"] | CSV[ValidatedNetworkHostStr] = Field("*")
     access_log_enabled: bool = True
+    access_log_rules: CSV[AccessLogRule] = Field(
+        default_factory=lambda: [AccessLogRule.model_validate("/api/health=never")]
+    )
+
+    default_page_size: int = Field(50, ge=1)
+    max_page_size: int = Field(500, ge=1)
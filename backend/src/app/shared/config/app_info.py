@@ -1,15 +1,13 @@
 from __future__ import annotations
 
-from importlib.metadata import PackageNotFoundError, metadata
-from typing import Annotated
+from pathlib import Path
+from typing import TYPE_CHECKING, Annotated
 
 from pydantic import BaseModel, ConfigDict, Field
-from pydantic_settings import (
-    BaseSettings,
-    PydanticBaseSettingsSource,
-    PyprojectTomlConfigSettingsSource,
-    SettingsConfigDict,
-)
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+if TYPE_CHECKING:
+    from pydantic_settings import PydanticBaseSettingsSource
 
 __all__ = ["ApplicationInfo", "LicenseInfo"]
 
@@ -23,6 +21,8 @@ class LicenseInfo(BaseModel):
 
 _PACKAGE_NAME = "menagerist"
 _DEFAULT_DISPLAY_NAME = "Menagerist"
+# Written at image build time by `menagerist app-info --write`.
+_SNAPSHOT = Path(__file__).with_name("app_info.json")
 
 
 class _MenageristToolConfig(BaseSettings):
@@ -46,6 +46,8 @@ class _MenageristToolConfig(BaseSettings):
         file_secret_settings: PydanticBaseSettingsSource,
     ) -> tuple[PydanticBaseSettingsSource, ...]:
         """Load from [tool.menagerist] in pyproject.toml."""
+        from pydantic_settings import PyprojectTomlConfigSettingsSource
+
         return (PyprojectTomlConfigSettingsSource(settings_cls),)
 
 
@@ -62,7 +64,22 @@ class ApplicationInfo(BaseModel):
 
     @classmethod
     def from_package(cls) -> ApplicationInfo:
-        """Load metadata from the installed package and pyproject.toml."""
+        """Load the metadata snapshot, or else read it from the package.
+
+        Reading the installed package's metadata and pyproject.toml costs
+        every worker some milliseconds at startup, so images ship a snapshot
+        taken at build time.
+        """
+        try:
+            return cls.model_validate_json(_SNAPSHOT.read_bytes())
+        except FileNotFoundError:
+            return cls.read_package()
+
+    @classmethod
+    def read_package(cls) -> ApplicationInfo:
+        """Read metadata from the installed package and pyproject.toml."""
+        from importlib.metadata import PackageNotFoundError, metadata
+
         tool = _MenageristToolConfig()
         try:
             meta = metadata(_PACKAGE_NAME)
@@ -81,3 +98,8 @@ class ApplicationInfo(BaseModel):
             )
         except PackageNotFoundError:
             return cls(display_name=tool.display_name)
+
+    def write_snapshot(self) -> Path:
+        """Save this metadata as the snapshot `from_package` loads."""
+        _SNAPSHOT.write_text(self.model_dump_json(indent=2) + "\n")
+        return _SNAPSHOT
@@ -0,0 +1,41 @@
+"""Database configuration settings."""
+
+from pydantic import Field, SecretStr
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class DatabaseSettings(BaseSettings):
+    """Settings for the PostgreSQL connection pool.
+
+    One pool is created per worker process, so the effective number of
+    server connections is roughly `workers * (pool_size + max_overflow)`.
+
+    With `read_dsn`, for example `postgresql://reader@replica/menagerist`,
+    a second pool of `read_pool_size` connections is opened on a read-only
+    replica for traversals, search and exports. A client that wrote within
+    `recent_write_seconds` keeps reading from the primary, so it sees its
+    writes despite replication lag.
+    """
+
+    model_config = SettingsConfigDict(
+        frozen=True,
+    )
+
+    host: str = "localhost"
+    port: int = Field(5432, ge=1, le=65535)
+    user: str = "menagerist"
+    password: SecretStr = SecretStr("")
+    name: str = "menagerist"
+
+    pool_size: int = Field(5, ge=1)
+    max_overflow: int = Field(10, ge=0)
+    pool_timeout: float = Field(30.0, gt=0)
+    pool_recycle: int = Field(1800, ge=-1)
+    pool_pre_ping: bool = True
+    statement_cache_size: int = Field(100, ge=0)
+    echo: bool = False
+
+    read_dsn: SecretStr | None = None
+    read_pool_size: int = Field(5, ge=1)
+    read_max_overflow: int = Field(10, ge=0)
+    recent_write_seconds: int = Field(5, ge=1)
@@ -0,0 +1,78 @@
+"""Background enrichment configuration settings."""
+
+from pydantic import Field, SecretStr
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+from app.shared.types import CSV  # noqa: TC001
+
+
+class TmdbSettings(BaseSettings):
+    """Settings for The Movie Database (TMDB) provider.
+
+    The provider only runs when an API read access token is configured.
+    """
+
+    model_config = SettingsConfigDict(
+        frozen=True,
+    )
+
+    enabled: bool = True
+    base_url: str = "https://api.themoviedb.org/3"
+    access_token: SecretStr = SecretStr("")
+    rate: float = Field(20.0, gt=0)
+    burst: int = Field(5, ge=1)
+
+    movie_types: CSV[str] = Field(["film", "movie"])
+    tv_types: CSV[str] = Field(["tv_show", "series"])
+
+
+class MusicBrainzSettings(BaseSettings):
+    """Settings for the MusicBrainz provider.
+
+    MusicBrainz allows one request per second per client and asks callers to
+    identify themselves with a meaningful `User-Agent`.
+    """
+
+    model_config = SettingsConfigDict(
+        frozen=True,
+    )
+
+    enabled: bool = True
+    base_url: str = "https://musicbrainz.org/ws/2"
+    user_agent: str = "Menagerist (https://github.com/samcorky/menagerist)"
+    rate: float = Field(1.0, gt=0)
+    min_score: int = Field(90, ge=0, le=100)
+
+    artist_types: CSV[str] = Field(["artist", "band", "musician"])
+    release_types: CSV[str] = Field(["album", "single", "release"])
+    recording_types: CSV[str] = Field(["recording", "song", "track"])
+
+
+class EnrichmentSettings(BaseSettings):
+    """Settings for background enrichment from external providers.
+
+    Only one worker process runs lookups at a time, so provider rate limits
+    apply to the whole deployment. Jobs are stored in the database; a job
+    claimed by a worker that stops is retried once `lease_seconds` pass.
+    """
+
+    model_config = SettingsConfigDict(
+        frozen=True,
+    )
+
+    enabled: bool = False
+    workers_per_provider: int = Field(2, ge=1)
+    queue_size: int = Field(100, ge=1)
+    batch_size: int = Field(50, ge=1)
+    poll_interval: float = Field(5.0, gt=0)
+    lease_seconds: float = Field(300.0, gt=0)
+
+    max_attempts: int = Field(5, ge=1)
+    retry_base_delay: float = Field(30.0, ge=0)
+    retry_max_delay: float = Field(3600.0, ge=0)
+
+    request_timeout: float = Field(10.0, gt=0)
+    request_retries: int = Field(3, ge=0)
+
+    tmdb: TmdbSettings = Field(default_factory=TmdbSettings)
+    musicbrainz: MusicBrainzSettings = Field(default_factory=MusicBrainzSettings)
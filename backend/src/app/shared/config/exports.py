@@ -0,0 +1,19 @@
+"""Graph export configuration settings."""
+
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class ExportSettings(BaseSettings):
+    """Settings for streamed exports.
+
+    Rows are fetched `batch_size` at a time from a server-side cursor and
+    written to the response in chunks of roughly `chunk_bytes`.
+    """
+
+    model_config = SettingsConfigDict(
+        frozen=True,
+    )
+
+    batch_size: int = Field(2000, ge=1)
+    chunk_bytes: int = Field(64 * 1024, ge=1024)
@@ -0,0 +1,43 @@
+"""Graph query configuration settings."""
+
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class GraphSettings(BaseSettings):
+    """Graph traversal and search limits, and the optional adjacency cache.
+
+    Path searches return at most `paths_max_count` paths of at most
+    `max_depth` links, and stop once they have looked at the edges of
+    `paths_max_visited` nodes.
+
+    A batch write holds at most `batch_max_nodes` nodes and
+    `batch_max_edges` edges, all written in one transaction.
+
+    `search_min_similarity` is how closely (0 to 1) a name must resemble the
+    search text to match when its words do not; lower tolerates more typos.
+
+    The adjacency cache is per worker. Writes made through a worker update
+    its own cache immediately; other workers notice the change on their next
+    refresh, at most `adjacency_cache_refresh_interval` seconds later.
+    """
+
+    model_config = SettingsConfigDict(
+        frozen=True,
+    )
+
+    max_depth: int = Field(6, ge=1)
+    max_results: int = Field(1000, ge=1)
+
+    paths_max_count: int = Field(10, ge=1)
+    paths_max_visited: int = Field(50_000, ge=1)
+
+    batch_max_nodes: int = Field(1000, ge=1)
+    batch_max_edges: int = Field(5000, ge=1)
+
+    search_max_results: int = Field(50, ge=1)
+    search_min_similarity: float = Field(0.4, ge=0, le=1)
+
+    adjacency_cache_enabled: bool = False
+    adjacency_cache_refresh_interval: float = Field(5.0, gt=0)
+    adjacency_cache_max_pending: int = Field(10_000, ge=0)
@@ -0,0 +1,20 @@
+"""Bulk import configuration settings."""
+
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class ImportSettings(BaseSettings):
+    """Settings for streamed bulk imports.
+
+    Rows are parsed incrementally and staged `batch_size` at a time, so
+    memory use is bounded by the batch size rather than the size of the file.
+    """
+
+    model_config = SettingsConfigDict(
+        frozen=True,
+    )
+
+    batch_size: int = Field(5000, ge=1)
+    max_errors: int = Field(100, ge=0)
+    max_line_bytes: int = Field(1024 * 1024, ge=1024)
@@ -1,5 +1,6 @@
 from enum import StrEnum, auto
 
+from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -20,8 +21,28 @@ class LoggingMode(StrEnum):
     JSON = auto()
 
 
+class LogSink(StrEnum):
+    """Where log events are written."""
+
+    DIRECT = auto()
+    QUEUED = auto()
+
+
+class LogOverflow(StrEnum):
+    """What happens to events logged while the queue is full."""
+
+    DROP = auto()
+    BLOCK = auto()
+
+
 class LoggingSettings(BaseSettings):
-    """Logging settings."""
+    """Logging settings.
+
+    With the `direct` sink, each event is written to stdout as it is logged,
+    and the async log methods do so in a thread. The `queued` sink renders
+    events in the caller and queues up to `queue_size` of them for one
+    writer thread to flush in batches of up to `batch_size`.
+    """
 
     model_config = SettingsConfigDict(
         frozen=True,
@@ -29,3 +50,8 @@ class LoggingSettings(BaseSettings):
 
     level: LogLevel = LogLevel.INFO
     mode: LoggingMode = LoggingMode.JSON
+
+    sink: LogSink = LogSink.DIRECT
+    queue_size: int = Field(10_000, ge=1)
+    batch_size: int = Field(512, ge=1)
+    overflow: LogOverflow = LogOverflow.DROP
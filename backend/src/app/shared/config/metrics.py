@@ -0,0 +1,31 @@
+"""Metrics configuration settings."""
+
+import tempfile
+from pathlib import Path
+
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+from app.shared.types import CSV  # noqa: TC001
+
+
+class MetricsSettings(BaseSettings):
+    """Settings for the Prometheus metrics endpoint.
+
+    Each worker keeps its metrics in a small file under `directory`, which
+    every worker of a server must share, and `/api/metrics` sums them all.
+    Request latency is counted into `latency_buckets` (in seconds). Gauges
+    such as pool usage are republished every `publish_interval` seconds.
+    """
+
+    model_config = SettingsConfigDict(
+        frozen=True,
+    )
+
+    enabled: bool = True
+    directory: Path = Path(tempfile.gettempdir()) / "menagerist-metrics"
+    latency_buckets: CSV[float] = Field(
+        [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0],
+        min_length=1,
+    )
+    publish_interval: float = Field(5.0, gt=0)
@@ -0,0 +1,24 @@
+"""Node type schema configuration settings."""
+
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class NodeTypeSettings(BaseSettings):
+    """Settings for node type schemas.
+
+    A type declares at most `max_fields` fields. Each worker keeps up to
+    `validator_cache_size` compiled property validators; 0 compiles one for
+    every check. When `index_builds_enabled`, workers build and drop the
+    indexes of filterable fields in the background, looking for queued
+    work every `index_poll_interval` seconds.
+    """
+
+    model_config = SettingsConfigDict(
+        frozen=True,
+    )
+
+    max_fields: int = Field(50, ge=1)
+    validator_cache_size: int = Field(256, ge=0)
+    index_builds_enabled: bool = True
+    index_poll_interval: float = Field(5.0, gt=0)
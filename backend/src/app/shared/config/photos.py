@@ -0,0 +1,47 @@
+"""Photo storage configuration settings."""
+
+from enum import StrEnum, auto
+from pathlib import Path
+
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+from app.domain.photos import DerivativeFormat
+from app.shared.types import CSV  # noqa: TC001
+
+
+class PhotoBackend(StrEnum):
+    """Where photos are stored."""
+
+    LOCAL = auto()
+
+
+class PhotoSettings(BaseSettings):
+    """Settings for uploaded photos.
+
+    Uploads are streamed to storage `buffer_bytes` at a time, so that much
+    (per upload) is the most ever held in memory. With the `local` backend,
+    photos live under `root`, which every worker must share.
+
+    Derivatives are offered at each of `derivative_sizes` (the longest side,
+    in pixels) in each of `derivative_formats`. They are rendered on first
+    request by a pool of `derivative_workers` processes per worker, or right
+    after upload (in the first format) with `eager_derivatives`.
+    """
+
+    model_config = SettingsConfigDict(
+        frozen=True,
+    )
+
+    backend: PhotoBackend = PhotoBackend.LOCAL
+    root: Path = Path("data/photos")
+    max_bytes: int = Field(50 * 1024 * 1024, ge=1)
+    buffer_bytes: int = Field(1024 * 1024, ge=4096)
+
+    derivative_workers: int = Field(2, ge=1)
+    derivative_sizes: CSV[int] = Field([320, 1600])
+    derivative_formats: CSV[DerivativeFormat] = Field(
+        [DerivativeFormat.WEBP, DerivativeFormat.JPEG], min_length=1
+    )
+    derivative_quality: int = Field(82, ge=1, le=100)
+    eager_derivatives: bool = False
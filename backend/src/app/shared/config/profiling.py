@@ -0,0 +1,24 @@
+"""Request profiling configuration settings."""
+
+import tempfile
+from pathlib import Path
+
+from pydantic import SecretStr
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class ProfilingSettings(BaseSettings):
+    """Settings for profiling single API requests on demand.
+
+    When enabled, a request sent with an `X-Profile` header is run under
+    `cProfile` and its stats are written to `directory`, named after the
+    request id. If a `token` is configured the header must carry it.
+    """
+
+    model_config = SettingsConfigDict(
+        frozen=True,
+    )
+
+    enabled: bool = False
+    token: SecretStr = SecretStr("")
+    directory: Path = Path(tempfile.gettempdir()) / "menagerist-profiles"
@@ -0,0 +1,28 @@
+"""Provider response cache configuration settings."""
+
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class ProviderCacheSettings(BaseSettings):
+    """Settings for caching enrichment provider responses.
+
+    Each worker keeps up to `memory_entries` responses in memory; with
+    `persistent` on, responses are also kept in the database, shared by all
+    workers and across restarts, up to about `max_persistent_entries`.
+    Responses that found nothing are kept for `negative_ttl_seconds` only,
+    so new catalogue entries are picked up sooner.
+    """
+
+    model_config = SettingsConfigDict(
+        frozen=True,
+    )
+
+    enabled: bool = True
+    memory_entries: int = Field(10_000, ge=0)
+    persistent: bool = True
+    max_persistent_entries: int = Field(1_000_000, ge=0)
+    prune_every: int = Field(1000, ge=1)
+
+    ttl_seconds: float = Field(30 * 24 * 3600, ge=0)
+    negative_ttl_seconds: float = Field(24 * 3600, ge=0)
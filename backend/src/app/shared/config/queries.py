@@ -0,0 +1,21 @@
+"""Saved query configuration settings."""
+
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class QuerySettings(BaseSettings):
+    """Settings for saved queries.
+
+    Each worker keeps up to `plan_cache_size` compiled filter statements,
+    one per filter shape; 0 compiles every run afresh. Filters are limited
+    to `max_terms` predicates and paths to `max_path_length` edges.
+    """
+
+    model_config = SettingsConfigDict(
+        frozen=True,
+    )
+
+    plan_cache_size: int = Field(256, ge=0)
+    max_terms: int = Field(50, ge=1)
+    max_path_length: int = Field(4, ge=1)
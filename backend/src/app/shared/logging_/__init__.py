@@ -6,14 +6,39 @@ modules (including `bootstrap`) can import the logging_ helpers without
 dragging in unrelated lifecycle code.
 """
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import structlog
 
-from app.shared.config.logging_ import LoggingMode, LogLevel
+from app.shared.config.logging_ import LoggingMode, LogLevel, LogOverflow, LogSink
 from app.shared.logging_.semantic_sorter import SemanticSorter
+from app.shared.logging_.sink import QueuedLogger, QueuedLogSink
 
-__all__ = ["configure_logging"]
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from structlog.typing import FilteringBoundLogger
+
+__all__ = ["close_logging", "configure_logging", "get_log_sink"]
+
+_sink: QueuedLogSink | None = None
+
+# Async methods of structlog's bound loggers, and the sync method each one
+# runs in a thread.
+_ASYNC_METHODS = {
+    f"a{name}": name
+    for name in (
+        "debug",
+        "info",
+        "msg",
+        "warning",
+        "warn",
+        "error",
+        "exception",
+        "critical",
+        "fatal",
+    )
+}
 
 
 def _level_value(level: LogLevel) -> int:
@@ -36,17 +61,66 @@ def _base_processors() -> list[Any]:
     ]
 
 
+def _inline_async(
+    wrapper_class: type[FilteringBoundLogger],
+) -> type[FilteringBoundLogger]:
+    """Make a bound logger class's async methods log on the calling thread.
+
+    Queuing a line never blocks (unless the queue is full and the overflow
+    policy is to block), so a hop to a thread would cost more than it saves.
+    """
+
+    def inline(name: str) -> Callable[..., Awaitable[None]]:
+        sync = getattr(wrapper_class, name)
+
+        async def method(
+            self: FilteringBoundLogger, event: str, *args: object, **kw: object
+        ) -> None:
+            sync(self, event, *args, **kw)
+
+        return method
+
+    async def alog(
+        self: FilteringBoundLogger, level: int, event: str, *args: object, **kw: object
+    ) -> None:
+        self.log(level, event, *args, **kw)
+
+    namespace = {name: inline(sync) for name, sync in _ASYNC_METHODS.items()}
+    return type(wrapper_class.__name__, (wrapper_class,), {**namespace, "alog": alog})
+
+
 def configure_logging(
     level: LogLevel = LogLevel.INFO,
     mode: LoggingMode = LoggingMode.JSON,
+    *,
+    sink: LogSink = LogSink.DIRECT,
+    queue_size: int = 10_000,
+    batch_size: int = 512,
+    overflow: LogOverflow = LogOverflow.DROP,
 ) -> None:
     """Configure structlog for development or production output.
 
     Args:
         level: Minimum log level for emitted events.
         mode: Output format mode.
+        sink: Whether to write events directly or via a writer thread.
+        queue_size: Most events the queued sink holds before overflowing.
+        batch_size: Most events the queued sink writes at once.
+        overflow: Whether the queued sink drops events or blocks when full.
     """
+    global _sink
+    close_logging()
+
     wrapper_class = structlog.make_filtering_bound_logger(_level_value(level))
+    logger_factory: Any = structlog.PrintLoggerFactory()
+    if sink is LogSink.QUEUED:
+        _sink = QueuedLogSink(
+            queue_size=queue_size, batch_size=batch_size, overflow=overflow
+        )
+        _sink.start()
+        logger = QueuedLogger(_sink)
+        logger_factory = lambda *_: logger  # noqa: E731
+        wrapper_class = _inline_async(wrapper_class)
 
     match mode:
         case LoggingMode.HUMAN:
@@ -68,5 +142,19 @@ def configure_logging(
     structlog.configure(
         wrapper_class=wrapper_class,
         processors=processors,
+        logger_factory=logger_factory,
         cache_logger_on_first_use=False,
     )
+
+
+def get_log_sink() -> QueuedLogSink | None:
+    """Return the queued log sink, if logging is configured to use one."""
+    return _sink
+
+
+def close_logging() -> None:
+    """Write out any queued log events and stop the writer thread."""
+    global _sink
+    if _sink is not None:
+        _sink.close()
+        _sink = None
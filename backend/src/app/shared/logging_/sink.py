@@ -0,0 +1,108 @@
+"""A log sink that keeps writing to stdout off the calling thread."""
+
+import queue
+import sys
+import threading
+import time
+from typing import Final, cast
+
+import structlog
+
+from app.shared.config.logging_ import LogOverflow
+
+__all__ = ["QueuedLogSink", "QueuedLogger"]
+
+_STOP: Final = object()
+
+
+class QueuedLogSink:
+    """Queues rendered log lines for a writer thread to write in batches.
+
+    Logging costs the caller a queue put instead of a write to stdout. The
+    queue holds at most `queue_size` lines: once it is full, new lines are
+    dropped and counted (`LogOverflow.DROP`), or the caller waits for the
+    writer to catch up (`LogOverflow.BLOCK`). The writer logs a
+    `logging.dropped` event after any batch during which lines were dropped.
+    """
+
+    def __init__(
+        self, *, queue_size: int, batch_size: int, overflow: LogOverflow
+    ) -> None:
+        self._queue: queue.Queue[str | object] = queue.Queue(queue_size)
+        self._batch_size = batch_size
+        self._block = overflow is LogOverflow.BLOCK
+        self._thread = threading.Thread(
+            target=self._run, name="log-writer", daemon=True
+        )
+        self.dropped = 0
+        self.written = 0
+
+    def start(self) -> None:
+        """Start the writer thread."""
+        self._thread.start()
+
+    def put(self, line: str) -> None:
+        """Queue a rendered line for writing."""
+        try:
+            self._queue.put(line, block=self._block)
+        except queue.Full:
+            self.dropped += 1
+
+    def _batch(self) -> tuple[list[str], bool]:
+        first = self._queue.get()
+        if first is _STOP:
+            return [], True
+        batch = [cast("str", first)]
+        while len(batch) < self._batch_size:
+            try:
+                line = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if line is _STOP:
+                return batch, True
+            batch.append(cast("str", line))
+        return batch, False
+
+    def _run(self) -> None:
+        reported = 0
+        stopping = False
+        while not stopping:
+            batch, stopping = self._batch()
+            if batch:
+                sys.stdout.write("".join(f"{line}\n" for line in batch))
+                sys.stdout.flush()
+                self.written += len(batch)
+            if (dropped := self.dropped) > reported and not stopping:
+                structlog.get_logger("logging").warning(
+                    "logging.dropped", count=dropped - reported, total=dropped
+                )
+                reported = dropped
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Write out everything queued so far and stop the writer thread.
+
+        Waits at most `timeout` seconds, even if the writer is stuck with a
+        full queue; lines still queued then are lost.
+        """
+        if not self._thread.is_alive():
+            return
+        deadline = time.monotonic() + timeout
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            return
+        self._thread.join(max(deadline - time.monotonic(), 0))
+
+
+class QueuedLogger:
+    """A structlog logger that hands rendered events to a `QueuedLogSink`."""
+
+    def __init__(self, sink: QueuedLogSink) -> None:
+        self._sink = sink
+
+    def msg(self, message: str) -> None:
+        """Queue a rendered event, whatever its level."""
+        self._sink.put(message)
+
+    log = debug = info = warn = warning = msg
+    fatal = failure = err = error = critical = exception = msg
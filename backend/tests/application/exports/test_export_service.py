@@ -0,0 +1,93 @@
+import asyncio
+import gzip
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+
+from app.application.exports import ExportService
+from app.domain.graph import Edge, Node
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+pytestmark = pytest.mark.unit
+
+
+class _ListSource:
+    def __init__(self, nodes: list[Node], edges: list[Edge]) -> None:
+        self._nodes = nodes
+        self._edges = edges
+
+    async def nodes(self) -> AsyncIterator[Node]:
+        for node in self._nodes:
+            yield node
+
+    async def edges(self) -> AsyncIterator[Edge]:
+        for edge in self._edges:
+            yield edge
+
+
+def _source(count: int) -> _ListSource:
+    nodes = [
+        Node(id=i, type="item", name=f"Item {i}", properties={"n": i})
+        for i in range(1, count + 1)
+    ]
+    edges = [
+        Edge(id=i, source_id=i, target_id=i + 1, type="next") for i in range(1, count)
+    ]
+    return _ListSource(nodes, edges)
+
+
+def _collect(service: ExportService, *, compress: bool) -> list[bytes]:
+    async def collect() -> list[bytes]:
+        return [chunk async for chunk in service.ndjson(compress=compress)]
+
+    return asyncio.run(collect())
+
+
+def test_export_writes_nodes_then_edges() -> None:
+    service = ExportService(_source(3), chunk_bytes=1024)
+
+    body = b"".join(_collect(service, compress=False))
+
+    records = [json.loads(line) for line in body.splitlines()]
+    assert [r["kind"] for r in records] == ["node"] * 3 + ["edge"] * 2
+    assert records[0] == {
+        "kind": "node",
+        "id": 1,
+        "key": None,
+        "type": "item",
+        "name": "Item 1",
+        "properties": {"n": 1},
+    }
+    assert records[3] == {
+        "kind": "edge",
+        "id": 1,
+        "source_id": 1,
+        "target_id": 2,
+        "type": "next",
+        "properties": {},
+    }
+
+
+def test_export_groups_lines_into_chunks() -> None:
+    service = ExportService(_source(200), chunk_bytes=4096)
+
+    chunks = _collect(service, compress=False)
+
+    assert len(chunks) > 1
+    assert all(chunk.endswith(b"\n") for chunk in chunks)
+    assert all(len(chunk) < 4096 + 200 for chunk in chunks)
+
+
+def test_gzip_export_is_a_single_gzip_stream() -> None:
+    plain = b"".join(
+        _collect(ExportService(_source(50), chunk_bytes=1024), compress=False)
+    )
+
+    compressed = b"".join(
+        _collect(ExportService(_source(50), chunk_bytes=1024), compress=True)
+    )
+
+    assert gzip.decompress(compressed) == plain
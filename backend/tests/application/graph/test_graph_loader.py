@@ -0,0 +1,158 @@
+import asyncio
+from typing import TYPE_CHECKING
+
+import pytest
+
+from app.application.graph import GraphLoader
+from app.domain.graph import NewEdge, NewNode
+from app.infrastructure.memory import InMemoryGraphRepository
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from app.domain.graph import Edge, Node
+
+pytestmark = pytest.mark.unit
+
+
+class CountingRepository(InMemoryGraphRepository):
+    """Records each by-id lookup, standing in for one query apiece."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.queries: list[tuple[str, list[int]]] = []
+        self.fail = False
+
+    async def get_nodes(self, node_ids: Sequence[int]) -> list[Node]:
+        self.queries.append(("nodes", list(node_ids)))
+        if self.fail:
+            raise ConnectionError("database went away")
+        return await super().get_nodes(node_ids)
+
+    async def get_edges(self, edge_ids: Sequence[int]) -> list[Edge]:
+        self.queries.append(("edges", list(edge_ids)))
+        return await super().get_edges(edge_ids)
+
+
+def _repository(nodes: int) -> CountingRepository:
+    repository = CountingRepository()
+
+    async def build() -> None:
+        for i in range(nodes):
+            await repository.add_node(NewNode(type="item", name=f"n{i}"))
+        for i in range(1, nodes):
+            await repository.add_edge(NewEdge(source_id=i, target_id=i + 1, type="x"))
+
+    asyncio.run(build())
+    return repository
+
+
+def test_lookups_in_one_tick_share_one_query() -> None:
+    repository = _repository(5)
+    loader = GraphLoader(repository)
+
+    async def load() -> list[Node | None]:
+        return await asyncio.gather(*(loader.node(i) for i in (3, 1, 3, 99, 1)))
+
+    found = asyncio.run(load())
+
+    assert [node and node.id for node in found] == [3, 1, 3, None, 1]
+    assert repository.queries == [("nodes", [3, 1, 99])]
+
+
+def test_nested_gathers_share_one_query() -> None:
+    repository = _repository(6)
+    loader = GraphLoader(repository)
+
+    async def pair(edge_id: int) -> tuple[Node | None, Node | None]:
+        edge = repository.edges[edge_id]
+        return await asyncio.gather(
+            loader.node(edge.source_id), loader.node(edge.target_id)
+        )
+
+    async def load() -> list[tuple[Node | None, Node | None]]:
+        return await asyncio.gather(*(pair(i) for i in range(1, 6)))
+
+    pairs = asyncio.run(load())
+
+    assert [(s and s.id, t and t.id) for s, t in pairs] == [
+        (i, i + 1) for i in range(1, 6)
+    ]
+    assert repository.queries == [("nodes", [1, 2, 3, 4, 5, 6])]
+
+
+def test_loaded_ids_are_not_fetched_again() -> None:
+    repository = _repository(4)
+    loader = GraphLoader(repository)
+
+    async def load() -> None:
+        await loader.nodes.load_many([1, 2])
+        await loader.nodes.load_many([2, 1, 3])
+        await loader.node(3)
+
+    asyncio.run(load())
+
+    assert repository.queries == [("nodes", [1, 2]), ("nodes", [3])]
+
+
+def test_sequential_lookups_each_query() -> None:
+    repository = _repository(3)
+    loader = GraphLoader(repository)
+
+    async def load() -> None:
+        await loader.node(1)
+        await loader.node(2)
+
+    asyncio.run(load())
+
+    assert repository.queries == [("nodes", [1]), ("nodes", [2])]
+
+
+def test_edges_are_loaded_in_one_query() -> None:
+    repository = _repository(4)
+    loader = GraphLoader(repository)
+
+    async def load() -> list[Edge | None]:
+        return await loader.edges.load_many([2, 1, 2, 42])
+
+    found = asyncio.run(load())
+
+    assert [edge and edge.id for edge in found] == [2, 1, 2, None]
+    assert repository.queries == [("edges", [2, 1, 42])]
+
+
+def test_failed_fetch_reaches_every_caller_and_is_retried() -> None:
+    repository = _repository(2)
+    loader = GraphLoader(repository)
+
+    async def load() -> tuple[Sequence[Node | None | BaseException], list[Node | None]]:
+        repository.fail = True
+        failed = await asyncio.gather(
+            loader.node(1), loader.node(2), return_exceptions=True
+        )
+        repository.fail = False
+        return failed, await loader.nodes.load_many([1, 2])
+
+    failed, retried = asyncio.run(load())
+
+    assert all(isinstance(result, ConnectionError) for result in failed)
+    assert [node and node.id for node in retried] == [1, 2]
+    assert repository.queries == [("nodes", [1, 2]), ("nodes", [1, 2])]
+
+
+def test_cancelled_caller_does_not_cancel_others() -> None:
+    repository = _repository(2)
+    loader = GraphLoader(repository)
+
+    async def load() -> Node | None:
+        first = asyncio.ensure_future(loader.node(1))
+        second = asyncio.ensure_future(loader.node(1))
+        await asyncio.sleep(0)
+        first.cancel()
+        return await second
+
+    node = asyncio.run(load())
+
+    assert node is not None
+    assert node.id == 1
+    assert repository.queries == [("nodes", [1])]
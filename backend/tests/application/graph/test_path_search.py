@@ -0,0 +1,225 @@
+import asyncio
+import itertools
+import random
+from typing import TYPE_CHECKING
+
+import pytest
+
+from app.application.graph import GraphService
+from app.application.graph.paths import find_routes
+from app.domain.graph import Direction, NewEdge, NewNode, NodeNotFoundError
+from app.infrastructure.memory import InMemoryGraphRepository
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from app.application.graph.paths import Route
+    from app.domain.graph import GraphRepository, Link
+
+pytestmark = pytest.mark.unit
+
+
+def _graph(
+    edges: list[tuple[int, int, str]], nodes: int
+) -> tuple[InMemoryGraphRepository, list[int]]:
+    repository = InMemoryGraphRepository()
+
+    async def build() -> list[int]:
+        ids = [
+            (await repository.add_node(NewNode(type="item", name=str(i)))).id
+            for i in range(nodes)
+        ]
+        for source, target, edge_type in edges:
+            await repository.add_edge(
+                NewEdge(source_id=ids[source], target_id=ids[target], type=edge_type)
+            )
+        return ids
+
+    return repository, asyncio.run(build())
+
+
+class _CountingRepository(InMemoryGraphRepository):
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls: list[tuple[Direction, list[int]]] = []
+
+    async def links(
+        self,
+        node_ids: Sequence[int],
+        *,
+        direction: Direction,
+        edge_types: Sequence[str] | None,
+    ) -> list[Link]:
+        self.calls.append((direction, sorted(node_ids)))
+        return await super().links(node_ids, direction=direction, edge_types=edge_types)
+
+
+def _routes(
+    repository: GraphRepository,
+    source: int,
+    target: int,
+    *,
+    count: int = 1,
+    max_length: int = 6,
+    direction: Direction = Direction.BOTH,
+    edge_types: Sequence[str] | None = None,
+    max_visited: int = 10_000,
+) -> tuple[list[Route], bool]:
+    return asyncio.run(
+        find_routes(
+            repository,
+            source,
+            target,
+            count=count,
+            max_length=max_length,
+            direction=direction,
+            edge_types=edge_types,
+            max_visited=max_visited,
+        )
+    )
+
+
+def _simple_paths(
+    edges: list[tuple[int, int, str]], source: int, target: int, max_length: int
+) -> list[int]:
+    """Lengths of every simple path, by brute force, for undirected links."""
+    links = {(a, b, t) for a, b, t in edges}
+    lengths: list[int] = []
+
+    def walk(node: int, visited: list[int]) -> None:
+        if node == target:
+            lengths.append(len(visited) - 1)
+            return
+        if len(visited) > max_length:
+            return
+        for a, b, _ in links:
+            for here, there in ((a, b), (b, a)):
+                if here == node and there not in visited:
+                    walk(there, [*visited, there])
+
+    walk(source, [source])
+    return sorted(lengths)
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_finds_the_k_shortest_simple_paths(seed: int) -> None:
+    rng = random.Random(seed)
+    edges = [(rng.randrange(9), rng.randrange(9), rng.choice("ab")) for _ in range(16)]
+    repository, ids = _graph(edges, 9)
+
+    routes, truncated = _routes(repository, ids[0], ids[8], count=6, max_length=5)
+
+    expected = _simple_paths(edges, 0, 8, max_length=5)[:6]
+    assert [len(route.links) for route in routes] == expected
+    assert not truncated
+    assert len(set(routes)) == len(routes)
+    for route in routes:
+        assert len(set(route.nodes)) == len(route.nodes)
+        hops = zip(itertools.pairwise(route.nodes), route.links, strict=True)
+        for (here, there), link in hops:
+            assert {here, there} == {link.source_id, link.target_id}
+
+
+def test_each_level_is_one_batched_lookup_of_the_smaller_frontier() -> None:
+    repository = _CountingRepository()
+    hub = [(0, i, "x") for i in range(1, 6)]
+
+    async def build() -> list[int]:
+        ids = [
+            (await repository.add_node(NewNode(type="item", name=str(i)))).id
+            for i in range(8)
+        ]
+        for source, target, edge_type in [*hub, (5, 6, "x"), (6, 7, "x")]:
+            await repository.add_edge(
+                NewEdge(source_id=ids[source], target_id=ids[target], type=edge_type)
+            )
+        return ids
+
+    ids = asyncio.run(build())
+
+    routes, _ = _routes(repository, ids[0], ids[7], direction=Direction.OUT)
+
+    assert routes[0].nodes == (ids[0], ids[5], ids[6], ids[7])
+    assert repository.calls == [
+        (Direction.OUT, [ids[0]]),
+        # Five nodes forward against one backward: the destination side grows.
+        (Direction.IN, [ids[7]]),
+        (Direction.IN, [ids[6]]),
+    ]
+
+
+def test_direction_and_edge_types_restrict_the_links_followed() -> None:
+    repository, ids = _graph([(1, 0, "a"), (1, 2, "b"), (2, 0, "a")], 3)
+
+    out, _ = _routes(repository, ids[0], ids[2], direction=Direction.OUT)
+    into, _ = _routes(repository, ids[0], ids[2], direction=Direction.IN, count=3)
+    typed, _ = _routes(repository, ids[0], ids[2], edge_types=["a"], count=3)
+
+    assert out == []
+    assert [route.nodes for route in into] == [(ids[0], ids[2])]
+    assert [route.nodes for route in typed] == [(ids[0], ids[2])]
+
+
+def test_paths_longer_than_the_limit_are_not_found() -> None:
+    chain = [(i, i + 1, "next") for i in range(4)]
+    repository, ids = _graph(chain, 5)
+
+    assert _routes(repository, ids[0], ids[4], max_length=3) == ([], False)
+    assert len(_routes(repository, ids[0], ids[4], max_length=4)[0]) == 1
+
+
+def test_visit_limit_truncates_the_search() -> None:
+    chain = [(i, i + 1, "next") for i in range(6)]
+    repository, ids = _graph(chain, 7)
+
+    assert _routes(repository, ids[0], ids[6], max_visited=3) == ([], True)
+
+
+def test_service_resolves_nodes_and_caps_the_count() -> None:
+    edges = [(0, 1, "x"), (1, 3, "x"), (0, 2, "x"), (2, 3, "x"), (0, 3, "y")]
+    repository, ids = _graph(edges, 4)
+    service = GraphService(repository, max_depth=6, max_results=100, paths_max_count=2)
+
+    result = asyncio.run(service.paths(ids[0], ids[3], count=5))
+
+    assert [[node.name for node in path.nodes] for path in result.paths] == [
+        ["0", "3"],
+        ["0", "1", "3"],
+    ]
+    assert result.paths[0].links[0].type == "y"
+    assert (result.origin.id, result.destination.id) == (ids[0], ids[3])
+    assert not result.truncated
+
+
+def test_service_requires_both_nodes() -> None:
+    repository, ids = _graph([], 1)
+    service = GraphService(repository, max_depth=6, max_results=100)
+
+    with pytest.raises(NodeNotFoundError) as excinfo:
+        asyncio.run(service.paths(ids[0], 99))
+
+    assert excinfo.value.node_ids == (99,)
+
+
+def test_same_node_is_a_path_of_no_links() -> None:
+    repository, ids = _graph([(0, 0, "self")], 1)
+
+    routes, _ = _routes(repository, ids[0], ids[0], count=3)
+
+    assert [(route.nodes, route.links) for route in routes] == [((ids[0],), ())]
+
+
+def test_parallel_links_of_different_types_are_distinct_paths() -> None:
+    repository, ids = _graph([(0, 1, "a"), (0, 1, "b"), (0, 1, "a")], 2)
+
+    routes, _ = _routes(repository, ids[0], ids[1], count=5)
+
+    assert sorted(route.links[0].type for route in routes) == ["a", "b"]
+
+
+def test_chains_are_found_across_many_combinations() -> None:
+    for length, direction in itertools.product(range(1, 5), list(Direction)):
+        repository, ids = _graph([(i, i + 1, "x") for i in range(length)], length + 1)
+        routes, _ = _routes(repository, ids[0], ids[-1], direction=direction)
+        expected = [] if direction is Direction.IN else [tuple(ids)]
+        assert [route.nodes for route in routes] == expected
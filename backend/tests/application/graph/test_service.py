@@ -0,0 +1,276 @@
+import asyncio
+import itertools
+
+import pytest
+
+from app.application.graph import GraphService
+from app.domain.graph import (
+    BatchEdge,
+    Direction,
+    EdgeNotFoundError,
+    InvalidBatchError,
+    NewEdge,
+    NewNode,
+    NodeNotFoundError,
+)
+from app.domain.pagination import PageRequest
+from app.infrastructure.memory import InMemoryGraphRepository
+
+pytestmark = pytest.mark.unit
+
+
+def _chain(repository: InMemoryGraphRepository, length: int) -> list[int]:
+    """Store `length` nodes linked a -> b -> c ... and return their ids."""
+
+    async def build() -> list[int]:
+        ids = [
+            (await repository.add_node(NewNode(type="item", name=f"n{i}"))).id
+            for i in range(length)
+        ]
+        for source, target in itertools.pairwise(ids):
+            await repository.add_edge(
+                NewEdge(source_id=source, target_id=target, type="next")
+            )
+        return ids
+
+    return asyncio.run(build())
+
+
+def test_neighbourhood_returns_nodes_by_depth() -> None:
+    repository = InMemoryGraphRepository()
+    ids = _chain(repository, 4)
+    service = GraphService(repository, max_depth=6, max_results=100)
+
+    result = asyncio.run(service.neighbourhood(ids[0], depth=2))
+
+    assert result.origin.id == ids[0]
+    assert [(n.node.id, n.depth) for n in result.neighbours] == [
+        (ids[1], 1),
+        (ids[2], 2),
+    ]
+    assert result.truncated is False
+
+
+def test_neighbourhood_caps_depth() -> None:
+    repository = InMemoryGraphRepository()
+    ids = _chain(repository, 5)
+    service = GraphService(repository, max_depth=2, max_results=100)
+
+    result = asyncio.run(service.neighbourhood(ids[0], depth=10))
+
+    assert result.depth == 2
+    assert [n.node.id for n in result.neighbours] == ids[1:3]
+
+
+def test_neighbourhood_caps_results_and_reports_truncation() -> None:
+    repository = InMemoryGraphRepository()
+    ids = _chain(repository, 5)
+    service = GraphService(repository, max_depth=6, max_results=2)
+
+    result = asyncio.run(service.neighbourhood(ids[0], depth=4))
+
+    assert len(result.neighbours) == 2
+    assert result.truncated is True
+
+
+def test_neighbourhood_respects_direction() -> None:
+    repository = InMemoryGraphRepository()
+    ids = _chain(repository, 3)
+    service = GraphService(repository, max_depth=6, max_results=100)
+
+    outgoing = asyncio.run(
+        service.neighbourhood(ids[1], depth=1, direction=Direction.OUT)
+    )
+    incoming = asyncio.run(
+        service.neighbourhood(ids[1], depth=1, direction=Direction.IN)
+    )
+
+    assert [n.node.id for n in outgoing.neighbours] == [ids[2]]
+    assert [n.node.id for n in incoming.neighbours] == [ids[0]]
+
+
+def test_neighbourhood_filters_edge_types() -> None:
+    repository = InMemoryGraphRepository()
+    ids = _chain(repository, 3)
+    service = GraphService(repository, max_depth=6, max_results=100)
+
+    result = asyncio.run(service.neighbourhood(ids[0], depth=2, edge_types=["other"]))
+
+    assert result.neighbours == []
+
+
+def test_neighbourhood_terminates_on_cycles() -> None:
+    repository = InMemoryGraphRepository()
+    ids = _chain(repository, 3)
+    asyncio.run(
+        repository.add_edge(NewEdge(source_id=ids[2], target_id=ids[0], type="next"))
+    )
+    service = GraphService(repository, max_depth=6, max_results=100)
+
+    result = asyncio.run(service.neighbourhood(ids[0], depth=6))
+
+    assert sorted(n.node.id for n in result.neighbours) == ids[1:]
+
+
+def test_missing_nodes_and_edges_raise() -> None:
+    service = GraphService(InMemoryGraphRepository(), max_depth=6, max_results=100)
+
+    with pytest.raises(NodeNotFoundError):
+        asyncio.run(service.neighbourhood(404))
+    with pytest.raises(NodeNotFoundError):
+        asyncio.run(service.create_edge(NewEdge(source_id=1, target_id=2, type="x")))
+    with pytest.raises(EdgeNotFoundError):
+        asyncio.run(service.delete_edge(404))
+
+
+def test_list_nodes_pages_through_every_node_once() -> None:
+    repository = InMemoryGraphRepository()
+    ids = _chain(repository, 5)
+    service = GraphService(repository, max_depth=6, max_results=100)
+
+    seen: list[int] = []
+    page = asyncio.run(service.list_nodes(PageRequest(limit=2)))
+    while True:
+        seen.extend(node.id for node in page.items)
+        if page.next is None:
+            break
+        page = asyncio.run(service.list_nodes(PageRequest(limit=2, after=page.next)))
+
+    assert seen == ids
+
+
+def test_list_edges_by_direction_counts_self_loops_once() -> None:
+    repository = InMemoryGraphRepository()
+    ids = _chain(repository, 3)
+    asyncio.run(
+        repository.add_edge(NewEdge(source_id=ids[1], target_id=ids[1], type="self"))
+    )
+    service = GraphService(repository, max_depth=6, max_results=100)
+
+    def types(direction: Direction) -> list[str]:
+        page = asyncio.run(
+            service.list_edges(ids[1], PageRequest(limit=10), direction=direction)
+        )
+        return [edge.type for edge in page.items]
+
+    assert types(Direction.OUT) == ["next", "self"]
+    assert types(Direction.IN) == ["next", "self"]
+    assert types(Direction.BOTH) == ["next", "next", "self"]
+
+
+def test_search_ranks_full_matches_first_and_tolerates_typos() -> None:
+    repository = InMemoryGraphRepository()
+
+    async def seed() -> None:
+        for name, properties in [
+            ("Let's Dance", {"artist": "David Bowie", "year": 1983}),
+            ("Modern Love", {"artist": "David Bowie", "year": 1983}),
+            ("David Bowie", {}),
+            ("Duran Duran", {}),
+        ]:
+            await repository.add_node(
+                NewNode(type="item", name=name, properties=properties)
+            )
+
+    asyncio.run(seed())
+    service = GraphService(repository, max_depth=6, max_results=100)
+
+    dance = asyncio.run(service.search("bowie danc"))
+    typo = asyncio.run(service.search("Davd Bowi"))
+
+    assert dance[0].node.name == "Let's Dance"
+    assert "Duran Duran" not in [hit.node.name for hit in dance]
+    assert typo[0].node.name == "David Bowie"
+
+
+def test_search_caps_results_and_ignores_blank_text() -> None:
+    repository = InMemoryGraphRepository()
+    _chain(repository, 5)
+    service = GraphService(
+        repository, max_depth=6, max_results=100, search_max_results=2
+    )
+
+    assert len(asyncio.run(service.search("n", limit=10))) == 2
+    assert asyncio.run(service.search("   ")) == []
+
+
+def test_write_batch_resolves_references_and_upserts_keyed_nodes() -> None:
+    repository = InMemoryGraphRepository()
+    [venue] = _chain(repository, 1)
+    existing = asyncio.run(
+        repository.add_node(NewNode(type="band", name="blur", key="band:blur"))
+    )
+    service = GraphService(repository, max_depth=6, max_results=100)
+
+    result = asyncio.run(
+        service.write_batch(
+            {
+                "gig": NewNode(type="gig", name="Astoria 1994"),
+                "band": NewNode(type="band", name="Blur", key="band:blur"),
+            },
+            [
+                BatchEdge(source="gig", target=venue, type="held_at"),
+                BatchEdge(source="band", target="gig", type="played"),
+            ],
+        )
+    )
+
+    assert result.node_ids["band"] == existing.id
+    assert repository.nodes[existing.id].name == "Blur"
+    gig = result.node_ids["gig"]
+    assert [(e.source_id, e.target_id, e.type) for e in result.edges] == [
+        (gig, venue, "held_at"),
+        (existing.id, gig, "played"),
+    ]
+    assert set(repository.edges) == {edge.id for edge in result.edges}
+
+
+@pytest.mark.parametrize(
+    ("nodes", "edges", "message"),
+    [
+        ({}, [], "empty"),
+        ({str(i): NewNode(type="t", name="n") for i in range(3)}, [], "at most 2"),
+        (
+            {
+                "a": NewNode(type="t", name="a", key="k"),
+                "b": NewNode(type="t", name="b", key="k"),
+            },
+            [],
+            "more than once: k",
+        ),
+        (
+            {"a": NewNode(type="t", name="a")},
+            [BatchEdge(source="a", target="b", type="x")],
+            "unknown node 'b'",
+        ),
+    ],
+)
+def test_write_batch_rejects_invalid_batches(
+    nodes: dict[str, NewNode], edges: list[BatchEdge], message: str
+) -> None:
+    service = GraphService(
+        InMemoryGraphRepository(),
+        max_depth=6,
+        max_results=100,
+        batch_max_nodes=2,
+        batch_max_edges=2,
+    )
+
+    with pytest.raises(InvalidBatchError, match=message):
+        asyncio.run(service.write_batch(nodes, edges))
+
+
+def test_write_batch_writes_nothing_when_a_stored_node_is_missing() -> None:
+    repository = InMemoryGraphRepository()
+    service = GraphService(repository, max_depth=6, max_results=100)
+
+    with pytest.raises(NodeNotFoundError):
+        asyncio.run(
+            service.write_batch(
+                {"a": NewNode(type="t", name="a")},
+                [BatchEdge(source="a", target=404, type="x")],
+            )
+        )
+
+    assert repository.nodes == {}
+    assert repository.edges == {}
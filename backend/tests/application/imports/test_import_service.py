@@ -0,0 +1,163 @@
+import asyncio
+from typing import TYPE_CHECKING
+
+import pytest
+
+from app.application.imports import (
+    EdgeRecord,
+    ImportFormat,
+    ImportFormatError,
+    ImportReport,
+    ImportService,
+    ImportTotals,
+    NodeRecord,
+    RejectedRow,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Sequence
+
+pytestmark = pytest.mark.unit
+
+
+class _RecordingSink:
+    """Keeps staged batches and resolves edges against the staged node keys."""
+
+    def __init__(self) -> None:
+        self.node_batches: list[list[NodeRecord]] = []
+        self.edge_batches: list[list[EdgeRecord]] = []
+        self.finished = 0
+
+    async def add_nodes(self, records: Sequence[NodeRecord]) -> None:
+        self.node_batches.append(list(records))
+
+    async def add_edges(self, records: Sequence[EdgeRecord]) -> None:
+        self.edge_batches.append(list(records))
+
+    async def finish(self, *, error_limit: int) -> ImportTotals:
+        self.finished += 1
+        keys = {n.key for batch in self.node_batches for n in batch}
+        edges = [e for batch in self.edge_batches for e in batch]
+        unresolved = [e.line for e in edges if not {e.source, e.target} <= keys]
+        return ImportTotals(
+            nodes=sum(map(len, self.node_batches)),
+            edges=len(edges) - len(unresolved),
+            unresolved_edge_lines=unresolved[:error_limit],
+            unresolved_edges=len(unresolved),
+        )
+
+
+async def _chunks(body: bytes, size: int) -> AsyncIterator[bytes]:
+    for start in range(0, len(body), size):
+        yield body[start : start + size]
+
+
+def _run(
+    body: bytes,
+    fmt: ImportFormat,
+    *,
+    sink: _RecordingSink | None = None,
+    chunk_size: int = 7,
+    batch_size: int = 100,
+    max_errors: int = 10,
+) -> ImportReport:
+    service = ImportService(
+        sink or _RecordingSink(),
+        batch_size=batch_size,
+        max_errors=max_errors,
+        max_line_bytes=1024,
+    )
+    return asyncio.run(service.run(_chunks(body, chunk_size), fmt))
+
+
+NDJSON = b"""\
+{"key": "bowie", "type": "person", "name": "David Bowie"}
+{"key": "lets-dance", "type": "single", "name": "Let's Dance", "year": 1983}
+
+{"source": "lets-dance", "target": "bowie", "type": "signed_by"}
+not json
+{"source": "lets-dance", "target": "nobody", "type": "signed_by"}
+"""
+
+
+def test_ndjson_import_stages_nodes_and_edges() -> None:
+    sink = _RecordingSink()
+
+    report = _run(NDJSON, ImportFormat.NDJSON, sink=sink)
+
+    assert (report.rows, report.nodes, report.edges) == (5, 2, 1)
+    assert report.rejected == 1
+    assert report.unresolved_edges == 1
+    assert [e.line for e in report.errors] == [5, 6]
+    assert report.errors[1] == RejectedRow(6, "edge endpoint not found")
+    single = sink.node_batches[0][1]
+    assert single.properties == {"year": 1983}
+    assert sink.finished == 1
+
+
+def test_csv_import_handles_bom_crlf_and_multiline_fields() -> None:
+    body = (
+        "﻿Kind,Key,Type,Name,Source,Target,Notes\r\n"
+        'node,a,book,"Dune, 1st ed.",,,"signed\r\non the flyleaf"\r\n'
+        "node,b,person,Frank Herbert,,,\r\n"
+        "edge,,written_by,,a,b,\r\n"
+    ).encode()
+    sink = _RecordingSink()
+
+    report = _run(body, ImportFormat.CSV, sink=sink, chunk_size=5)
+
+    assert (report.rows, report.nodes, report.edges, report.rejected) == (3, 2, 1, 0)
+    dune = sink.node_batches[0][0]
+    assert dune.name == "Dune, 1st ed."
+    assert dune.properties == {"notes": "signed\non the flyleaf"}
+    # Line numbers are physical lines, as an editor shows them.
+    assert sink.edge_batches[0][0].line == 5
+
+
+def test_csv_rows_with_wrong_column_count_are_rejected() -> None:
+    body = b"type,name\nperson,Ada\nperson\n"
+
+    report = _run(body, ImportFormat.CSV)
+
+    assert report.nodes == 1
+    assert report.errors == [RejectedRow(3, "expected 2 columns, got 1")]
+
+
+def test_rows_are_written_in_batches() -> None:
+    body = b"".join(b'{"type": "item", "name": "n%d"}\n' % i for i in range(7))
+    sink = _RecordingSink()
+
+    _run(body, ImportFormat.NDJSON, sink=sink, batch_size=3)
+
+    assert [len(batch) for batch in sink.node_batches] == [3, 3, 1]
+
+
+def test_reported_errors_are_capped() -> None:
+    body = b"[]\n" * 5
+
+    report = _run(body, ImportFormat.NDJSON, max_errors=2)
+
+    assert report.rejected == 5
+    assert len(report.errors) == 2
+
+
+def test_overlong_line_aborts_the_import() -> None:
+    body = b'{"name": "' + b"x" * 2048 + b'"}\n'
+
+    with pytest.raises(ImportFormatError):
+        _run(body, ImportFormat.NDJSON, chunk_size=512)
+
+
+def test_line_limit_counts_bytes_not_characters() -> None:
+    # Under 1024 characters, but over 1024 bytes once encoded.
+    body = ('{"name": "' + "é" * 800 + '"}\n').encode()
+
+    with pytest.raises(ImportFormatError):
+        _run(body, ImportFormat.NDJSON, chunk_size=512)
+
+
+def test_csv_record_limit_counts_bytes_not_characters() -> None:
+    body = ('name\n"' + ("é" * 100 + "\n") * 6 + '"\n').encode()
+
+    with pytest.raises(ImportFormatError):
+        _run(body, ImportFormat.CSV, chunk_size=2048)
@@ -0,0 +1,202 @@
+import asyncio
+from dataclasses import replace
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from app.application.graph import GraphService
+from app.application.node_types import NodeTypeService, ValidatorCache
+from app.domain.graph import NewNode
+from app.domain.node_types import (
+    FieldKind,
+    FieldSpec,
+    IndexState,
+    InvalidNodeTypeError,
+    InvalidPropertiesError,
+    NodeTypeNotFoundError,
+    index_name,
+)
+from app.infrastructure.memory import (
+    InMemoryGraphRepository,
+    InMemoryNodeTypeRepository,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from app.domain.node_types import NodeTypeSchema
+
+pytestmark = pytest.mark.unit
+
+_PRESSING = (
+    FieldSpec(name="label", kind=FieldKind.STRING, required=True),
+    FieldSpec(name="year", kind=FieldKind.INTEGER, filterable=True),
+    FieldSpec(name="rpm", kind=FieldKind.NUMBER),
+    FieldSpec(name="colored", kind=FieldKind.BOOLEAN),
+    FieldSpec(name="tags", kind=FieldKind.LIST, filterable=True),
+)
+
+
+class CountingRepository(InMemoryNodeTypeRepository):
+    """Records each schema lookup, standing in for one query apiece."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.lookups = 0
+
+    async def get_many(self, names: Sequence[str]) -> list[NodeTypeSchema]:
+        self.lookups += 1
+        return await super().get_many(names)
+
+
+def _service(
+    repository: InMemoryNodeTypeRepository | None = None,
+    validators: ValidatorCache | None = None,
+) -> NodeTypeService:
+    return NodeTypeService(
+        repository or InMemoryNodeTypeRepository(),
+        validators or ValidatorCache(capacity=8),
+        max_fields=5,
+    )
+
+
+def _node(node_type: str = "vinyl_pressing", **properties: object) -> NewNode:
+    return NewNode(type=node_type, name="Heroes", properties=properties)
+
+
+def test_defining_a_type_queues_indexes_for_filterable_fields() -> None:
+    repository = InMemoryNodeTypeRepository()
+    service = _service(repository)
+
+    schema = asyncio.run(service.define("vinyl_pressing", _PRESSING))
+    indexes = asyncio.run(service.indexes("vinyl_pressing"))
+
+    assert schema.version == 1
+    assert [(i.field, i.kind, i.state) for i in indexes] == [
+        ("tags", FieldKind.LIST, IndexState.PENDING),
+        ("year", FieldKind.INTEGER, IndexState.PENDING),
+    ]
+    assert indexes[1].name == index_name("vinyl_pressing", "year")
+
+
+def test_redefining_keeps_fitting_indexes_and_drops_the_rest() -> None:
+    repository = InMemoryNodeTypeRepository()
+    service = _service(repository)
+    asyncio.run(service.define("vinyl_pressing", _PRESSING))
+    for key, index in repository.field_indexes.items():
+        repository.field_indexes[key] = replace(index, state=IndexState.READY)
+
+    fields = (
+        replace(_PRESSING[1], kind=FieldKind.NUMBER),
+        replace(_PRESSING[4], filterable=False),
+    )
+    schema = asyncio.run(service.define("vinyl_pressing", fields))
+    indexes = {i.field: i.state for i in asyncio.run(service.indexes("vinyl_pressing"))}
+
+    assert schema.version == 2
+    assert indexes == {"year": IndexState.PENDING, "tags": IndexState.DROPPING}
+
+
+def test_deleting_a_type_queues_its_indexes_for_dropping() -> None:
+    repository = InMemoryNodeTypeRepository()
+    service = _service(repository)
+    asyncio.run(service.define("vinyl_pressing", _PRESSING))
+
+    asyncio.run(service.delete("vinyl_pressing"))
+
+    assert {i.state for i in repository.field_indexes.values()} == {IndexState.DROPPING}
+    with pytest.raises(NodeTypeNotFoundError):
+        asyncio.run(service.get("vinyl_pressing"))
+
+
+@pytest.mark.parametrize(
+    ("name", "fields"),
+    [
+        ("Vinyl Pressing", ()),
+        ("vinyl", (FieldSpec(name="Year", kind=FieldKind.INTEGER),)),
+        ("vinyl", (_PRESSING[0], _PRESSING[0])),
+        ("vinyl", (*_PRESSING, FieldSpec(name="extra", kind=FieldKind.STRING))),
+    ],
+)
+def test_rejects_invalid_definitions(name: str, fields: tuple[FieldSpec, ...]) -> None:
+    with pytest.raises(InvalidNodeTypeError):
+        asyncio.run(_service().define(name, fields))
+
+
+def test_check_accepts_matching_and_extra_properties() -> None:
+    service = _service()
+    asyncio.run(service.define("vinyl_pressing", _PRESSING))
+
+    asyncio.run(
+        service.check(
+            [
+                _node(label="RCA", year=1977, rpm=33.3, colored=False, tags=["a", 1]),
+                _node(label="RCA", rpm=45, musicbrainz={"id": "x"}),
+                _node("person", anything="goes"),
+            ]
+        )
+    )
+
+
+@pytest.mark.parametrize(
+    ("properties", "problem"),
+    [
+        ({}, "label: Field required"),
+        ({"label": "RCA", "year": "1977"}, "year: Input should be a valid integer"),
+        ({"label": "RCA", "colored": 1}, "colored: Input should be a valid boolean"),
+        ({"label": "RCA", "tags": ["a", {"b": 1}]}, "tags.1"),
+    ],
+)
+def test_check_reports_what_is_wrong(properties: dict[str, Any], problem: str) -> None:
+    service = _service()
+    asyncio.run(service.define("vinyl_pressing", _PRESSING))
+
+    with pytest.raises(InvalidPropertiesError) as excinfo:
+        asyncio.run(service.check([_node(**properties)]))
+
+    assert excinfo.value.node_type == "vinyl_pressing"
+    assert any(p.startswith(problem) for p in excinfo.value.problems)
+
+
+def test_validators_are_compiled_once_per_version() -> None:
+    repository = CountingRepository()
+    validators = ValidatorCache(capacity=8)
+    service = _service(repository, validators)
+    asyncio.run(service.define("vinyl_pressing", _PRESSING))
+
+    for _ in range(3):
+        asyncio.run(service.check([_node(label="RCA"), _node(label="EMI")]))
+    assert validators.compiled == 1
+    assert repository.lookups == 3
+
+    asyncio.run(service.define("vinyl_pressing", _PRESSING[:2]))
+    asyncio.run(service.check([_node(label="RCA")]))
+    assert validators.compiled == 2
+
+
+def test_field_names_may_shadow_model_attributes() -> None:
+    service = _service()
+    fields = (
+        FieldSpec(name="json", kind=FieldKind.STRING, required=True),
+        FieldSpec(name="model_config", kind=FieldKind.INTEGER),
+    )
+    asyncio.run(service.define("odd", fields))
+
+    asyncio.run(service.check([_node("odd", json="yes", model_config=1)]))
+    with pytest.raises(InvalidPropertiesError):
+        asyncio.run(service.check([_node("odd", json=1)]))
+
+
+def test_graph_service_checks_nodes_before_storing_them() -> None:
+    graph = InMemoryGraphRepository()
+    node_types = _service()
+    asyncio.run(node_types.define("vinyl_pressing", _PRESSING))
+    service = GraphService(graph, max_depth=3, max_results=10, checker=node_types)
+
+    with pytest.raises(InvalidPropertiesError):
+        asyncio.run(service.create_node(_node(year=1977)))
+    with pytest.raises(InvalidPropertiesError):
+        asyncio.run(service.write_batch({"a": _node(label="RCA"), "b": _node()}, []))
+    stored = asyncio.run(service.create_node(_node(label="RCA")))
+
+    assert list(graph.nodes) == [stored.id]
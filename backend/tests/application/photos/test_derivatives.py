@@ -0,0 +1,110 @@
+import asyncio
+from typing import TYPE_CHECKING
+
+import pytest
+
+from app.application.photos import (
+    DerivativeService,
+    PhotoNotFoundError,
+    StagedPhoto,
+    UnavailableDerivativeError,
+)
+from app.domain.photos import DerivativeFormat
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+pytestmark = pytest.mark.unit
+
+DIGEST = "ab" * 32
+
+
+class _Storage:
+    def __init__(self, root: Path) -> None:
+        self.root = root
+
+    def stage(self) -> StagedPhoto:
+        raise AssertionError("derivatives never store uploads")
+
+    def path(self, digest: str) -> Path:
+        return self.root / digest
+
+    def derivative_path(self, digest: str, *, size: int, fmt: DerivativeFormat) -> Path:
+        return self.root / f"{digest}-{size}.{fmt}"
+
+
+class _Renderer:
+    def __init__(self) -> None:
+        self.rendered: list[tuple[str, int, str]] = []
+        self.scheduled: list[tuple[str, int, str]] = []
+
+    async def render(
+        self, source: Path, target: Path, *, size: int, fmt: str, quality: int
+    ) -> None:
+        self.rendered.append((target.name, size, fmt))
+        target.write_bytes(source.read_bytes()[:size])
+
+    def schedule(
+        self, source: Path, target: Path, *, size: int, fmt: str, quality: int
+    ) -> None:
+        self.scheduled.append((target.name, size, fmt))
+
+
+def _service(root: Path, renderer: _Renderer) -> DerivativeService:
+    return DerivativeService(
+        _Storage(root),
+        renderer,
+        sizes=[320, 64],
+        formats=[DerivativeFormat.WEBP, DerivativeFormat.JPEG],
+        quality=80,
+    )
+
+
+def test_derivative_is_rendered_once_then_reused(tmp_path: Path) -> None:
+    (tmp_path / DIGEST).write_bytes(bytes(1000))
+    renderer = _Renderer()
+    service = _service(tmp_path, renderer)
+
+    async def fetch_twice() -> tuple[Path, Path]:
+        first = await service.derivative(DIGEST, size=64, fmt=DerivativeFormat.JPEG)
+        second = await service.derivative(DIGEST, size=64, fmt=DerivativeFormat.JPEG)
+        return first, second
+
+    first, second = asyncio.run(fetch_twice())
+
+    assert first == second == tmp_path / f"{DIGEST}-64.jpeg"
+    assert first.read_bytes() == bytes(64)
+    assert renderer.rendered == [(first.name, 64, "jpeg")]
+
+
+def test_derivative_of_missing_photo(tmp_path: Path) -> None:
+    service = _service(tmp_path, _Renderer())
+
+    with pytest.raises(PhotoNotFoundError):
+        asyncio.run(service.derivative(DIGEST, size=64, fmt=DerivativeFormat.WEBP))
+
+
+@pytest.mark.parametrize(
+    ("size", "fmt"), [(100, DerivativeFormat.WEBP), (64, DerivativeFormat.PNG)]
+)
+def test_only_configured_derivatives_are_offered(
+    tmp_path: Path, size: int, fmt: DerivativeFormat
+) -> None:
+    (tmp_path / DIGEST).write_bytes(bytes(1000))
+    renderer = _Renderer()
+
+    with pytest.raises(UnavailableDerivativeError):
+        asyncio.run(_service(tmp_path, renderer).derivative(DIGEST, size=size, fmt=fmt))
+
+    assert renderer.rendered == []
+
+
+def test_prefetch_schedules_every_size_in_the_first_format(tmp_path: Path) -> None:
+    renderer = _Renderer()
+
+    _service(tmp_path, renderer).prefetch(DIGEST)
+
+    assert renderer.scheduled == [
+        (f"{DIGEST}-64.webp", 64, "webp"),
+        (f"{DIGEST}-320.webp", 320, "webp"),
+    ]
@@ -0,0 +1,128 @@
+import asyncio
+import hashlib
+from pathlib import Path
+from typing import TYPE_CHECKING
+from unittest.mock import Mock
+
+import pytest
+
+from app.application.photos import (
+    PhotoService,
+    PhotoTooLargeError,
+    UnsupportedPhotoError,
+)
+from app.domain.photos import DerivativeFormat, Photo
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+pytestmark = pytest.mark.unit
+
+PNG = b"\x89PNG\r\n\x1a\n" + bytes(range(256)) * 4
+
+
+class _Staged:
+    def __init__(self, storage: _Storage) -> None:
+        self._storage = storage
+        self.data = b""
+        self.discarded = False
+
+    async def write(self, chunk: bytes) -> None:
+        self.data += chunk
+
+    async def commit(self, digest: str) -> bool:
+        created = digest not in self._storage.files
+        self._storage.files.setdefault(digest, self.data)
+        return created
+
+    async def discard(self) -> None:
+        self.discarded = True
+
+
+class _Storage:
+    def __init__(self) -> None:
+        self.files: dict[str, bytes] = {}
+        self.staged: list[_Staged] = []
+
+    def stage(self) -> _Staged:
+        self.staged.append(_Staged(self))
+        return self.staged[-1]
+
+    def path(self, digest: str) -> Path:
+        return Path("/photos") / digest
+
+    def derivative_path(self, digest: str, *, size: int, fmt: DerivativeFormat) -> Path:
+        return Path("/photos") / f"{digest}-{size}.{fmt}"
+
+
+async def _chunks(data: bytes, size: int = 100) -> AsyncIterator[bytes]:
+    for start in range(0, len(data), size):
+        yield data[start : start + size]
+
+
+def _upload(service: PhotoService, data: bytes) -> tuple[Photo, bool]:
+    return asyncio.run(service.upload(_chunks(data)))
+
+
+def test_upload_stores_photo_under_its_hash() -> None:
+    storage = _Storage()
+
+    photo, created = _upload(PhotoService(storage, max_bytes=10_000), PNG)
+
+    digest = hashlib.sha256(PNG).hexdigest()
+    assert photo == Photo(digest=digest, size=len(PNG), media_type="image/png")
+    assert created
+    assert storage.files == {digest: PNG}
+
+
+def test_uploading_the_same_photo_twice_stores_it_once() -> None:
+    storage = _Storage()
+    service = PhotoService(storage, max_bytes=10_000)
+
+    first, _ = _upload(service, PNG)
+    second, created = _upload(service, PNG)
+
+    assert second == first
+    assert not created
+    assert len(storage.files) == 1
+
+
+def test_upload_rejects_photos_over_the_limit() -> None:
+    storage = _Storage()
+
+    with pytest.raises(PhotoTooLargeError):
+        _upload(PhotoService(storage, max_bytes=500), PNG)
+
+    assert storage.files == {}
+    assert storage.staged[0].discarded
+    # The limit is enforced while streaming, not after reading everything.
+    assert len(storage.staged[0].data) <= 500
+
+
+def test_upload_rejects_non_images_early() -> None:
+    storage = _Storage()
+
+    with pytest.raises(UnsupportedPhotoError):
+        _upload(PhotoService(storage, max_bytes=10_000), b"%PDF-1.7" + bytes(1000))
+
+    assert storage.staged[0].discarded
+    assert storage.staged[0].data == b""
+
+
+def test_upload_accepts_tiny_images() -> None:
+    gif = b"GIF89a\x01\x00"
+
+    photo, _ = _upload(PhotoService(_Storage(), max_bytes=10_000), gif)
+
+    assert photo.media_type == "image/gif"
+
+
+def test_new_photos_get_derivatives_prefetched() -> None:
+    prefetched: list[str] = []
+    derivatives = Mock(prefetch=prefetched.append)
+    service = PhotoService(_Storage(), max_bytes=10_000, derivatives=derivatives)
+
+    photo, _ = _upload(service, PNG)
+    _upload(service, PNG)
+
+    assert prefetched == [photo.digest]
@@ -0,0 +1,84 @@
+import pytest
+
+from app.application.queries import parse_filter
+from app.domain.graph import Direction
+from app.domain.queries import (
+    AllOf,
+    AnyOf,
+    InvalidFilterError,
+    Not,
+    PathExists,
+    PathStep,
+    PropertyIs,
+    PropertyOp,
+    TypeIs,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def test_parses_every_form() -> None:
+    document = {
+        "all": [
+            {"type": "band"},
+            {"property": "formed", "op": "gte", "value": 1990},
+            {"edge": {"direction": "in", "type": "member_of"}},
+            {
+                "path": [{"type": "played_at"}, {"direction": "both"}],
+                "node": {"property": "city", "op": "exists"},
+            },
+            {"any": [{"not": {"property": "genre", "value": "jazz"}}]},
+        ]
+    }
+
+    assert parse_filter(document) == AllOf(
+        (
+            TypeIs("band"),
+            PropertyIs("formed", PropertyOp.GTE, 1990),
+            PathExists((PathStep(Direction.IN, "member_of"),), None),
+            PathExists(
+                (PathStep(Direction.OUT, "played_at"), PathStep(Direction.BOTH)),
+                PropertyIs("city", PropertyOp.EXISTS),
+            ),
+            AnyOf((Not(PropertyIs("genre", PropertyOp.EQ, "jazz")),)),
+        )
+    )
+
+
+@pytest.mark.parametrize(
+    ("document", "path"),
+    [
+        ([], "$"),
+        ({"type": "band", "not": {"type": "gig"}}, "$"),
+        ({"type": ""}, "$.type"),
+        ({"property": "formed", "op": "between", "value": 1}, "$.op"),
+        ({"property": "formed", "op": "gt"}, "$"),
+        ({"property": "genre", "op": "in", "value": "jazz"}, "$.value"),
+        ({"property": "tags", "op": "contains", "value": ["jazz"]}, "$.value"),
+        ({"all": [{"type": "band"}, {"colour": "red"}]}, "$.all[1]"),
+        ({"path": [{"type": "x", "node": {"type": "y"}}]}, "$.path[0]"),
+        ({"edge": {"direction": "sideways"}}, "$.edge.direction"),
+        ({"not": {"edge": {"node": {"type": 3}}}}, "$.not.edge.node.type"),
+    ],
+)
+def test_rejects_invalid_documents_with_their_path(document: object, path: str) -> None:
+    with pytest.raises(InvalidFilterError) as excinfo:
+        parse_filter(document)
+
+    assert excinfo.value.path == path
+
+
+def test_limits_the_number_of_terms() -> None:
+    document = {"any": [{"type": str(i)} for i in range(5)]}
+
+    parse_filter(document, max_terms=6)
+    with pytest.raises(InvalidFilterError, match="more than 5 terms"):
+        parse_filter(document, max_terms=5)
+
+
+def test_limits_the_path_length() -> None:
+    document = {"path": [{"type": "knows"}] * 3}
+
+    parse_filter(document, max_path_length=3)
+    with pytest.raises(InvalidFilterError, match="longer than 2 steps"):
+        parse_filter(document, max_path_length=2)
@@ -0,0 +1,26 @@
+from typing import TYPE_CHECKING
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.application.graph import GraphService
+from app.entrypoints.api.dependencies import get_graph_reader, get_graph_service
+from app.entrypoints.api.main import create_app
+from app.infrastructure.memory import InMemoryGraphRepository
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+
+@pytest.fixture
+def client() -> Generator[TestClient]:
+    """Provide a client for the API over an empty in-memory graph."""
+    repository = InMemoryGraphRepository()
+    app = create_app()
+
+    def service() -> GraphService:
+        return GraphService(repository, max_depth=3, max_results=100)
+
+    app.dependency_overrides[get_graph_service] = service
+    app.dependency_overrides[get_graph_reader] = service
+    yield TestClient(app)
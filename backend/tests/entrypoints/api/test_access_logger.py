@@ -1,94 +1,156 @@
 import asyncio
-from types import SimpleNamespace
-from typing import Any, cast
+import contextlib
+from typing import TYPE_CHECKING, Any
 
 import pytest
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
 pytestmark = pytest.mark.unit
 
 
-# noinspection DuplicatedCode
-def test_access_log_middleware_logs_request_and_response(
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
-    recorded: dict[str, list[tuple[str, dict[str, object]]]] = {
-        "ainfo": [],
-        "aexception": [],
+class FakeLogger:
+    def __init__(self) -> None:
+        self.ainfo_calls: list[tuple[str, dict[str, Any]]] = []
+        self.aexception_calls: list[tuple[str, dict[str, Any]]] = []
+
+    async def ainfo(self, event: str, **kwargs: Any) -> None:
+        self.ainfo_calls.append((event, kwargs))
+
+    async def aexception(self, event: str, **kwargs: Any) -> None:
+        self.aexception_calls.append((event, kwargs))
+
+
+def _scope(path: str, method: str, query_string: bytes = b"") -> dict[str, Any]:
+    return {
+        "type": "http",
+        "path": path,
+        "method": method,
+        "client": ("127.0.0.1", 50000),
+        "query_string": query_string,
+        "headers": [],
     }
 
-    # noinspection PyMethodMayBeStatic
-    class FakeLogger:
-        async def ainfo(self, event: str, **kwargs: Any) -> None:
-            recorded["ainfo"].append((event, kwargs))
 
-        async def aexception(self, event: str, **kwargs: Any) -> None:
-            recorded["aexception"].append((event, kwargs))
+async def _receive() -> dict[str, Any]:
+    return {"type": "http.request", "body": b"", "more_body": False}
 
-    monkeypatch.setattr("structlog.get_logger", lambda name=None: FakeLogger())
 
-    # noinspection PyUnusedLocal,PyShadowingNames
-    async def _call_next(request: Any) -> object:
-        resp = SimpleNamespace()
-        resp.status_code = 201
-        return resp
+def _run(
+    logger: FakeLogger, app: Any, scope: dict[str, Any], rules: Sequence[str] = ()
+) -> list[Any]:
+    from app.entrypoints.api.middlewares.access_logger import AccessLogMiddleware
+    from app.shared.config.api import AccessLogRule
 
-    from app.entrypoints.api.middlewares.access_logger import access_log_middleware
+    sent: list[Any] = []
 
-    request = SimpleNamespace()
-    request.client = SimpleNamespace(host="127.0.0.1")
-    request.url = SimpleNamespace(path="/test")
-    request.method = "GET"
-    request.query_params = {}
+    async def send(message: Any) -> None:
+        sent.append(message)
 
-    result = asyncio.run(
-        cast(Any, access_log_middleware)(cast(Any, request), cast(Any, _call_next))
+    middleware = AccessLogMiddleware(
+        app, rules=[AccessLogRule.model_validate(rule) for rule in rules]
     )
+    middleware.logger = logger
+    asyncio.run(middleware(scope, _receive, send))
+    return sent
 
-    assert any(entry[0] == "http.request" for entry in recorded["ainfo"]) is True
-    resp_logs = [entry[1] for entry in recorded["ainfo"] if entry[0] == "http.response"]
-    assert resp_logs, "http.response not logged"
-    assert resp_logs[0]["status_code"] == 201
-    assert result.status_code == 201
 
+def _responding(status: int, delay: float = 0.0) -> Any:
+    async def app(scope: Any, receive: Any, send: Any) -> None:
+        await asyncio.sleep(delay)
+        await send({"type": "http.response.start", "status": status, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
 
-def test_access_log_middleware_logs_exception(monkeypatch: pytest.MonkeyPatch) -> None:
-    # noinspection DuplicatedCode
-    recorded: dict[str, list[tuple[str, dict[str, object]]]] = {
-        "ainfo": [],
-        "aexception": [],
-    }
+    return app
 
-    # noinspection PyMethodMayBeStatic
-    class FakeLogger:
-        async def ainfo(self, event: str, **kwargs: Any) -> None:
-            recorded["ainfo"].append((event, kwargs))
 
-        async def aexception(self, event: str, **kwargs: Any) -> None:
-            recorded["aexception"].append((event, kwargs))
+def test_access_log_middleware_logs_request_and_response() -> None:
+    logger = FakeLogger()
 
-    monkeypatch.setattr("structlog.get_logger", lambda name=None: FakeLogger())
+    async def app(scope: Any, receive: Any, send: Any) -> None:
+        await send({"type": "http.response.start", "status": 201, "headers": []})
+        await send({"type": "http.response.body", "body": b"{}"})
 
-    # noinspection PyUnusedLocal,PyShadowingNames
-    async def _call_next(request: Any) -> object:
-        raise RuntimeError("boom")
+    sent = _run(logger, app, _scope("/test", "GET", b"a=1&b=x+y"))
+
+    assert logger.ainfo_calls[0] == (
+        "http.request",
+        {"path": "/test", "method": "GET", "client": "127.0.0.1", "query": "a=1&b=x+y"},
+    )
+    event, response_data = logger.ainfo_calls[1]
+    assert event == "http.response"
+    assert response_data["status_code"] == 201
+    assert response_data["duration_ms"] >= 0
+    assert [message["type"] for message in sent] == [
+        "http.response.start",
+        "http.response.body",
+    ]
 
-    from app.entrypoints.api.middlewares.access_logger import access_log_middleware
 
-    request = SimpleNamespace()
-    request.client = SimpleNamespace(host="127.0.0.1")
-    request.url = SimpleNamespace(path="/error")
-    request.method = "POST"
-    request.query_params = {}
+def test_access_log_middleware_logs_exception() -> None:
+    logger = FakeLogger()
 
-    import contextlib
+    async def app(scope: Any, receive: Any, send: Any) -> None:
+        raise RuntimeError("boom")
 
     with contextlib.suppress(RuntimeError):
-        asyncio.run(
-            cast(Any, access_log_middleware)(cast(Any, request), cast(Any, _call_next))
-        )
-
-    # exception log should have been recorded
-    assert (
-        any(entry[0] == "http.response.exception" for entry in recorded["aexception"])
-        is True
+        _run(logger, app, _scope("/error", "POST"))
+
+    assert [event for event, _ in logger.ainfo_calls] == ["http.request"]
+    assert logger.aexception_calls[0][0] == "http.response.exception"
+    assert logger.aexception_calls[0][1]["path"] == "/error"
+
+
+@pytest.mark.parametrize(
+    ("path", "logged"),
+    [("/api/health", False), ("/api/v1/nodes", True), ("/api/other", False)],
+)
+def test_longest_matching_prefix_decides(path: str, logged: bool) -> None:
+    logger = FakeLogger()
+    rules = ["/api/health=never", "/api=never", "/api/v1=always"]
+
+    sent = _run(logger, _responding(200), _scope(path, "GET"), rules)
+
+    assert [event for event, _ in logger.ainfo_calls] == (
+        ["http.request", "http.response"] if logged else []
+    )
+    assert sent[0]["status"] == 200
+
+
+@pytest.mark.parametrize(("percent", "logged"), [("10", False), ("60", True)])
+def test_sampled_requests(
+    monkeypatch: pytest.MonkeyPatch, percent: str, logged: bool
+) -> None:
+    monkeypatch.setattr("random.random", lambda: 0.5)
+    logger = FakeLogger()
+
+    _run(logger, _responding(200), _scope("/api", "GET"), [f"/=sample:{percent}"])
+
+    assert bool(logger.ainfo_calls) is logged
+
+
+@pytest.mark.parametrize(("delay", "logged"), [(0.0, False), (0.05, True)])
+def test_only_slow_requests(delay: float, logged: bool) -> None:
+    logger = FakeLogger()
+
+    _run(logger, _responding(200, delay), _scope("/thumb", "GET"), ["/=slow:40"])
+
+    if logged:
+        [(event, data)] = logger.ainfo_calls
+        assert event == "http.response"
+        assert data["path"] == "/thumb"
+        assert data["duration_ms"] >= 40
+    else:
+        assert logger.ainfo_calls == []
+
+
+@pytest.mark.parametrize(("status", "logged"), [(200, False), (404, True)])
+def test_only_errors(status: int, logged: bool) -> None:
+    logger = FakeLogger()
+
+    _run(logger, _responding(status), _scope("/thumb", "GET"), ["/=errors"])
+
+    assert [event for event, _ in logger.ainfo_calls] == (
+        ["http.response"] if logged else []
     )
@@ -1,43 +1,49 @@
 import asyncio
-from types import SimpleNamespace
-from typing import Any, cast
+from typing import Any
 
 import pytest
 
 pytestmark = pytest.mark.unit
 
 
-def test_app_response_headers_middleware_applies_settings(
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
+def test_app_headers_middleware_adds_headers() -> None:
     """The middleware should attach application name/version headers to the response."""
-    from app.shared.config import Settings
-    from app.shared.config.app_info import ApplicationInfo
+    from app.entrypoints.api.middlewares.app_headers import AppHeadersMiddleware
 
-    settings = Settings(app=ApplicationInfo(display_name="TestApp", version="9.9.9"))
+    async def app(scope: Any, receive: Any, send: Any) -> None:
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
 
-    monkeypatch.setattr(
-        "app.entrypoints.api.middlewares.app_headers.get_settings", lambda: settings
-    )
+    sent: list[Any] = []
 
-    # noinspection PyUnusedLocal,PyShadowingNames
-    async def _call_next(request: Any) -> object:
-        resp = SimpleNamespace()
-        resp.headers = {}
-        resp.status_code = 200
-        return resp
+    async def receive() -> dict[str, Any]:
+        return {"type": "http.request", "body": b"", "more_body": False}
 
-    from app.entrypoints.api.middlewares.app_headers import (
-        app_response_headers_middleware,
-    )
+    async def send(message: Any) -> None:
+        sent.append(message)
+
+    middleware = AppHeadersMiddleware(app, name="TestApp", version="9.9.9")
+    asyncio.run(middleware({"type": "http"}, receive, send))
+
+    assert sent[0]["headers"] == [
+        (b"application-name", b"TestApp"),
+        (b"application-version", b"9.9.9"),
+    ]
+    assert "headers" not in sent[1]
+
+
+def test_app_responses_carry_app_and_request_id_headers() -> None:
+    from fastapi.testclient import TestClient
+
+    from app.entrypoints.api.main import create_app
+    from app.shared.config import get_settings
 
-    request = SimpleNamespace()
+    settings = get_settings()
 
-    result = asyncio.run(
-        cast(Any, app_response_headers_middleware)(
-            cast(Any, request), cast(Any, _call_next)
-        )
+    response = TestClient(create_app()).get(
+        "/api/health", headers={"X-Request-ID": "req-abc"}
     )
 
-    assert result.headers["Application-Name"] == "TestApp"
-    assert result.headers["Application-Version"] == "9.9.9"
+    assert response.headers["Application-Name"] == settings.app.display_name
+    assert response.headers["Application-Version"] == settings.app.version
+    assert response.headers["X-Request-ID"] == "req-abc"
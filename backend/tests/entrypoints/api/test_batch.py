@@ -0,0 +1,90 @@
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.application.graph import GraphService
+from app.entrypoints.api.dependencies import get_graph_service
+from app.entrypoints.api.main import create_app
+from app.infrastructure.memory import InMemoryGraphRepository
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def repository() -> InMemoryGraphRepository:
+    return InMemoryGraphRepository()
+
+
+@pytest.fixture
+def client(repository: InMemoryGraphRepository) -> Generator[TestClient]:
+    app = create_app()
+    app.dependency_overrides[get_graph_service] = lambda: GraphService(
+        repository, max_depth=3, max_results=100, batch_max_edges=3
+    )
+    yield TestClient(app)
+
+
+def test_batch_writes_a_gig_in_one_request(client: TestClient) -> None:
+    venue = client.post("/api/v1/nodes", json={"type": "venue", "name": "Astoria"})
+    venue_id = venue.json()["id"]
+
+    response = client.post(
+        "/api/v1/batch",
+        json={
+            "nodes": [
+                {"ref": "gig", "type": "gig", "name": "Astoria 1994"},
+                {"ref": "band", "type": "band", "name": "Blur", "key": "band:blur"},
+            ],
+            "edges": [
+                {"source": "gig", "target": venue_id, "type": "held_at"},
+                {"source": "band", "target": "gig", "type": "played"},
+            ],
+        },
+    )
+
+    assert response.status_code == 201
+    body = response.json()
+    assert set(body["nodes"]) == {"gig", "band"}
+    gig, band = body["nodes"]["gig"], body["nodes"]["band"]
+    assert [(e["source_id"], e["target_id"]) for e in body["edges"]] == [
+        (gig, venue_id),
+        (band, gig),
+    ]
+    assert client.get(f"/api/v1/nodes/{gig}").json()["name"] == "Astoria 1994"
+
+
+def test_batch_is_all_or_nothing(
+    client: TestClient, repository: InMemoryGraphRepository
+) -> None:
+    response = client.post(
+        "/api/v1/batch",
+        json={
+            "nodes": [{"ref": "gig", "type": "gig", "name": "Astoria 1994"}],
+            "edges": [{"source": "gig", "target": 404, "type": "held_at"}],
+        },
+    )
+
+    assert response.status_code == 422
+    assert repository.nodes == {}
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        {},
+        {
+            "nodes": [
+                {"ref": "a", "type": "t", "name": "a"},
+                {"ref": "a", "type": "t", "name": "b"},
+            ]
+        },
+        {"edges": [{"source": "nowhere", "target": 1, "type": "x"}]},
+        {"edges": [{"source": 1, "target": 1, "type": "x"}] * 4},
+    ],
+)
+def test_invalid_batches_are_rejected(client: TestClient, body: dict[str, Any]) -> None:
+    assert client.post("/api/v1/batch", json=body).status_code == 422
@@ -0,0 +1,149 @@
+from typing import TYPE_CHECKING
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.application.graph import GraphService
+from app.entrypoints.api.dependencies import get_graph_service
+from app.entrypoints.api.main import create_app
+from app.infrastructure.memory import InMemoryGraphRepository
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Sequence
+
+    from app.domain.graph import Direction, Edge, Node
+    from app.domain.pagination import Position
+
+pytestmark = pytest.mark.unit
+
+
+class CountingRepository(InMemoryGraphRepository):
+    """Records the reads a request makes, standing in for one query apiece."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.queries: list[str] = []
+
+    async def get_node(self, node_id: int) -> Node | None:
+        self.queries.append("get_node")
+        return await super().get_node(node_id)
+
+    async def get_nodes(self, node_ids: Sequence[int]) -> list[Node]:
+        self.queries.append("get_nodes")
+        return await super().get_nodes(node_ids)
+
+    async def get_edges(self, edge_ids: Sequence[int]) -> list[Edge]:
+        self.queries.append("get_edges")
+        return await super().get_edges(edge_ids)
+
+    async def list_edges(
+        self,
+        node_id: int,
+        *,
+        direction: Direction,
+        edge_types: Sequence[str] | None,
+        after: Position | None,
+        limit: int,
+    ) -> list[Edge]:
+        self.queries.append("list_edges")
+        return await super().list_edges(
+            node_id,
+            direction=direction,
+            edge_types=edge_types,
+            after=after,
+            limit=limit,
+        )
+
+
+@pytest.fixture
+def repository() -> CountingRepository:
+    return CountingRepository()
+
+
+@pytest.fixture
+def client(repository: CountingRepository) -> Generator[TestClient]:
+    app = create_app()
+    app.dependency_overrides[get_graph_service] = lambda: GraphService(
+        repository, max_depth=3, max_results=100
+    )
+    yield TestClient(app)
+
+
+def _create(client: TestClient, name: str) -> int:
+    response = client.post("/api/v1/nodes", json={"type": "person", "name": name})
+    assert response.status_code == 201
+    return int(response.json()["id"])
+
+
+def _connect(client: TestClient, source: int, target: int) -> int:
+    response = client.post(
+        "/api/v1/edges",
+        json={"source_id": source, "target_id": target, "type": "knows"},
+    )
+    assert response.status_code == 201
+    return int(response.json()["id"])
+
+
+def test_expanded_edges_load_their_nodes_in_one_query(
+    client: TestClient, repository: CountingRepository
+) -> None:
+    hub = _create(client, "Hub")
+    others = [_create(client, f"Other {i}") for i in range(10)]
+    for other in others:
+        _connect(client, hub, other)
+        _connect(client, other, hub)
+    repository.queries.clear()
+
+    response = client.get(
+        f"/api/v1/nodes/{hub}/edges", params={"expand": "true", "limit": 20}
+    )
+
+    assert response.status_code == 200
+    items = response.json()["items"]
+    assert len(items) == 20
+    for item in items:
+        assert item["source"]["id"] == item["source_id"]
+        assert item["target"]["id"] == item["target_id"]
+    assert repository.queries == ["get_node", "list_edges", "get_nodes"]
+
+
+def test_edges_are_not_expanded_by_default(
+    client: TestClient, repository: CountingRepository
+) -> None:
+    a, b = _create(client, "A"), _create(client, "B")
+    _connect(client, a, b)
+    repository.queries.clear()
+
+    item = client.get(f"/api/v1/nodes/{a}/edges").json()["items"][0]
+
+    assert set(item) == {"id", "source_id", "target_id", "type", "properties"}
+    assert repository.queries == ["get_node", "list_edges"]
+
+
+def test_get_expanded_edge(client: TestClient, repository: CountingRepository) -> None:
+    a, b = _create(client, "A"), _create(client, "B")
+    edge_id = _connect(client, a, b)
+    repository.queries.clear()
+
+    response = client.get(f"/api/v1/edges/{edge_id}", params={"expand": "true"})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert (body["source"]["name"], body["target"]["name"]) == ("A", "B")
+    assert repository.queries == ["get_edges", "get_nodes"]
+
+
+def test_get_edge(client: TestClient) -> None:
+    a, b = _create(client, "A"), _create(client, "B")
+    edge_id = _connect(client, a, b)
+
+    response = client.get(f"/api/v1/edges/{edge_id}")
+
+    assert response.json() == {
+        "id": edge_id,
+        "source_id": a,
+        "target_id": b,
+        "type": "knows",
+        "properties": {},
+    }
+    assert client.get("/api/v1/edges/999").status_code == 404
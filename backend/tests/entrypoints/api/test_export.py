@@ -0,0 +1,77 @@
+import asyncio
+import gzip
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.application.exports import ExportService
+from app.domain.graph import NewEdge, NewNode
+from app.entrypoints.api.dependencies import get_export_service
+from app.entrypoints.api.main import create_app
+from app.infrastructure.memory import InMemoryGraphRepository
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Generator
+
+    from app.domain.graph import Edge, Node
+
+pytestmark = pytest.mark.unit
+
+
+class _RepositorySource:
+    def __init__(self, repository: InMemoryGraphRepository) -> None:
+        self._repository = repository
+
+    async def nodes(self) -> AsyncIterator[Node]:
+        for node in self._repository.nodes.values():
+            yield node
+
+    async def edges(self) -> AsyncIterator[Edge]:
+        for edge in self._repository.edges.values():
+            yield edge
+
+
+@pytest.fixture
+def client() -> Generator[TestClient]:
+    repository = InMemoryGraphRepository()
+
+    async def seed() -> None:
+        ada = await repository.add_node(NewNode(type="person", name="Ada", key="a"))
+        bo = await repository.add_node(NewNode(type="person", name="Bo"))
+        await repository.add_edge(
+            NewEdge(source_id=ada.id, target_id=bo.id, type="knows")
+        )
+
+    asyncio.run(seed())
+    app = create_app()
+    app.dependency_overrides[get_export_service] = lambda: ExportService(
+        _RepositorySource(repository), chunk_bytes=1024
+    )
+    yield TestClient(app)
+
+
+def test_export_streams_ndjson(client: TestClient) -> None:
+    response = client.get("/api/v1/export")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert "menagerist-export.ndjson" in response.headers["content-disposition"]
+    records = [json.loads(line) for line in response.content.splitlines()]
+    assert [(r["kind"], r["id"]) for r in records] == [
+        ("node", 1),
+        ("node", 2),
+        ("edge", 1),
+    ]
+
+
+def test_export_can_be_gzipped(client: TestClient) -> None:
+    plain = client.get("/api/v1/export").content
+
+    response = client.get("/api/v1/export", params={"gzip": True})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/gzip"
+    assert "ndjson.gz" in response.headers["content-disposition"]
+    assert gzip.decompress(response.content) == plain
@@ -0,0 +1,87 @@
+from typing import TYPE_CHECKING
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.application.imports import ImportService, ImportTotals
+from app.entrypoints.api.dependencies import get_import_service
+from app.entrypoints.api.main import create_app
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Sequence
+
+    from app.application.imports import EdgeRecord, NodeRecord
+
+pytestmark = pytest.mark.unit
+
+
+class _CountingSink:
+    def __init__(self) -> None:
+        self.nodes = 0
+        self.edges = 0
+
+    async def add_nodes(self, records: Sequence[NodeRecord]) -> None:
+        self.nodes += len(records)
+
+    async def add_edges(self, records: Sequence[EdgeRecord]) -> None:
+        self.edges += len(records)
+
+    async def finish(self, *, error_limit: int) -> ImportTotals:
+        return ImportTotals(
+            nodes=self.nodes,
+            edges=self.edges,
+            unresolved_edge_lines=[],
+            unresolved_edges=0,
+        )
+
+
+@pytest.fixture
+def client() -> Generator[TestClient]:
+    app = create_app()
+    app.dependency_overrides[get_import_service] = lambda: ImportService(
+        _CountingSink(), batch_size=2, max_errors=10, max_line_bytes=1024
+    )
+    yield TestClient(app)
+
+
+def test_import_csv_body(client: TestClient) -> None:
+    body = b"key,type,name,source,target\na,person,Ada,,\nb,person,Bo,,\n,knows,,a,b\n"
+
+    response = client.post(
+        "/api/v1/import", content=body, headers={"Content-Type": "text/csv"}
+    )
+
+    assert response.status_code == 200
+    report = response.json()
+    assert (report["rows"], report["nodes"], report["edges"]) == (3, 2, 1)
+    assert report["errors"] == []
+    assert report["rows_per_second"] >= 0
+
+
+def test_import_format_query_overrides_content_type(client: TestClient) -> None:
+    response = client.post(
+        "/api/v1/import?format=ndjson",
+        content=b'{"type": "person", "name": "Ada"}\n{"type": "person"}\n',
+        headers={"Content-Type": "text/plain"},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["errors"] == [{"line": 2, "reason": "missing 'name'"}]
+
+
+def test_import_rejects_unknown_media_type(client: TestClient) -> None:
+    response = client.post(
+        "/api/v1/import", content=b"", headers={"Content-Type": "application/pdf"}
+    )
+
+    assert response.status_code == 415
+
+
+def test_import_rejects_unparseable_body(client: TestClient) -> None:
+    response = client.post(
+        "/api/v1/import",
+        content=b"x" * 4096,
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+
+    assert response.status_code == 422
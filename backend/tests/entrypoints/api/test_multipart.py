@@ -0,0 +1,71 @@
+import asyncio
+from typing import TYPE_CHECKING
+
+import pytest
+
+from app.entrypoints.api.v1.photos.multipart import (
+    MultipartError,
+    boundary,
+    file_part,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+pytestmark = pytest.mark.unit
+
+BOUNDARY = b"----boundary7MA4YWxk"
+
+
+def _body(*parts: tuple[str, bytes]) -> bytes:
+    body = b"preamble"
+    for name, content in parts:
+        body += (
+            b"\r\n--" + BOUNDARY + b"\r\n"
+            b'Content-Disposition: form-data; name="' + name.encode() + b'"; '
+            b'filename="scan.jpg"\r\nContent-Type: image/jpeg\r\n\r\n' + content
+        )
+    return body + b"\r\n--" + BOUNDARY + b"--\r\n"
+
+
+async def _chunks(data: bytes, size: int) -> AsyncIterator[bytes]:
+    for start in range(0, len(data), size):
+        yield data[start : start + size]
+
+
+def _read(body: bytes, *, size: int, field: str = "file") -> bytes:
+    async def read() -> bytes:
+        parts = [
+            part async for part in file_part(_chunks(body, size), BOUNDARY, field=field)
+        ]
+        return b"".join(parts)
+
+    return asyncio.run(read())
+
+
+def test_boundary_is_read_from_the_content_type() -> None:
+    content_type = 'multipart/form-data; boundary="----boundary7MA4YWxk"'
+
+    assert boundary(content_type) == BOUNDARY
+    assert boundary("image/jpeg") is None
+
+
+@pytest.mark.parametrize("size", [1, 7, 64, 4096])
+def test_file_part_survives_any_chunking(size: int) -> None:
+    # Content that almost, but not quite, contains the delimiter.
+    content = b"\xff\xd8\xff" + b"\r\n--" + BOUNDARY[:-1] + b"x" + bytes(200)
+    body = _body(("caption", b"hello"), ("file", content), ("other", b"x"))
+
+    assert _read(body, size=size) == content
+
+
+def test_file_part_requires_the_field() -> None:
+    with pytest.raises(MultipartError, match="no 'file' part"):
+        _read(_body(("caption", b"hello")), size=16)
+
+
+def test_file_part_rejects_truncated_bodies() -> None:
+    body = _body(("file", b"data"))[:-30]
+
+    with pytest.raises(MultipartError, match="ended unexpectedly"):
+        _read(body, size=16)
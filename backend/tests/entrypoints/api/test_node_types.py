@@ -0,0 +1,123 @@
+from typing import TYPE_CHECKING
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.application.graph import GraphService
+from app.application.node_types import NodeTypeService, ValidatorCache
+from app.entrypoints.api.dependencies import get_graph_service, get_node_type_service
+from app.entrypoints.api.main import create_app
+from app.infrastructure.memory import (
+    InMemoryGraphRepository,
+    InMemoryNodeTypeRepository,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+pytestmark = pytest.mark.unit
+
+_PRESSING = {
+    "fields": [
+        {"name": "label", "kind": "string", "required": True},
+        {"name": "year", "kind": "integer", "filterable": True},
+    ]
+}
+
+
+@pytest.fixture
+def client() -> Generator[TestClient]:
+    node_types = NodeTypeService(
+        InMemoryNodeTypeRepository(), ValidatorCache(capacity=8), max_fields=10
+    )
+    graph = GraphService(
+        InMemoryGraphRepository(), max_depth=3, max_results=100, checker=node_types
+    )
+    app = create_app()
+    app.dependency_overrides[get_node_type_service] = lambda: node_types
+    app.dependency_overrides[get_graph_service] = lambda: graph
+    yield TestClient(app)
+
+
+def test_defines_and_redefines_a_node_type(client: TestClient) -> None:
+    first = client.put("/api/v1/node-types/vinyl_pressing", json=_PRESSING)
+    second = client.put("/api/v1/node-types/vinyl_pressing", json=_PRESSING)
+
+    assert first.status_code == 200
+    assert first.json()["version"] == 1
+    assert second.json()["version"] == 2
+    body = client.get("/api/v1/node-types/vinyl_pressing").json()
+    assert [field["name"] for field in body["fields"]] == ["label", "year"]
+    assert [t["name"] for t in client.get("/api/v1/node-types").json()] == [
+        "vinyl_pressing"
+    ]
+
+
+def test_reports_the_state_of_field_indexes(client: TestClient) -> None:
+    client.put("/api/v1/node-types/vinyl_pressing", json=_PRESSING)
+
+    response = client.get("/api/v1/node-types/vinyl_pressing/indexes")
+
+    assert response.status_code == 200
+    assert [(i["field"], i["state"]) for i in response.json()] == [("year", "pending")]
+
+
+def test_rejects_invalid_definitions(client: TestClient) -> None:
+    fields = {"fields": [_PRESSING["fields"][0], _PRESSING["fields"][0]]}
+
+    response = client.put("/api/v1/node-types/vinyl_pressing", json=fields)
+
+    assert response.status_code == 422
+    assert "more than once" in response.json()["detail"]
+
+
+def test_unknown_types_are_not_found(client: TestClient) -> None:
+    assert client.get("/api/v1/node-types/nope").status_code == 404
+    assert client.get("/api/v1/node-types/nope/indexes").status_code == 404
+    assert client.delete("/api/v1/node-types/nope").status_code == 404
+
+
+def test_deleting_a_type_lifts_its_schema(client: TestClient) -> None:
+    client.put("/api/v1/node-types/vinyl_pressing", json=_PRESSING)
+    node = {"type": "vinyl_pressing", "name": "Heroes", "properties": {}}
+
+    assert client.post("/api/v1/nodes", json=node).status_code == 422
+    assert client.delete("/api/v1/node-types/vinyl_pressing").status_code == 204
+    assert client.post("/api/v1/nodes", json=node).status_code == 201
+
+
+def test_nodes_are_checked_against_their_schema(client: TestClient) -> None:
+    client.put("/api/v1/node-types/vinyl_pressing", json=_PRESSING)
+
+    created = client.post(
+        "/api/v1/nodes",
+        json={
+            "type": "vinyl_pressing",
+            "name": "Heroes",
+            "properties": {"label": "RCA", "year": 1977},
+        },
+    )
+    rejected = client.post(
+        "/api/v1/nodes",
+        json={
+            "type": "vinyl_pressing",
+            "name": "Heroes",
+            "properties": {"label": "RCA", "year": "1977"},
+        },
+    )
+    batch = client.post(
+        "/api/v1/batch",
+        json={
+            "nodes": [
+                {"ref": "a", "type": "vinyl_pressing", "name": "Low"},
+                {"ref": "b", "type": "band", "name": "Bowie"},
+            ],
+            "edges": [],
+        },
+    )
+
+    assert created.status_code == 201
+    assert rejected.status_code == 422
+    assert "year: Input should be a valid integer" in rejected.json()["detail"]
+    assert batch.status_code == 422
+    assert "label: Field required" in batch.json()["detail"]
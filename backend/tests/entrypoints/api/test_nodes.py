@@ -0,0 +1,142 @@
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from fastapi.testclient import TestClient
+
+pytestmark = pytest.mark.unit
+
+
+def _create(client: TestClient, name: str) -> int:
+    response = client.post("/api/v1/nodes", json={"type": "person", "name": name})
+    assert response.status_code == 201
+    return int(response.json()["id"])
+
+
+def test_create_and_get_node(client: TestClient) -> None:
+    node_id = _create(client, "David Bowie")
+
+    response = client.get(f"/api/v1/nodes/{node_id}")
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "id": node_id,
+        "key": None,
+        "type": "person",
+        "name": "David Bowie",
+        "properties": {},
+    }
+
+
+def test_get_missing_node_returns_404(client: TestClient) -> None:
+    assert client.get("/api/v1/nodes/999").status_code == 404
+
+
+def test_neighbourhood_endpoint(client: TestClient) -> None:
+    bowie = _create(client, "David Bowie")
+    single = _create(client, "Let's Dance")
+    venue = _create(client, "Wembley")
+    for source, target, edge_type in [
+        (single, bowie, "signed_by"),
+        (bowie, venue, "performed_at"),
+    ]:
+        response = client.post(
+            "/api/v1/edges",
+            json={"source_id": source, "target_id": target, "type": edge_type},
+        )
+        assert response.status_code == 201
+
+    response = client.get(
+        f"/api/v1/nodes/{single}/neighbourhood",
+        params={"depth": 5, "direction": "both"},
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["depth"] == 3
+    assert [(n["id"], n["depth"]) for n in body["neighbours"]] == [
+        (bowie, 1),
+        (venue, 2),
+    ]
+    assert body["truncated"] is False
+
+    filtered = client.get(
+        f"/api/v1/nodes/{single}/neighbourhood",
+        params={"depth": 2, "edge_types": ["signed_by"]},
+    )
+    assert [n["id"] for n in filtered.json()["neighbours"]] == [bowie]
+
+
+def test_edge_to_missing_node_is_rejected(client: TestClient) -> None:
+    node_id = _create(client, "David Bowie")
+
+    response = client.post(
+        "/api/v1/edges",
+        json={"source_id": node_id, "target_id": 999, "type": "signed_by"},
+    )
+
+    assert response.status_code == 422
+
+
+def test_delete_node_and_edge(client: TestClient) -> None:
+    a = _create(client, "a")
+    b = _create(client, "b")
+    edge = client.post(
+        "/api/v1/edges", json={"source_id": a, "target_id": b, "type": "x"}
+    ).json()
+
+    assert client.delete(f"/api/v1/edges/{edge['id']}").status_code == 204
+    assert client.delete(f"/api/v1/edges/{edge['id']}").status_code == 404
+    assert client.delete(f"/api/v1/nodes/{a}").status_code == 204
+    assert client.get(f"/api/v1/nodes/{a}").status_code == 404
+
+
+def test_list_nodes_follows_cursors_to_the_last_page(client: TestClient) -> None:
+    ids = [_create(client, name) for name in ("A", "B", "C", "D", "E")]
+
+    seen: list[int] = []
+    params: dict[str, str | int] = {"type": "person", "limit": 2}
+    while True:
+        response = client.get("/api/v1/nodes", params=params)
+        assert response.status_code == 200
+        body = response.json()
+        seen.extend(item["id"] for item in body["items"])
+        if body["next_cursor"] is None:
+            break
+        params["cursor"] = body["next_cursor"]
+
+    assert seen == ids
+
+
+def test_list_edges_of_a_node(client: TestClient) -> None:
+    band = _create(client, "Band")
+    venues = [_create(client, f"Venue {i}") for i in range(3)]
+    for venue in venues:
+        client.post(
+            "/api/v1/edges",
+            json={"source_id": band, "target_id": venue, "type": "performed_at"},
+        )
+
+    response = client.get(
+        f"/api/v1/nodes/{band}/edges", params={"direction": "out", "limit": 2}
+    )
+
+    body = response.json()
+    assert [edge["target_id"] for edge in body["items"]] == venues[:2]
+    following = client.get(
+        f"/api/v1/nodes/{band}/edges",
+        params={"direction": "out", "limit": 2, "cursor": body["next_cursor"]},
+    ).json()
+    assert [edge["target_id"] for edge in following["items"]] == venues[2:]
+    assert following["next_cursor"] is None
+
+
+def test_list_edges_of_missing_node_returns_404(client: TestClient) -> None:
+    assert client.get("/api/v1/nodes/999/edges").status_code == 404
+
+
+def test_invalid_cursor_returns_400(client: TestClient) -> None:
+    response = client.get("/api/v1/nodes", params={"cursor": "not-a-cursor"})
+
+    assert response.status_code == 400
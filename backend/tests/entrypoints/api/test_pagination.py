@@ -0,0 +1,21 @@
+import pytest
+
+from app.domain.pagination import Position
+from app.entrypoints.api.v1.pagination import decode_cursor, encode_cursor
+
+pytestmark = pytest.mark.unit
+
+
+def test_cursor_round_trips() -> None:
+    position = Position("performed at / ✓", 9_007_199_254_740_993)
+
+    cursor = encode_cursor(position)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == position
+
+
+@pytest.mark.parametrize("cursor", ["%%%", "bm90IGpzb24", "WzEsMl0", "eyJhIjoxfQ"])
+def test_malformed_cursors_are_rejected(cursor: str) -> None:
+    with pytest.raises(ValueError, match="malformed cursor"):
+        decode_cursor(cursor)
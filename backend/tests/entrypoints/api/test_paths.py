@@ -0,0 +1,70 @@
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from fastapi.testclient import TestClient
+
+pytestmark = pytest.mark.unit
+
+
+def _node(client: TestClient, node_type: str, name: str) -> int:
+    response = client.post("/api/v1/nodes", json={"type": node_type, "name": name})
+    return int(response.json()["id"])
+
+
+def _edge(client: TestClient, source_id: int, target_id: int, edge_type: str) -> None:
+    body = {"source_id": source_id, "target_id": target_id, "type": edge_type}
+    client.post("/api/v1/edges", json=body)
+
+
+def test_paths_connect_two_nodes_shortest_first(client: TestClient) -> None:
+    poster = _node(client, "item", "Signed poster")
+    gig = _node(client, "gig", "Astoria 1994")
+    band = _node(client, "band", "Blur")
+    venue = _node(client, "venue", "Astoria")
+    _edge(client, poster, gig, "from_gig")
+    _edge(client, gig, venue, "held_at")
+    _edge(client, poster, band, "signed_by")
+    _edge(client, band, gig, "played")
+
+    response = client.get("/api/v1/paths", params={"from": poster, "to": venue, "k": 3})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert (body["origin"]["id"], body["destination"]["id"]) == (poster, venue)
+    assert [[n["name"] for n in path["nodes"]] for path in body["paths"]] == [
+        ["Signed poster", "Astoria 1994", "Astoria"],
+        ["Signed poster", "Blur", "Astoria 1994", "Astoria"],
+    ]
+    assert body["paths"][0]["length"] == 2
+    assert body["paths"][0]["links"] == [
+        {"source_id": poster, "target_id": gig, "type": "from_gig"},
+        {"source_id": gig, "target_id": venue, "type": "held_at"},
+    ]
+    assert body["max_depth"] == 3
+    assert body["truncated"] is False
+
+
+def test_paths_follow_only_the_requested_edge_types(client: TestClient) -> None:
+    a = _node(client, "person", "a")
+    b = _node(client, "person", "b")
+    _edge(client, a, b, "knows")
+
+    response = client.get(
+        "/api/v1/paths", params={"from": a, "to": b, "edge_types": ["member_of"]}
+    )
+
+    assert response.json()["paths"] == []
+
+
+def test_paths_between_missing_nodes_are_not_found(client: TestClient) -> None:
+    a = _node(client, "person", "a")
+
+    response = client.get("/api/v1/paths", params={"from": a, "to": 99})
+
+    assert response.status_code == 404
+
+
+def test_paths_require_both_ends(client: TestClient) -> None:
+    assert client.get("/api/v1/paths", params={"from": 1}).status_code == 422
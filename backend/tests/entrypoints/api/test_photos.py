@@ -0,0 +1,221 @@
+import hashlib
+from typing import TYPE_CHECKING
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.application.photos import DerivativeError, DerivativeService
+from app.domain.photos import DerivativeFormat
+from app.entrypoints.api.dependencies import get_derivative_service
+from app.entrypoints.api.main import create_app
+from app.infrastructure.storage import LocalPhotoStorage
+from app.shared.config import get_settings
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator
+    from pathlib import Path
+
+    from app.shared.config import Settings
+
+pytestmark = pytest.mark.unit
+
+JPEG = b"\xff\xd8\xff\xe0" + bytes(range(256)) * 64
+
+
+class _Renderer:
+    async def render(
+        self, source: Path, target: Path, *, size: int, fmt: str, quality: int
+    ) -> None:
+        if source.read_bytes() != JPEG:
+            msg = "cannot decode"
+            raise DerivativeError(msg)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(b"RIFF....WEBP")
+
+    def schedule(
+        self, source: Path, target: Path, *, size: int, fmt: str, quality: int
+    ) -> None:
+        raise NotImplementedError
+
+
+@pytest.fixture
+def client(
+    tmp_path: Path, settings_factory: Callable[..., Settings]
+) -> Generator[TestClient]:
+    settings = settings_factory(
+        env={"MG_PHOTOS__ROOT": str(tmp_path), "MG_PHOTOS__MAX_BYTES": "100000"}
+    )
+    app = create_app()
+    app.dependency_overrides[get_settings] = lambda: settings
+    app.dependency_overrides[get_derivative_service] = lambda: DerivativeService(
+        LocalPhotoStorage(tmp_path, buffer_bytes=1024),
+        _Renderer(),
+        sizes=[64],
+        formats=[DerivativeFormat.WEBP],
+        quality=80,
+    )
+    yield TestClient(app)
+
+
+def test_upload_multipart_photo(client: TestClient, tmp_path: Path) -> None:
+    response = client.post(
+        "/api/v1/photos",
+        files={"file": ("scan.jpg", JPEG, "image/jpeg")},
+        data={"caption": "signed programme"},
+    )
+
+    assert response.status_code == 201
+    digest = hashlib.sha256(JPEG).hexdigest()
+    assert response.json() == {
+        "digest": digest,
+        "size": len(JPEG),
+        "media_type": "image/jpeg",
+    }
+    assert (tmp_path / digest[:2] / digest[2:4] / digest).read_bytes() == JPEG
+
+
+def test_reupload_is_deduplicated(client: TestClient) -> None:
+    first = client.post(
+        "/api/v1/photos", content=JPEG, headers={"Content-Type": "image/jpeg"}
+    )
+    second = client.post("/api/v1/photos", files={"file": ("again.jpg", JPEG)})
+
+    assert (first.status_code, second.status_code) == (201, 200)
+    assert first.json() == second.json()
+
+
+def test_upload_rejects_non_images(client: TestClient) -> None:
+    response = client.post(
+        "/api/v1/photos",
+        content=b"not an image at all",
+        headers={"Content-Type": "image/png"},
+    )
+
+    assert response.status_code == 415
+
+
+def test_upload_rejects_unknown_content_types(client: TestClient) -> None:
+    response = client.post(
+        "/api/v1/photos", content=JPEG, headers={"Content-Type": "text/plain"}
+    )
+
+    assert response.status_code == 415
+
+
+def test_upload_rejects_large_bodies(client: TestClient) -> None:
+    response = client.post(
+        "/api/v1/photos",
+        content=JPEG * 10,
+        headers={"Content-Type": "image/jpeg"},
+    )
+
+    assert response.status_code == 413
+
+
+def test_upload_rejects_malformed_multipart(client: TestClient) -> None:
+    response = client.post(
+        "/api/v1/photos",
+        content=b"--x\r\nContent-Disposition: form-data",
+        headers={"Content-Type": "multipart/form-data; boundary=x"},
+    )
+
+    assert response.status_code == 400
+
+
+def test_get_derivative(client: TestClient) -> None:
+    digest = client.post("/api/v1/photos", files={"file": JPEG}).json()["digest"]
+
+    response = client.get(f"/api/v1/photos/{digest}/derivatives/64.webp")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "image/webp"
+    assert response.content == b"RIFF....WEBP"
+
+
+@pytest.mark.parametrize(
+    "path", [f"{'ab' * 32}/derivatives/64.webp", "nope/derivatives/64.webp"]
+)
+def test_get_derivative_of_missing_photo(client: TestClient, path: str) -> None:
+    response = client.get(f"/api/v1/photos/{path}")
+
+    assert response.status_code == 404
+
+
+def test_get_unoffered_derivative(client: TestClient) -> None:
+    digest = client.post("/api/v1/photos", files={"file": JPEG}).json()["digest"]
+
+    response = client.get(f"/api/v1/photos/{digest}/derivatives/128.webp")
+
+    assert response.status_code == 404
+
+
+def test_get_derivative_of_undecodable_photo(client: TestClient) -> None:
+    corrupt = JPEG[:100]
+    digest = client.post("/api/v1/photos", files={"file": corrupt}).json()["digest"]
+
+    response = client.get(f"/api/v1/photos/{digest}/derivatives/64.webp")
+
+    assert response.status_code == 422
+
+
+def test_get_photo(client: TestClient) -> None:
+    digest = client.post("/api/v1/photos", files={"file": JPEG}).json()["digest"]
+
+    response = client.get(f"/api/v1/photos/{digest}")
+
+    assert response.status_code == 200
+    assert response.content == JPEG
+    assert response.headers["content-type"] == "image/jpeg"
+    assert response.headers["etag"] == f'"{digest}"'
+    assert response.headers["accept-ranges"] == "bytes"
+    assert "immutable" in response.headers["cache-control"]
+
+
+def test_get_photo_range(client: TestClient) -> None:
+    digest = client.post("/api/v1/photos", files={"file": JPEG}).json()["digest"]
+
+    response = client.get(f"/api/v1/photos/{digest}", headers={"Range": "bytes=4-9"})
+
+    assert response.status_code == 206
+    assert response.content == JPEG[4:10]
+    assert response.headers["content-range"] == f"bytes 4-9/{len(JPEG)}"
+
+
+@pytest.mark.parametrize("derivative", ["", "/derivatives/64.webp"])
+def test_unchanged_photos_are_not_sent_again(
+    client: TestClient, derivative: str
+) -> None:
+    digest = client.post("/api/v1/photos", files={"file": JPEG}).json()["digest"]
+    url = f"/api/v1/photos/{digest}{derivative}"
+    etag = client.get(url).headers["etag"]
+
+    response = client.get(url, headers={"If-None-Match": f'W/"other", {etag}'})
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        f"{'ab' * 32}",
+        f"{'ab' * 32}/derivatives/64.webp",
+        "{digest}/derivatives/32.webp",
+    ],
+)
+def test_conditional_requests_for_missing_files_are_not_found(
+    client: TestClient, path: str
+) -> None:
+    digest = client.post("/api/v1/photos", files={"file": JPEG}).json()["digest"]
+    url = f"/api/v1/photos/{path.format(digest=digest)}"
+
+    response = client.get(url, headers={"If-None-Match": "*"})
+
+    assert response.status_code == 404
+
+
+def test_get_missing_photo(client: TestClient) -> None:
+    response = client.get(f"/api/v1/photos/{'ab' * 32}")
+
+    assert response.status_code == 404
@@ -0,0 +1,48 @@
+import pstats
+from typing import TYPE_CHECKING
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.entrypoints.api.main import create_app
+from app.entrypoints.api.middlewares import ProfilingMiddleware
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def client(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> TestClient:
+    monkeypatch.setenv("MG_PROFILING__ENABLED", "true")
+    monkeypatch.setenv("MG_PROFILING__DIRECTORY", str(tmp_path))
+    monkeypatch.setenv("MG_PROFILING__TOKEN", "secret")
+    return TestClient(create_app())
+
+
+def test_profiling_is_not_installed_by_default() -> None:
+    middleware: list[object] = [m.cls for m in create_app().user_middleware]
+
+    assert ProfilingMiddleware not in middleware
+
+
+def test_request_with_token_is_profiled(client: TestClient, tmp_path: Path) -> None:
+    response = client.get(
+        "/api/health", headers={"X-Profile": "secret", "X-Request-ID": "req/1"}
+    )
+
+    assert response.status_code == 200
+    [written] = tmp_path.glob("*.pstats")
+    assert written.name.endswith("-req_1.pstats")
+    assert pstats.Stats(str(written)).total_calls > 0  # type: ignore[attr-defined]
+
+
+@pytest.mark.parametrize("headers", [{}, {"X-Profile": "wrong"}])
+def test_request_without_token_is_not_profiled(
+    client: TestClient, tmp_path: Path, headers: dict[str, str]
+) -> None:
+    response = client.get("/api/health", headers=headers)
+
+    assert response.status_code == 200
+    assert not list(tmp_path.glob("*.pstats"))
@@ -0,0 +1,146 @@
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.application.graph import GraphService
+from app.application.queries import QueryService
+from app.entrypoints.api.dependencies import get_graph_service, get_query_service
+from app.entrypoints.api.main import create_app
+from app.infrastructure.memory import (
+    InMemoryFilterRunner,
+    InMemoryGraphRepository,
+    InMemorySavedQueryRepository,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def client() -> Generator[TestClient]:
+    graph = InMemoryGraphRepository()
+    queries = InMemorySavedQueryRepository()
+    app = create_app()
+    app.dependency_overrides[get_graph_service] = lambda: GraphService(
+        graph, max_depth=3, max_results=100
+    )
+    app.dependency_overrides[get_query_service] = lambda: QueryService(
+        queries, InMemoryFilterRunner(graph), max_terms=10, max_path_length=2
+    )
+    yield TestClient(app)
+
+
+def _node(client: TestClient, node_type: str, name: str, **properties: object) -> int:
+    body = {"type": node_type, "name": name, "properties": properties}
+    return int(client.post("/api/v1/nodes", json=body).json()["id"])
+
+
+def _edge(client: TestClient, source_id: int, target_id: int, edge_type: str) -> None:
+    body = {"source_id": source_id, "target_id": target_id, "type": edge_type}
+    client.post("/api/v1/edges", json=body)
+
+
+def _run(client: TestClient, filter: dict[str, Any], **params: str | int) -> list[str]:
+    saved = client.post("/api/v1/queries", json={"name": "q", "filter": filter})
+    response = client.get(f"/api/v1/queries/{saved.json()['id']}/run", params=params)
+    assert response.status_code == 200
+    return [node["name"] for node in response.json()["items"]]
+
+
+def test_saved_queries_are_stored_listed_and_deleted(client: TestClient) -> None:
+    created = client.post(
+        "/api/v1/queries", json={"name": "bands", "filter": {"type": "band"}}
+    )
+
+    assert created.status_code == 201
+    query = created.json()
+    assert client.get(f"/api/v1/queries/{query['id']}").json() == query
+    assert client.get("/api/v1/queries").json()["items"] == [query]
+    assert client.delete(f"/api/v1/queries/{query['id']}").status_code == 204
+    assert client.get(f"/api/v1/queries/{query['id']}").status_code == 404
+
+
+def test_runs_property_and_edge_filters(client: TestClient) -> None:
+    blur = _node(client, "band", "Blur", formed=1988)
+    _node(client, "band", "Elastica", formed=1992)
+    _node(client, "band", "Unknown")
+    venue = _node(client, "venue", "Astoria", city="London")
+    _edge(client, blur, venue, "played_at")
+
+    assert _run(client, {"property": "formed", "op": "gt", "value": 1990}) == [
+        "Elastica"
+    ]
+    assert _run(client, {"not": {"property": "formed", "op": "gt", "value": 1990}}) == [
+        "Blur",
+        "Unknown",
+        "Astoria",
+    ]
+    assert _run(
+        client,
+        {
+            "edge": {
+                "type": "played_at",
+                "node": {"property": "city", "value": "London"},
+            }
+        },
+    ) == ["Blur"]
+
+
+def test_runs_path_filters(client: TestClient) -> None:
+    damon = _node(client, "person", "Damon")
+    graham = _node(client, "person", "Graham")
+    blur = _node(client, "band", "Blur")
+    venue = _node(client, "venue", "Astoria")
+    _edge(client, damon, blur, "member_of")
+    _edge(client, graham, blur, "member_of")
+    _edge(client, blur, venue, "played_at")
+
+    path = [{"type": "member_of"}, {"type": "played_at"}]
+    assert _run(client, {"path": path, "node": {"type": "venue"}}) == [
+        "Damon",
+        "Graham",
+    ]
+    assert _run(client, {"path": path, "node": {"type": "venue"}}, limit=1) == ["Damon"]
+
+
+def test_run_pages_through_matches(client: TestClient) -> None:
+    for i in range(5):
+        _node(client, "band", f"band {i}")
+    saved = client.post(
+        "/api/v1/queries", json={"name": "bands", "filter": {"type": "band"}}
+    ).json()
+
+    seen: list[str] = []
+    params: dict[str, str | int] = {"limit": 2}
+    while True:
+        body = client.get(f"/api/v1/queries/{saved['id']}/run", params=params).json()
+        seen.extend(node["name"] for node in body["items"])
+        if body["next_cursor"] is None:
+            break
+        params["cursor"] = body["next_cursor"]
+
+    assert seen == [f"band {i}" for i in range(5)]
+
+
+def test_invalid_filters_are_rejected(client: TestClient) -> None:
+    response = client.post(
+        "/api/v1/queries",
+        json={"name": "bad", "filter": {"path": [{"type": "x"}] * 3}},
+    )
+
+    assert response.status_code == 422
+    assert response.json()["detail"] == "$.path: longer than 2 steps"
+
+
+def test_running_a_missing_query_is_not_found(client: TestClient) -> None:
+    assert client.get("/api/v1/queries/99/run").status_code == 404
+
+
+def test_query_plan_cache_statistics(client: TestClient) -> None:
+    response = client.get("/api/query-plan-cache")
+
+    assert response.status_code == 200
+    assert set(response.json()) == {"size", "capacity", "hits", "misses", "hit_rate"}
@@ -0,0 +1,94 @@
+import asyncio
+from typing import TYPE_CHECKING
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from starlette.requests import Request
+
+from app.application.graph import GraphService
+from app.entrypoints.api import dependencies
+from app.entrypoints.api.dependencies import get_graph_service
+from app.entrypoints.api.main import create_app
+from app.entrypoints.api.middlewares import RecentWriteMiddleware
+from app.infrastructure.database import Database
+from app.infrastructure.memory import InMemoryGraphRepository
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def client(monkeypatch: pytest.MonkeyPatch) -> Generator[TestClient]:
+    monkeypatch.setenv("MG_DATABASE__READ_DSN", "postgresql://reader@replica/mg")
+    monkeypatch.setenv("MG_DATABASE__RECENT_WRITE_SECONDS", "7")
+    repository = InMemoryGraphRepository()
+    app = create_app()
+    app.dependency_overrides[get_graph_service] = lambda: GraphService(
+        repository, max_depth=3, max_results=100
+    )
+    yield TestClient(app)
+
+
+@pytest.fixture
+def database(monkeypatch: pytest.MonkeyPatch) -> Generator[Database]:
+    database = Database(
+        create_async_engine("postgresql+asyncpg://writer@primary/mg"),
+        create_async_engine("postgresql+asyncpg://reader@replica/mg"),
+    )
+    monkeypatch.setattr(dependencies, "get_database", lambda: database)
+    yield database
+    asyncio.run(database.dispose())
+
+
+def _bound_engine(headers: list[tuple[bytes, bytes]]) -> AsyncEngine:
+    request = Request({"type": "http", "method": "GET", "headers": headers})
+
+    async def bind() -> AsyncEngine:
+        async for session in dependencies.get_read_session(request):
+            assert isinstance(session.bind, AsyncEngine)
+            return session.bind
+        raise AssertionError
+
+    return asyncio.run(bind())
+
+
+def test_recent_writes_are_not_tracked_without_a_replica() -> None:
+    middleware: list[object] = [m.cls for m in create_app().user_middleware]
+
+    assert RecentWriteMiddleware not in middleware
+
+
+def test_successful_writes_mark_the_client(client: TestClient) -> None:
+    created = client.post("/api/v1/nodes", json={"type": "band", "name": "Blur"})
+
+    assert created.status_code == 201
+    assert created.headers["set-cookie"] == (
+        "recent_write=1; Max-Age=7; Path=/; HttpOnly; SameSite=Lax"
+    )
+
+
+def test_reads_and_failed_writes_do_not_mark_the_client(client: TestClient) -> None:
+    read = client.get("/api/v1/nodes/1")
+    failed = client.post("/api/v1/nodes", json={"type": "band"})
+
+    assert read.status_code == 404
+    assert failed.status_code == 422
+    assert "set-cookie" not in read.headers
+    assert "set-cookie" not in failed.headers
+
+
+def test_reads_go_to_the_replica(database: Database) -> None:
+    assert _bound_engine([]) is database.read_engine
+
+
+@pytest.mark.parametrize(
+    "headers",
+    [[(b"cookie", b"recent_write=1")], [(b"x-recent-write", b"1")]],
+)
+def test_clients_that_just_wrote_read_from_the_primary(
+    database: Database, headers: list[tuple[bytes, bytes]]
+) -> None:
+    assert _bound_engine(headers) is database.engine
@@ -1,27 +1,24 @@
 import asyncio
-from types import SimpleNamespace
-from typing import Any, cast
+import uuid
+from typing import Any
 
 import pytest
 
 pytestmark = pytest.mark.unit
 
 
-def _make_call_next() -> Any:
-    # noinspection PyUnusedLocal
-    async def _call_next(request: Any) -> object:
-        resp = SimpleNamespace()
-        resp.headers = {}
-        resp.status_code = 200
-        return resp
+async def _receive() -> dict[str, Any]:
+    return {"type": "http.request", "body": b"", "more_body": False}
 
-    return _call_next
 
+async def _app(scope: Any, receive: Any, send: Any) -> None:
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b""})
 
-# noinspection DuplicatedCode
-def test_request_id_middleware_binds_and_attaches_id(
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
+
+def _run(
+    monkeypatch: pytest.MonkeyPatch, headers: list[tuple[bytes, bytes]]
+) -> tuple[dict[str, object], list[Any]]:
     recorded: dict[str, object] = {}
 
     def fake_clear() -> None:
@@ -33,49 +30,35 @@ def test_request_id_middleware_binds_and_attaches_id(
     monkeypatch.setattr("structlog.contextvars.clear_contextvars", fake_clear)
     monkeypatch.setattr("structlog.contextvars.bind_contextvars", fake_bind)
 
-    from app.entrypoints.api.middlewares.request_id import request_id_middleware
+    from app.entrypoints.api.middlewares.request_id import RequestIdMiddleware
 
-    request = SimpleNamespace()
-    request.headers = {"X-Request-ID": "req-xyz"}
+    sent: list[Any] = []
 
-    result = asyncio.run(
-        cast(Any, request_id_middleware)(cast(Any, request), _make_call_next())
-    )
+    async def send(message: Any) -> None:
+        sent.append(message)
 
-    assert recorded.get("cleared") is True
-    assert recorded.get("bound") == {"request_id": "req-xyz"}
-    assert result.headers["X-Request-ID"] == "req-xyz"
+    scope = {"type": "http", "headers": headers}
+    asyncio.run(RequestIdMiddleware(_app)(scope, _receive, send))
+    return recorded, sent
 
 
-# noinspection DuplicatedCode
-def test_request_id_middleware_generates_uuid_when_missing(
+def test_request_id_middleware_binds_and_attaches_id(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    recorded: dict[str, object] = {}
-
-    def fake_clear() -> None:
-        recorded["cleared"] = True
+    recorded, sent = _run(monkeypatch, [(b"x-request-id", b"req-xyz")])
 
-    def fake_bind(**kwargs: Any) -> None:
-        recorded["bound"] = kwargs
-
-    monkeypatch.setattr("structlog.contextvars.clear_contextvars", fake_clear)
-    monkeypatch.setattr("structlog.contextvars.bind_contextvars", fake_bind)
-
-    from app.entrypoints.api.middlewares.request_id import request_id_middleware
+    assert recorded.get("cleared") is True
+    assert recorded.get("bound") == {"request_id": "req-xyz"}
+    assert sent[0]["headers"] == [(b"x-request-id", b"req-xyz")]
 
-    request = SimpleNamespace()
-    request.headers = {}
 
-    result = asyncio.run(
-        cast(Any, request_id_middleware)(cast(Any, request), _make_call_next())
-    )
+def test_request_id_middleware_generates_uuid_when_missing(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    recorded, sent = _run(monkeypatch, [])
 
     assert recorded.get("cleared") is True
     bound = recorded.get("bound")
     assert isinstance(bound, dict) and "request_id" in bound
-    # validate UUID format
-    import uuid
-
     uuid.UUID(bound["request_id"])  # will raise if invalid
-    assert result.headers["X-Request-ID"] == bound["request_id"]
+    assert sent[0]["headers"] == [(b"x-request-id", bound["request_id"].encode())]
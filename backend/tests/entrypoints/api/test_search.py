@@ -0,0 +1,38 @@
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from fastapi.testclient import TestClient
+
+pytestmark = pytest.mark.unit
+
+
+def test_search_returns_ranked_hits(client: TestClient) -> None:
+    for node_type, name in [
+        ("person", "David Bowie"),
+        ("single", "Let's Dance"),
+        ("person", "Nile Rodgers"),
+    ]:
+        client.post("/api/v1/nodes", json={"type": node_type, "name": name})
+
+    response = client.get("/api/v1/search", params={"q": "bowie"})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["query"] == "bowie"
+    assert [hit["name"] for hit in body["hits"]] == ["David Bowie"]
+    assert body["hits"][0]["score"] > 0
+
+
+def test_search_filters_by_type(client: TestClient) -> None:
+    client.post("/api/v1/nodes", json={"type": "person", "name": "Dance Band"})
+    client.post("/api/v1/nodes", json={"type": "single", "name": "Let's Dance"})
+
+    response = client.get("/api/v1/search", params={"q": "dance", "type": "single"})
+
+    assert [hit["name"] for hit in response.json()["hits"]] == ["Let's Dance"]
+
+
+def test_search_requires_a_query(client: TestClient) -> None:
+    assert client.get("/api/v1/search").status_code == 422
@@ -0,0 +1,53 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import app
+
+pytestmark = pytest.mark.unit
+
+# Importing the ASGI module builds the whole app, as each server worker does.
+_MODULE = "app.entrypoints.api.asgi"
+
+# Loaded only when a worker needs them, never while building the app.
+_DEFERRED = ("PIL", "app.entrypoints.cli")
+
+_SCRIPT = """
+import json, sys
+from pathlib import Path
+from app.shared.config import app_info
+
+def read_package(cls):
+    raise AssertionError("read the package metadata despite the snapshot")
+
+app_info._SNAPSHOT = Path(sys.argv[1])
+app_info.ApplicationInfo.read_package = classmethod(read_package)
+import {module}
+print(json.dumps(sorted(sys.modules)))
+"""
+
+
+def _import(module: str, snapshot: Path) -> set[str]:
+    src = Path(app.__file__).parents[1]
+    result = subprocess.run(
+        [sys.executable, "-c", _SCRIPT.format(module=module), str(snapshot)],
+        capture_output=True,
+        check=True,
+        env=os.environ | {"PYTHONPATH": str(src)},
+        text=True,
+    )
+    return set(json.loads(result.stdout))
+
+
+def test_asgi_module_defers_optional_imports(tmp_path: Path) -> None:
+    snapshot = tmp_path / "app_info.json"
+    snapshot.write_text('{"name": "menagerist", "version": "1.2.3"}')
+
+    modules = _import(_MODULE, snapshot)
+
+    assert _MODULE in modules
+    assert not modules.intersection(_DEFERRED)
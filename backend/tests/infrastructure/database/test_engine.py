@@ -0,0 +1,102 @@
+import asyncio
+
+import pytest
+from sqlalchemy.pool import QueuePool
+
+from app.infrastructure.database import engine as engine_module
+from app.shared.config.database import DatabaseSettings
+
+pytestmark = pytest.mark.unit
+
+
+def test_database_url_uses_settings() -> None:
+    settings = DatabaseSettings(
+        host="db", port=6543, user="u", password="p", name="n", statement_cache_size=0
+    )
+
+    url = engine_module.database_url(settings)
+
+    assert url.drivername == "postgresql+asyncpg"
+    assert url.host == "db"
+    assert url.port == 6543
+    assert url.username == "u"
+    assert url.password == "p"
+    assert url.database == "n"
+    assert url.query["prepared_statement_cache_size"] == "0"
+
+
+def test_create_engine_applies_pool_settings() -> None:
+    settings = DatabaseSettings(pool_size=7, max_overflow=3, pool_recycle=60)
+
+    engine = engine_module.create_engine(settings)
+    try:
+        assert isinstance(engine.pool, QueuePool)
+        assert engine.pool.size() == 7
+        assert engine.pool._max_overflow == 3
+        assert engine.pool._recycle == 60
+    finally:
+        asyncio.run(engine.dispose())
+
+
+def test_get_database_requires_initialisation() -> None:
+    asyncio.run(engine_module.close_database())
+
+    with pytest.raises(RuntimeError):
+        engine_module.get_database()
+
+
+def test_init_and_close_database_manage_worker_instance() -> None:
+    database = engine_module.init_database(DatabaseSettings())
+
+    assert engine_module.get_database() is database
+
+    asyncio.run(engine_module.close_database())
+
+    with pytest.raises(RuntimeError):
+        engine_module.get_database()
+
+
+def test_read_database_url_is_optional() -> None:
+    assert engine_module.read_database_url(DatabaseSettings()) is None
+
+
+def test_read_database_url_uses_the_async_driver() -> None:
+    settings = DatabaseSettings(
+        read_dsn="postgresql://reader:pw@replica:5433/n", statement_cache_size=0
+    )
+
+    url = engine_module.read_database_url(settings)
+
+    assert url is not None
+    assert url.drivername == "postgresql+asyncpg"
+    assert (url.host, url.port, url.username) == ("replica", 5433, "reader")
+    assert url.query["prepared_statement_cache_size"] == "0"
+
+
+def test_read_engine_has_its_own_pool() -> None:
+    settings = DatabaseSettings(
+        read_dsn="postgresql://reader@replica/n", read_pool_size=2, pool_size=7
+    )
+
+    database = engine_module.init_database(settings)
+    try:
+        assert database.has_replica
+        assert database.read_engine.url.host == "replica"
+        assert isinstance(database.read_engine.pool, QueuePool)
+        assert isinstance(database.engine.pool, QueuePool)
+        assert database.read_engine.pool.size() == 2
+        assert database.engine.pool.size() == 7
+        assert database.read_sessionmaker is not database.sessionmaker
+    finally:
+        asyncio.run(engine_module.close_database())
+
+
+def test_reads_share_the_primary_without_a_replica() -> None:
+    database = engine_module.Database(engine_module.create_engine(DatabaseSettings()))
+    try:
+        assert not database.has_replica
+        assert database.read_sessionmaker is database.sessionmaker
+        with pytest.raises(ValueError, match="replica"):
+            engine_module.create_engine(DatabaseSettings(), read_only=True)
+    finally:
+        asyncio.run(database.dispose())
@@ -0,0 +1,78 @@
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.domain.node_types import (
+    FieldIndex,
+    FieldKind,
+    FieldSpec,
+    IndexState,
+    NodeTypeSchema,
+    index_name,
+)
+from app.infrastructure.database.field_indexes import create_index_sql, drop_index_sql
+from app.infrastructure.database.repositories.node_types import (
+    queue_drops_statement,
+    queue_indexes_statement,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def _index(kind: FieldKind, field: str = "year") -> FieldIndex:
+    return FieldIndex(
+        node_type="vinyl_pressing",
+        field=field,
+        kind=kind,
+        name=index_name("vinyl_pressing", field),
+        state=IndexState.PENDING,
+    )
+
+
+def test_scalar_fields_get_a_partial_expression_index() -> None:
+    index = _index(FieldKind.INTEGER)
+
+    assert create_index_sql(index) == (
+        f"CREATE INDEX CONCURRENTLY {index.name} ON nodes "
+        "((properties['year'])) WHERE type = 'vinyl_pressing'"
+    )
+
+
+def test_list_fields_get_a_gin_index_for_contains() -> None:
+    sql = create_index_sql(_index(FieldKind.LIST, field="o'tags"))
+
+    assert "USING gin ((properties['o''tags']) jsonb_path_ops)" in sql
+
+
+def test_drops_do_not_block_writes() -> None:
+    index = _index(FieldKind.STRING)
+
+    assert drop_index_sql(index) == f"DROP INDEX CONCURRENTLY IF EXISTS {index.name}"
+
+
+def test_index_names_fit_postgres_identifiers() -> None:
+    long = index_name("t" * 48, "f" * 48)
+
+    assert len(long) <= 63
+    assert long != index_name("t" * 48, "f" * 47 + "g")
+
+
+def test_saving_queues_index_work_in_upserts() -> None:
+    schema = NodeTypeSchema(
+        name="vinyl_pressing",
+        fields=(
+            FieldSpec(name="year", kind=FieldKind.INTEGER, filterable=True),
+            FieldSpec(name="label", kind=FieldKind.STRING),
+        ),
+    )
+    dialect = postgresql.dialect()  # type: ignore[no-untyped-call]
+
+    queue = str(queue_indexes_statement(schema).compile(dialect=dialect))
+    drops = str(
+        queue_drops_statement("vinyl_pressing", ["year"]).compile(dialect=dialect)
+    )
+
+    assert "ON CONFLICT (node_type, field) DO UPDATE" in queue
+    assert index_name("vinyl_pressing", "label") not in str(
+        queue_indexes_statement(schema).compile().params
+    )
+    assert drops.startswith("UPDATE node_type_indexes SET state=")
@@ -0,0 +1,114 @@
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.application.queries import parse_filter
+from app.infrastructure.database.filters import (
+    QueryPlanCache,
+    filter_parameters,
+    filter_shape,
+    filter_statement,
+)
+
+pytestmark = pytest.mark.unit
+
+_DIALECT = postgresql.dialect()  # type: ignore[no-untyped-call]
+
+
+def _sql(document: object, *, paginated: bool = False) -> str:
+    statement = filter_statement(parse_filter(document), paginated=paginated)
+    return str(statement.compile(dialect=_DIALECT))
+
+
+def test_values_become_positional_bind_parameters() -> None:
+    document = {
+        "all": [
+            {"type": "band"},
+            {"property": "formed", "op": "lt", "value": 1990},
+            {"edge": {"type": "played_at", "node": {"type": "venue"}}},
+        ]
+    }
+
+    assert filter_parameters(parse_filter(document)) == {
+        "f_0_type": "band",
+        "f_1_key": "formed",
+        "f_1_value": 1990,
+        "f_2_e0_type": "played_at",
+        "f_2_n_type": "venue",
+    }
+    sql = _sql(document)
+    assert "nodes.type = %(f_0_type)s" in sql
+    assert "jsonb_typeof(nodes.properties[%(f_1_key)s])" in sql
+    assert "f_2_e0.type = %(f_2_e0_type)s" in sql
+    assert "band" not in sql
+    assert "1990" not in sql
+
+
+def test_paths_are_one_exists_over_edge_aliases() -> None:
+    sql = _sql({"path": [{"type": "member_of"}, {"direction": "in"}]})
+
+    assert sql.count("EXISTS") == 1
+    assert "f_e0.source_id = nodes.id" in sql
+    assert "f_e1.target_id = f_e0.target_id" in sql
+
+
+def test_contains_tests_for_a_one_element_array() -> None:
+    sql = _sql({"property": "tags", "op": "contains", "value": "jazz"})
+
+    assert "nodes.properties[%(f_key)s] @> jsonb_build_array(%(f_value)s" in sql
+
+
+def test_pagination_adds_a_keyset_condition() -> None:
+    sql = _sql({"type": "band"}, paginated=True)
+
+    assert "(nodes.type, nodes.id) > (%(after_type)s, %(after_id)s)" in sql
+    assert sql.endswith("ORDER BY nodes.type, nodes.id \n LIMIT %(limit)s")
+
+
+def test_shape_ignores_values_but_not_operators() -> None:
+    gte = parse_filter({"property": "formed", "op": "gte", "value": 1990})
+    later = parse_filter({"property": "split", "op": "gte", "value": 2001})
+    lt = parse_filter({"property": "formed", "op": "lt", "value": 1990})
+
+    assert filter_shape(gte) == filter_shape(later)
+    assert filter_shape(gte) != filter_shape(lt)
+
+
+def test_cache_reuses_the_statement_for_a_shape() -> None:
+    cache = QueryPlanCache(capacity=4)
+
+    first = cache.plan(parse_filter({"type": "band"}), paginated=False)
+    second = cache.plan(parse_filter({"type": "venue"}), paginated=False)
+    cache.plan(parse_filter({"type": "band"}), paginated=True)
+
+    assert second is first
+    stats = cache.stats()
+    assert (stats.size, stats.hits, stats.misses) == (2, 1, 2)
+    assert stats.hit_rate == pytest.approx(1 / 3)
+
+
+def test_cache_evicts_the_least_recently_used_shape() -> None:
+    cache = QueryPlanCache(capacity=2)
+    band, gig, rank = (
+        parse_filter({"type": "band"}),
+        parse_filter({"not": {"type": "gig"}}),
+        parse_filter({"property": "rank", "op": "exists"}),
+    )
+
+    cache.plan(band, paginated=False)
+    cache.plan(gig, paginated=False)
+    cache.plan(band, paginated=False)
+    cache.plan(rank, paginated=False)
+    cache.plan(band, paginated=False)
+    cache.plan(gig, paginated=False)
+
+    assert (cache.hits, cache.misses) == (2, 4)
+    assert cache.stats().size == 2
+
+
+def test_cache_without_capacity_compiles_every_time() -> None:
+    cache = QueryPlanCache(capacity=0)
+
+    cache.plan(parse_filter({"type": "band"}), paginated=False)
+    cache.plan(parse_filter({"type": "band"}), paginated=False)
+
+    assert (cache.stats().size, cache.misses) == (0, 2)
@@ -0,0 +1,228 @@
+import asyncio
+from typing import TYPE_CHECKING, Any
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import IntegrityError
+
+from app.application.graph import GraphLoader
+from app.domain.graph import BatchEdge, Direction, NodeNotFoundError
+from app.domain.pagination import Position
+from app.infrastructure.database.repositories.graph import (
+    SqlAlchemyGraphRepository,
+    batch_edges_statement,
+    batch_nodes_statement,
+    links_statement,
+    list_edges_statement,
+    list_nodes_statement,
+    neighbourhood_statement,
+    search_statement,
+    tsquery_terms,
+)
+
+if TYPE_CHECKING:
+    from sqlalchemy import Select
+
+pytestmark = pytest.mark.unit
+
+_DIALECT = postgresql.dialect()  # type: ignore[no-untyped-call]
+
+
+def _sql(direction: Direction, *, filter_types: bool) -> str:
+    statement = neighbourhood_statement(direction, filter_types=filter_types)
+    return str(statement.compile(dialect=_DIALECT))
+
+
+def test_neighbourhood_is_a_single_recursive_query_with_set_union() -> None:
+    sql = _sql(Direction.OUT, filter_types=False)
+
+    assert sql.startswith("WITH RECURSIVE walk")
+    # UNION (not UNION ALL) in the recursive term deduplicates visited rows.
+    assert " UNION SELECT " in sql
+    assert "walk.depth < %(depth)s" in sql
+    assert "LIMIT %(limit)s" in sql
+
+
+def test_batch_nodes_are_one_multi_row_upsert() -> None:
+    row: dict[str, Any] = {
+        "key": None,
+        "type": "gig",
+        "name": "Astoria",
+        "properties": {},
+    }
+    statement = batch_nodes_statement([row, {**row, "key": "gig:1"}])
+    sql = str(statement.compile(dialect=_DIALECT))
+
+    assert "VALUES (%(key_m0)s, %(type_m0)s" in sql
+    assert "(%(key_m1)s, %(type_m1)s" in sql
+    assert "ON CONFLICT (key) DO UPDATE SET type = excluded.type" in sql
+    assert "updated_at = now()" in sql
+    assert sql.endswith("RETURNING nodes.id, nodes.key")
+
+
+def test_batch_edges_are_one_multi_row_insert() -> None:
+    row = {"source_id": 1, "target_id": 2, "type": "played", "properties": {}}
+    statement = batch_edges_statement([row, row, row])
+    sql = str(statement.compile(dialect=_DIALECT))
+
+    assert sql.startswith("INSERT INTO edges (source_id, target_id, type, properties)")
+    assert "%(source_id_m2)s" in sql
+    assert "RETURNING edges.id" in sql
+
+
+def test_links_fetch_a_whole_frontier_in_one_statement() -> None:
+    out = str(
+        links_statement(Direction.OUT, filter_types=True).compile(dialect=_DIALECT)
+    )
+    both = str(
+        links_statement(Direction.BOTH, filter_types=False).compile(dialect=_DIALECT)
+    )
+
+    assert out.startswith("SELECT DISTINCT edges.source_id, edges.target_id")
+    assert "edges.source_id = ANY (%(ids)s::BIGINT[])" in out
+    assert "edges.type = ANY (%(edge_types)s::TEXT[])" in out
+    assert (
+        "edges.source_id = ANY (%(ids)s::BIGINT[]) "
+        "OR edges.target_id = ANY (%(ids)s::BIGINT[])"
+    ) in both
+
+
+def test_neighbourhood_edge_types_use_one_array_parameter() -> None:
+    sql = _sql(Direction.BOTH, filter_types=True)
+
+    assert "edges.type = ANY (%(edge_types)s::TEXT[])" in sql
+    assert "UNION ALL" in sql
+
+
+def test_neighbourhood_direction_selects_join_columns() -> None:
+    outgoing = _sql(Direction.OUT, filter_types=False)
+    incoming = _sql(Direction.IN, filter_types=False)
+
+    assert "edges.source_id AS from_id, edges.target_id AS to_id" in outgoing
+    assert "edges.target_id AS from_id, edges.source_id AS to_id" in incoming
+
+
+def _compiled(statement: Select[Any]) -> str:
+    return str(statement.compile(dialect=_DIALECT))
+
+
+def test_list_nodes_seeks_past_the_cursor_with_a_row_comparison() -> None:
+    first = _compiled(list_nodes_statement(node_type="band", after=None, limit=3))
+    later = _compiled(
+        list_nodes_statement(node_type="band", after=Position("band", 42), limit=3)
+    )
+
+    assert "OFFSET" not in later
+    assert "(nodes.type, nodes.id) >" not in first
+    assert "(nodes.type, nodes.id) > (%(param_1)s, %(param_2)s)" in later
+    assert later.endswith("ORDER BY nodes.type, nodes.id \n LIMIT %(param_3)s")
+
+
+def test_list_edges_both_merges_two_ordered_branches() -> None:
+    sql = _compiled(
+        list_edges_statement(
+            7,
+            direction=Direction.BOTH,
+            edge_types=["performed_at"],
+            after=Position("performed_at", 100),
+            limit=25,
+        )
+    )
+
+    assert "UNION ALL" in sql
+    assert sql.count("(edges.type, edges.id) >") == 2
+    assert "edges.source_id != " in sql
+    assert sql.endswith("ORDER BY touching.type, touching.id \n LIMIT %(param_7)s")
+
+
+def test_tsquery_terms_match_words_by_prefix() -> None:
+    assert tsquery_terms("Bowie single 1983", match_all=True) == (
+        "'bowie':* & 'single':* & '1983':*"
+    )
+    assert tsquery_terms("a tour", match_all=False) == "'a' | 'tour':*"
+
+
+def test_tsquery_terms_drop_operators_and_duplicates() -> None:
+    assert tsquery_terms("bowie & !(bowie) | ':*", match_all=True) == "'bowie':*"
+    assert tsquery_terms("!!!", match_all=True) == ""
+
+
+def test_search_combines_full_text_and_trigram_matches() -> None:
+    sql = _compiled(search_statement(use_terms=True, filter_type=True))
+
+    assert "search_vector @@ to_tsquery('simple'::regconfig, %(terms)s)" in sql
+    assert "%(text)s <%% nodes.name" in sql
+    assert "nodes.type = %(node_type)s" in sql
+    assert "ORDER BY score DESC, nodes.id" in sql
+
+
+def test_search_without_words_uses_trigrams_only() -> None:
+    sql = _compiled(search_statement(use_terms=False, filter_type=False))
+
+    assert "to_tsquery" not in sql
+    assert "%(text)s <%% nodes.name" in sql
+
+
+class _RecordingSession:
+    """Records the statements executed, answering each with no rows."""
+
+    def __init__(self) -> None:
+        self.statements: list[str] = []
+
+    async def execute(self, statement: Any) -> list[Any]:
+        self.statements.append(str(statement.compile(dialect=_DIALECT)))
+        return []
+
+
+def test_loader_lookups_become_one_any_query() -> None:
+    session = _RecordingSession()
+    loader = GraphLoader(SqlAlchemyGraphRepository(session))  # type: ignore[arg-type]
+
+    async def load() -> None:
+        await asyncio.gather(
+            loader.nodes.load_many([4, 2, 4]),
+            loader.node(2),
+            loader.node(7),
+            loader.edges.load_many([9, 9]),
+        )
+
+    asyncio.run(load())
+
+    assert len(session.statements) == 2
+    nodes_sql, edges_sql = sorted(session.statements, key=lambda sql: "edges" in sql)
+    assert nodes_sql.endswith("WHERE nodes.id = ANY (%(ids)s::BIGINT[])")
+    assert edges_sql.endswith("WHERE edges.id = ANY (%(ids)s::BIGINT[])")
+
+
+class _MissingEndSession:
+    """Fails edge inserts as a missing foreign key would; `existing` are stored."""
+
+    def __init__(self, existing: list[int]) -> None:
+        self.existing = existing
+        self.rolled_back = False
+
+    async def execute(self, statement: Any) -> Any:
+        sql = str(statement.compile(dialect=_DIALECT))
+        if sql.startswith("INSERT INTO edges"):
+            raise IntegrityError(sql, {}, Exception("foreign key violation"))
+        assert sql.startswith("SELECT nodes.id")
+        return Mock(scalars=lambda: self.existing)
+
+    async def commit(self) -> None:
+        raise AssertionError("committed a failed batch")
+
+    async def rollback(self) -> None:
+        self.rolled_back = True
+
+
+def test_failed_batch_reports_only_the_missing_nodes() -> None:
+    session = _MissingEndSession(existing=[1])
+    repository = SqlAlchemyGraphRepository(session)  # type: ignore[arg-type]
+    edges = [BatchEdge(source=1, target=99, type="played")]
+
+    with pytest.raises(NodeNotFoundError) as excinfo:
+        asyncio.run(repository.write_batch({}, edges))
+
+    assert session.rolled_back
+    assert excinfo.value.node_ids == (99,)
@@ -0,0 +1,139 @@
+import asyncio
+from typing import TYPE_CHECKING
+
+import httpx
+import pytest
+
+from app.application.enrichment import ProviderError
+from app.infrastructure.enrichment import ProviderClient
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Coroutine
+
+pytestmark = pytest.mark.unit
+
+
+def _client(
+    handler: Callable[[httpx.Request], Coroutine[None, None, httpx.Response]],
+    *,
+    max_retries: int = 3,
+) -> ProviderClient:
+    return ProviderClient(
+        "https://provider.test/api",
+        rate=1000.0,
+        backoff=0.0,
+        max_retries=max_retries,
+        headers={"User-Agent": "tests"},
+        transport=httpx.MockTransport(handler),
+    )
+
+
+def test_get_json_sends_base_url_headers_and_params() -> None:
+    seen: list[httpx.Request] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json={"ok": True})
+
+    async def scenario() -> dict[str, object]:
+        client = _client(handler)
+        try:
+            return await client.get_json("/search", {"query": "Blur"})
+        finally:
+            await client.aclose()
+
+    assert asyncio.run(scenario()) == {"ok": True}
+    assert str(seen[0].url) == "https://provider.test/api/search?query=Blur"
+    assert seen[0].headers["user-agent"] == "tests"
+
+
+def test_get_json_retries_server_errors() -> None:
+    statuses = iter([503, 502, 200])
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(next(statuses), json={"attempt": "last"})
+
+    async def scenario() -> tuple[dict[str, object], int]:
+        client = _client(handler)
+        try:
+            return await client.get_json("/x", {}), client.requests
+        finally:
+            await client.aclose()
+
+    assert asyncio.run(scenario()) == ({"attempt": "last"}, 3)
+
+
+def test_get_json_gives_up_after_max_retries() -> None:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(429, headers={"Retry-After": "0"})
+
+    async def scenario() -> int:
+        client = _client(handler, max_retries=2)
+        try:
+            with pytest.raises(ProviderError) as caught:
+                await client.get_json("/x", {})
+            assert caught.value.retryable
+            return client.requests
+        finally:
+            await client.aclose()
+
+    assert asyncio.run(scenario()) == 3
+
+
+def test_get_json_does_not_retry_client_errors() -> None:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(404)
+
+    async def scenario() -> int:
+        client = _client(handler)
+        try:
+            with pytest.raises(ProviderError) as caught:
+                await client.get_json("/x", {})
+            assert not caught.value.retryable
+            return client.requests
+        finally:
+            await client.aclose()
+
+    assert asyncio.run(scenario()) == 1
+
+
+def test_get_json_rejects_non_object_bodies() -> None:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=[1, 2])
+
+    async def scenario() -> None:
+        client = _client(handler)
+        try:
+            await client.get_json("/x", {})
+        finally:
+            await client.aclose()
+
+    with pytest.raises(ProviderError, match="expected a JSON object"):
+        asyncio.run(scenario())
+
+
+def test_identical_concurrent_requests_share_one_response() -> None:
+    calls = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"query": request.url.params["q"]})
+
+    async def scenario() -> tuple[list[dict[str, object]], int]:
+        client = _client(handler)
+        try:
+            results = await asyncio.gather(
+                client.get_json("/s", {"q": "a"}),
+                client.get_json("/s", {"q": "a"}),
+                client.get_json("/s", {"q": "b"}),
+            )
+            return list(results), client.shared
+        finally:
+            await client.aclose()
+
+    results, shared = asyncio.run(scenario())
+
+    assert results == [{"query": "a"}, {"query": "a"}, {"query": "b"}]
+    assert (calls, shared) == (2, 1)
@@ -0,0 +1,145 @@
+import asyncio
+from typing import TYPE_CHECKING, Any
+
+import httpx
+import pytest
+
+from app.domain.graph import Node
+from app.infrastructure.enrichment import (
+    MusicBrainzProvider,
+    ProviderClient,
+    TmdbProvider,
+)
+
+if TYPE_CHECKING:
+    from app.application.enrichment import EnrichmentProvider
+
+pytestmark = pytest.mark.unit
+
+
+class _Upstream:
+    """Answers every request with one canned body and records the requests."""
+
+    def __init__(self, body: dict[str, Any]) -> None:
+        self.body = body
+        self.requests: list[httpx.Request] = []
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        return httpx.Response(200, json=self.body)
+
+    def client(self) -> ProviderClient:
+        return ProviderClient(
+            "https://provider.test", rate=1000.0, transport=httpx.MockTransport(self)
+        )
+
+
+def _lookup(provider: EnrichmentProvider, node: Node) -> dict[str, Any] | None:
+    return asyncio.run(provider.lookup(node))
+
+
+def _musicbrainz(upstream: _Upstream) -> MusicBrainzProvider:
+    return MusicBrainzProvider(
+        upstream.client(),
+        artist_types=["band"],
+        release_types=["album"],
+        recording_types=["song"],
+    )
+
+
+def test_musicbrainz_finds_artists_by_escaped_name() -> None:
+    upstream = _Upstream(
+        {
+            "artists": [
+                {
+                    "id": "mbid-1",
+                    "score": 100,
+                    "name": "AC/DC",
+                    "type": "Group",
+                    "country": "AU",
+                    "life-span": {"begin": "1973"},
+                }
+            ]
+        }
+    )
+
+    data = _lookup(_musicbrainz(upstream), Node(id=1, type="band", name="AC/DC"))
+
+    assert data is not None
+    assert data["entity"] == "artist"
+    assert (data["id"], data["country"], data["begin"]) == ("mbid-1", "AU", "1973")
+    params = upstream.requests[0].url.params
+    assert upstream.requests[0].url.path == "/artist"
+    assert params["query"] == 'artist:"AC\\/DC"'
+    assert params["fmt"] == "json"
+
+
+def test_musicbrainz_narrows_releases_by_artist_property() -> None:
+    upstream = _Upstream(
+        {
+            "releases": [
+                {
+                    "id": "mbid-2",
+                    "score": 95,
+                    "title": "Parklife",
+                    "artist-credit": [{"name": "Blur"}],
+                }
+            ]
+        }
+    )
+    node = Node(id=2, type="album", name="Parklife", properties={"artist": "Blur"})
+
+    data = _lookup(_musicbrainz(upstream), node)
+
+    assert data is not None
+    assert (data["entity"], data["title"], data["artist"]) == (
+        "release",
+        "Parklife",
+        "Blur",
+    )
+    query = upstream.requests[0].url.params["query"]
+    assert query == 'release:"Parklife" AND artist:"Blur"'
+
+
+def test_musicbrainz_ignores_low_scores() -> None:
+    upstream = _Upstream({"recordings": [{"id": "mbid-3", "score": 40}]})
+
+    assert _lookup(_musicbrainz(upstream), Node(id=3, type="song", name="x")) is None
+
+
+def test_tmdb_searches_films_with_year() -> None:
+    upstream = _Upstream(
+        {"results": [{"id": 603, "title": "The Matrix", "release_date": "1999-03-30"}]}
+    )
+    provider = TmdbProvider(upstream.client(), movie_types=["film"], tv_types=["tv"])
+    node = Node(id=4, type="film", name="The Matrix", properties={"year": 1999})
+
+    data = _lookup(provider, node)
+
+    assert data == {
+        "media_type": "movie",
+        "id": 603,
+        "title": "The Matrix",
+        "original_title": None,
+        "release_date": "1999-03-30",
+        "overview": None,
+        "poster_path": None,
+    }
+    assert upstream.requests[0].url.path == "/search/movie"
+    assert upstream.requests[0].url.params["primary_release_year"] == "1999"
+
+
+def test_tmdb_returns_none_without_results() -> None:
+    upstream = _Upstream({"results": []})
+    provider = TmdbProvider(upstream.client(), movie_types=["film"], tv_types=["tv"])
+
+    assert _lookup(provider, Node(id=5, type="tv", name="Nothing")) is None
+    assert upstream.requests[0].url.path == "/search/tv"
+
+
+def test_providers_skip_unknown_node_types() -> None:
+    upstream = _Upstream({})
+    provider = TmdbProvider(upstream.client(), movie_types=["film"], tv_types=[])
+
+    assert _lookup(provider, Node(id=6, type="band", name="Blur")) is None
+    assert upstream.requests == []
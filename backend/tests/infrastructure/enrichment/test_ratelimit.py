@@ -0,0 +1,39 @@
+import asyncio
+import time
+
+import pytest
+
+from app.infrastructure.enrichment import TokenBucket
+
+pytestmark = pytest.mark.unit
+
+
+async def _time_acquires(bucket: TokenBucket, count: int) -> float:
+    start = time.monotonic()
+    for _ in range(count):
+        await bucket.acquire()
+    return time.monotonic() - start
+
+
+def test_acquire_is_paced_to_the_rate_after_the_burst() -> None:
+    bucket = TokenBucket(100.0, capacity=2)
+
+    elapsed = asyncio.run(_time_acquires(bucket, 6))
+
+    # Two tokens are available immediately; the other four arrive 10ms apart.
+    assert elapsed >= 0.035
+
+
+def test_burst_is_not_delayed() -> None:
+    bucket = TokenBucket(1.0, capacity=3)
+
+    assert asyncio.run(_time_acquires(bucket, 3)) < 0.05
+
+
+def test_pause_holds_back_the_next_token() -> None:
+    async def paused() -> float:
+        bucket = TokenBucket(1000.0, capacity=5)
+        bucket.pause(0.05)
+        return await _time_acquires(bucket, 1)
+
+    assert asyncio.run(paused()) >= 0.045
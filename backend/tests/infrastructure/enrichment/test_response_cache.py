@@ -0,0 +1,209 @@
+import asyncio
+from typing import TYPE_CHECKING, Any
+
+import httpx
+import pytest
+
+from app.application.enrichment import CachedResponse
+from app.infrastructure.enrichment import ProviderClient, ResponseCache, request_key
+
+if TYPE_CHECKING:
+    from collections.abc import Coroutine
+
+pytestmark = pytest.mark.unit
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> _Clock:
+    clock = _Clock()
+    monkeypatch.setattr("app.infrastructure.enrichment.cache.time.time", clock)
+    return clock
+
+
+class _Store:
+    def __init__(self, *, broken: bool = False) -> None:
+        self.responses: dict[str, CachedResponse] = {}
+        self.broken = broken
+        self.prunes: list[int] = []
+
+    async def get(self, key: str) -> CachedResponse | None:
+        if self.broken:
+            raise ConnectionError
+        return self.responses.get(key)
+
+    async def put(self, key: str, response: CachedResponse) -> None:
+        if self.broken:
+            raise ConnectionError
+        self.responses[key] = response
+
+    async def prune(self, *, max_entries: int) -> int:
+        self.prunes.append(max_entries)
+        return 1
+
+
+def _cache(store: _Store | None = None, **overrides: Any) -> ResponseCache:
+    options = {"ttl": 60.0, "negative_ttl": 10.0, "max_memory_entries": 2}
+    return ResponseCache(store=store, **{**options, **overrides})
+
+
+def _run[T](coroutine: Coroutine[Any, Any, T]) -> T:
+    return asyncio.run(coroutine)
+
+
+def test_request_key_ignores_order_case_and_spacing() -> None:
+    key = request_key("https://p.test/", "/search", {"q": "The  Beatles", "n": "1"})
+
+    assert key == request_key(
+        "https://p.test", "/search", {"n": "1", "q": "the beatles"}
+    )
+    assert key != request_key("https://p.test", "/search", {"n": "2", "q": "beatles"})
+    assert key != request_key("https://other.test", "/search", {"q": "the beatles"})
+
+
+def test_memory_tier_is_lru(clock: _Clock) -> None:
+    cache = _cache()
+
+    async def scenario() -> list[bool]:
+        await cache.put("a", {"v": 1}, negative=False)
+        await cache.put("b", {"v": 2}, negative=False)
+        await cache.get("a")  # "b" is now the least recently used
+        await cache.put("c", {"v": 3}, negative=False)
+        return [await cache.get(key) is not None for key in "abc"]
+
+    assert _run(scenario()) == [True, False, True]
+    assert cache.stats.evictions == 1
+    assert (cache.stats.memory_hits, cache.stats.misses) == (3, 1)
+
+
+def test_entries_expire_after_their_ttl(clock: _Clock) -> None:
+    cache = _cache()
+
+    async def put_both() -> None:
+        await cache.put("found", {"results": [1]}, negative=False)
+        await cache.put("missing", {"results": []}, negative=True)
+
+    async def lookup() -> tuple[bool, bool]:
+        return (
+            await cache.get("found") is not None,
+            await cache.get("missing") is not None,
+        )
+
+    _run(put_both())
+    clock.now += 30
+
+    assert _run(lookup()) == (True, False)
+    clock.now += 31
+    assert _run(lookup()) == (False, False)
+
+
+def test_negative_hits_are_counted(clock: _Clock) -> None:
+    cache = _cache()
+
+    async def scenario() -> CachedResponse | None:
+        await cache.put("missing", {"results": []}, negative=True)
+        return await cache.get("missing")
+
+    response = _run(scenario())
+
+    assert response is not None
+    assert response.negative
+    assert cache.stats.negative_hits == 1
+
+
+def test_persistent_hits_are_promoted_to_memory(clock: _Clock) -> None:
+    store = _Store()
+    store.responses["k"] = CachedResponse(
+        body={"v": 1}, negative=False, expires_at=clock.now + 60
+    )
+    cache = _cache(store)
+
+    async def scenario() -> None:
+        await cache.get("k")
+        store.responses.clear()
+        await cache.get("k")
+
+    _run(scenario())
+
+    assert (cache.stats.persistent_hits, cache.stats.memory_hits) == (1, 1)
+    assert cache.stats.hit_ratio == 1.0
+
+
+def test_writes_reach_the_store_and_prune_it(clock: _Clock) -> None:
+    store = _Store()
+    cache = _cache(store, max_persistent_entries=100, prune_every=2)
+
+    async def scenario() -> None:
+        for key in "abcde":
+            await cache.put(key, {}, negative=False)
+
+    _run(scenario())
+
+    assert set(store.responses) == set("abcde")
+    assert store.prunes == [100, 100]
+    assert cache.stats.pruned == 2
+
+
+def test_store_failures_only_cost_hits(clock: _Clock) -> None:
+    cache = _cache(_Store(broken=True))
+
+    async def scenario() -> tuple[CachedResponse | None, CachedResponse | None]:
+        missing = await cache.get("k")
+        await cache.put("k", {"v": 1}, negative=False)
+        return missing, await cache.get("k")
+
+    missing, cached = _run(scenario())
+
+    assert missing is None
+    assert cached is not None
+    assert cache.stats.errors == 2
+
+
+def test_zero_ttl_disables_caching(clock: _Clock) -> None:
+    cache = _cache(negative_ttl=0.0)
+
+    async def scenario() -> CachedResponse | None:
+        await cache.put("missing", {}, negative=True)
+        return await cache.get("missing")
+
+    assert _run(scenario()) is None
+
+
+def test_client_answers_repeated_requests_from_the_cache(clock: _Clock) -> None:
+    calls = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return httpx.Response(200, json={"results": []})
+
+    cache = _cache()
+
+    async def scenario() -> None:
+        client = ProviderClient(
+            "https://provider.test",
+            rate=1000.0,
+            transport=httpx.MockTransport(handler),
+            cache=cache,
+        )
+        try:
+            for query in ("Blur", "blur", " BLUR "):
+                await client.get_json(
+                    "/search",
+                    {"query": query},
+                    not_found=lambda body: not body["results"],
+                )
+        finally:
+            await client.aclose()
+
+    _run(scenario())
+
+    assert calls == 1
+    assert (cache.stats.misses, cache.stats.negative_hits) == (1, 2)
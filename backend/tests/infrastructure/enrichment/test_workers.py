@@ -0,0 +1,234 @@
+import asyncio
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from app.application.enrichment import EnrichmentJob, ProviderError
+from app.domain.graph import Node
+from app.infrastructure.enrichment import EnrichmentWorkers
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+pytestmark = pytest.mark.unit
+
+
+class _Store:
+    """In-memory job store: every discovered node is due immediately."""
+
+    def __init__(self, nodes: Sequence[Node]) -> None:
+        self.nodes = {node.id: node for node in nodes}
+        self.attempts: dict[int, int] = {}
+        self.pending: list[int] = []
+        self.completed: dict[int, dict[str, Any] | None] = {}
+        self.retried: dict[int, float] = {}
+        self.failed: dict[int, str] = {}
+        self.largest_claim = 0
+        self.scanned: list[int] = []
+        self.closed = False
+        self.elections = 0
+        self.losses = 0
+
+    async def try_lead(self) -> bool:
+        self.elections += 1
+        return True
+
+    async def still_leading(self) -> bool:
+        if self.losses:
+            self.losses -= 1
+            return False
+        return True
+
+    async def high_water(
+        self, provider: str, node_types: Sequence[str]
+    ) -> dict[str, int]:
+        top: dict[str, int] = {}
+        for node_id in self.attempts:
+            node_type = self.nodes[node_id].type
+            if node_type in node_types:
+                top[node_type] = max(top.get(node_type, 0), node_id)
+        return top
+
+    async def discover(
+        self, provider: str, node_type: str, *, after_id: int, limit: int
+    ) -> int | None:
+        self.scanned.append(after_id)
+        found = sorted(
+            i for i, n in self.nodes.items() if n.type == node_type and i > after_id
+        )[:limit]
+        for node_id in found:
+            self.attempts.setdefault(node_id, 0)
+            self.pending.append(node_id)
+        return found[-1] if found else None
+
+    async def claim(
+        self, provider: str, *, limit: int, lease: float
+    ) -> list[EnrichmentJob]:
+        self.largest_claim = max(self.largest_claim, limit)
+        claimed, self.pending = self.pending[:limit], self.pending[limit:]
+        jobs = []
+        for node_id in claimed:
+            self.attempts[node_id] += 1
+            jobs.append(
+                EnrichmentJob(
+                    node=self.nodes[node_id],
+                    provider=provider,
+                    attempt=self.attempts[node_id],
+                )
+            )
+        return jobs
+
+    async def complete(self, job: EnrichmentJob, data: dict[str, Any] | None) -> None:
+        self.completed[job.node.id] = data
+
+    async def retry(self, job: EnrichmentJob, error: str, *, delay: float) -> None:
+        self.retried[job.node.id] = delay
+        self.pending.append(job.node.id)
+
+    async def fail(self, job: EnrichmentJob, error: str) -> None:
+        self.failed[job.node.id] = error
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class _Provider:
+    name = "fake"
+    node_types = frozenset({"band"})
+
+    def __init__(self, errors: dict[str, ProviderError] | None = None) -> None:
+        self.errors = errors or {}
+        self.in_flight = 0
+        self.most_in_flight = 0
+
+    async def lookup(self, node: Node) -> dict[str, Any] | None:
+        self.in_flight += 1
+        self.most_in_flight = max(self.most_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0)
+            if node.name in self.errors:
+                raise self.errors[node.name]
+            return None if node.name == "unknown" else {"name": node.name}
+        finally:
+            self.in_flight -= 1
+
+
+def _workers(store: _Store, provider: _Provider, **overrides: int) -> EnrichmentWorkers:
+    options = {"workers": 2, "queue_size": 4, "batch_size": 3, **overrides}
+    return EnrichmentWorkers(
+        store,
+        [provider],
+        poll_interval=0.001,
+        lease=60.0,
+        max_attempts=3,
+        retry_delay=0.0,
+        max_retry_delay=0.0,
+        **options,
+    )
+
+
+async def _run_until(workers: EnrichmentWorkers, done: Any) -> None:
+    workers.start()
+    try:
+        async with asyncio.timeout(2):
+            while not done():
+                await asyncio.sleep(0.001)
+    finally:
+        await workers.stop()
+
+
+def _nodes(*names: str, node_type: str = "band") -> list[Node]:
+    return [Node(id=i, type=node_type, name=n) for i, n in enumerate(names, 1)]
+
+
+def test_workers_enrich_every_matching_node() -> None:
+    nodes = [
+        *_nodes(*(f"band {i}" for i in range(10))),
+        Node(id=11, type="film", name="x"),
+    ]
+    store, provider = _Store(nodes), _Provider()
+    workers = _workers(store, provider)
+
+    asyncio.run(_run_until(workers, lambda: len(store.completed) == 10))
+
+    assert store.completed == {i: {"name": f"band {i - 1}"} for i in range(1, 11)}
+    assert store.closed
+    assert workers.stats()["fake"].enriched == 10
+    # Bounded: never more lookups than workers, never more claims than room.
+    assert provider.most_in_flight <= 2
+    assert store.largest_claim <= 3
+
+
+def test_discovery_resumes_after_the_nodes_already_queued() -> None:
+    store, provider = _Store(_nodes("old", "older", "new")), _Provider()
+    store.attempts = {1: 1, 2: 1}
+    workers = _workers(store, provider)
+
+    asyncio.run(_run_until(workers, lambda: store.completed))
+
+    assert store.completed == {3: {"name": "new"}}
+    assert store.scanned[0] == 2
+
+
+def test_lost_leadership_is_won_again_before_more_lookups() -> None:
+    store, provider = _Store(_nodes("a", "b", "c")), _Provider()
+    store.losses = 1
+    workers = _workers(store, provider)
+
+    asyncio.run(_run_until(workers, lambda: len(store.completed) == 3))
+
+    assert store.elections == 2
+    assert len(store.completed) == 3
+
+
+def test_workers_record_unmatched_nodes() -> None:
+    store, provider = _Store(_nodes("unknown")), _Provider()
+    workers = _workers(store, provider)
+
+    asyncio.run(_run_until(workers, lambda: store.completed))
+
+    assert store.completed == {1: None}
+    assert workers.stats()["fake"].unmatched == 1
+
+
+def test_retryable_errors_are_retried_until_max_attempts() -> None:
+    flaky = ProviderError("HTTP 503", retryable=True)
+    store = _Store(_nodes("flaky"))
+    workers = _workers(store, _Provider({"flaky": flaky}))
+
+    asyncio.run(_run_until(workers, lambda: store.failed))
+
+    assert store.attempts[1] == 3
+    assert store.failed == {1: "HTTP 503"}
+    assert workers.stats()["fake"].retried == 2
+
+
+def test_permanent_errors_fail_immediately() -> None:
+    broken = ProviderError("HTTP 404", retryable=False)
+    store = _Store(_nodes("broken", "fine"))
+    workers = _workers(store, _Provider({"broken": broken}))
+
+    asyncio.run(_run_until(workers, lambda: store.failed and store.completed))
+
+    assert store.attempts[1] == 1
+    assert store.failed == {1: "HTTP 404"}
+    assert store.completed == {2: {"name": "fine"}}
+
+
+def test_retry_delay_grows_exponentially_with_jitter() -> None:
+    workers = EnrichmentWorkers(
+        _Store([]),
+        [],
+        workers=1,
+        queue_size=1,
+        batch_size=1,
+        poll_interval=1.0,
+        lease=1.0,
+        max_attempts=5,
+        retry_delay=10.0,
+        max_retry_delay=25.0,
+    )
+
+    assert 5.0 <= workers._backoff(1) <= 10.0
+    assert 10.0 <= workers._backoff(2) <= 20.0
+    assert 12.5 <= workers._backoff(5) <= 25.0
@@ -0,0 +1,192 @@
+import asyncio
+import itertools
+
+import pytest
+
+from app.domain.graph import BatchEdge, Direction, NewEdge, NewNode
+from app.infrastructure.graph_cache import (
+    AdjacencyCache,
+    CachedGraphRepository,
+    CompressedAdjacency,
+)
+from app.infrastructure.memory import InMemoryGraphRepository
+
+pytestmark = pytest.mark.unit
+
+
+def _load(cache: AdjacencyCache, repository: InMemoryGraphRepository) -> None:
+    """Build the cache snapshot from the repository's current edges."""
+    type_codes: dict[str, int] = {}
+    snapshot = CompressedAdjacency.build(
+        (e.source_id, e.target_id, type_codes.setdefault(e.type, len(type_codes)))
+        for e in repository.edges.values()
+    )
+    fingerprint = (len(repository.edges), max(repository.edges, default=0))
+    cache.replace(snapshot, type_codes, fingerprint, seconds=0.0)
+
+
+def _graph() -> tuple[InMemoryGraphRepository, list[int]]:
+    """A small graph with a cycle, a diamond and two edge types."""
+    repository = InMemoryGraphRepository()
+
+    async def build() -> list[int]:
+        ids = [
+            (await repository.add_node(NewNode(type="item", name=str(i)))).id
+            for i in range(6)
+        ]
+        for source, target, edge_type in [
+            (0, 1, "a"),
+            (1, 2, "a"),
+            (2, 0, "a"),
+            (0, 3, "b"),
+            (3, 4, "a"),
+            (1, 4, "b"),
+            (4, 5, "a"),
+        ]:
+            await repository.add_edge(
+                NewEdge(source_id=ids[source], target_id=ids[target], type=edge_type)
+            )
+        return ids
+
+    return repository, asyncio.run(build())
+
+
+@pytest.mark.parametrize(
+    ("depth", "direction", "edge_types"),
+    list(
+        itertools.product([1, 2, 3], list(Direction), [None, ["a"], ["b"], ["missing"]])
+    ),
+)
+def test_cache_matches_repository_traversal(
+    depth: int, direction: Direction, edge_types: list[str] | None
+) -> None:
+    repository, ids = _graph()
+    cache = AdjacencyCache(max_pending=100)
+    _load(cache, repository)
+
+    expected = asyncio.run(
+        repository.neighbourhood(
+            ids[0], depth=depth, direction=direction, edge_types=edge_types, limit=100
+        )
+    )
+    actual = cache.neighbourhood(
+        ids[0], depth=depth, direction=direction, edge_types=edge_types, limit=100
+    )
+
+    assert actual == [(n.node.id, n.depth) for n in expected]
+
+
+@pytest.mark.parametrize(
+    ("direction", "edge_types"),
+    list(itertools.product(list(Direction), [None, ["a"], ["b"], ["missing"]])),
+)
+def test_cache_matches_repository_links(
+    direction: Direction, edge_types: list[str] | None
+) -> None:
+    repository, ids = _graph()
+    cache = AdjacencyCache(max_pending=100)
+    _load(cache, repository)
+    frontier = [ids[0], ids[4]]
+
+    expected = asyncio.run(
+        repository.links(frontier, direction=direction, edge_types=edge_types)
+    )
+    actual = cache.links(frontier, direction=direction, edge_types=edge_types)
+
+    assert sorted(actual, key=repr) == sorted(expected, key=repr)
+    assert len(set(actual)) == len(actual)
+
+
+def test_cached_repository_applies_writes_incrementally() -> None:
+    repository, ids = _graph()
+    cache = AdjacencyCache(max_pending=100)
+    _load(cache, repository)
+    cached = CachedGraphRepository(repository, cache)
+
+    async def scenario() -> list[tuple[int, int]]:
+        extra = await cached.add_node(NewNode(type="item", name="extra"))
+        await cached.add_edge(NewEdge(source_id=ids[5], target_id=extra.id, type="a"))
+        edge_4_5 = next(
+            e
+            for e in repository.edges.values()
+            if (e.source_id, e.target_id) == (ids[4], ids[5])
+        )
+        await cached.delete_edge(edge_4_5.id)
+        await cached.delete_node(ids[3])
+        result = await cached.neighbourhood(
+            ids[5], depth=6, direction=Direction.BOTH, edge_types=None, limit=100
+        )
+        return [(n.node.id, n.depth) for n in result]
+
+    actual = asyncio.run(scenario())
+    expected = asyncio.run(
+        repository.neighbourhood(
+            ids[5], depth=6, direction=Direction.BOTH, edge_types=None, limit=100
+        )
+    )
+
+    assert actual == [(n.node.id, n.depth) for n in expected]
+    assert cache.fingerprint[0] == len(repository.edges)
+    assert cache.stats().pending_changes == 3
+    assert cache.hits == 1
+
+
+def test_cached_repository_applies_batch_edges() -> None:
+    repository, ids = _graph()
+    cache = AdjacencyCache(max_pending=100)
+    _load(cache, repository)
+    cached = CachedGraphRepository(repository, cache)
+
+    result = asyncio.run(
+        cached.write_batch(
+            {"new": NewNode(type="item", name="new")},
+            [BatchEdge(source=ids[5], target="new", type="a")],
+        )
+    )
+
+    assert cache.neighbourhood(
+        ids[5], depth=1, direction=Direction.OUT, edge_types=None, limit=10
+    ) == [(result.node_ids["new"], 1)]
+    assert cache.fingerprint[0] == len(repository.edges)
+
+
+def test_cached_repository_falls_back_until_ready() -> None:
+    repository, ids = _graph()
+    cache = AdjacencyCache(max_pending=100)
+    cached = CachedGraphRepository(repository, cache)
+
+    result = asyncio.run(
+        cached.neighbourhood(
+            ids[0], depth=1, direction=Direction.OUT, edge_types=None, limit=100
+        )
+    )
+
+    assert [n.node.id for n in result] == [ids[1], ids[3]]
+    assert (cache.hits, cache.misses) == (0, 1)
+    assert cache.stats().hit_rate == 0.0
+
+
+def test_cache_limit_stops_search() -> None:
+    repository, ids = _graph()
+    cache = AdjacencyCache(max_pending=100)
+    _load(cache, repository)
+
+    result = cache.neighbourhood(
+        ids[0], depth=6, direction=Direction.BOTH, edge_types=None, limit=2
+    )
+
+    assert len(result) == 2
+
+
+def test_overlay_growth_requests_compaction() -> None:
+    repository, ids = _graph()
+    cache = AdjacencyCache(max_pending=1)
+    _load(cache, repository)
+    cached = CachedGraphRepository(repository, cache)
+
+    for _ in range(2):
+        asyncio.run(
+            cached.add_edge(NewEdge(source_id=ids[0], target_id=ids[5], type="c"))
+        )
+
+    assert cache.needs_compaction is True
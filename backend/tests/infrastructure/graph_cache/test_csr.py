@@ -0,0 +1,35 @@
+import pytest
+
+from app.infrastructure.graph_cache import CompressedAdjacency
+
+pytestmark = pytest.mark.unit
+
+
+def test_build_groups_edges_by_endpoint() -> None:
+    snapshot = CompressedAdjacency.build(
+        [(10, 20, 0), (10, 30, 1), (30, 10, 0), (20, 20, 2)]
+    )
+
+    assert list(snapshot.node_ids) == [10, 20, 30]
+    assert sorted(snapshot.outgoing(10)) == [(20, 0), (30, 1)]
+    assert sorted(snapshot.incoming(10)) == [(30, 0)]
+    assert list(snapshot.outgoing(20)) == [(20, 2)]
+    assert list(snapshot.incoming(20)) == [(10, 0), (20, 2)]
+    assert snapshot.edge_count == 4
+
+
+def test_unknown_node_has_no_neighbours() -> None:
+    snapshot = CompressedAdjacency.build([(1, 2, 0)])
+
+    assert snapshot.index_of(99) is None
+    assert list(snapshot.outgoing(99)) == []
+
+
+def test_snapshot_uses_compact_arrays() -> None:
+    edges = [(i, i + 1, 0) for i in range(1_000)]
+
+    snapshot = CompressedAdjacency.build(edges)
+
+    # 1001 node ids (8B) + 2x1002 offsets (8B) + 2x1000 x (int32 + uint16).
+    assert snapshot.nbytes == 1001 * 8 + 2 * 1002 * 8 + 2 * 1000 * 6
+    assert snapshot.out_targets.typecode == "i"
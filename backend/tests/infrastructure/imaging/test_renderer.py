@@ -0,0 +1,92 @@
+import asyncio
+from typing import TYPE_CHECKING
+
+import pytest
+from PIL import Image
+
+from app.application.photos import DerivativeError
+from app.domain.photos import DerivativeFormat
+from app.infrastructure.imaging import ProcessPoolRenderer, render_derivative
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+pytestmark = pytest.mark.unit
+
+
+def _photo(path: Path, size: tuple[int, int] = (400, 200)) -> Path:
+    Image.new("RGBA", size, (200, 30, 30, 255)).save(path, format="PNG")
+    return path
+
+
+@pytest.mark.parametrize("fmt", list(DerivativeFormat))
+def test_render_derivative_fits_the_size(tmp_path: Path, fmt: DerivativeFormat) -> None:
+    source = _photo(tmp_path / "photo")
+    target = tmp_path / "out" / f"photo.{fmt}"
+
+    render_derivative(source, target, 100, fmt, 80)
+
+    with Image.open(target) as image:
+        assert image.format == fmt.upper()
+        assert image.size == (100, 50)
+    assert [p.name for p in target.parent.iterdir()] == [target.name]
+
+
+def test_render_derivative_rejects_undecodable_files(tmp_path: Path) -> None:
+    source = tmp_path / "photo"
+    source.write_bytes(b"\x89PNG\r\n\x1a\n" + bytes(100))
+
+    with pytest.raises(DerivativeError):
+        render_derivative(source, tmp_path / "out.webp", 100, "webp", 80)
+
+    assert not (tmp_path / "out.webp").exists()
+
+
+def test_concurrent_requests_share_one_render(tmp_path: Path) -> None:
+    source = _photo(tmp_path / "photo")
+    target = tmp_path / "photo-64.webp"
+
+    async def render_twice() -> ProcessPoolRenderer:
+        renderer = ProcessPoolRenderer(workers=1)
+        try:
+            await asyncio.gather(
+                *(
+                    renderer.render(
+                        source, target, size=64, fmt=DerivativeFormat.WEBP, quality=80
+                    )
+                    for _ in range(2)
+                )
+            )
+        finally:
+            await renderer.stop()
+        return renderer
+
+    renderer = asyncio.run(render_twice())
+
+    assert (renderer.rendered, renderer.failed, renderer.in_flight) == (1, 0, 0)
+    with Image.open(target) as image:
+        assert image.size == (64, 32)
+
+
+def test_scheduled_render_failures_are_not_raised(tmp_path: Path) -> None:
+    source = tmp_path / "photo"
+    source.write_bytes(b"garbage")
+
+    async def schedule() -> ProcessPoolRenderer:
+        renderer = ProcessPoolRenderer(workers=1)
+        renderer.schedule(
+            source,
+            tmp_path / "out.jpeg",
+            size=64,
+            fmt=DerivativeFormat.JPEG,
+            quality=80,
+        )
+        await asyncio.sleep(0)  # let the background task submit its render
+        while renderer.in_flight:
+            await asyncio.sleep(0.01)
+        await renderer.stop()
+        return renderer
+
+    renderer = asyncio.run(schedule())
+
+    assert (renderer.rendered, renderer.failed) == (0, 1)
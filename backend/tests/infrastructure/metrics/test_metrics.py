@@ -0,0 +1,109 @@
+import os
+import subprocess
+import sys
+from typing import TYPE_CHECKING
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.entrypoints.api.main import create_app
+from app.infrastructure.metrics import Metrics, Scalar
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+pytestmark = pytest.mark.unit
+
+ROUTES = [("/api/nodes/{node_id}", {"GET", "DELETE"}), ("/api/health", {"GET"})]
+QUEUE = Scalar("queue_depth", "gauge", "Jobs waiting.")
+HITS = Scalar("cache_hits_total", "counter", "Hits.")
+MISSES = Scalar("cache_misses_total", "counter", "Misses.")
+
+
+def _metrics(directory: Path, pid: int, values: dict[Scalar, float]) -> Metrics:
+    return Metrics(
+        directory,
+        routes=ROUTES,
+        buckets=[0.1, 0.01, 1.0],
+        collect=lambda: values.items(),
+        interval=60,
+        pid=pid,
+    )
+
+
+def _dead_pid() -> int:
+    process = subprocess.Popen([sys.executable, "-c", ""])
+    process.wait()
+    return process.pid
+
+
+def _samples(text: str) -> dict[str, str]:
+    return dict(
+        line.rsplit(" ", 1) for line in text.splitlines() if not line.startswith("#")
+    )
+
+
+def test_requests_are_counted_by_route_method_and_status(tmp_path: Path) -> None:
+    metrics = _metrics(tmp_path, os.getpid(), {})
+
+    for _ in range(4):
+        metrics.request_started()
+    metrics.request_finished("/api/nodes/{node_id}", "GET", 200, 0.05)
+    metrics.request_finished("/api/nodes/{node_id}", "GET", 404, 0.005)
+    metrics.request_finished("/api/nodes/{node_id}", "PATCH", 405, 2.0)
+    metrics.request_finished(None, "GET", 404, 0.001)
+
+    samples = _samples(metrics.render())
+    route = 'route="/api/nodes/{node_id}",method="GET"'
+    assert samples[f'http_requests_total{{{route},status="2xx"}}'] == "1"
+    assert samples[f'http_requests_total{{{route},status="4xx"}}'] == "1"
+    assert samples[f'http_request_duration_seconds_bucket{{{route},le="0.01"}}'] == "1"
+    assert samples[f'http_request_duration_seconds_bucket{{{route},le="0.1"}}'] == "2"
+    assert samples[f'http_request_duration_seconds_bucket{{{route},le="+Inf"}}'] == "2"
+    assert samples[f"http_request_duration_seconds_count{{{route}}}"] == "2"
+    assert float(samples[f"http_request_duration_seconds_sum{{{route}}}"]) == 0.055
+    unmatched = 'route="<unmatched>",method="",status="4xx"'
+    assert samples[f"http_requests_total{{{unmatched}}}"] == "2"
+    assert samples["http_requests_in_flight"] == "0"
+    assert not any("DELETE" in key for key in samples)
+
+
+def test_workers_are_summed_without_stopped_workers_gauges(tmp_path: Path) -> None:
+    values = {QUEUE: 2.0, HITS: 3.0, MISSES: 1.0}
+    here = _metrics(tmp_path, os.getpid(), values)
+    _metrics(tmp_path, os.getppid(), values).publish()
+    _metrics(tmp_path, _dead_pid(), values).publish()
+
+    samples = _samples(here.render())
+
+    assert samples["queue_depth"] == "4"
+    assert samples["cache_hits_total"] == "9"
+    assert samples["cache_misses_total"] == "3"
+    assert samples["cache_hit_ratio"] == "0.75"
+
+
+def test_workers_with_another_layout_are_ignored(tmp_path: Path) -> None:
+    here = _metrics(tmp_path, os.getpid(), {QUEUE: 1.0})
+    _metrics(tmp_path, os.getppid(), {QUEUE: 5.0, HITS: 1.0}).publish()
+
+    assert _samples(here.render())["queue_depth"] == "1"
+
+
+def test_metrics_endpoint(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    app = create_app()
+    monkeypatch.setattr(
+        "app.infrastructure.metrics.registry._metrics",
+        _metrics(tmp_path, os.getpid(), {}),
+    )
+    client = TestClient(app)
+
+    client.get("/api/health")
+    response = client.get("/api/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    samples = _samples(response.text)
+    series = 'route="/api/health",method="GET",status="2xx"'
+    assert samples[f"http_requests_total{{{series}}}"] == "1"
+    # The scrape itself is still in flight.
+    assert samples["http_requests_in_flight"] == "1"
@@ -0,0 +1,74 @@
+import asyncio
+import hashlib
+import os
+from typing import TYPE_CHECKING
+
+import pytest
+
+from app.infrastructure.storage import LocalPhotoStorage
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+pytestmark = pytest.mark.unit
+
+
+async def _store(storage: LocalPhotoStorage, *chunks: bytes) -> tuple[str, bool]:
+    staged = storage.stage()
+    for chunk in chunks:
+        await staged.write(chunk)
+    digest = hashlib.sha256(b"".join(chunks)).hexdigest()
+    return digest, await staged.commit(digest)
+
+
+def test_commit_places_file_under_its_digest(tmp_path: Path) -> None:
+    storage = LocalPhotoStorage(tmp_path, buffer_bytes=4)
+
+    digest, created = asyncio.run(_store(storage, b"abc", b"defg", b"h"))
+
+    path = storage.path(digest)
+    assert created
+    assert path == tmp_path / digest[:2] / digest[2:4] / digest
+    assert path.read_bytes() == b"abcdefgh"
+    assert path.stat().st_mode & 0o777 == 0o644
+    assert list((tmp_path / "staging").iterdir()) == []
+
+
+def test_commit_keeps_the_existing_copy(tmp_path: Path) -> None:
+    storage = LocalPhotoStorage(tmp_path, buffer_bytes=1024)
+
+    async def twice() -> tuple[bool, bool]:
+        first = await _store(storage, b"same")
+        second = await _store(storage, b"same")
+        return first[1], second[1]
+
+    assert asyncio.run(twice()) == (True, False)
+    digest = hashlib.sha256(b"same").hexdigest()
+    assert os.stat(storage.path(digest)).st_nlink == 1
+    assert list((tmp_path / "staging").iterdir()) == []
+
+
+def test_small_duplicates_are_never_written(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    storage = LocalPhotoStorage(tmp_path, buffer_bytes=1024)
+    asyncio.run(_store(storage, b"same"))
+    monkeypatch.setattr("tempfile.mkstemp", pytest.fail)
+
+    assert asyncio.run(_store(storage, b"sa", b"me")) == (
+        hashlib.sha256(b"same").hexdigest(),
+        False,
+    )
+
+
+def test_discard_removes_the_staged_file(tmp_path: Path) -> None:
+    storage = LocalPhotoStorage(tmp_path, buffer_bytes=1)
+
+    async def discard() -> None:
+        staged = storage.stage()
+        await staged.write(b"partial")
+        await staged.discard()
+
+    asyncio.run(discard())
+
+    assert list((tmp_path / "staging").iterdir()) == []
@@ -1,7 +1,7 @@
 import asyncio
 from types import SimpleNamespace
 from typing import TYPE_CHECKING
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 
@@ -26,18 +26,35 @@ def test_startup_calls_configure_logging_and_logs(
     # assert it was called with the configured values from settings.
     monkeypatch.setattr(
         "app.infrastructure.wiring.bootstrap.configure_logging",
-        lambda level, mode: recorded.update({"level": level, "mode": mode}),
+        lambda level, mode, **options: recorded.update(
+            {"level": level, "mode": mode, **options}
+        ),
     )
 
     fake_logger = SimpleNamespace(info=Mock(), debug=Mock())
     monkeypatch.setattr("structlog.get_logger", lambda name=None: fake_logger)
 
+    init_database = Mock()
+    monkeypatch.setattr(
+        "app.infrastructure.wiring.bootstrap.init_database", init_database
+    )
+    start_field_indexes = Mock()
+    monkeypatch.setattr(
+        "app.infrastructure.wiring.bootstrap.start_field_indexes", start_field_indexes
+    )
+
     from app.infrastructure.wiring.bootstrap import startup
 
     asyncio.run(startup(settings))
 
+    init_database.assert_called_once_with(settings.database)
+    start_field_indexes.assert_called_once_with(
+        init_database.return_value.engine, settings.node_types
+    )
+
     assert recorded.get("level") is settings.logging.level
     assert recorded.get("mode") is settings.logging.mode
+    assert recorded.get("sink") is settings.logging.sink
 
     fake_logger.info.assert_called_once_with("application.startup")
 
@@ -58,8 +75,67 @@ def test_shutdown_logs_application_shutdown(
     fake_logger = SimpleNamespace(info=Mock(), debug=Mock())
     monkeypatch.setattr("structlog.get_logger", lambda name=None: fake_logger)
 
+    close_database = AsyncMock()
+    monkeypatch.setattr(
+        "app.infrastructure.wiring.bootstrap.close_database", close_database
+    )
+
     from app.infrastructure.wiring.bootstrap import shutdown
 
     asyncio.run(shutdown(settings))
 
+    close_database.assert_awaited_once()
     fake_logger.info.assert_called_once_with("application.shutdown")
+
+
+def test_startup_starts_adjacency_cache_when_enabled(
+    settings_factory: Callable[..., Settings], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    settings = settings_factory(env={"MG_GRAPH__ADJACENCY_CACHE_ENABLED": "true"})
+
+    monkeypatch.setattr(
+        "app.infrastructure.wiring.bootstrap.configure_logging",
+        lambda level, mode, **options: None,
+    )
+    database = SimpleNamespace(engine=object())
+    monkeypatch.setattr(
+        "app.infrastructure.wiring.bootstrap.init_database", lambda _: database
+    )
+    start_adjacency_cache = Mock()
+    monkeypatch.setattr(
+        "app.infrastructure.wiring.bootstrap.start_adjacency_cache",
+        start_adjacency_cache,
+    )
+
+    from app.infrastructure.wiring.bootstrap import startup
+
+    asyncio.run(startup(settings))
+
+    start_adjacency_cache.assert_called_once_with(database.engine, settings.graph)
+
+
+def test_startup_starts_enrichment_when_enabled(
+    settings_factory: Callable[..., Settings], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    settings = settings_factory(env={"MG_ENRICHMENT__ENABLED": "true"})
+
+    monkeypatch.setattr(
+        "app.infrastructure.wiring.bootstrap.configure_logging",
+        lambda level, mode, **options: None,
+    )
+    database = SimpleNamespace(engine=object())
+    monkeypatch.setattr(
+        "app.infrastructure.wiring.bootstrap.init_database", lambda _: database
+    )
+    start_enrichment = Mock()
+    monkeypatch.setattr(
+        "app.infrastructure.wiring.bootstrap.start_enrichment", start_enrichment
+    )
+
+    from app.infrastructure.wiring.bootstrap import startup
+
+    asyncio.run(startup(settings))
+
+    start_enrichment.assert_called_once_with(
+        database.engine, settings.enrichment, settings.provider_cache
+    )
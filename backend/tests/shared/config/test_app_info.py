@@ -1,7 +1,12 @@
+from typing import TYPE_CHECKING
+
 import pytest
 
 from app.shared.config.app_info import ApplicationInfo, LicenseInfo
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
 pytestmark = pytest.mark.unit
 
 
@@ -40,3 +45,17 @@ def test_application_info_package_not_found(monkeypatch: pytest.MonkeyPatch) ->
     )
     app_info = ApplicationInfo.from_package()
     assert app_info.name == "menagerist"
+
+
+def test_application_info_prefers_snapshot(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.setattr(
+        "app.shared.config.app_info._SNAPSHOT", tmp_path / "app_info.json"
+    )
+    ApplicationInfo(display_name="Snapshot", version="2026.10.1").write_snapshot()
+
+    app_info = ApplicationInfo.from_package()
+
+    assert app_info.display_name == "Snapshot"
+    assert app_info.version == "2026.10.1"
@@ -1,6 +1,7 @@
 from typing import TYPE_CHECKING
 
 import pytest
+from pydantic import ValidationError
 
 from app.shared.config import Settings
 
@@ -33,6 +34,36 @@ def test_settings_applies_api_env_overrides(
     assert settings.api.trusted_hosts == ["127.0.0.1", "10.0.0.0/8"]
 
 
+def test_settings_parses_access_log_rules(
+    settings_factory: Callable[..., Settings],
+) -> None:
+    settings = settings_factory(
+        env={
+            "MG_API__ACCESS_LOG_RULES": (
+                "/api/health=never, /api/v1/photos=slow:250,/api=sample:10,/x=errors"
+            )
+        }
+    )
+
+    assert [
+        (rule.prefix, rule.policy, rule.sample_percent, rule.slow_ms)
+        for rule in settings.api.access_log_rules
+    ] == [
+        ("/api/health", "never", 100, 0),
+        ("/api/v1/photos", "slow", 100, 250),
+        ("/api", "sample", 10, 0),
+        ("/x", "errors", 100, 0),
+    ]
+
+
+@pytest.mark.parametrize("rule", ["/api=sample", "/api=sample:0", "api=never", "/=x"])
+def test_settings_rejects_bad_access_log_rules(
+    settings_factory: Callable[..., Settings], rule: str
+) -> None:
+    with pytest.raises(ValidationError):
+        settings_factory(env={"MG_API__ACCESS_LOG_RULES": rule})
+
+
 def test_settings_applies_app_overrides(
     settings_factory: Callable[..., Settings],
 ) -> None:
@@ -40,3 +71,22 @@ def test_settings_applies_app_overrides(
 
     assert settings.app.display_name == "TestApp"
     assert settings.app.version == "1.2.3"
+
+
+def test_settings_applies_database_env_overrides(
+    settings_factory: Callable[..., Settings],
+) -> None:
+    settings = settings_factory(
+        env={
+            "MG_DATABASE__HOST": "db",
+            "MG_DATABASE__PASSWORD": "hunter2",
+            "MG_DATABASE__POOL_SIZE": "20",
+            "MG_DATABASE__STATEMENT_CACHE_SIZE": "0",
+        }
+    )
+
+    assert settings.database.host == "db"
+    assert settings.database.password.get_secret_value() == "hunter2"
+    assert settings.database.pool_size == 20
+    assert settings.database.statement_cache_size == 0
+    assert settings.model_dump(mode="json")["database"]["password"] != "hunter2"
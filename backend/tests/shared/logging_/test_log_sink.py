@@ -0,0 +1,90 @@
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+import pytest
+import structlog
+
+from app.shared.config.logging_ import LoggingMode, LogLevel, LogOverflow, LogSink
+from app.shared.logging_ import close_logging, configure_logging, get_log_sink
+from app.shared.logging_.sink import QueuedLogSink
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture(autouse=True)
+def reset_logging() -> Generator[None]:
+    yield
+    close_logging()
+    structlog.reset_defaults()
+
+
+class _NoExecutor(ThreadPoolExecutor):
+    def submit(self, *args: Any, **kwargs: Any) -> Any:
+        raise AssertionError("logged via the executor")
+
+
+def test_queued_sink_writes_events_in_order(capsys: pytest.CaptureFixture[str]) -> None:
+    configure_logging(LogLevel.INFO, LoggingMode.JSON, sink=LogSink.QUEUED)
+    logger = structlog.get_logger("test")
+
+    async def log() -> None:
+        asyncio.get_running_loop().set_default_executor(_NoExecutor())
+        for i in range(3):
+            await logger.ainfo("event", i=i)
+        await logger.adebug("filtered")
+
+    asyncio.run(log())
+    close_logging()
+
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [(line["event"], line["i"]) for line in lines] == [
+        ("event", i) for i in range(3)
+    ]
+
+
+def test_configure_logging_replaces_the_sink() -> None:
+    configure_logging(sink=LogSink.QUEUED)
+    first = get_log_sink()
+
+    configure_logging(sink=LogSink.DIRECT)
+
+    assert first is not None
+    assert get_log_sink() is None
+
+
+def test_full_queue_drops_and_counts_events(capsys: pytest.CaptureFixture[str]) -> None:
+    sink = QueuedLogSink(queue_size=2, batch_size=10, overflow=LogOverflow.DROP)
+
+    for i in range(5):
+        sink.put(f"line {i}")
+    sink.start()
+    sink.close()
+
+    assert (sink.written, sink.dropped) == (2, 3)
+    assert capsys.readouterr().out.splitlines()[:2] == ["line 0", "line 1"]
+
+
+def test_full_queue_can_block_instead(capsys: pytest.CaptureFixture[str]) -> None:
+    sink = QueuedLogSink(queue_size=2, batch_size=1, overflow=LogOverflow.BLOCK)
+    sink.start()
+
+    for i in range(50):
+        sink.put(f"line {i}")
+    sink.close()
+
+    assert (sink.written, sink.dropped) == (50, 0)
+    assert capsys.readouterr().out.splitlines() == [f"line {i}" for i in range(50)]
+
+
+def test_close_does_not_wait_for_a_writer_that_never_started() -> None:
+    sink = QueuedLogSink(queue_size=1, batch_size=1, overflow=LogOverflow.DROP)
+    sink.put("never written")
+
+    sink.close(timeout=0.01)
+
+    assert sink.written == 0